@@ -0,0 +1,58 @@
+import { beforeEach, describe, expect, it, vi } from 'vitest'
+
+vi.mock('@/lib/prisma', () => ({
+  prisma: {
+    jobseekers: { findUnique: vi.fn() },
+    applications: { findMany: vi.fn() },
+  },
+}))
+
+import { prisma } from '@/lib/prisma'
+import {
+  clearJobseekerIdCache,
+  getAppliedJobIds,
+  getJobseekerIdForUser,
+} from '@/lib/jobs/appliedStatus'
+
+describe('Applied status resolver', () => {
+  beforeEach(() => {
+    vi.clearAllMocks()
+    clearJobseekerIdCache()
+  })
+
+  it('resolves a whole page with one query', async () => {
+    prisma.applications.findMany.mockResolvedValue([{ jobId: 'job-2' }])
+
+    const applied = await getAppliedJobIds('seeker-1', ['job-1', 'job-2', 'job-3'])
+
+    expect(prisma.applications.findMany).toHaveBeenCalledTimes(1)
+    expect(prisma.applications.findMany.mock.calls[0][0].where).toEqual({
+      jobseekerId: 'seeker-1',
+      jobId: { in: ['job-1', 'job-2', 'job-3'] },
+    })
+    expect([...applied]).toEqual(['job-2'])
+  })
+
+  it('skips the query for anonymous users', async () => {
+    const applied = await getAppliedJobIds(null, ['job-1'])
+
+    expect(applied.size).toBe(0)
+    expect(prisma.applications.findMany).not.toHaveBeenCalled()
+  })
+
+  it('caches the user to jobseeker id lookup', async () => {
+    prisma.jobseekers.findUnique.mockResolvedValue({ id: 'seeker-1' })
+
+    expect(await getJobseekerIdForUser('user-1')).toBe('seeker-1')
+    expect(await getJobseekerIdForUser('user-1')).toBe('seeker-1')
+    expect(prisma.jobseekers.findUnique).toHaveBeenCalledTimes(1)
+  })
+
+  it('does not cache missing jobseeker profiles', async () => {
+    prisma.jobseekers.findUnique.mockResolvedValue(null)
+
+    expect(await getJobseekerIdForUser('user-1')).toBeNull()
+    expect(await getJobseekerIdForUser('user-1')).toBeNull()
+    expect(prisma.jobseekers.findUnique).toHaveBeenCalledTimes(2)
+  })
+})
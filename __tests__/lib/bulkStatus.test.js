@@ -0,0 +1,105 @@
+import { beforeEach, describe, expect, it, vi } from 'vitest'
+
+vi.mock('@/lib/prisma', () => {
+  const tx = {
+    $queryRaw: vi.fn(),
+    jobseekers: { updateMany: vi.fn() },
+    email_outbox: { createMany: vi.fn() },
+  }
+  return {
+    prisma: {
+      applications: { findMany: vi.fn() },
+      audit_logs: { createMany: vi.fn() },
+      $transaction: vi.fn(fn => fn(tx)),
+      tx,
+    },
+  }
+})
+
+vi.mock('@/lib/logger', () => ({
+  createLogger: () => ({ warn: vi.fn(), error: vi.fn() }),
+  logError: vi.fn(),
+}))
+
+import { prisma } from '@/lib/prisma'
+import { applyBulkStatusChange } from '@/lib/applications/bulkStatus'
+
+const { tx } = prisma
+const recruiter = { id: 'rec-1', userId: 'user-1' }
+const job = { id: 'job-1', title: 'Admin Gudang', companies: { name: 'PT Maju' } }
+
+const application = (id, status, jobseekerId = `js-${id}`) => ({
+  id,
+  status,
+  jobseekerId,
+  jobseekers: { firstName: 'Calon', lastName: id, email: `${id}@example.com`, users: { email: `${id}@example.com` } },
+})
+
+describe('applyBulkStatusChange', () => {
+  beforeEach(() => {
+    vi.clearAllMocks()
+    prisma.audit_logs.createMany.mockResolvedValue({ count: 0 })
+    tx.email_outbox.createMany.mockImplementation(({ data }) => Promise.resolve({ count: data.length }))
+  })
+
+  it('validates every id and updates the valid ones in one statement', async () => {
+    prisma.applications.findMany.mockResolvedValueOnce([
+      application('a', 'REVIEWING'),
+      application('b', 'PENDING'),
+      application('c', 'INTERVIEW_SCHEDULED'),
+    ])
+    tx.$queryRaw.mockResolvedValue([{ id: 'a' }, { id: 'b' }])
+
+    const result = await applyBulkStatusChange({ recruiter, job, ids: ['a', 'b', 'c', 'missing', 'a'], status: 'SHORTLISTED' })
+
+    expect(result.updated).toBe(2)
+    expect(result.emailsQueued).toBe(0)
+    expect(result.results).toEqual([
+      { id: 'a', ok: true, from: 'REVIEWING', to: 'SHORTLISTED' },
+      { id: 'b', ok: true, from: 'PENDING', to: 'SHORTLISTED' },
+      { id: 'c', ok: false, error: expect.stringContaining('INTERVIEW_SCHEDULED') },
+      { id: 'missing', ok: false, error: expect.any(String) },
+    ])
+    expect(prisma.applications.findMany).toHaveBeenCalledTimes(1)
+    expect(tx.$queryRaw).toHaveBeenCalledTimes(1)
+    // One audit insert for the whole batch
+    expect(prisma.audit_logs.createMany).toHaveBeenCalledTimes(1)
+    expect(prisma.audit_logs.createMany.mock.calls[0][0].data.map(row => row.targetId)).toEqual(['a', 'b'])
+  })
+
+  it('reports rows changed concurrently instead of overwriting them', async () => {
+    prisma.applications.findMany.mockResolvedValueOnce([application('a', 'REVIEWING'), application('b', 'REVIEWING')])
+    tx.$queryRaw.mockResolvedValue([{ id: 'a' }])
+
+    const { results } = await applyBulkStatusChange({ recruiter, job, ids: ['a', 'b'], status: 'REJECTED' })
+
+    expect(results[1]).toMatchObject({ id: 'b', ok: false })
+    const { data } = tx.email_outbox.createMany.mock.calls[0][0]
+    expect(data.map(row => row.dedupKey)).toEqual(['applicationDecision:a:REJECTED'])
+  })
+
+  it('skips candidates already hired elsewhere and marks the rest employed', async () => {
+    prisma.applications.findMany
+      .mockResolvedValueOnce([application('a', 'INTERVIEW_COMPLETED'), application('b', 'INTERVIEW_COMPLETED')])
+      .mockResolvedValueOnce([{ jobseekerId: 'js-b' }])
+    tx.$queryRaw.mockResolvedValue([{ id: 'a' }])
+
+    const result = await applyBulkStatusChange({ recruiter, job, ids: ['a', 'b'], status: 'ACCEPTED' })
+
+    expect(result.results[1]).toEqual({ id: 'b', ok: false, error: 'Kandidat sudah menerima tawaran perusahaan lain' })
+    expect(tx.jobseekers.updateMany).toHaveBeenCalledWith(expect.objectContaining({
+      where: { id: { in: ['js-a'] } },
+    }))
+    expect(result.emailsQueued).toBe(1)
+  })
+
+  it('does not open a transaction when nothing is valid', async () => {
+    prisma.applications.findMany.mockResolvedValueOnce([application('a', 'ACCEPTED')])
+
+    const result = await applyBulkStatusChange({ recruiter, job, ids: ['a'], status: 'REJECTED' })
+
+    expect(result.updated).toBe(0)
+    expect(prisma.$transaction).not.toHaveBeenCalled()
+    expect(prisma.audit_logs.createMany).not.toHaveBeenCalled()
+  })
+})
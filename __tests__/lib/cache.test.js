@@ -0,0 +1,182 @@
+import { beforeEach, describe, expect, it, vi } from 'vitest'
+
+vi.mock('@/lib/logger', () => ({
+  logError: vi.fn(),
+}))
+
+import {
+  cached,
+  CacheTag,
+  createMemoryStore,
+  createRedisStore,
+  invalidateCacheTags,
+  setCacheStore,
+} from '@/lib/cache'
+
+describe('Response cache', () => {
+  beforeEach(() => {
+    setCacheStore(createMemoryStore())
+  })
+
+  it('serves repeated reads from the cache', async () => {
+    const loader = vi.fn().mockResolvedValue({ total: 3 })
+
+    const first = await cached('stats', { ttl: 60 }, loader)
+    const second = await cached('stats', { ttl: 60 }, loader)
+
+    expect(first).toEqual({ total: 3 })
+    expect(second).toEqual({ total: 3 })
+    expect(loader).toHaveBeenCalledTimes(1)
+  })
+
+  it('runs the loader once for concurrent misses', async () => {
+    let resolveLoader
+    const loader = vi.fn(() => new Promise(resolve => { resolveLoader = resolve }))
+
+    const pending = Promise.all([
+      cached('jobs:list', { ttl: 60 }, loader),
+      cached('jobs:list', { ttl: 60 }, loader),
+      cached('jobs:list', { ttl: 60 }, loader),
+    ])
+    // Let the cache lookups settle before the loader finishes
+    await new Promise(resolve => setTimeout(resolve, 0))
+    resolveLoader(['job-1'])
+
+    expect(await pending).toEqual([['job-1'], ['job-1'], ['job-1']])
+    expect(loader).toHaveBeenCalledTimes(1)
+  })
+
+  it('drops tagged entries on invalidation', async () => {
+    const jobsLoader = vi.fn().mockResolvedValue('jobs')
+    const companiesLoader = vi.fn().mockResolvedValue('companies')
+
+    await cached('a', { ttl: 60, tags: [CacheTag.JOBS] }, jobsLoader)
+    await cached('b', { ttl: 60, tags: [CacheTag.COMPANIES] }, companiesLoader)
+    await invalidateCacheTags(CacheTag.JOBS)
+    await cached('a', { ttl: 60, tags: [CacheTag.JOBS] }, jobsLoader)
+    await cached('b', { ttl: 60, tags: [CacheTag.COMPANIES] }, companiesLoader)
+
+    expect(jobsLoader).toHaveBeenCalledTimes(2)
+    expect(companiesLoader).toHaveBeenCalledTimes(1)
+  })
+
+  it('does not cache null results', async () => {
+    const loader = vi.fn().mockResolvedValue(null)
+
+    await cached('missing', { ttl: 60 }, loader)
+    await cached('missing', { ttl: 60 }, loader)
+
+    expect(loader).toHaveBeenCalledTimes(2)
+  })
+
+  it('falls back to the loader when the store fails', async () => {
+    const store = createMemoryStore()
+    store.get = vi.fn().mockRejectedValue(new Error('redis down'))
+    setCacheStore(store)
+
+    const value = await cached('stats', { ttl: 60 }, async () => 'fresh')
+
+    expect(value).toBe('fresh')
+  })
+})
+
+// Just the commands the Redis store uses, kept in a Map
+function createFakeRedis() {
+  const data = new Map()
+  const commands = {
+    async get(key) { return data.has(key) ? data.get(key) : null },
+    async set(key, value, options) {
+      if (options?.nx && data.has(key)) return null
+      data.set(key, value)
+      return 'OK'
+    },
+    async mget(...keys) { return keys.map(key => (data.has(key) ? data.get(key) : null)) },
+    async incr(key) {
+      data.set(key, (Number(data.get(key)) || 0) + 1)
+      return data.get(key)
+    },
+    async expire() { return 1 },
+    async del(...keys) { keys.forEach(key => data.delete(key)) },
+  }
+  return {
+    ...commands,
+    data,
+    pipeline() {
+      const queued = []
+      const pipeline = {
+        incr: key => (queued.push(() => commands.incr(key)), pipeline),
+        expire: key => (queued.push(() => commands.expire(key)), pipeline),
+        exec: () => Promise.all(queued.map(run => run())),
+      }
+      return pipeline
+    },
+  }
+}
+
+describe('Redis store', () => {
+  it('invalidates a tag with one generation bump', async () => {
+    const redis = createFakeRedis()
+    setCacheStore(createRedisStore(redis))
+    const loader = vi.fn().mockResolvedValue('jobs')
+
+    await cached('jobs:list:a', { ttl: 60, tags: [CacheTag.JOBS] }, loader)
+    await cached('jobs:list:b', { ttl: 60, tags: [CacheTag.JOBS] }, loader)
+    await cached('jobs:list:a', { ttl: 60, tags: [CacheTag.JOBS] }, loader)
+    expect(loader).toHaveBeenCalledTimes(2)
+
+    await invalidateCacheTags(CacheTag.JOBS)
+    await cached('jobs:list:a', { ttl: 60, tags: [CacheTag.JOBS] }, loader)
+
+    expect(loader).toHaveBeenCalledTimes(3)
+    expect(redis.data.get('cache-tag:jobs')).toBe(1)
+    // Nothing is registered per key; old generations are left to expire
+    expect([...redis.data.keys()].filter(key => key.startsWith('cache:'))).toEqual([
+      'cache:jobs:list:a@0',
+      'cache:jobs:list:b@0',
+      'cache:jobs:list:a@1',
+    ])
+  })
+})
+
+describe('Memory store', () => {
+  it('evicts the least recently used entry', async () => {
+    const store = createMemoryStore({ maxEntries: 2 })
+
+    await store.set('a', 1, 60)
+    await store.set('b', 2, 60)
+    await store.get('a')
+    await store.set('c', 3, 60)
+
+    expect(await store.get('a')).toBe(1)
+    expect(await store.get('b')).toBeUndefined()
+    expect(await store.get('c')).toBe(3)
+    expect(store.size).toBe(2)
+  })
+
+  it('expires entries after their TTL', async () => {
+    vi.useFakeTimers()
+    const store = createMemoryStore()
+
+    await store.set('a', 1, 1)
+    vi.advanceTimersByTime(1500)
+
+    expect(await store.get('a')).toBeUndefined()
+    vi.useRealTimers()
+  })
+
+  it('removes evicted and expired keys from their tags', async () => {
+    vi.useFakeTimers()
+    const store = createMemoryStore({ maxEntries: 2 })
+
+    await store.set('a', 1, 60, [CacheTag.JOBS])
+    await store.set('b', 2, 1, [CacheTag.JOBS, CacheTag.COMPANIES])
+    await store.set('c', 3, 60, [CacheTag.NEWS])
+    expect(store.taggedKeyCount).toBe(3)
+
+    vi.advanceTimersByTime(1500)
+    await store.get('b')
+
+    expect(store.taggedKeyCount).toBe(1)
+    vi.useRealTimers()
+  })
+})
@@ -0,0 +1,81 @@
+import { describe, expect, it } from 'vitest'
+import { gunzipSync } from 'zlib'
+import { createCsvStream, escapeCsvValue, toCsvRow } from '@/lib/csv'
+
+async function readStream(stream) {
+  const chunks = []
+  const reader = stream.getReader()
+  while (true) {
+    const { value, done } = await reader.read()
+    if (done) break
+    chunks.push(value)
+  }
+  return Buffer.concat(chunks.map(chunk => Buffer.from(chunk)))
+}
+
+async function* batchesOf(...batches) {
+  for (const batch of batches) yield batch
+}
+
+describe('CSV helpers', () => {
+  it('leaves plain values unquoted', () => {
+    expect(escapeCsvValue('LOGIN')).toBe('LOGIN')
+    expect(escapeCsvValue(null)).toBe('')
+    expect(escapeCsvValue(undefined)).toBe('')
+  })
+
+  it('quotes delimiters, quotes and line breaks', () => {
+    expect(escapeCsvValue('a,b')).toBe('"a,b"')
+    expect(escapeCsvValue('say "hi"')).toBe('"say ""hi"""')
+    expect(escapeCsvValue('line\nbreak')).toBe('"line\nbreak"')
+  })
+
+  it('keeps JSON intact instead of rewriting commas', () => {
+    const json = JSON.stringify({ name: 'PT A, Tbk', notes: 'ok' })
+    expect(escapeCsvValue(json)).toBe(`"${json.replace(/"/g, '""')}"`)
+  })
+
+  it('neutralizes spreadsheet formulas', () => {
+    expect(escapeCsvValue('=HYPERLINK("x")')).toBe('"\'=HYPERLINK(""x"")"')
+    expect(escapeCsvValue('@cmd')).toBe("'@cmd")
+  })
+
+  it('formats dates as ISO strings', () => {
+    expect(escapeCsvValue(new Date('2026-01-02T03:04:05.000Z'))).toBe('2026-01-02T03:04:05.000Z')
+  })
+
+  it('terminates rows with CRLF', () => {
+    expect(toCsvRow(['a', 'b,c'])).toBe('a,"b,c"\r\n')
+  })
+})
+
+describe('createCsvStream', () => {
+  it('streams the header followed by every batch', async () => {
+    const stream = createCsvStream(['ID', 'Action'], batchesOf([['1', 'LOGIN']], [['2', 'LOGOUT']]))
+
+    const text = (await readStream(stream)).toString('utf8')
+
+    expect(text).toBe('ID,Action\r\n1,LOGIN\r\n2,LOGOUT\r\n')
+  })
+
+  it('gzips the output when requested', async () => {
+    const stream = createCsvStream(['ID'], batchesOf([['1']]), { gzip: true })
+
+    const text = gunzipSync(await readStream(stream)).toString('utf8')
+
+    expect(text).toBe('ID\r\n1\r\n')
+  })
+
+  it('reports batch failures', async () => {
+    const errors = []
+    async function* failing() {
+      yield [['1']]
+      throw new Error('db down')
+    }
+
+    const stream = createCsvStream(['ID'], failing(), { onError: error => errors.push(error.message) })
+
+    await expect(readStream(stream)).rejects.toThrow('db down')
+    expect(errors).toEqual(['db down'])
+  })
+})
@@ -0,0 +1,128 @@
+import { afterEach, beforeEach, describe, expect, it, vi } from 'vitest'
+
+vi.mock('@/lib/logger', () => ({
+  logError: vi.fn(),
+}))
+
+import { createMemoryStore, setCacheStore } from '@/lib/cache'
+import { createCvMatcher, scoreSkillOverlap } from '@/lib/matching/cvMatcher'
+import { mapWithConcurrency } from '@/lib/utils'
+
+const pythonResponse = (body, status = 200) =>
+  new Response(JSON.stringify(body), { status, headers: { 'Content-Type': 'application/json' } })
+
+describe('scoreSkillOverlap', () => {
+  it('scores the share of job skills found in the profile', () => {
+    const result = scoreSkillOverlap(['excel', ' Python '], ['Excel', 'Python', 'SQL', 'Go'])
+
+    expect(result).toMatchObject({
+      match_score: 50,
+      highlights: ['Excel', 'Python'],
+      status: 'NOT_RECOMMENDED',
+      source: 'local_overlap',
+    })
+  })
+
+  it('returns zero without job skills', () => {
+    expect(scoreSkillOverlap(['Excel'], []).match_score).toBe(0)
+  })
+})
+
+describe('mapWithConcurrency', () => {
+  it('keeps order and never exceeds the limit', async () => {
+    let active = 0
+    let peak = 0
+
+    const results = await mapWithConcurrency([1, 2, 3, 4, 5, 6], 2, async value => {
+      active++
+      peak = Math.max(peak, active)
+      await new Promise(resolve => setTimeout(resolve, 5))
+      active--
+      return value * 10
+    })
+
+    expect(results).toEqual([10, 20, 30, 40, 50, 60])
+    expect(peak).toBe(2)
+  })
+})
+
+describe('createCvMatcher', () => {
+  let fetchMock
+
+  beforeEach(() => {
+    setCacheStore(createMemoryStore())
+    fetchMock = vi.fn()
+    vi.stubGlobal('fetch', fetchMock)
+  })
+
+  afterEach(() => {
+    vi.unstubAllGlobals()
+  })
+
+  const item = {
+    cvUrl: 'https://cdn.example.com/cv-1.pdf',
+    cvSkills: ['Excel'],
+    jobTitle: 'Admin',
+    jobSkills: ['Excel', 'Word'],
+  }
+
+  it('uses the Python service and caches the result per CV and skill set', async () => {
+    fetchMock.mockResolvedValue(pythonResponse({ persentase: '80%', skill: ['Excel', 'Word'], status: 'RECOMMENDED' }))
+    const matcher = createCvMatcher({ pythonApiUrl: 'http://matcher' })
+
+    const first = await matcher.match(item)
+    const second = await matcher.match({ ...item, jobSkills: ['word', 'excel'] })
+
+    expect(first).toMatchObject({ match_score: 80, source: 'python_api', status: 'RECOMMENDED' })
+    expect(second.match_score).toBe(80)
+    expect(fetchMock).toHaveBeenCalledTimes(1)
+  })
+
+  it('falls back to skill overlap when the service is down', async () => {
+    fetchMock.mockRejectedValue(new TypeError('fetch failed'))
+    const matcher = createCvMatcher({ pythonApiUrl: 'http://matcher' })
+
+    const results = await matcher.matchMany([
+      item,
+      { ...item, cvUrl: 'https://cdn.example.com/cv-2.pdf' },
+      { ...item, cvUrl: 'https://cdn.example.com/cv-3.pdf' },
+    ], 1)
+
+    expect(results.map(result => result.source)).toEqual(['local_overlap', 'local_overlap', 'local_overlap'])
+    expect(results[0].match_score).toBe(50)
+    // The first failure short-circuits the rest of the batch
+    expect(fetchMock).toHaveBeenCalledTimes(1)
+  })
+
+  it('keeps cached Python scores once the service is down', async () => {
+    fetchMock.mockResolvedValueOnce(pythonResponse({ persentase: '80%', skill: ['Excel', 'Word'] }))
+    await createCvMatcher({ pythonApiUrl: 'http://matcher' }).match(item)
+
+    fetchMock.mockRejectedValue(new TypeError('fetch failed'))
+    const results = await createCvMatcher({ pythonApiUrl: 'http://matcher' }).matchMany([
+      { ...item, cvUrl: 'https://cdn.example.com/cv-2.pdf' },
+      item,
+    ], 1)
+
+    expect(results.map(result => result.source)).toEqual(['local_overlap', 'python_api'])
+    expect(results[1].match_score).toBe(80)
+    expect(fetchMock).toHaveBeenCalledTimes(2)
+  })
+
+  it('does not cache fallback results', async () => {
+    fetchMock.mockRejectedValueOnce(new TypeError('fetch failed'))
+    await createCvMatcher({ pythonApiUrl: 'http://matcher' }).match(item)
+
+    fetchMock.mockResolvedValue(pythonResponse({ persentase: '90%', skill: ['Excel'] }))
+    const result = await createCvMatcher({ pythonApiUrl: 'http://matcher' }).match(item)
+
+    expect(result).toMatchObject({ match_score: 90, source: 'python_api' })
+  })
+
+  it('scores locally when no service is configured', async () => {
+    const result = await createCvMatcher({ pythonApiUrl: '' }).match(item)
+
+    expect(result.source).toBe('local_overlap')
+    expect(fetchMock).not.toHaveBeenCalled()
+  })
+})
@@ -0,0 +1,161 @@
+import { beforeEach, describe, expect, it, vi } from 'vitest'
+
+vi.mock('@/lib/prisma', () => ({
+  prisma: {
+    $queryRaw: vi.fn(),
+    $executeRaw: vi.fn(),
+    email_outbox: { createMany: vi.fn(), updateMany: vi.fn() },
+  },
+}))
+
+vi.mock('@/lib/logger', () => ({
+  createLogger: () => ({ warn: vi.fn(), error: vi.fn() }),
+  logError: vi.fn(),
+}))
+
+import { prisma } from '@/lib/prisma'
+import { applicationDecisionEmail } from '@/lib/email/applicationDecision'
+import {
+  deliverEmailOutbox,
+  drainEmailOutbox,
+  emailBackoffMs,
+  enqueueEmails,
+  EmailStatus,
+  MAX_EMAIL_ATTEMPTS,
+} from '@/lib/email/outbox'
+import { createFakeTransport, EmailTransportError } from '@/lib/email/transport'
+
+const row = (id, attempts = 0) => ({
+  id,
+  dedupKey: `test:${id}`,
+  recipient: `${id}@example.com`,
+  subject: `Subject ${id}`,
+  html: '<p>hi</p>',
+  attempts,
+})
+
+const updatesBy = status => prisma.email_outbox.updateMany.mock.calls
+  .map(([args]) => args)
+  .filter(args => args.data.status === status)
+
+describe('Email outbox', () => {
+  beforeEach(() => {
+    vi.clearAllMocks()
+    prisma.$executeRaw.mockResolvedValue(0)
+    prisma.email_outbox.updateMany.mockResolvedValue({ count: 0 })
+  })
+
+  it('queues rendered emails with a dedup key on the given client', async () => {
+    const tx = { email_outbox: { createMany: vi.fn().mockResolvedValue({ count: 1 }) } }
+
+    const email = applicationDecisionEmail({
+      applicationId: 'app-1',
+      to: 'ani@example.com',
+      jobseekerName: 'Ani',
+      jobTitle: 'Admin',
+      companyName: 'PT Maju',
+      decision: 'ACCEPTED',
+    })
+    const count = await enqueueEmails(tx, [email, { ...email, to: null }])
+
+    expect(count).toBe(1)
+    expect(prisma.email_outbox.createMany).not.toHaveBeenCalled()
+    const { data, skipDuplicates } = tx.email_outbox.createMany.mock.calls[0][0]
+    expect(skipDuplicates).toBe(true)
+    expect(data).toHaveLength(1)
+    expect(data[0]).toMatchObject({
+      template: 'applicationDecision',
+      dedupKey: 'applicationDecision:app-1:ACCEPTED',
+      recipient: 'ani@example.com',
+      subject: expect.stringContaining('PT Maju'),
+    })
+  })
+
+  it('sends in batches paced to the transport budget', async () => {
+    prisma.$queryRaw.mockResolvedValue(Array.from({ length: 5 }, (_, i) => row(`e${i}`)))
+    const transport = createFakeTransport({ maxBatchSize: 2, requestsPerSecond: 2 })
+    const sleep = vi.fn().mockResolvedValue()
+
+    const result = await deliverEmailOutbox({ transport, sleep })
+
+    expect(result).toEqual({ claimed: 5, sent: 5, retried: 0, failed: 0, deferred: 0 })
+    expect(transport.requests).toBe(3)
+    expect(transport.sent.map(message => message.idempotencyKey)).toEqual(
+      ['test:e0', 'test:e1', 'test:e2', 'test:e3', 'test:e4']
+    )
+    // A wait before every request after the first
+    expect(sleep).toHaveBeenCalledTimes(2)
+    expect(prisma.$executeRaw).toHaveBeenCalledTimes(3)
+  })
+
+  it('retries transient failures with backoff and gives up after the last attempt', async () => {
+    prisma.$queryRaw.mockResolvedValue([row('a', 0), row('b', MAX_EMAIL_ATTEMPTS - 1)])
+    const transport = createFakeTransport()
+    transport.failWith(new EmailTransportError('Service unavailable'))
+
+    const before = Date.now()
+    const result = await deliverEmailOutbox({ transport })
+
+    expect(result).toMatchObject({ sent: 0, retried: 1, failed: 1 })
+    const [retry] = updatesBy(EmailStatus.PENDING)
+    expect(retry.where.id.in).toEqual(['a'])
+    expect(retry.data.attempts).toBe(1)
+    expect(retry.data.nextAttemptAt.getTime()).toBeGreaterThanOrEqual(before + emailBackoffMs(1))
+    expect(updatesBy(EmailStatus.FAILED)[0].where.id.in).toEqual(['b'])
+  })
+
+  it('isolates a rejected message instead of failing its whole batch', async () => {
+    prisma.$queryRaw.mockResolvedValue([row('good'), row('bad')])
+    const transport = createFakeTransport()
+    const rejected = new EmailTransportError('Invalid `to` field', { retryable: false })
+    transport.failWith(rejected)
+    const sendBatch = transport.sendBatch
+    transport.sendBatch = async messages => {
+      if (messages.length === 1 && messages[0].to === 'bad@example.com') throw rejected
+      return sendBatch(messages)
+    }
+
+    const result = await deliverEmailOutbox({ transport })
+
+    expect(result).toMatchObject({ sent: 1, failed: 1, retried: 0 })
+    expect(transport.sent.map(message => message.to)).toEqual(['good@example.com'])
+    expect(updatesBy(EmailStatus.FAILED)[0].where.id.in).toEqual(['bad'])
+  })
+
+  it('defers the rest of the run on a rate limit without using an attempt', async () => {
+    prisma.$queryRaw.mockResolvedValue([row('a'), row('b'), row('c')])
+    const transport = createFakeTransport({ maxBatchSize: 1 })
+    const sendBatch = transport.sendBatch
+    transport.sendBatch = async messages => {
+      if (transport.requests === 1) {
+        transport.requests++
+        throw new EmailTransportError('Too many requests', { rateLimited: true, retryAfterMs: 5000 })
+      }
+      return sendBatch(messages)
+    }
+
+    const result = await deliverEmailOutbox({ transport })
+
+    expect(result).toMatchObject({ sent: 1, deferred: 2 })
+    const [deferred] = updatesBy(EmailStatus.PENDING)
+    expect(deferred.where.id.in).toEqual(['b', 'c'])
+    expect(deferred.data.attempts).toBeUndefined()
+  })
+
+  it('goes another round for emails queued during a drain', async () => {
+    const transport = createFakeTransport()
+    prisma.$queryRaw
+      .mockImplementationOnce(async () => {
+        // A second request queues an email and asks for a drain meanwhile
+        await drainEmailOutbox({ transport })
+        return [row('a')]
+      })
+      .mockResolvedValueOnce([row('b')])
+      .mockResolvedValue([])
+
+    await drainEmailOutbox({ transport })
+
+    expect(transport.sent.map(message => message.to)).toEqual(['a@example.com', 'b@example.com'])
+    expect(prisma.$queryRaw).toHaveBeenCalledTimes(2)
+  })
+})
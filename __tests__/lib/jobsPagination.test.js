@@ -0,0 +1,40 @@
+import { describe, expect, it } from 'vitest'
+import {
+  decodeJobCursor,
+  encodeJobCursor,
+  jobCursorWhere,
+  jobListOrderBy,
+} from '@/lib/jobs/pagination'
+
+describe('Job keyset pagination', () => {
+  it('round-trips a publishedAt cursor', () => {
+    const publishedAt = new Date('2026-01-02T03:04:05.000Z')
+    const cursor = encodeJobCursor({ id: 'job-1', publishedAt }, 'latest')
+
+    expect(decodeJobCursor(cursor, 'latest')).toEqual({ value: publishedAt, id: 'job-1' })
+  })
+
+  it('rejects cursors from a different sort or malformed input', () => {
+    const cursor = encodeJobCursor({ id: 'job-1', salaryMax: 5000000 }, 'salary')
+
+    expect(decodeJobCursor(cursor, 'latest')).toBeNull()
+    expect(decodeJobCursor('not-a-cursor', 'latest')).toBeNull()
+  })
+
+  it('continues after the cursor with an id tie-break', () => {
+    expect(jobCursorWhere({ value: 10, id: 'job-5' }, 'popular')).toEqual({
+      OR: [
+        { applicationCount: { lt: 10 } },
+        { applicationCount: 10, id: { lt: 'job-5' } },
+      ],
+    })
+  })
+
+  it('keeps jobs without salary at the end of the salary sort', () => {
+    expect(jobListOrderBy('salary')[0]).toEqual({ salaryMax: { sort: 'desc', nulls: 'last' } })
+    expect(jobCursorWhere({ value: null, id: 'job-5' }, 'salary')).toEqual({
+      salaryMax: null,
+      id: { lt: 'job-5' },
+    })
+  })
+})
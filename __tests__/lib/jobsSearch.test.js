@@ -0,0 +1,93 @@
+import { beforeEach, describe, expect, it, vi } from 'vitest'
+
+vi.mock('@/lib/prisma', () => ({
+  prisma: {
+    $queryRaw: vi.fn(),
+  },
+}))
+
+import { Prisma } from '@prisma/client'
+import { prisma } from '@/lib/prisma'
+import {
+  buildPrefixTsQuery,
+  countJobSearchMatches,
+  escapeLikePattern,
+  findJobSearchPage,
+} from '@/lib/jobs/search'
+
+const queryOf = call => Prisma.sql(...call)
+const noFilters = { location: null, jobTypes: null, categories: null, minExperience: null }
+
+describe('Job search query builder', () => {
+  it('builds a prefix query from free text', () => {
+    expect(buildPrefixTsQuery('Software  Eng')).toBe('software:* & eng:*')
+  })
+
+  it('strips tsquery operators and accents', () => {
+    expect(buildPrefixTsQuery("kafé & (staf)|'admin'")).toBe('kafe:* & staf:* & admin:*')
+  })
+
+  it('returns null when nothing searchable remains', () => {
+    expect(buildPrefixTsQuery('  !!  ')).toBeNull()
+  })
+
+  it('escapes LIKE wildcards', () => {
+    expect(escapeLikePattern('50%_off')).toBe('50\\%\\_off')
+  })
+})
+
+describe('Job search paging', () => {
+  beforeEach(() => {
+    vi.clearAllMocks()
+  })
+
+  it('applies the listing filters and paging in SQL', async () => {
+    prisma.$queryRaw.mockResolvedValue([{ id: 'job-2' }, { id: 'job-1' }])
+
+    const ids = await findJobSearchPage({
+      search: 'admin',
+      filters: { location: 'Sumber', jobTypes: ['FULL_TIME'], categories: ['Administrasi'], minExperience: [1] },
+      sortBy: 'relevance',
+      offset: 40,
+      take: 21,
+    })
+
+    expect(ids).toEqual(['job-2', 'job-1'])
+    const query = queryOf(prisma.$queryRaw.mock.calls[0])
+    expect(query.text).toContain('j.location ILIKE')
+    expect(query.text).toContain('j."jobType"::text = ANY(')
+    expect(query.text).toContain('j.category = ANY(')
+    expect(query.text).toContain('ORDER BY rank DESC')
+    expect(query.values).toEqual(expect.arrayContaining(['%Sumber%', ['FULL_TIME'], ['Administrasi'], 21, 40]))
+  })
+
+  it('continues a keyset cursor for column sorts', async () => {
+    prisma.$queryRaw.mockResolvedValue([])
+
+    await findJobSearchPage({
+      search: 'kasir',
+      filters: noFilters,
+      sortBy: 'popular',
+      cursor: { value: 10, id: 'job-5' },
+      take: 21,
+    })
+
+    const query = queryOf(prisma.$queryRaw.mock.calls[0])
+    expect(query.text).toContain('(j."applicationCount" < $')
+    expect(query.text).toContain('ORDER BY j."applicationCount" DESC, j.id DESC')
+    expect(query.values).toEqual(expect.arrayContaining([10, 'job-5']))
+  })
+
+  it('counts every match', async () => {
+    prisma.$queryRaw.mockResolvedValue([{ count: 4321 }])
+
+    expect(await countJobSearchMatches('operator', noFilters)).toBe(4321)
+    expect(queryOf(prisma.$queryRaw.mock.calls[0]).text).not.toContain('LIMIT')
+  })
+
+  it('skips the database when nothing is searchable', async () => {
+    expect(await findJobSearchPage({ search: '!!', filters: noFilters, sortBy: 'relevance', take: 21 })).toBeNull()
+    expect(await countJobSearchMatches('!!', noFilters)).toBeNull()
+    expect(prisma.$queryRaw).not.toHaveBeenCalled()
+  })
+})
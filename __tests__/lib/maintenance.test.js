@@ -0,0 +1,183 @@
+import { beforeEach, describe, expect, it, vi } from 'vitest'
+
+vi.mock('@/lib/prisma', () => ({
+  prisma: {
+    $queryRaw: vi.fn(),
+    $transaction: vi.fn(),
+    jobs: { findMany: vi.fn(), updateMany: vi.fn() },
+    contract_workers: { findMany: vi.fn(), updateMany: vi.fn() },
+    applications: { updateMany: vi.fn() },
+    interviews: { count: vi.fn() },
+    maintenance_locks: { updateMany: vi.fn() },
+    maintenance_runs: { create: vi.fn(), update: vi.fn() },
+  },
+}))
+
+vi.mock('@/lib/cache', () => ({
+  invalidateCacheTags: vi.fn(),
+  CacheTag: { JOBS: 'jobs', COMPANIES: 'companies' },
+}))
+
+vi.mock('@/lib/stats', () => ({
+  refreshDailyStats: vi.fn(),
+}))
+
+vi.mock('@/lib/recruiterDashboard', () => ({
+  reconcileDashboardCounters: vi.fn(),
+}))
+
+vi.mock('@/lib/mediaQueue', () => ({
+  processMediaJobs: vi.fn(),
+}))
+
+vi.mock('@/lib/email/outbox', () => ({
+  deliverEmailOutbox: vi.fn(),
+}))
+
+vi.mock('@/lib/logger', () => ({
+  createLogger: () => ({ info: vi.fn(), warn: vi.fn(), error: vi.fn() }),
+}))
+
+import { prisma } from '@/lib/prisma'
+import { invalidateCacheTags } from '@/lib/cache'
+import { refreshDailyStats } from '@/lib/stats'
+import { reconcileDashboardCounters } from '@/lib/recruiterDashboard'
+import { processMediaJobs } from '@/lib/mediaQueue'
+import { deliverEmailOutbox } from '@/lib/email/outbox'
+import { MaintenanceTask, runMaintenance } from '@/lib/maintenance'
+
+const ids = (count, prefix = 'job') =>
+  Array.from({ length: count }, (_, i) => ({ id: `${prefix}-${i}` }))
+
+describe('Maintenance runner', () => {
+  beforeEach(() => {
+    vi.clearAllMocks()
+    prisma.$queryRaw.mockResolvedValue([{ owner: 'me' }])
+    prisma.maintenance_locks.updateMany.mockResolvedValue({ count: 1 })
+    prisma.maintenance_runs.create.mockResolvedValue({ id: 'run-1' })
+    prisma.maintenance_runs.update.mockResolvedValue({})
+  })
+
+  it('skips the run when another instance holds the lock', async () => {
+    prisma.$queryRaw.mockResolvedValue([])
+
+    const result = await runMaintenance()
+
+    expect(result).toEqual({ skipped: true })
+    expect(prisma.maintenance_runs.create).not.toHaveBeenCalled()
+    expect(prisma.jobs.updateMany).not.toHaveBeenCalled()
+  })
+
+  it('deactivates expired jobs in bounded batches', async () => {
+    prisma.jobs.findMany
+      .mockResolvedValueOnce(ids(2))
+      .mockResolvedValueOnce(ids(2))
+      .mockResolvedValueOnce(ids(1))
+    prisma.jobs.updateMany
+      .mockResolvedValueOnce({ count: 2 })
+      .mockResolvedValueOnce({ count: 2 })
+      .mockResolvedValueOnce({ count: 1 })
+
+    const result = await runMaintenance({
+      tasks: [MaintenanceTask.EXPIRED_JOBS],
+      batchSize: 2,
+    })
+
+    expect(prisma.jobs.findMany).toHaveBeenCalledTimes(3)
+    expect(prisma.jobs.findMany.mock.calls[0][0].take).toBe(2)
+    expect(result.metrics.expiredJobs).toMatchObject({ processed: 5, batches: 3, hasMore: false })
+    expect(invalidateCacheTags).toHaveBeenCalledWith('jobs')
+  })
+
+  it('stops at maxBatches and reports the backlog', async () => {
+    prisma.jobs.findMany.mockResolvedValue(ids(2))
+    prisma.jobs.updateMany.mockResolvedValue({ count: 2 })
+
+    const result = await runMaintenance({
+      tasks: [MaintenanceTask.EXPIRED_JOBS],
+      batchSize: 2,
+      maxBatches: 3,
+    })
+
+    expect(prisma.jobs.updateMany).toHaveBeenCalledTimes(3)
+    expect(result.metrics.expiredJobs).toMatchObject({ processed: 6, batches: 3, hasMore: true })
+  })
+
+  it('completes expired contracts together with their applications', async () => {
+    prisma.contract_workers.findMany.mockResolvedValueOnce([
+      { id: 'cw-1', applicationId: 'app-1' },
+    ])
+    prisma.$transaction.mockResolvedValue([{ count: 1 }, { count: 1 }])
+
+    const result = await runMaintenance({ tasks: [MaintenanceTask.EXPIRED_CONTRACTS] })
+
+    expect(prisma.$transaction).toHaveBeenCalledTimes(1)
+    expect(prisma.applications.updateMany.mock.calls[0][0]).toEqual({
+      where: { id: { in: ['app-1'] } },
+      data: { status: 'RESIGNED' },
+    })
+    expect(result.metrics.expiredContracts.processed).toBe(1)
+  })
+
+  it('records a failed task without blocking the others and releases the lock', async () => {
+    prisma.jobs.findMany.mockRejectedValue(new Error('db timeout'))
+    prisma.interviews.count.mockResolvedValue(4)
+
+    const result = await runMaintenance({
+      tasks: [MaintenanceTask.EXPIRED_JOBS, MaintenanceTask.OVERDUE_INTERVIEWS],
+    })
+
+    expect(result.status).toBe('FAILED')
+    expect(result.metrics.expiredJobs.error).toBe('db timeout')
+    expect(result.metrics.overdueInterviews.overdue).toBe(4)
+    expect(prisma.maintenance_runs.update.mock.calls[0][0].data).toMatchObject({
+      status: 'FAILED',
+      error: 'expiredJobs: db timeout',
+    })
+    expect(prisma.maintenance_locks.updateMany).toHaveBeenCalledTimes(1)
+  })
+
+  it('refreshes the daily stats rollup', async () => {
+    refreshDailyStats.mockResolvedValue({ processed: 3, from: '2026-10-15T00:00:00.000Z', to: '2026-10-18T00:00:00.000Z' })
+    const now = new Date('2026-10-18T01:00:00Z')
+
+    const result = await runMaintenance({ tasks: [MaintenanceTask.DAILY_STATS], now })
+
+    expect(refreshDailyStats).toHaveBeenCalledWith({ now })
+    expect(result.metrics.dailyStats).toMatchObject({ processed: 3, batches: 1, hasMore: false })
+  })
+
+  it('reconciles the recruiter dashboard counters', async () => {
+    reconcileDashboardCounters.mockResolvedValue({ processed: 2, companies: 1, pruned: 5 })
+    const now = new Date('2026-10-18T01:00:00Z')
+
+    const result = await runMaintenance({ tasks: [MaintenanceTask.DASHBOARD_COUNTERS], now })
+
+    expect(reconcileDashboardCounters).toHaveBeenCalledWith({ now })
+    expect(result.metrics.dashboardCounters).toMatchObject({ processed: 2, companies: 1, pruned: 5, hasMore: false })
+  })
+
+  it('works through the media queue until a short batch', async () => {
+    processMediaJobs
+      .mockResolvedValueOnce({ claimed: 10, done: 9, failed: 1 })
+      .mockResolvedValueOnce({ claimed: 3, done: 3, failed: 0 })
+
+    const result = await runMaintenance({ tasks: [MaintenanceTask.MEDIA_QUEUE] })
+
+    expect(processMediaJobs).toHaveBeenCalledTimes(2)
+    expect(processMediaJobs).toHaveBeenCalledWith({ limit: 10 })
+    expect(result.metrics.mediaQueue).toMatchObject({ processed: 12, batches: 2, hasMore: false })
+  })
+
+  it('delivers due outbox emails and stops at a rate limit', async () => {
+    deliverEmailOutbox
+      .mockResolvedValueOnce({ claimed: 2, sent: 2, retried: 0, failed: 0, deferred: 0 })
+      .mockResolvedValueOnce({ claimed: 2, sent: 1, retried: 0, failed: 0, deferred: 1 })
+
+    const result = await runMaintenance({ tasks: [MaintenanceTask.EMAIL_OUTBOX], batchSize: 2 })
+
+    expect(deliverEmailOutbox).toHaveBeenCalledTimes(2)
+    expect(deliverEmailOutbox).toHaveBeenCalledWith({ limit: 2 })
+    expect(result.metrics.emailOutbox).toMatchObject({ processed: 3, batches: 2, hasMore: false })
+  })
+})
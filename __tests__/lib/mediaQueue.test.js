@@ -0,0 +1,143 @@
+import { mkdtemp, rm } from 'fs/promises'
+import { tmpdir } from 'os'
+import path from 'path'
+import sharp from 'sharp'
+import { afterEach, beforeEach, describe, expect, it, vi } from 'vitest'
+
+vi.mock('@/lib/prisma', () => ({
+  prisma: {
+    $queryRaw: vi.fn(),
+    $executeRaw: vi.fn(),
+    media_jobs: { create: vi.fn(), update: vi.fn(), findFirst: vi.fn() },
+    recruiters: { updateMany: vi.fn() },
+    jobseekers: { updateMany: vi.fn() },
+  },
+}))
+
+vi.mock('@/lib/supabase', () => ({
+  supabaseAdmin: null,
+}))
+
+vi.mock('@/lib/logger', () => ({
+  createLogger: () => ({ warn: vi.fn(), error: vi.fn() }),
+  logError: vi.fn(),
+}))
+
+import { prisma } from '@/lib/prisma'
+import { createLocalStorage, setStorage } from '@/lib/storage'
+import {
+  mediaPaths,
+  processMediaJob,
+  processMediaJobs,
+  variantPath,
+  MediaTarget,
+} from '@/lib/mediaQueue'
+
+const image = width => sharp({
+  create: { width, height: Math.round(width / 2), channels: 3, background: '#3366ff' },
+}).png().toBuffer()
+
+describe('Media queue', () => {
+  let root
+  let storage
+
+  beforeEach(async () => {
+    vi.clearAllMocks()
+    root = await mkdtemp(path.join(tmpdir(), 'media-'))
+    storage = createLocalStorage({ root, publicUrl: '/uploads' })
+    setStorage(storage)
+  })
+
+  afterEach(async () => {
+    setStorage(null)
+    await rm(root, { recursive: true, force: true })
+  })
+
+  it('names variants after the original', () => {
+    expect(variantPath('company/1/gallery/123.png', 800)).toBe('company/1/gallery/123_800w.webp')
+  })
+
+  it('stores and reads back objects on the local adapter', async () => {
+    await storage.upload('Profile', 'a/b.txt', new Blob(['hello']))
+
+    expect((await storage.download('Profile', 'a/b.txt')).toString()).toBe('hello')
+    expect(storage.getPublicUrl('Profile', 'a/b.txt')).toBe('/uploads/Profile/a/b.txt')
+    await expect(storage.upload('Profile', 'a/b.txt', Buffer.from('again'))).rejects.toThrow('already exists')
+    await expect(storage.upload('Profile', '../../escape.txt', Buffer.from('x'))).rejects.toThrow('Invalid storage path')
+  })
+
+  it('resizes into WebP variants without upscaling and swaps the target', async () => {
+    await storage.upload('Profile', 'recruiter/r1/profile.png', await image(1000))
+
+    const variants = await processMediaJob({
+      id: 'job-1',
+      bucket: 'Profile',
+      path: 'recruiter/r1/profile.png',
+      sourceUrl: '/uploads/Profile/recruiter/r1/profile.png',
+      target: { kind: MediaTarget.RECRUITER_PHOTO, id: 'r1' },
+    })
+
+    expect(Object.keys(variants)).toEqual(['320', '800', '1600'])
+    const small = await sharp(await storage.download('Profile', 'recruiter/r1/profile_320w.webp')).metadata()
+    const large = await sharp(await storage.download('Profile', 'recruiter/r1/profile_1600w.webp')).metadata()
+    expect(small).toMatchObject({ format: 'webp', width: 320 })
+    expect(large.width).toBe(1000)
+
+    // Only replaces the URL if the record still points at the original
+    expect(prisma.recruiters.updateMany).toHaveBeenCalledWith({
+      where: { id: 'r1', photoUrl: '/uploads/Profile/recruiter/r1/profile.png' },
+      data: { photoUrl: '/uploads/Profile/recruiter/r1/profile_1600w.webp' },
+    })
+  })
+
+  it('only strips the metadata of untargeted images', async () => {
+    const photo = await sharp(await image(400))
+      .jpeg()
+      .withExif({ IFD0: { Make: 'Camera', Copyright: 'Pemilik' } })
+      .toBuffer()
+    expect((await sharp(photo).metadata()).exif).toBeDefined()
+    await storage.upload('Resume', 'jobseeker/j1/ktp/ktp-1.jpg', photo)
+
+    const variants = await processMediaJob({
+      id: 'job-1',
+      bucket: 'Resume',
+      path: 'jobseeker/j1/ktp/ktp-1.jpg',
+      sourceUrl: '/uploads/Resume/jobseeker/j1/ktp/ktp-1.jpg',
+      target: null,
+    })
+
+    const stored = await sharp(await storage.download('Resume', 'jobseeker/j1/ktp/ktp-1.jpg')).metadata()
+    expect(stored).toMatchObject({ format: 'jpeg', width: 400 })
+    expect(stored.exif).toBeUndefined()
+    // No copies of the document nothing would link to
+    expect(variants).toEqual({})
+    await expect(storage.download('Resume', 'jobseeker/j1/ktp/ktp-1_320w.webp')).rejects.toThrow()
+  })
+
+  it('puts failed jobs back in the queue until the last attempt', async () => {
+    prisma.$queryRaw.mockResolvedValue([
+      { id: 'job-1', bucket: 'Profile', path: 'missing.png', sourceUrl: '/x', target: null, attempts: 1 },
+      { id: 'job-2', bucket: 'Profile', path: 'missing.jpg', sourceUrl: '/y', target: null, attempts: 3 },
+    ])
+    prisma.media_jobs.update.mockResolvedValue({})
+
+    const result = await processMediaJobs()
+
+    expect(result).toEqual({ claimed: 2, done: 0, failed: 2 })
+    const statuses = prisma.media_jobs.update.mock.calls.map(([args]) => [args.where.id, args.data.status])
+    expect(statuses).toEqual(expect.arrayContaining([['job-1', 'PENDING'], ['job-2', 'FAILED']]))
+  })
+
+  it('lists the original and every variant for deletion', async () => {
+    prisma.media_jobs.findFirst.mockResolvedValue({ path: 'company/c1/gallery/1.jpg' })
+
+    const paths = await mediaPaths('Profile', 'company/c1/gallery/1_1600w.webp')
+
+    expect(paths).toEqual(expect.arrayContaining([
+      'company/c1/gallery/1.jpg',
+      'company/c1/gallery/1_320w.webp',
+      'company/c1/gallery/1_800w.webp',
+      'company/c1/gallery/1_1600w.webp',
+    ]))
+  })
+})
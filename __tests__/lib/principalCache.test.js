@@ -0,0 +1,82 @@
+import { beforeEach, describe, expect, it, vi } from 'vitest'
+
+vi.mock('@/lib/prisma', () => ({
+  prisma: {
+    users: { findUnique: vi.fn() },
+    jobseekers: { findUnique: vi.fn() },
+    recruiters: { findUnique: vi.fn() },
+  },
+}))
+
+vi.mock('@/lib/auth', () => ({
+  getTokenFromRequest: () => 'token',
+  verifyToken: () => ({ userId: 'user-1' }),
+}))
+
+vi.mock('@/lib/logger', () => ({
+  logError: vi.fn(),
+}))
+
+import { prisma } from '@/lib/prisma'
+import { createMemoryStore, setCacheStore } from '@/lib/cache'
+import { getCurrentUser, requireRecruiter } from '@/lib/authHelper'
+import {
+  getPrincipalCacheStats,
+  invalidatePrincipal,
+  resetPrincipalCacheStats,
+} from '@/lib/principalCache'
+
+const request = { headers: { get: () => null } }
+const activeUser = { id: 'user-1', email: 'hr@example.com', role: 'RECRUITER', status: 'ACTIVE' }
+
+describe('Principal cache', () => {
+  beforeEach(() => {
+    vi.clearAllMocks()
+    setCacheStore(createMemoryStore())
+    resetPrincipalCacheStats()
+    prisma.users.findUnique.mockResolvedValue(activeUser)
+  })
+
+  it('looks the user up once across requests', async () => {
+    await getCurrentUser(request)
+    const { user } = await getCurrentUser(request)
+
+    expect(user).toEqual(activeUser)
+    expect(prisma.users.findUnique).toHaveBeenCalledTimes(1)
+    expect(getPrincipalCacheStats()).toMatchObject({ lookups: 2, hits: 1, misses: 1, hitRate: 0.5 })
+  })
+
+  it('reloads after invalidation', async () => {
+    await getCurrentUser(request)
+    prisma.users.findUnique.mockResolvedValue({ ...activeUser, status: 'SUSPENDED' })
+
+    await invalidatePrincipal('user-1')
+    const result = await getCurrentUser(request)
+
+    expect(result).toMatchObject({ error: 'Account is not active', status: 403 })
+  })
+
+  it('caches the recruiter profile and drops it with the user', async () => {
+    prisma.recruiters.findUnique.mockResolvedValue({ id: 'rec-1', userId: 'user-1', companyId: 'company-1' })
+
+    await requireRecruiter(request)
+    const { recruiter } = await requireRecruiter(request)
+    expect(recruiter.companyId).toBe('company-1')
+    expect(prisma.recruiters.findUnique).toHaveBeenCalledTimes(1)
+
+    await invalidatePrincipal('user-1')
+    await requireRecruiter(request)
+    expect(prisma.recruiters.findUnique).toHaveBeenCalledTimes(2)
+  })
+
+  it('does not cache a missing profile', async () => {
+    prisma.recruiters.findUnique.mockResolvedValueOnce(null)
+    const first = await requireRecruiter(request)
+
+    prisma.recruiters.findUnique.mockResolvedValue({ id: 'rec-1', userId: 'user-1', companyId: 'company-1' })
+    const second = await requireRecruiter(request)
+
+    expect(first.status).toBe(404)
+    expect(second.recruiter.id).toBe('rec-1')
+  })
+})
@@ -0,0 +1,130 @@
+import { afterEach, beforeEach, describe, expect, it, vi } from 'vitest'
+
+vi.mock('@upstash/redis', () => ({
+  Redis: { fromEnv: () => ({}) },
+}))
+
+import {
+  createRateLimiter,
+  createRedisRateLimitStore,
+  limitRequest,
+} from '@/lib/rateLimit'
+
+// Local Redis stand-in: just enough of MULTI for SET NX PX + INCRBY
+function createFakeRedis() {
+  const values = new Map()
+  const client = {
+    roundTrips: 0,
+    failing: false,
+    multi() {
+      const commands = []
+      const pipeline = {
+        set(key, value, { nx }) {
+          commands.push(() => {
+            if (nx && values.has(key)) return null
+            values.set(key, value)
+            return 'OK'
+          })
+          return pipeline
+        },
+        incrby(key, amount) {
+          commands.push(() => {
+            values.set(key, (values.get(key) ?? 0) + amount)
+            return values.get(key)
+          })
+          return pipeline
+        },
+        async exec() {
+          client.roundTrips++
+          if (client.failing) throw new Error('connection refused')
+          return commands.map(command => command())
+        },
+      }
+      return pipeline
+    },
+  }
+  return client
+}
+
+const requestFrom = (ip, headers = {}) =>
+  new Request('http://localhost/api/jobs', { headers: { 'x-forwarded-for': ip, ...headers } })
+
+describe('createRateLimiter', () => {
+  let redis
+
+  beforeEach(() => {
+    vi.useFakeTimers()
+    vi.setSystemTime(new Date('2026-10-18T10:00:00Z'))
+    redis = createFakeRedis()
+  })
+
+  afterEach(() => {
+    vi.useRealTimers()
+  })
+
+  it('serves leased tokens from memory', async () => {
+    const limiter = createRateLimiter('test', { limit: 100, windowSeconds: 60 }, {
+      store: createRedisRateLimitStore(redis),
+    })
+
+    for (let i = 0; i < 10; i++) {
+      expect((await limiter.limit('1.1.1.1')).success).toBe(true)
+    }
+    // Lease size is limit / 20 = 5
+    expect(redis.roundTrips).toBe(2)
+  })
+
+  it('enforces the limit across instances sharing Redis', async () => {
+    const store = createRedisRateLimitStore(redis)
+    const instances = [1, 2, 3].map(() =>
+      createRateLimiter('test', { limit: 10, windowSeconds: 60 }, { store, leaseSize: 2 })
+    )
+
+    let allowed = 0
+    for (let i = 0; i < 30; i++) {
+      if ((await instances[i % 3].limit('1.1.1.1')).success) allowed++
+    }
+    expect(allowed).toBe(10)
+  })
+
+  it('denies locally until the window resets', async () => {
+    const limiter = createRateLimiter('test', { limit: 2, windowSeconds: 60 }, {
+      store: createRedisRateLimitStore(redis),
+    })
+
+    await limiter.limit('1.1.1.1')
+    await limiter.limit('1.1.1.1')
+    const denied = await limiter.limit('1.1.1.1')
+    const roundTrips = redis.roundTrips
+    await limiter.limit('1.1.1.1')
+
+    expect(denied).toMatchObject({ success: false, remaining: 0 })
+    expect(redis.roundTrips).toBe(roundTrips)
+
+    vi.advanceTimersByTime(60 * 1000)
+    expect((await limiter.limit('1.1.1.1')).success).toBe(true)
+  })
+
+  it('fails open to a local window when Redis is down', async () => {
+    redis.failing = true
+    const limiter = createRateLimiter('test', { limit: 2, windowSeconds: 60 }, {
+      store: createRedisRateLimitStore(redis),
+    })
+
+    expect((await limiter.limit('1.1.1.1')).success).toBe(true)
+    expect((await limiter.limit('1.1.1.1')).success).toBe(true)
+    expect((await limiter.limit('1.1.1.1')).success).toBe(false)
+  })
+})
+
+describe('limitRequest', () => {
+  it('charges the client IP of the request', async () => {
+    const increment = vi.fn().mockResolvedValue(5)
+    const limiter = createRateLimiter('public', { limit: 100, windowSeconds: 60 }, { store: { increment } })
+
+    const result = await limitRequest(requestFrom('1.1.1.1, 10.0.0.1'), limiter)
+
+    expect(result.success).toBe(true)
+    expect(increment.mock.calls[0][0]).toMatch(/^ratelimit:public:1\.1\.1\.1:/)
+  })
+})
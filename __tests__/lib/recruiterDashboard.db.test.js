@@ -0,0 +1,149 @@
+// @vitest-environment node
+import { afterAll, beforeAll, describe, expect, it } from 'vitest'
+
+// Checks the trigger-maintained counters against the live aggregates on a real
+// database. Needs a migrated Postgres and is skipped otherwise:
+//   TEST_DATABASE_URL=postgresql://... npx vitest run __tests__/lib/recruiterDashboard.db.test.js
+const databaseUrl = process.env.TEST_DATABASE_URL
+const DAY_MS = 24 * 60 * 60 * 1000
+const run = `dashboard-test-${Date.now()}`
+const id = name => `${run}-${name}`
+
+describe.skipIf(!databaseUrl)('Recruiter dashboard counters (database)', () => {
+  let prisma
+  let dashboard
+
+  async function expectCountersToMatchLive(companyId) {
+    const [counters, live] = await Promise.all([
+      dashboard.getDashboardSummary(companyId),
+      dashboard.computeLiveDashboardSummary(companyId),
+    ])
+    expect(counters).toEqual(live)
+  }
+
+  const job = (name, data = {}) => ({
+    id: id(name),
+    companyId: id('company-a'),
+    recruiterId: id('recruiter'),
+    title: name,
+    slug: id(name),
+    description: 'Deskripsi',
+    requirements: 'Persyaratan',
+    responsibilities: 'Tanggung jawab',
+    jobType: 'FULL_TIME',
+    category: 'Teknologi',
+    location: 'Cirebon',
+    city: 'Cirebon',
+    province: 'Jawa Barat',
+    status: 'ACTIVE',
+    ...data,
+  })
+
+  const application = (n, jobName, data = {}) => ({
+    id: id(`application-${n}`),
+    jobId: id(jobName),
+    jobseekerId: id(`jobseeker-${n}`),
+    updatedAt: new Date(),
+    ...data,
+  })
+
+  beforeAll(async () => {
+    process.env.DATABASE_URL = databaseUrl
+    ;({ prisma } = await import('@/lib/prisma'))
+    dashboard = await import('@/lib/recruiterDashboard')
+
+    const now = new Date()
+    const jobseekers = [1, 2, 3, 4]
+    await prisma.users.createMany({
+      data: [
+        { id: id('recruiter-user'), email: `${id('recruiter-user')}@example.com`, password: 'x', role: 'RECRUITER', updatedAt: now },
+        ...jobseekers.map(n => ({ id: id(`user-${n}`), email: `${id(`user-${n}`)}@example.com`, password: 'x', role: 'JOBSEEKER', updatedAt: now })),
+      ],
+    })
+    await prisma.companies.createMany({
+      data: ['company-a', 'company-b'].map(name => ({
+        id: id(name),
+        name,
+        slug: id(name),
+        industry: 'Teknologi',
+        companySize: '1-10',
+        email: `${id(name)}@example.com`,
+        address: 'Jl. Uji',
+        city: 'Cirebon',
+        province: 'Jawa Barat',
+        updatedAt: now,
+      })),
+    })
+    await prisma.recruiters.create({
+      data: { id: id('recruiter'), userId: id('recruiter-user'), companyId: id('company-a'), firstName: 'Uji', lastName: 'Coba', position: 'HR', updatedAt: now },
+    })
+    await prisma.jobseekers.createMany({
+      data: jobseekers.map(n => ({ id: id(`jobseeker-${n}`), userId: id(`user-${n}`), updatedAt: now })),
+    })
+  })
+
+  afterAll(async () => {
+    if (!prisma) return
+    // Jobs first (their recruiter relation restricts deletes); companies then
+    // cascade to recruiters, users to jobseekers
+    await prisma.jobs.deleteMany({ where: { id: { startsWith: run } } })
+    await prisma.companies.deleteMany({ where: { id: { startsWith: run } } })
+    await prisma.users.deleteMany({ where: { id: { startsWith: run } } })
+    await prisma.company_dashboard_counters.deleteMany({ where: { companyId: { startsWith: run } } })
+    await prisma.$disconnect()
+  })
+
+  it('follows job and application writes', async () => {
+    const companyId = id('company-a')
+
+    await prisma.jobs.create({ data: job('job-1') })
+    await prisma.jobs.createMany({ data: [job('job-2', { status: 'PENDING', isActive: false }), job('job-3')] })
+    await expectCountersToMatchLive(companyId)
+
+    await prisma.applications.createMany({
+      data: [
+        application(1, 'job-1'),
+        application(2, 'job-1'),
+        application(3, 'job-3'),
+        application(4, 'job-3', { createdAt: new Date(Date.now() - 30 * DAY_MS) }),
+      ],
+    })
+    await expectCountersToMatchLive(companyId)
+
+    // Raw bulk update, as lib/applications/bulkStatus.js issues
+    await prisma.$executeRaw`
+      UPDATE "applications" SET "status" = 'REVIEWING'
+      WHERE "id" = ANY(${[id('application-1'), id('application-2')]})
+    `
+    await prisma.applications.update({ where: { id: id('application-3') }, data: { status: 'REJECTED', viewed: true } })
+    await prisma.applications.update({ where: { id: id('application-1') }, data: { recruiterNotes: 'Tidak mengubah hitungan' } })
+    await expectCountersToMatchLive(companyId)
+
+    await prisma.jobs.update({ where: { id: id('job-3') }, data: { isActive: false, status: 'CLOSED' } })
+    await prisma.applications.delete({ where: { id: id('application-2') } })
+    await expectCountersToMatchLive(companyId)
+
+    // Cascades to the job's remaining application
+    await prisma.jobs.delete({ where: { id: id('job-1') } })
+    await expectCountersToMatchLive(companyId)
+  })
+
+  it('moves application counters with a job that changes company', async () => {
+    await prisma.jobs.update({ where: { id: id('job-3') }, data: { companyId: id('company-b') } })
+
+    await expectCountersToMatchLive(id('company-a'))
+    await expectCountersToMatchLive(id('company-b'))
+  })
+
+  it('repairs drifted counters', async () => {
+    const companyId = id('company-b')
+    await prisma.$executeRaw`
+      UPDATE "company_dashboard_counters" SET "count" = "count" + 5 WHERE "companyId" = ${companyId}
+    `
+
+    const result = await dashboard.reconcileDashboardCounters()
+
+    expect(result.processed).toBeGreaterThan(0)
+    await expectCountersToMatchLive(companyId)
+  })
+})
@@ -0,0 +1,121 @@
+import { beforeEach, describe, expect, it, vi } from 'vitest'
+
+vi.mock('@/lib/prisma', () => ({
+  prisma: {
+    $queryRaw: vi.fn(),
+    $executeRaw: vi.fn(),
+    jobs: { groupBy: vi.fn() },
+    applications: { groupBy: vi.fn(), count: vi.fn() },
+  },
+}))
+
+import { prisma } from '@/lib/prisma'
+import {
+  computeLiveDashboardSummary,
+  getDashboardSummary,
+  reconcileDashboardCounters,
+  toDashboardStats,
+} from '@/lib/recruiterDashboard'
+
+const now = new Date('2026-10-18T10:00:00Z')
+const sqlOf = call => call[0].join('?')
+
+// One company: 3 jobs, 5 applications (2 created this week)
+const jobs = [
+  { status: 'ACTIVE', isActive: true },
+  { status: 'ACTIVE', isActive: true },
+  { status: 'CLOSED', isActive: false },
+]
+const applications = [
+  { status: 'PENDING', createdAt: '2026-10-18T08:00:00Z' },
+  { status: 'REVIEWING', createdAt: '2026-10-12T00:00:00Z' },
+  { status: 'REVIEWING', createdAt: '2026-10-11T23:59:59Z' },
+  { status: 'ACCEPTED', createdAt: '2026-09-01T00:00:00Z' },
+  { status: 'REJECTED', createdAt: '2026-08-01T00:00:00Z' },
+]
+
+function groupCount(rows, key) {
+  const counts = new Map()
+  for (const row of rows) counts.set(key(row), (counts.get(key(row)) || 0) + 1)
+  return [...counts]
+}
+
+// Rows the triggers keep for this company, day buckets already windowed
+const counterRows = [
+  ...groupCount(jobs, job => job.status).map(([key, count]) => ({ kind: 'job_status', key, count })),
+  ...groupCount(jobs, job => String(job.isActive)).map(([key, count]) => ({ kind: 'job_open', key, count })),
+  ...groupCount(applications, app => app.status).map(([key, count]) => ({ kind: 'application_status', key, count })),
+  ...groupCount(applications.filter(app => app.createdAt >= '2026-10-12'), app => app.createdAt.slice(0, 10))
+    .map(([key, count]) => ({ kind: 'application_day', key, count })),
+]
+
+describe('Recruiter dashboard summary', () => {
+  beforeEach(() => {
+    vi.clearAllMocks()
+  })
+
+  it('reads the counters once, limited to this week\'s day buckets', async () => {
+    prisma.$queryRaw.mockResolvedValue(counterRows)
+
+    const summary = await getDashboardSummary('company-1', { now })
+
+    expect(prisma.$queryRaw).toHaveBeenCalledTimes(1)
+    // 7 UTC days including today
+    expect(prisma.$queryRaw.mock.calls[0]).toContain('2026-10-12')
+    expect(summary.jobs).toEqual({ total: 3, open: 2, byStatus: { PENDING: 0, ACTIVE: 2, REJECTED: 0, CLOSED: 1 } })
+    expect(summary.applications).toMatchObject({ total: 5, newThisWeek: 2 })
+  })
+
+  it('matches the live aggregates for the same data', async () => {
+    prisma.$queryRaw.mockResolvedValue(counterRows)
+    prisma.jobs.groupBy.mockResolvedValue(
+      groupCount(jobs, job => `${job.status}:${job.isActive}`).map(([key, _count]) => {
+        const [status, isActive] = key.split(':')
+        return { status, isActive: isActive === 'true', _count }
+      })
+    )
+    prisma.applications.groupBy.mockResolvedValue(
+      groupCount(applications, app => app.status).map(([status, _count]) => ({ status, _count }))
+    )
+    prisma.applications.count.mockResolvedValue(2)
+
+    const [fromCounters, live] = await Promise.all([
+      getDashboardSummary('company-1', { now }),
+      computeLiveDashboardSummary('company-1', { now }),
+    ])
+
+    expect(fromCounters).toEqual(live)
+    expect(prisma.applications.count.mock.calls[0][0].where.createdAt).toEqual({ gte: new Date('2026-10-12T00:00:00Z') })
+  })
+
+  it('keeps the existing stats fields', async () => {
+    prisma.$queryRaw.mockResolvedValue(counterRows)
+
+    const stats = toDashboardStats(await getDashboardSummary('company-1', { now }))
+
+    expect(stats).toMatchObject({
+      totalJobs: 3,
+      activeJobs: 2,
+      totalApplications: 5,
+      pendingApplications: 1,
+      reviewingApplications: 2,
+      shortlistedApplications: 0,
+      interviewScheduled: 0,
+      accepted: 1,
+      rejected: 1,
+      newApplicationsThisWeek: 2,
+    })
+  })
+
+  it('applies drift as a delta and prunes expired day buckets', async () => {
+    prisma.$queryRaw.mockResolvedValue([{ companyId: 'company-1' }, { companyId: 'company-1' }, { companyId: 'company-2' }])
+    prisma.$executeRaw.mockResolvedValue(4)
+
+    const result = await reconcileDashboardCounters({ now })
+
+    expect(result).toEqual({ processed: 3, companies: 2, pruned: 4 })
+    expect(sqlOf(prisma.$queryRaw.mock.calls[0])).toContain('"count" = c."count" + EXCLUDED."count"')
+    // 8 tracked days: one more than the dashboard reads
+    expect(prisma.$executeRaw.mock.calls[0]).toContain('2026-10-11')
+  })
+})
@@ -0,0 +1,121 @@
+import { beforeEach, describe, expect, it, vi } from 'vitest'
+
+vi.mock('@/lib/prisma', () => ({
+  prisma: {
+    $queryRaw: vi.fn(),
+    jobs: { findMany: vi.fn(), findFirst: vi.fn() },
+    companies: { findMany: vi.fn(), findFirst: vi.fn() },
+    news: { findMany: vi.fn(), findFirst: vi.fn() },
+  },
+}))
+
+vi.mock('@/lib/logger', () => ({
+  logError: vi.fn(),
+}))
+
+import { prisma } from '@/lib/prisma'
+import { createMemoryStore, setCacheStore } from '@/lib/cache'
+import {
+  escapeXml,
+  getSitemapManifest,
+  getSitemapShard,
+  MAX_SHARD_URLS,
+  renderSitemapIndex,
+  sitemapResponse,
+} from '@/lib/sitemap'
+
+const monthRow = (month, lastModified, count) => ({ month, lastModified: new Date(lastModified), count })
+
+describe('Sitemap', () => {
+  beforeEach(() => {
+    vi.clearAllMocks()
+    setCacheStore(createMemoryStore())
+    prisma.$queryRaw
+      .mockResolvedValueOnce([monthRow('2026-09', '2026-09-30T10:00:00Z', 2), monthRow('2026-10', '2026-10-17T08:00:00Z', 1)])
+      .mockResolvedValueOnce([monthRow('2026-01', '2026-02-01T00:00:00Z', 4)])
+      .mockResolvedValueOnce([])
+  })
+
+  it('lists one shard per section and month', async () => {
+    const manifest = await getSitemapManifest()
+    const xml = renderSitemapIndex(manifest)
+
+    expect(manifest.map(shard => shard.name)).toEqual(['pages', 'jobs-2026-09', 'jobs-2026-10', 'companies-2026-01'])
+    expect(xml).toContain('<sitemapindex')
+    expect(xml).toContain('/sitemaps/jobs-2026-10.xml</loc><lastmod>2026-10-17T08:00:00.000Z</lastmod>')
+  })
+
+  it('iterates a shard by id until a short batch', async () => {
+    const rows = count => Array.from({ length: count }, (_, i) => ({
+      id: `job-${String(i).padStart(4, '0')}`,
+      slug: `job-${i}`,
+      updatedAt: new Date('2026-09-30T10:00:00Z'),
+    }))
+    prisma.jobs.findMany.mockResolvedValueOnce(rows(1000)).mockResolvedValueOnce(rows(2))
+
+    const shard = await getSitemapShard('jobs-2026-09')
+    const xml = await shard.load()
+
+    expect(prisma.jobs.findMany).toHaveBeenCalledTimes(2)
+    expect(prisma.jobs.findMany.mock.calls[0][0].where.createdAt).toEqual({
+      gte: new Date('2026-09-01T00:00:00Z'),
+      lt: new Date('2026-10-01T00:00:00Z'),
+    })
+    expect(prisma.jobs.findMany.mock.calls[1][0].where.id).toEqual({ gt: 'job-0999' })
+    expect(xml.match(/<url>/g)).toHaveLength(1002)
+
+    // Same version is served from the cache
+    await (await getSitemapShard('jobs-2026-09')).load()
+    expect(prisma.jobs.findMany).toHaveBeenCalledTimes(2)
+  })
+
+  it('splits months over the URL limit into numbered parts', async () => {
+    prisma.$queryRaw.mockReset()
+    prisma.$queryRaw
+      .mockResolvedValueOnce([monthRow('2026-10', '2026-10-17T08:00:00Z', 120000)])
+      .mockResolvedValueOnce([])
+      .mockResolvedValueOnce([])
+
+    const manifest = await getSitemapManifest()
+    expect(manifest.map(shard => shard.name)).toEqual(['pages', 'jobs-2026-10', 'jobs-2026-10-2', 'jobs-2026-10-3'])
+    expect(renderSitemapIndex(manifest)).toContain('/sitemaps/jobs-2026-10-3.xml</loc>')
+
+    prisma.jobs.findFirst.mockResolvedValueOnce({ id: 'job-099999' })
+    prisma.jobs.findMany.mockResolvedValueOnce([{ id: 'job-100000', slug: 'job-100000', updatedAt: new Date('2026-10-17T08:00:00Z') }])
+
+    const xml = await (await getSitemapShard('jobs-2026-10-3')).load()
+
+    expect(prisma.jobs.findFirst.mock.calls[0][0]).toMatchObject({ orderBy: { id: 'asc' }, skip: 2 * MAX_SHARD_URLS - 1 })
+    expect(prisma.jobs.findMany.mock.calls[0][0].where.id).toEqual({ gt: 'job-099999' })
+    expect(xml.match(/<url>/g)).toHaveLength(1)
+  })
+
+  it('stops a part at the URL limit', async () => {
+    const batch = Array.from({ length: 1000 }, (_, i) => ({ id: `job-${i}`, slug: `job-${i}`, updatedAt: new Date('2026-09-30T10:00:00Z') }))
+    prisma.jobs.findMany.mockResolvedValue(batch)
+
+    const xml = await (await getSitemapShard('jobs-2026-09')).load()
+
+    expect(prisma.jobs.findMany).toHaveBeenCalledTimes(MAX_SHARD_URLS / 1000)
+    expect(xml.match(/<url>/g)).toHaveLength(MAX_SHARD_URLS)
+    prisma.jobs.findMany.mockReset()
+  })
+
+  it('returns null for unknown shards', async () => {
+    expect(await getSitemapShard('jobs-2020-01')).toBeNull()
+  })
+
+  it('answers 304 for a matching ETag without building the body', async () => {
+    const load = vi.fn()
+    const request = new Request('http://localhost/sitemap.xml', { headers: { 'If-None-Match': '"v1"' } })
+
+    const response = await sitemapResponse(request, { etag: '"v1"', lastModified: '2026-10-17T08:00:00.000Z', load })
+
+    expect(response.status).toBe(304)
+    expect(load).not.toHaveBeenCalled()
+  })
+
+  it('escapes XML in locations', () => {
+    expect(escapeXml('/jobs/a&b<c>')).toBe('/jobs/a&amp;b&lt;c&gt;')
+  })
+})
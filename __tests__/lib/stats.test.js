@@ -0,0 +1,85 @@
+import { beforeEach, describe, expect, it, vi } from 'vitest'
+
+vi.mock('@/lib/prisma', () => ({
+  prisma: {
+    $queryRaw: vi.fn(),
+    $executeRaw: vi.fn(),
+    jobs: { count: vi.fn() },
+    daily_stats: { aggregate: vi.fn() },
+  },
+}))
+
+vi.mock('@/lib/logger', () => ({
+  logError: vi.fn(),
+}))
+
+import { prisma } from '@/lib/prisma'
+import { createMemoryStore, invalidateCacheTags, setCacheStore, CacheTag } from '@/lib/cache'
+import { getJobTotals, getMonthlyJobCounts, refreshDailyStats } from '@/lib/stats'
+
+const sqlOf = call => call[0].join('?')
+
+describe('Stats', () => {
+  beforeEach(() => {
+    vi.clearAllMocks()
+    setCacheStore(createMemoryStore())
+  })
+
+  it('zero-fills the monthly job series, oldest month first', async () => {
+    prisma.$queryRaw.mockResolvedValue([
+      { month: '2026-06', count: 4 },
+      { month: '2026-10', count: 2 },
+    ])
+
+    const series = await getMonthlyJobCounts({ months: 6, now: new Date('2026-10-18T10:00:00Z') })
+
+    expect(series).toEqual([
+      { month: '2026-05', count: 0 },
+      { month: '2026-06', count: 4 },
+      { month: '2026-07', count: 0 },
+      { month: '2026-08', count: 0 },
+      { month: '2026-09', count: 0 },
+      { month: '2026-10', count: 2 },
+    ])
+    // Rolled-up days plus the live tail in one round-trip
+    expect(prisma.$queryRaw).toHaveBeenCalledTimes(1)
+    expect(sqlOf(prisma.$queryRaw.mock.calls[0])).toContain('daily_stats')
+  })
+
+  it('caches totals until a job write invalidates them', async () => {
+    prisma.$queryRaw.mockResolvedValue([{ active: 3, pending: 1 }])
+    prisma.jobs.count.mockResolvedValue(2)
+
+    await getJobTotals()
+    const totals = await getJobTotals()
+    expect(totals).toEqual({ active: 3, pending: 1, public: 2 })
+    expect(prisma.$queryRaw).toHaveBeenCalledTimes(1)
+
+    await invalidateCacheTags(CacheTag.JOBS)
+    await getJobTotals()
+    expect(prisma.$queryRaw).toHaveBeenCalledTimes(2)
+  })
+
+  it('backfills closed days on an empty rollup', async () => {
+    prisma.daily_stats.aggregate.mockResolvedValue({ _max: { day: null } })
+    prisma.$executeRaw.mockResolvedValue(400)
+
+    const result = await refreshDailyStats({ now: new Date('2026-10-18T10:00:00Z') })
+
+    expect(result).toEqual({
+      processed: 400,
+      from: '2025-09-13T00:00:00.000Z',
+      to: '2026-10-18T00:00:00.000Z',
+    })
+  })
+
+  it('recomputes only the last stored days afterwards', async () => {
+    prisma.daily_stats.aggregate.mockResolvedValue({ _max: { day: new Date('2026-10-17T00:00:00Z') } })
+    prisma.$executeRaw.mockResolvedValue(3)
+
+    const result = await refreshDailyStats({ now: new Date('2026-10-18T10:00:00Z') })
+
+    expect(result.from).toBe('2026-10-15T00:00:00.000Z')
+    expect(result.processed).toBe(3)
+  })
+})
@@ -0,0 +1,154 @@
+import { readdirSync, readFileSync } from 'fs'
+import path from 'path'
+import { beforeEach, describe, expect, it, vi } from 'vitest'
+
+const { warn } = vi.hoisted(() => ({ warn: vi.fn() }))
+
+vi.mock('@/lib/logger', () => ({
+  createLogger: () => ({ warn, error: vi.fn() }),
+  logError: vi.fn(),
+}))
+
+import { createCollectedCounter, createCounter, createHistogram, renderMetrics, resetMetrics } from '@/lib/metrics'
+import {
+  getRequestTelemetry,
+  queryTelemetryExtension,
+  withTelemetry,
+} from '@/lib/telemetry'
+
+const { $allOperations } = queryTelemetryExtension.query
+
+function fakeResponse(status = 200) {
+  const headers = new Map()
+  return { status, headers: { append: (name, value) => headers.set(name, value), get: name => headers.get(name) } }
+}
+
+// Stand-in for a Prisma operation taking `ms` on the clock
+function operation(model, name, ms) {
+  return $allOperations({
+    model,
+    operation: name,
+    args: {},
+    query: async () => {
+      vi.advanceTimersByTime(ms)
+      return []
+    },
+  })
+}
+
+describe('Request telemetry', () => {
+  beforeEach(() => {
+    vi.clearAllMocks()
+    vi.useFakeTimers({ toFake: ['performance'] })
+    resetMetrics()
+  })
+
+  it('counts the queries of each request and reports them in Server-Timing', async () => {
+    const handler = withTelemetry('/api/test', async () => {
+      await operation('jobs', 'findMany', 12)
+      await operation(undefined, '$queryRaw', 3)
+      expect(getRequestTelemetry()).toMatchObject({ route: '/api/test', queries: 2 })
+      return fakeResponse()
+    })
+
+    const response = await handler({ method: 'GET' })
+
+    expect(response.headers.get('Server-Timing')).toMatch(/^db;dur=15\.0;desc="2 queries", total;dur=\d+\.\d$/)
+    const metrics = renderMetrics()
+    expect(metrics).toContain('http_request_db_queries_bucket{route="/api/test",le="2"} 1')
+    expect(metrics).toContain('db_query_duration_seconds_count{model="raw",operation="$queryRaw"} 1')
+    expect(metrics).toContain('http_request_duration_seconds_count{route="/api/test",method="GET",status="200"} 1')
+  })
+
+  it('keeps concurrent requests apart', async () => {
+    const handler = withTelemetry('/api/test', async ({ queries }) => {
+      for (let i = 0; i < queries; i++) {
+        await Promise.resolve()
+        await operation('jobs', 'count', 1)
+      }
+      return fakeResponse()
+    })
+
+    const [a, b] = await Promise.all([handler({ method: 'GET', queries: 1 }), handler({ method: 'GET', queries: 3 })])
+
+    expect(a.headers.get('Server-Timing')).toContain('desc="1 queries"')
+    expect(b.headers.get('Server-Timing')).toContain('desc="3 queries"')
+  })
+
+  it('logs slow queries without their arguments', async () => {
+    await withTelemetry('/api/slow', async () => {
+      await operation('applications', 'findMany', 500)
+      return fakeResponse()
+    })({ method: 'GET' })
+
+    expect(warn).toHaveBeenCalledWith(
+      { type: 'slow_query', model: 'applications', operation: 'findMany', durationMs: 500, route: '/api/slow' },
+      'Slow database query'
+    )
+    expect(renderMetrics()).toContain('db_slow_queries_total{model="applications",operation="findMany"} 1')
+  })
+
+  it('records thrown handlers as 500s', async () => {
+    const handler = withTelemetry('/api/broken', async () => {
+      throw new Error('boom')
+    })
+
+    await expect(handler({ method: 'POST' })).rejects.toThrow('boom')
+    expect(renderMetrics()).toContain('http_request_duration_seconds_count{route="/api/broken",method="POST",status="500"} 1')
+  })
+})
+
+describe('Metrics registry', () => {
+  beforeEach(() => {
+    vi.useRealTimers()
+    resetMetrics()
+  })
+
+  it('renders cumulative histogram buckets', () => {
+    const histogram = createHistogram({ name: 'test_duration_seconds', help: 'Test', labelNames: ['kind'], buckets: [0.1, 1] })
+    histogram.observe({ kind: 'a' }, 0.05)
+    histogram.observe({ kind: 'a' }, 0.5)
+    histogram.observe({ kind: 'a' }, 5)
+
+    const lines = renderMetrics().split('\n')
+    expect(lines).toContain('# TYPE test_duration_seconds histogram')
+    expect(lines).toContain('test_duration_seconds_bucket{kind="a",le="0.1"} 1')
+    expect(lines).toContain('test_duration_seconds_bucket{kind="a",le="1"} 2')
+    expect(lines).toContain('test_duration_seconds_bucket{kind="a",le="+Inf"} 3')
+    expect(lines).toContain('test_duration_seconds_count{kind="a"} 3')
+  })
+
+  it('returns the existing metric for a repeated name and escapes label values', () => {
+    const first = createCounter({ name: 'test_events_total', help: 'Test', labelNames: ['path'] })
+    const second = createCounter({ name: 'test_events_total', help: 'Test', labelNames: ['path'] })
+    expect(second).toBe(first)
+
+    first.inc({ path: 'a"b\\c' })
+    expect(renderMetrics()).toContain('test_events_total{path="a\\"b\\\\c"} 1')
+  })
+
+  it('types collected counters as counters', () => {
+    let hits = 3
+    createCollectedCounter({
+      name: 'test_hits_total',
+      help: 'Test',
+      collect: () => [{ labels: { result: 'hit' }, value: hits }]
+    })
+    hits = 5
+
+    const lines = renderMetrics().split('\n')
+    expect(lines).toContain('# TYPE test_hits_total counter')
+    expect(lines).toContain('test_hits_total{result="hit"} 5')
+  })
+
+  it('wraps every API route handler', () => {
+    const unwrapped = ['app/api/health/metrics/route.js', 'app/api/interviews/schedule/route.js']
+    const routes = readdirSync('app/api', { recursive: true })
+      .filter(file => file.endsWith('route.js'))
+      .map(file => path.join('app/api', file))
+      .filter(file => !unwrapped.includes(file))
+
+    const plain = routes.filter(file => /^export (async )?function (GET|POST|PUT|PATCH|DELETE)\b/m.test(readFileSync(file, 'utf8')))
+    expect(plain).toEqual([])
+  })
+})
@@ -2,20 +2,88 @@ import { NextResponse } from 'next/server'
 import { prisma } from '@/lib/prisma'
 import { createErrorResponse } from '@/lib/errorHandler'
 import { requireAdmin } from '@/lib/authHelper'
+import { validateQuery } from '@/lib/validations'
+import { createCsvStream } from '@/lib/csv'
+import { logError } from '@/lib/logger'
+import { z } from 'zod'
+import { withTelemetry } from '@/lib/telemetry'
 
-// GET /api/admin/audit-logs/export - Export audit logs as CSV
-export async function GET(request) {
+const EXPORT_BATCH_SIZE = 1000
+
+const optionalDate = z.string().optional().refine(
+  v => !v || !Number.isNaN(new Date(v).getTime()),
+  { message: 'Tanggal tidak valid' }
+)
+
+// Query schema
+const auditExportSchema = z.object({
+  action: z.string().optional(),
+  startDate: optionalDate,
+  endDate: optionalDate,
+  gzip: z.enum(['true', 'false', '1', '0']).optional().transform(v => v === 'true' || v === '1')
+})
+
+const CSV_HEADERS = ['ID', 'Timestamp', 'Action', 'User ID', 'Role', 'Target Type', 'Target ID', 'IP Address', 'Changes']
+
+/**
+ * Walk audit_logs newest first in keyset batches over (createdAt, id)
+ */
+async function* auditLogBatches(where) {
+  let last = null
+
+  while (true) {
+    const logs = await prisma.audit_logs.findMany({
+      where: last
+        ? {
+            AND: [
+              where,
+              {
+                OR: [
+                  { createdAt: { lt: last.createdAt } },
+                  { createdAt: last.createdAt, id: { lt: last.id } }
+                ]
+              }
+            ]
+          }
+        : where,
+      orderBy: [{ createdAt: 'desc' }, { id: 'desc' }],
+      take: EXPORT_BATCH_SIZE
+    })
+
+    if (logs.length === 0) return
+
+    yield logs.map(log => [
+      log.id,
+      log.createdAt,
+      log.action,
+      log.userId,
+      log.userRole,
+      log.targetType,
+      log.targetId,
+      log.ipAddress,
+      log.changes ? JSON.stringify(log.changes) : ''
+    ])
+
+    if (logs.length < EXPORT_BATCH_SIZE) return
+    last = logs[logs.length - 1]
+  }
+}
+
+// GET /api/admin/audit-logs/export - Stream audit logs as CSV (optionally gzipped)
+async function handleGET(request) {
   try {
     const auth = await requireAdmin(request)
     if (auth.error) {
       return NextResponse.json({ error: auth.error }, { status: auth.status })
     }
 
-    // Get query params for filters
-    const { searchParams } = new URL(request.url)
-    const action = searchParams.get('action')
-    const startDate = searchParams.get('startDate')
-    const endDate = searchParams.get('endDate')
+    // Validate query
+    const validation = validateQuery(request, auditExportSchema)
+    if (!validation.success) {
+      return validation.response
+    }
+
+    const { action, startDate, endDate, gzip } = validation.data
 
     // Build where clause
     const where = {}
@@ -28,47 +96,31 @@ export async function GET(request) {
       if (endDate) where.createdAt.lte = new Date(endDate)
     }
 
-    // Get logs (limit to 10000 for performance)
-    const logs = await prisma.audit_logs.findMany({
-      where,
-      orderBy: { createdAt: 'desc' },
-      take: 10000
+    // Headers are already sent once streaming starts, so a failing batch
+    // can only abort the download and be logged
+    const body = createCsvStream(CSV_HEADERS, auditLogBatches(where), {
+      gzip,
+      onError: error => logError(error, { context: 'audit-logs.export' })
     })
 
-    // Generate CSV
-    const headers = ['ID', 'Timestamp', 'Action', 'User ID', 'Role', 'Target Type', 'Target ID', 'IP Address', 'Changes']
-    
-    const csvRows = [
-      headers.join(','),
-      ...logs.map(log => [
-        log.id,
-        log.createdAt.toISOString(),
-        log.action,
-        log.userId || '',
-        log.userRole || '',
-        log.targetType || '',
-        log.targetId || '',
-        log.ipAddress || '',
-        log.changes ? JSON.stringify(log.changes).replace(/,/g, ';') : ''
-      ].map(v => `"${v}"`).join(','))
-    ]
-
-    const csv = csvRows.join('\n')
-
-    // Return as CSV file
-    return new NextResponse(csv, {
+    const filename = `audit-logs-${new Date().toISOString().split('T')[0]}.csv${gzip ? '.gz' : ''}`
+
+    return new Response(body, {
       status: 200,
       headers: {
-        'Content-Type': 'text/csv',
-        'Content-Disposition': `attachment; filename="audit-logs-${new Date().toISOString().split('T')[0]}.csv"`
+        'Content-Type': gzip ? 'application/gzip' : 'text/csv; charset=utf-8',
+        'Content-Disposition': `attachment; filename="${filename}"`,
+        'Cache-Control': 'no-store'
       }
     })
 
   } catch (error) {
     console.error('Error exporting audit logs:', error)
-    return NextResponse.json({ 
+    return NextResponse.json({
       error: 'Failed to export audit logs',
-      ...createErrorResponse('Terjadi kesalahan', error) 
+      ...createErrorResponse('Terjadi kesalahan', error)
     }, { status: 500 })
   }
 }
+
+export const GET = withTelemetry('/api/admin/audit-logs/export', handleGET)
@@ -4,6 +4,7 @@ import { createErrorResponse } from '@/lib/errorHandler'
 import { requireAdmin } from '@/lib/authHelper'
 import { validateQuery } from '@/lib/validations'
 import { z } from 'zod'
+import { withTelemetry } from '@/lib/telemetry'
 
 // Query schema
 const auditQuerySchema = z.object({
@@ -18,7 +19,7 @@ const auditQuerySchema = z.object({
 })
 
 // GET /api/admin/audit-logs - Get audit logs with filters
-export async function GET(request) {
+async function handleGET(request) {
   try {
     const auth = await requireAdmin(request)
     if (auth.error) {
@@ -105,3 +106,5 @@ export async function GET(request) {
     }, { status: 500 })
   }
 }
+
+export const GET = withTelemetry('/api/admin/audit-logs', handleGET)
@@ -1,8 +1,14 @@
 import { NextResponse } from 'next/server'
-import { prisma } from '@/lib/prisma'
 import { getTokenFromRequest, verifyToken } from '@/lib/auth'
+import {
+    getCompanyTotals,
+    getJobseekerTotals,
+    getJobTotals,
+    getMonthlyJobCounts
+} from '@/lib/stats'
+import { withTelemetry } from '@/lib/telemetry'
 
-export async function GET(request) {
+async function handleGET(request) {
     try {
         // Verify admin
         const token = getTokenFromRequest(request)
@@ -16,64 +22,17 @@ export async function GET(request) {
             return NextResponse.json({ error: 'Unauthorized' }, { status: 401 })
         }
 
-        // Get current date and calculate 6 months ago
-        const now = new Date()
-        const sixMonthsAgo = new Date(now.getFullYear(), now.getMonth() - 5, 1)
-
-        // Run all queries in parallel for better performance
-        const [
-            // Monthly jobs using groupBy for efficiency
-            jobs,
-            // Employment stats
-            totalJobseekers,
-            employedCount,
-            lookingCount,
-            // New stats
-            verifiedCompanies,
-            activeJobs,
-            pendingJobs
-        ] = await Promise.all([
-            // Get jobs for last 6 months
-            prisma.jobs.findMany({
-                where: {
-                    createdAt: { gte: sixMonthsAgo }
-                },
-                select: { createdAt: true }
-            }),
-            // Jobseeker Stats
-            prisma.jobseekers.count(),
-            prisma.jobseekers.count({ where: { isEmployed: true } }),
-            prisma.jobseekers.count({ where: { isLookingForJob: true } }),
-            
-            // New Dashboard Stats
-            prisma.companies.count({ where: { status: 'VERIFIED' } }),
-            prisma.jobs.count({ where: { status: 'ACTIVE' } }),
-            prisma.jobs.count({ where: { status: 'PENDING' } })
+        // Aggregated in SQL (monthly series from the daily_stats rollup)
+        const [monthlyJobs, jobseekers, companies, jobs] = await Promise.all([
+            getMonthlyJobCounts({ months: 6 }),
+            getJobseekerTotals(),
+            getCompanyTotals(),
+            getJobTotals()
         ])
 
-        // Group jobs by month
-        const monthlyJobs = {}
-        const months = []
-        
-        for (let i = 5; i >= 0; i--) {
-            const date = new Date(now.getFullYear(), now.getMonth() - i, 1)
-            const monthKey = `${date.getFullYear()}-${String(date.getMonth() + 1).padStart(2, '0')}`
-            const monthName = date.toLocaleDateString('id-ID', { month: 'short' })
-            months.push({ key: monthKey, name: monthName })
-            monthlyJobs[monthKey] = 0
-        }
-
-        jobs.forEach(job => {
-            const date = new Date(job.createdAt)
-            const monthKey = `${date.getFullYear()}-${String(date.getMonth() + 1).padStart(2, '0')}`
-            if (monthlyJobs.hasOwnProperty(monthKey)) {
-                monthlyJobs[monthKey]++
-            }
-        })
-
-        const monthlyJobsData = months.map(m => ({
-            month: m.name,
-            count: monthlyJobs[m.key]
+        const monthlyJobsData = monthlyJobs.map(({ month, count }) => ({
+            month: new Date(`${month}-01T00:00:00Z`).toLocaleDateString('id-ID', { month: 'short', timeZone: 'UTC' }),
+            count
         }))
 
         return NextResponse.json({
@@ -81,18 +40,18 @@ export async function GET(request) {
             data: {
                 monthlyJobs: monthlyJobsData,
                 employment: {
-                    employed: employedCount,
-                    unemployed: totalJobseekers - employedCount
+                    employed: jobseekers.employed,
+                    unemployed: jobseekers.total - jobseekers.employed
                 },
                 looking: {
-                    looking: lookingCount,
-                    notLooking: totalJobseekers - lookingCount
+                    looking: jobseekers.looking,
+                    notLooking: jobseekers.total - jobseekers.looking
                 },
-                totalJobseekers,
-                totalJobs: jobs.length,
-                verifiedCompanies,
-                activeJobs,
-                pendingJobs
+                totalJobseekers: jobseekers.total,
+                totalJobs: monthlyJobs.reduce((sum, { count }) => sum + count, 0),
+                verifiedCompanies: companies.verified,
+                activeJobs: jobs.active,
+                pendingJobs: jobs.pending
             }
         })
 
@@ -104,3 +63,5 @@ export async function GET(request) {
         }, { status: 500 })
     }
 }
+
+export const GET = withTelemetry('/api/admin/chart-stats', handleGET)
@@ -5,8 +5,10 @@ import { validateCSRFToken, csrfErrorResponse } from '@/lib/csrf'
 import { validateBody } from '@/lib/validations'
 import { rejectCompanySchema } from '@/lib/validations/admin'
 import { createAuditLog, AuditAction } from '@/lib/audit'
+import { invalidateCacheTags, CacheTag } from '@/lib/cache'
+import { withTelemetry } from '@/lib/telemetry'
 
-export async function PATCH(request, context) {
+async function handlePATCH(request, context) {
     try {
         // CSRF validation
         if (!validateCSRFToken(request)) {
@@ -70,6 +72,8 @@ export async function PATCH(request, context) {
             request
         })
 
+        await invalidateCacheTags(CacheTag.JOBS, CacheTag.COMPANIES)
+
         return NextResponse.json({
             success: true,
             message: 'Company rejected',
@@ -85,3 +89,5 @@ export async function PATCH(request, context) {
         )
     }
 }
+
+export const PATCH = withTelemetry('/api/admin/companies/[id]/reject', handlePATCH)
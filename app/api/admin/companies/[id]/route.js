@@ -2,8 +2,9 @@ import { NextResponse } from 'next/server'
 import { prisma } from '@/lib/prisma'
 import { requireAdmin } from '@/lib/authHelper'
 import { createErrorResponse } from '@/lib/errorHandler'
+import { withTelemetry } from '@/lib/telemetry'
 
-export async function GET(request, { params }) {
+async function handleGET(request, { params }) {
     try {
         const auth = await requireAdmin(request)
 
@@ -130,3 +131,5 @@ export async function GET(request, { params }) {
         )
     }
 }
+
+export const GET = withTelemetry('/api/admin/companies/[id]', handleGET)
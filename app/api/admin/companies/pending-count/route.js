@@ -1,8 +1,9 @@
 import { NextResponse } from 'next/server'
 import { prisma } from '@/lib/prisma'
 import { requireAdmin } from '@/lib/authHelper'
+import { withTelemetry } from '@/lib/telemetry'
 
-export async function GET(request) {
+async function handleGET(request) {
     try {
         const auth = await requireAdmin(request)
         
@@ -32,3 +33,5 @@ export async function GET(request) {
         )
     }
 }
+
+export const GET = withTelemetry('/api/admin/companies/pending-count', handleGET)
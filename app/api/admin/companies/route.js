@@ -2,13 +2,13 @@ import { NextResponse } from 'next/server'
 import { prisma } from '@/lib/prisma'
 import { createErrorResponse } from '@/lib/errorHandler'
 import { requireAdmin } from '@/lib/authHelper'
-import { adminLimiter, getIP, rateLimitResponse } from '@/lib/rateLimit'
+import { adminLimiter, limitRequest, rateLimitResponse } from '@/lib/rateLimit'
+import { withTelemetry } from '@/lib/telemetry'
 
-export async function GET(request) {
+async function handleGET(request) {
     try {
         // Rate limiting - 120 requests per minute for admin
-        const ip = getIP(request)
-        const { success, reset } = await adminLimiter.limit(ip)
+        const { success, reset } = await limitRequest(request, adminLimiter)
         if (!success) {
             return rateLimitResponse(reset)
         }
@@ -154,3 +154,5 @@ export async function GET(request) {
         )
     }
 }
+
+export const GET = withTelemetry('/api/admin/companies', handleGET)
@@ -5,9 +5,10 @@ import { requireAdmin } from '@/lib/authHelper'
 import { serializeBigInt } from '@/lib/utils'
 import { validateBody } from '@/lib/validations'
 import { processContractSchema } from '@/lib/validations/admin'
+import { withTelemetry } from '@/lib/telemetry'
 
 // GET /api/admin/contracts/[id] - Get contract registration detail
-export async function GET(request, { params }) {
+async function handleGET(request, { params }) {
   try {
     const auth = await requireAdmin(request)
     if (auth.error) {
@@ -92,7 +93,7 @@ export async function GET(request, { params }) {
 }
 
 // PATCH /api/admin/contracts/[id] - Approve or reject contract registration
-export async function PATCH(request, { params }) {
+async function handlePATCH(request, { params }) {
   try {
     const auth = await requireAdmin(request)
     if (auth.error) {
@@ -168,3 +169,6 @@ export async function PATCH(request, { params }) {
     }, { status: 500 })
   }
 }
+
+export const GET = withTelemetry('/api/admin/contracts/[id]', handleGET)
+export const PATCH = withTelemetry('/api/admin/contracts/[id]', handlePATCH)
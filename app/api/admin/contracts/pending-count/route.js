@@ -1,9 +1,10 @@
 import { NextResponse } from 'next/server'
 import { prisma } from '@/lib/prisma'
 import { requireAdmin } from '@/lib/authHelper'
+import { withTelemetry } from '@/lib/telemetry'
 
 // GET /api/admin/contracts/pending-count - Get count of pending contracts
-export async function GET(request) {
+async function handleGET(request) {
   try {
     const auth = await requireAdmin(request)
     if (auth.error) {
@@ -22,3 +23,5 @@ export async function GET(request) {
     return NextResponse.json({ error: 'Internal server error' }, { status: 500 })
   }
 }
+
+export const GET = withTelemetry('/api/admin/contracts/pending-count', handleGET)
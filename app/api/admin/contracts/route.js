@@ -3,9 +3,10 @@ import { prisma } from '@/lib/prisma'
 import { createErrorResponse } from '@/lib/errorHandler'
 import { requireAdmin } from '@/lib/authHelper'
 import { serializeBigInt } from '@/lib/utils'
+import { withTelemetry } from '@/lib/telemetry'
 
 // GET /api/admin/contracts - Get all contract registrations for admin review
-export async function GET(request) {
+async function handleGET(request) {
   try {
     const auth = await requireAdmin(request)
     if (auth.error) {
@@ -128,3 +129,5 @@ export async function GET(request) {
     }, { status: 500 })
   }
 }
+
+export const GET = withTelemetry('/api/admin/contracts', handleGET)
@@ -1,8 +1,9 @@
 import { NextResponse } from 'next/server'
 import { getCurrentUser } from '@/lib/authHelper'
 import { prisma } from '@/lib/prisma'
+import { withTelemetry } from '@/lib/telemetry'
 
-export async function GET(request, { params }) {
+async function handleGET(request, { params }) {
     try {
         const auth = await getCurrentUser(request)
         
@@ -94,3 +95,5 @@ export async function GET(request, { params }) {
         )
     }
 }
+
+export const GET = withTelemetry('/api/admin/jobs/[id]', handleGET)
@@ -3,8 +3,10 @@ import { prisma } from '@/lib/prisma'
 import { createErrorResponse } from '@/lib/errorHandler'
 import { getTokenFromRequest, verifyToken } from '@/lib/auth'
 import { validateCSRFToken, csrfErrorResponse } from '@/lib/csrf'
+import { invalidateCacheTags, CacheTag } from '@/lib/cache'
+import { withTelemetry } from '@/lib/telemetry'
 
-export async function GET(request) {
+async function handleGET(request) {
     try {
         // Verify admin
         const token = getTokenFromRequest(request)
@@ -186,7 +188,7 @@ export async function GET(request) {
     }
 }
 
-export async function PATCH(request) {
+async function handlePATCH(request) {
     try {
         // CSRF validation
         if (!validateCSRFToken(request)) {
@@ -236,6 +238,8 @@ export async function PATCH(request) {
             data: updateData
         })
 
+        await invalidateCacheTags(CacheTag.JOBS)
+
         return NextResponse.json({
             success: true,
             data: updatedJob
@@ -248,3 +252,6 @@ export async function PATCH(request) {
         )
     }
 }
+
+export const GET = withTelemetry('/api/admin/jobs', handleGET)
+export const PATCH = withTelemetry('/api/admin/jobs', handlePATCH)
@@ -1,8 +1,9 @@
 import { NextResponse } from 'next/server'
 import { prisma } from '@/lib/prisma'
 import { requireAdmin } from '@/lib/authHelper'
+import { withTelemetry } from '@/lib/telemetry'
 
-export async function GET(request, { params }) {
+async function handleGET(request, { params }) {
     try {
         const auth = await requireAdmin(request)
 
@@ -172,3 +173,5 @@ export async function GET(request, { params }) {
         )
     }
 }
+
+export const GET = withTelemetry('/api/admin/jobseekers/[id]', handleGET)
@@ -1,8 +1,9 @@
 import { NextResponse } from 'next/server'
-import { prisma } from '@/lib/prisma'
 import { requireAdmin } from '@/lib/authHelper'
+import { getApplicationTotals, getJobseekerTotals } from '@/lib/stats'
+import { withTelemetry } from '@/lib/telemetry'
 
-export async function GET(request) {
+async function handleGET(request) {
     try {
         // Authenticate admin
         const auth = await requireAdmin(request)
@@ -14,48 +15,24 @@ export async function GET(request) {
             )
         }
 
-        // Get statistics in parallel
-        const [
-            totalJobseekers,
-            totalApplications,
-            acceptedApplications,
-            rejectedApplications,
-            pendingApplications,
-            employedCount,
-            lookingForJobCount
-        ] = await Promise.all([
-            prisma.jobseekers.count(),
-            prisma.applications.count(),
-            prisma.applications.count({ where: { status: 'ACCEPTED' } }),
-            prisma.applications.count({ where: { status: 'REJECTED' } }),
-            prisma.applications.count({
-                where: {
-                    status: {
-                        in: ['PENDING', 'REVIEWING', 'SHORTLISTED', 'INTERVIEW_SCHEDULED', 'INTERVIEW_COMPLETED']
-                    }
-                }
-            }),
-            // Count jobseekers who marked themselves as employed
-            prisma.jobseekers.count({ where: { isEmployed: true } }),
-            // Count jobseekers who are still looking for jobs
-            prisma.jobseekers.count({ where: { isLookingForJob: true } })
+        // Shared with the admin dashboard (see lib/stats)
+        const [jobseekers, applications] = await Promise.all([
+            getJobseekerTotals(),
+            getApplicationTotals()
         ])
 
-        const unemployedCount = totalJobseekers - employedCount
-        const notLookingCount = totalJobseekers - lookingForJobCount
-
         return NextResponse.json({
             success: true,
             data: {
-                totalJobseekers,
-                employed: employedCount,
-                unemployed: unemployedCount,
-                lookingForJob: lookingForJobCount,
-                notLooking: notLookingCount,
-                totalApplications,
-                acceptedApplications,
-                rejectedApplications,
-                pendingApplications
+                totalJobseekers: jobseekers.total,
+                employed: jobseekers.employed,
+                unemployed: jobseekers.total - jobseekers.employed,
+                lookingForJob: jobseekers.looking,
+                notLooking: jobseekers.total - jobseekers.looking,
+                totalApplications: applications.total,
+                acceptedApplications: applications.accepted,
+                rejectedApplications: applications.rejected,
+                pendingApplications: applications.pending
             }
         })
 
@@ -66,3 +43,5 @@ export async function GET(request) {
         )
     }
 }
+
+export const GET = withTelemetry('/api/admin/jobseekers/stats', handleGET)
@@ -3,6 +3,8 @@ import { prisma } from '@/lib/prisma'
 import { getTokenFromRequest, verifyToken } from '@/lib/auth'
 import { validateBody } from '@/lib/validations'
 import { updateNewsSchema } from '@/lib/validations/admin'
+import { invalidateCacheTags, CacheTag } from '@/lib/cache'
+import { withTelemetry } from '@/lib/telemetry'
 
 // Helper to generate slug
 function generateSlug(title) {
@@ -15,7 +17,7 @@ function generateSlug(title) {
 }
 
 // GET - Get single news by ID
-export async function GET(request, { params }) {
+async function handleGET(request, { params }) {
     try {
         const token = getTokenFromRequest(request)
         if (!token) {
@@ -50,7 +52,7 @@ export async function GET(request, { params }) {
 }
 
 // PUT - Update news
-export async function PUT(request, { params }) {
+async function handlePUT(request, { params }) {
     try {
         const token = getTokenFromRequest(request)
         if (!token) {
@@ -116,6 +118,8 @@ export async function PUT(request, { params }) {
             data: updateData
         })
 
+        await invalidateCacheTags(CacheTag.NEWS)
+
         return NextResponse.json({
             success: true,
             message: 'News updated successfully',
@@ -129,7 +133,7 @@ export async function PUT(request, { params }) {
 }
 
 // DELETE - Delete news
-export async function DELETE(request, { params }) {
+async function handleDELETE(request, { params }) {
     try {
         const token = getTokenFromRequest(request)
         if (!token) {
@@ -157,6 +161,8 @@ export async function DELETE(request, { params }) {
             where: { id }
         })
 
+        await invalidateCacheTags(CacheTag.NEWS)
+
         return NextResponse.json({
             success: true,
             message: 'News deleted successfully'
@@ -167,3 +173,7 @@ export async function DELETE(request, { params }) {
         return NextResponse.json({ error: 'Internal server error' }, { status: 500 })
     }
 }
+
+export const GET = withTelemetry('/api/admin/news/[id]', handleGET)
+export const PUT = withTelemetry('/api/admin/news/[id]', handlePUT)
+export const DELETE = withTelemetry('/api/admin/news/[id]', handleDELETE)
@@ -4,6 +4,8 @@ import { getTokenFromRequest, verifyToken } from '@/lib/auth'
 import { validateCSRFToken, csrfErrorResponse } from '@/lib/csrf'
 import { validateBody, validateQuery } from '@/lib/validations'
 import { newsQuerySchema, createNewsSchema } from '@/lib/validations/admin'
+import { invalidateCacheTags, CacheTag } from '@/lib/cache'
+import { withTelemetry } from '@/lib/telemetry'
 
 // Helper to generate slug
 function generateSlug(title) {
@@ -16,7 +18,7 @@ function generateSlug(title) {
 }
 
 // GET - Get all news (admin)
-export async function GET(request) {
+async function handleGET(request) {
     try {
         // Verify admin
         const token = getTokenFromRequest(request)
@@ -112,7 +114,7 @@ export async function GET(request) {
 }
 
 // POST - Create news
-export async function POST(request) {
+async function handlePOST(request) {
     try {
         // CSRF validation
         if (!validateCSRFToken(request)) {
@@ -163,6 +165,8 @@ export async function POST(request) {
             }
         })
 
+        await invalidateCacheTags(CacheTag.NEWS)
+
         return NextResponse.json({
             success: true,
             message: 'News created successfully',
@@ -174,3 +178,6 @@ export async function POST(request) {
         return NextResponse.json({ error: 'Internal server error' }, { status: 500 })
     }
 }
+
+export const GET = withTelemetry('/api/admin/news', handleGET)
+export const POST = withTelemetry('/api/admin/news', handlePOST)
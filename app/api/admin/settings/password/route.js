@@ -1,16 +1,17 @@
 import { NextResponse } from "next/server";
 import { prisma } from "@/lib/prisma";
 import { requireAdmin } from "@/lib/authHelper";
-import { authLimiter, getIP, rateLimitResponse } from "@/lib/rateLimit";
+import { authLimiter, limitRequest, rateLimitResponse } from "@/lib/rateLimit";
 import { verifyPassword, hashPassword } from "@/lib/password";
 import { changePasswordSchema } from "@/lib/validations/auth";
+import { invalidatePrincipal } from "@/lib/principalCache";
+import { withTelemetry } from "@/lib/telemetry";
 
 // PUT - Change admin password
-export async function PUT(request) {
+async function handlePUT(request) {
   try {
     // Use auth limiter (more restrictive for password changes)
-    const ip = getIP(request);
-    const { success } = await authLimiter.limit(ip);
+    const { success } = await limitRequest(request, authLimiter);
     if (!success) return rateLimitResponse();
 
     // Verify admin
@@ -63,6 +64,7 @@ export async function PUT(request) {
       where: { id: admin.id },
       data: { password: hashedPassword },
     });
+    await invalidatePrincipal(admin.id);
 
     return NextResponse.json({
       message: "Password berhasil diubah",
@@ -75,3 +77,5 @@ export async function PUT(request) {
     );
   }
 }
+
+export const PUT = withTelemetry("/api/admin/settings/password", handlePUT);
@@ -1,14 +1,15 @@
 import { NextResponse } from "next/server";
 import { prisma } from "@/lib/prisma";
 import { requireAdmin } from "@/lib/authHelper";
-import { adminLimiter, getIP, rateLimitResponse } from "@/lib/rateLimit";
+import { adminLimiter, limitRequest, rateLimitResponse } from "@/lib/rateLimit";
+import { invalidatePrincipal } from "@/lib/principalCache";
+import { withTelemetry } from "@/lib/telemetry";
 
 // PUT - Update admin profile
-export async function PUT(request) {
+async function handlePUT(request) {
   try {
     // Rate limiting
-    const ip = getIP(request);
-    const { success } = await adminLimiter.limit(ip);
+    const { success } = await limitRequest(request, adminLimiter);
     if (!success) return rateLimitResponse();
 
     // Verify admin
@@ -50,6 +51,7 @@ export async function PUT(request) {
         role: true,
       },
     });
+    await invalidatePrincipal(admin.id);
 
     return NextResponse.json({
       message: "Profil berhasil diperbarui",
@@ -63,3 +65,5 @@ export async function PUT(request) {
     );
   }
 }
+
+export const PUT = withTelemetry("/api/admin/settings/profile", handlePUT);
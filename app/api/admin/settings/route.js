@@ -1,14 +1,14 @@
 import { NextResponse } from "next/server";
 import { prisma } from "@/lib/prisma";
 import { requireAdmin } from "@/lib/authHelper";
-import { adminLimiter, getIP, rateLimitResponse, redis } from "@/lib/rateLimit";
+import { adminLimiter, limitRequest, rateLimitResponse, redis } from "@/lib/rateLimit";
+import { withTelemetry } from "@/lib/telemetry";
 
 // GET - Ambil semua settings
-export async function GET(request) {
+async function handleGET(request) {
   try {
     // Rate limiting
-    const ip = getIP(request);
-    const { success } = await adminLimiter.limit(ip);
+    const { success } = await limitRequest(request, adminLimiter);
     if (!success) return rateLimitResponse();
 
     // Verify admin
@@ -39,11 +39,10 @@ export async function GET(request) {
 }
 
 // PUT - Update settings
-export async function PUT(request) {
+async function handlePUT(request) {
   try {
     // Rate limiting
-    const ip = getIP(request);
-    const { success } = await adminLimiter.limit(ip);
+    const { success } = await limitRequest(request, adminLimiter);
     if (!success) return rateLimitResponse();
 
     // Verify admin
@@ -121,3 +120,6 @@ export async function PUT(request) {
     );
   }
 }
+
+export const GET = withTelemetry("/api/admin/settings", handleGET);
+export const PUT = withTelemetry("/api/admin/settings", handlePUT);
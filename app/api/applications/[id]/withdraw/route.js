@@ -4,8 +4,9 @@ import { createErrorResponse } from '@/lib/errorHandler'
 import { cookies } from 'next/headers'
 import { verifyToken } from '@/lib/auth'
 import { validateCSRFToken, csrfErrorResponse } from '@/lib/csrf'
+import { withTelemetry } from '@/lib/telemetry'
 
-export async function PATCH(request, context) {
+async function handlePATCH(request, context) {
     try {
         // CSRF validation
         if (!validateCSRFToken(request)) {
@@ -94,3 +95,5 @@ export async function PATCH(request, context) {
         )
     }
 }
+
+export const PATCH = withTelemetry('/api/applications/[id]/withdraw', handlePATCH)
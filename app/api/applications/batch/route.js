@@ -1,10 +1,11 @@
 import { NextResponse } from 'next/server'
 import { prisma } from '@/lib/prisma'
 import { getCurrentUser } from '@/lib/authHelper'
+import { withTelemetry } from '@/lib/telemetry'
 
 // GET /api/applications/batch?ids=id1,id2,id3
 // Fetch multiple applications by their IDs
-export async function GET(request) {
+async function handleGET(request) {
     try {
         const auth = await getCurrentUser(request)
         if (auth.error) {
@@ -148,3 +149,5 @@ export async function GET(request) {
         return NextResponse.json({ error: 'Failed to fetch applications' }, { status: 500 })
     }
 }
+
+export const GET = withTelemetry('/api/applications/batch', handleGET)
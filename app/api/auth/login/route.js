@@ -4,16 +4,17 @@ import { loginSchema } from '@/lib/validations/auth'
 import { prisma } from '@/lib/prisma'
 import { verifyPassword, hashPassword, needsRehash } from '@/lib/password'
 import { signToken } from '@/lib/auth'
-import { authLimiter, getIP, rateLimitResponse } from '@/lib/rateLimit'
+import { authLimiter, limitRequest, rateLimitResponse } from '@/lib/rateLimit'
 import { generateCSRFToken } from '@/lib/csrf'
+import { invalidatePrincipal } from '@/lib/principalCache'
 import { createAuditLog, AuditAction } from '@/lib/audit'
 import { createErrorResponse } from '@/lib/errorHandler'
+import { withTelemetry } from '@/lib/telemetry'
 
-export async function POST(request) {
+async function handlePOST(request) {
   try {
     // Rate limiting - 5 requests per 15 minutes
-    const ip = getIP(request)
-    const { success, reset } = await authLimiter.limit(ip)
+    const { success, reset } = await limitRequest(request, authLimiter)
     if (!success) {
       return rateLimitResponse(reset)
     }
@@ -100,6 +101,8 @@ export async function POST(request) {
       where: { id: user.id },
       data: { lastLogin: new Date() }
     })
+    // Start the new session from the current account state
+    await invalidatePrincipal(user.id)
 
     // Audit log - successful login
     await createAuditLog({
@@ -192,3 +195,5 @@ export async function POST(request) {
     )
   }
 }
+
+export const POST = withTelemetry('/api/auth/login', handlePOST)
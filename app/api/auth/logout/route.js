@@ -2,8 +2,10 @@ import { NextResponse } from 'next/server'
 import { cookies } from 'next/headers'
 import { createAuditLog, AuditAction } from '@/lib/audit'
 import { getCurrentUser } from '@/lib/authHelper'
+import { invalidatePrincipal } from '@/lib/principalCache'
+import { withTelemetry } from '@/lib/telemetry'
 
-export async function POST(request) {
+async function handlePOST(request) {
   try {
     // Try to get user for audit logging (ignore errors if token expired)
     const { user } = await getCurrentUser(request)
@@ -17,6 +19,7 @@ export async function POST(request) {
         targetId: user.id,
         request
       })
+      await invalidatePrincipal(user.id)
     }
 
     const response = NextResponse.json(
@@ -53,4 +56,6 @@ export async function POST(request) {
       { status: 500 }
     )
   }
-}
\ No newline at end of file
+}
+
+export const POST = withTelemetry('/api/auth/logout', handlePOST)
@@ -1,8 +1,9 @@
 import { NextResponse } from 'next/server'
 import { prisma } from '@/lib/prisma'
 import { getTokenFromRequest, verifyToken } from '@/lib/auth'
+import { withTelemetry } from '@/lib/telemetry'
 
-export async function GET(request) {
+async function handleGET(request) {
   try {
     // Get token from httpOnly cookie, with Authorization header kept only for legacy clients.
     const token = getTokenFromRequest(request)
@@ -132,3 +133,5 @@ export async function GET(request) {
     )
   }
 }
+
+export const GET = withTelemetry('/api/auth/me', handleGET)
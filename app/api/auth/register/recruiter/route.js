@@ -5,13 +5,13 @@ import { registerRecruiterSchema } from '@/lib/validations/auth'
 import { prisma } from '@/lib/prisma'
 import { hashPassword } from '@/lib/password'
 import { v4 as uuidv4 } from 'uuid'
-import { authLimiter, getIP, rateLimitResponse } from '@/lib/rateLimit'
+import { authLimiter, limitRequest, rateLimitResponse } from '@/lib/rateLimit'
+import { withTelemetry } from '@/lib/telemetry'
 
-export async function POST(request) {
+async function handlePOST(request) {
   try {
     // Rate limiting - 5 requests per 15 minutes
-    const ip = getIP(request)
-    const { success, reset } = await authLimiter.limit(ip)
+    const { success, reset } = await limitRequest(request, authLimiter)
     if (!success) {
       return rateLimitResponse(reset)
     }
@@ -174,4 +174,6 @@ export async function POST(request) {
       { status: 500 }
     )
   }
-}
\ No newline at end of file
+}
+
+export const POST = withTelemetry('/api/auth/register/recruiter', handlePOST)
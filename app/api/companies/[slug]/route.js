@@ -1,8 +1,9 @@
 import { NextResponse } from 'next/server'
 import { prisma } from '@/lib/prisma'
 import { openApplicationDeadlineWhere } from '@/lib/jobs/publicFilters'
+import { withTelemetry } from '@/lib/telemetry'
 
-export async function GET(request, { params }) {
+async function handleGET(request, { params }) {
   try {
     const { slug } = await params
     const openDeadlineWhere = openApplicationDeadlineWhere(new Date())
@@ -139,3 +140,5 @@ export async function GET(request, { params }) {
     )
   }
 }
+
+export const GET = withTelemetry('/api/companies/[slug]', handleGET)
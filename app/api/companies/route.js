@@ -1,13 +1,13 @@
 import { NextResponse } from 'next/server'
 import { prisma } from '@/lib/prisma'
-import { publicLimiter, getIP, rateLimitResponse } from '@/lib/rateLimit'
+import { publicLimiter, limitRequest, rateLimitResponse } from '@/lib/rateLimit'
 import { openApplicationDeadlineWhere } from '@/lib/jobs/publicFilters'
+import { withTelemetry } from '@/lib/telemetry'
 
-export async function GET(request) {
+async function handleGET(request) {
   try {
     // Rate limiting - 100 requests per minute
-    const ip = getIP(request)
-    const { success, reset } = await publicLimiter.limit(ip)
+    const { success, reset } = await limitRequest(request, publicLimiter)
     if (!success) {
       return rateLimitResponse(reset)
     }
@@ -137,3 +137,5 @@ export async function GET(request) {
     )
   }
 }
+
+export const GET = withTelemetry('/api/companies', handleGET)
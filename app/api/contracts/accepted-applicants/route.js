@@ -3,9 +3,10 @@ import { prisma } from '@/lib/prisma'
 import { createErrorResponse } from '@/lib/errorHandler'
 import { requireRecruiter } from '@/lib/authHelper'
 import { serializeBigInt } from '@/lib/utils'
+import { withTelemetry } from '@/lib/telemetry'
 
 // GET /api/contracts/accepted-applicants - Get accepted applicants for contract registration
-export async function GET(request) {
+async function handleGET(request) {
   try {
     const auth = await requireRecruiter(request)
     if (auth.error) {
@@ -206,3 +207,5 @@ export async function GET(request) {
     }, { status: 500 })
   }
 }
+
+export const GET = withTelemetry('/api/contracts/accepted-applicants', handleGET)
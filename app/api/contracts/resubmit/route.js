@@ -5,6 +5,7 @@ import { requireRecruiter } from '@/lib/authHelper'
 import { validateBody } from '@/lib/validations'
 import { validateCSRFToken, csrfErrorResponse } from '@/lib/csrf'
 import { z } from 'zod'
+import { withTelemetry } from '@/lib/telemetry'
 
 // Validation schema
 const resubmitSchema = z.object({
@@ -12,7 +13,7 @@ const resubmitSchema = z.object({
 })
 
 // POST /api/contracts/resubmit - Resubmit a rejected contract
-export async function POST(request) {
+async function handlePOST(request) {
   try {
     if (!validateCSRFToken(request)) {
       return csrfErrorResponse()
@@ -91,3 +92,5 @@ export async function POST(request) {
     }, { status: 500 })
   }
 }
+
+export const POST = withTelemetry('/api/contracts/resubmit', handlePOST)
@@ -6,9 +6,10 @@ import { serializeBigInt } from '@/lib/utils'
 import { validateCSRFToken, csrfErrorResponse } from '@/lib/csrf'
 import { validateBody } from '@/lib/validations'
 import { createContractSchema } from '@/lib/validations/profile'
+import { withTelemetry } from '@/lib/telemetry'
 
 // GET /api/contracts - Get contract registrations for recruiter's company
-export async function GET(request) {
+async function handleGET(request) {
   try {
     const auth = await requireRecruiter(request)
     if (auth.error) {
@@ -119,7 +120,7 @@ export async function GET(request) {
 }
 
 // POST /api/contracts - Create new contract registration
-export async function POST(request) {
+async function handlePOST(request) {
   try {
     // CSRF validation
     if (!validateCSRFToken(request)) {
@@ -251,3 +252,6 @@ export async function POST(request) {
     }, { status: 500 })
   }
 }
+
+export const GET = withTelemetry('/api/contracts', handleGET)
+export const POST = withTelemetry('/api/contracts', handlePOST)
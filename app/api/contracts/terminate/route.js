@@ -5,6 +5,7 @@ import { requireRecruiter } from '@/lib/authHelper'
 import { validateBody } from '@/lib/validations'
 import { validateCSRFToken, csrfErrorResponse } from '@/lib/csrf'
 import { z } from 'zod'
+import { withTelemetry } from '@/lib/telemetry'
 
 // Validation schema
 const terminateSchema = z.object({
@@ -13,7 +14,7 @@ const terminateSchema = z.object({
 })
 
 // POST /api/contracts/terminate - Terminate a contract worker
-export async function POST(request) {
+async function handlePOST(request) {
   try {
     if (!validateCSRFToken(request)) {
       return csrfErrorResponse()
@@ -123,3 +124,5 @@ export async function POST(request) {
     }, { status: 500 })
   }
 }
+
+export const POST = withTelemetry('/api/contracts/terminate', handlePOST)
@@ -6,8 +6,9 @@ import { NextResponse } from 'next/server'
 import { prisma } from '@/lib/prisma'
 import { createErrorResponse } from '@/lib/errorHandler'
 import { authorizeCronRequest } from '@/lib/cron'
+import { withTelemetry } from '@/lib/telemetry'
 
-export async function GET(request) {
+async function handleGET(request) {
   try {
     const unauthorized = authorizeCronRequest(request)
     if (unauthorized) return unauthorized
@@ -50,3 +51,5 @@ export async function GET(request) {
     )
   }
 }
+
+export const GET = withTelemetry('/api/cron/complete-interviews', handleGET)
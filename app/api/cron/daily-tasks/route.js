@@ -1,77 +1,49 @@
 import { NextResponse } from 'next/server'
-import { prisma } from '@/lib/prisma'
 import { createErrorResponse } from '@/lib/errorHandler'
 import { authorizeCronRequest } from '@/lib/cron'
+import { runMaintenance } from '@/lib/maintenance'
+import { withTelemetry } from '@/lib/telemetry'
 
 // Combined daily tasks cron job
 // Runs at 1 AM daily
-export async function GET(request) {
+async function handleGET(request) {
   try {
     const unauthorized = authorizeCronRequest(request)
     if (unauthorized) return unauthorized
 
-    const results = {
-      completedInterviews: 0,
-      overdueInterviews: 0,
-      completedContracts: 0,
-      expiredJobs: 0
-    }
-
-    // Task 1: Report overdue interviews. Recruiters complete interviews manually.
     const now = new Date()
-    const twentyFourHoursAgo = new Date(now.getTime() - 24 * 60 * 60 * 1000)
-
-    results.overdueInterviews = await prisma.interviews.count({
-      where: {
-        scheduledAt: { lte: twentyFourHoursAgo },
-        status: 'SCHEDULED'
-      }
-    })
-
-    // Task 2: Complete expired contracts
-    const expiredContracts = await prisma.contract_workers.findMany({
-      where: {
-        status: 'ACTIVE',
-        endDate: { lt: now }
-      },
-      select: { id: true }
-    })
+    const run = await runMaintenance({ now })
 
-    if (expiredContracts.length > 0) {
-      const updatedContracts = await prisma.contract_workers.updateMany({
-        where: {
-          id: { in: expiredContracts.map(c => c.id) }
-        },
-        data: {
-          status: 'COMPLETED',
-          updatedAt: now
-        }
+    if (run.skipped) {
+      return NextResponse.json({
+        success: true,
+        skipped: true,
+        message: 'Maintenance lain sedang berjalan'
       })
-      results.completedContracts = updatedContracts.count
     }
 
-    // Task 3: Deactivate expired jobs (optional)
-    const expiredJobs = await prisma.jobs.updateMany({
-      where: {
-        status: 'ACTIVE',
-        applicationDeadline: { lt: now, not: null }
-      },
-      data: {
-        status: 'CLOSED',
-        isActive: false,
-        closedAt: now,
-        updatedAt: now
-      }
-    })
-    results.expiredJobs = expiredJobs.count
-
+    const { metrics } = run
+    const results = {
+      completedInterviews: 0,
+      overdueInterviews: metrics.overdueInterviews?.overdue ?? 0,
+      completedContracts: metrics.expiredContracts?.processed ?? 0,
+      expiredJobs: metrics.expiredJobs?.processed ?? 0,
+      dailyStatsDays: metrics.dailyStats?.processed ?? 0,
+      dashboardCountersCorrected: metrics.dashboardCounters?.processed ?? 0,
+      mediaJobsProcessed: metrics.mediaQueue?.processed ?? 0,
+      emailsSent: metrics.emailOutbox?.processed ?? 0
+    }
 
     return NextResponse.json({
-      success: true,
-      message: 'Tugas harian berhasil diselesaikan',
+      success: run.status === 'SUCCESS',
+      message: run.status === 'SUCCESS'
+        ? 'Tugas harian berhasil diselesaikan'
+        : 'Sebagian tugas harian gagal',
       results,
+      runId: run.runId,
+      metrics,
       executedAt: now.toISOString()
-    })
+    }, { status: run.status === 'SUCCESS' ? 200 : 500 })
 
   } catch (error) {
     console.error('Daily tasks cron error:', error)
@@ -82,3 +54,5 @@ export async function GET(request) {
     }, { status: 500 })
   }
 }
+
+export const GET = withTelemetry('/api/cron/daily-tasks', handleGET)
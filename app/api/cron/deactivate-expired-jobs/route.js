@@ -1,37 +1,40 @@
 import { NextResponse } from 'next/server'
-import { prisma } from '@/lib/prisma'
 import { authorizeCronRequest } from '@/lib/cron'
+import { runMaintenance, MaintenanceTask } from '@/lib/maintenance'
+import { withTelemetry } from '@/lib/telemetry'
 
 // Auto-deactivate jobs that have passed their application deadline
 // This can be called by a cron job or triggered periodically
 
-export async function POST(request) {
+async function handlePOST(request) {
     try {
         const unauthorized = authorizeCronRequest(request)
         if (unauthorized) return unauthorized
 
         const now = new Date()
-        
-        // Find and update all active jobs where deadline has passed
-        const result = await prisma.jobs.updateMany({
-            where: {
-                isActive: true,
-                applicationDeadline: {
-                    lt: now, // deadline is less than (before) current time
-                    not: null
-                }
-            },
-            data: {
-                isActive: false,
-                status: 'CLOSED',
-                closedAt: now
-            }
-        })
+        const run = await runMaintenance({ tasks: [MaintenanceTask.EXPIRED_JOBS], now })
+
+        if (run.skipped) {
+            return NextResponse.json({
+                success: true,
+                skipped: true,
+                message: 'Maintenance lain sedang berjalan',
+                count: 0,
+                timestamp: now.toISOString()
+            })
+        }
+
+        const metrics = run.metrics[MaintenanceTask.EXPIRED_JOBS]
+        if (metrics.error) {
+            throw new Error(metrics.error)
+        }
 
         return NextResponse.json({
             success: true,
-            message: `Deactivated ${result.count} expired jobs`,
-            count: result.count,
+            message: `Deactivated ${metrics.processed} expired jobs`,
+            count: metrics.processed,
+            // More expired jobs remain than one run processes
+            hasMore: metrics.hasMore,
             timestamp: now.toISOString()
         })
 
@@ -45,6 +48,9 @@ export async function POST(request) {
 }
 
 // Also support GET for Vercel Cron.
-export async function GET(request) {
-    return POST(request)
+async function handleGET(request) {
+    return handlePOST(request)
 }
+
+export const POST = withTelemetry('/api/cron/deactivate-expired-jobs', handlePOST)
+export const GET = withTelemetry('/api/cron/deactivate-expired-jobs', handleGET)
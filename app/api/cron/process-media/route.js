@@ -0,0 +1,34 @@
+import { NextResponse } from 'next/server'
+import { createErrorResponse } from '@/lib/errorHandler'
+import { authorizeCronRequest } from '@/lib/cron'
+import { processMediaJobs } from '@/lib/mediaQueue'
+import { withTelemetry } from '@/lib/telemetry'
+
+// GET /api/cron/process-media - Resize queued uploads
+// Uploads drain the queue after responding; this picks up anything left over
+// (retries, expired leases, instances that stopped mid-drain)
+async function handleGET(request) {
+  try {
+    const unauthorized = authorizeCronRequest(request)
+    if (unauthorized) return unauthorized
+
+    const result = await processMediaJobs({ limit: 50 })
+
+    return NextResponse.json({
+      success: true,
+      message: result.claimed === 0
+        ? 'Tidak ada media yang menunggu diproses'
+        : `Memproses ${result.done} dari ${result.claimed} media`,
+      ...result
+    })
+
+  } catch (error) {
+    console.error('Error processing media queue:', error)
+    return NextResponse.json({
+      error: 'Gagal memproses antrean media',
+      ...createErrorResponse('Terjadi kesalahan', error)
+    }, { status: 500 })
+  }
+}
+
+export const GET = withTelemetry('/api/cron/process-media', handleGET)
@@ -0,0 +1,34 @@
+import { NextResponse } from 'next/server'
+import { createErrorResponse } from '@/lib/errorHandler'
+import { authorizeCronRequest } from '@/lib/cron'
+import { deliverEmailOutbox } from '@/lib/email/outbox'
+import { withTelemetry } from '@/lib/telemetry'
+
+// GET /api/cron/send-emails - Deliver queued emails
+// Routes drain the outbox after responding; this picks up retries that came
+// due later and anything left by an instance that stopped mid-drain
+async function handleGET(request) {
+  try {
+    const unauthorized = authorizeCronRequest(request)
+    if (unauthorized) return unauthorized
+
+    const result = await deliverEmailOutbox({ limit: 500 })
+
+    return NextResponse.json({
+      success: true,
+      message: result.claimed === 0
+        ? 'Tidak ada email yang menunggu dikirim'
+        : `Mengirim ${result.sent} dari ${result.claimed} email`,
+      ...result
+    })
+
+  } catch (error) {
+    console.error('Error delivering email outbox:', error)
+    return NextResponse.json({
+      error: 'Gagal mengirim antrean email',
+      ...createErrorResponse('Terjadi kesalahan', error)
+    }, { status: 500 })
+  }
+}
+
+export const GET = withTelemetry('/api/cron/send-emails', handleGET)
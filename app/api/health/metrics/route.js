@@ -0,0 +1,63 @@
+import { NextResponse } from 'next/server'
+import { createCollectedCounter, createGauge, renderMetrics } from '@/lib/metrics'
+import { getPrincipalCacheStats } from '@/lib/principalCache'
+
+export const dynamic = 'force-dynamic'
+
+createCollectedCounter({
+  name: 'principal_cache_lookups_total',
+  help: 'Principal cache lookups since process start',
+  collect: () => {
+    const stats = getPrincipalCacheStats()
+    return [
+      { labels: { result: 'hit' }, value: stats.hits },
+      { labels: { result: 'miss' }, value: stats.misses }
+    ]
+  }
+})
+
+createCollectedCounter({
+  name: 'principal_cache_miss_ms_total',
+  help: 'Milliseconds spent loading principals on cache misses',
+  collect: () => getPrincipalCacheStats().missMsTotal
+})
+
+// Moves with the average miss cost, so not a counter
+createGauge({
+  name: 'principal_cache_estimated_saved_ms',
+  help: 'Estimated milliseconds saved by principal cache hits (hits x average miss)',
+  collect: () => getPrincipalCacheStats().estimatedSavedMs
+})
+
+/**
+ * Prometheus scrape endpoint
+ * GET /api/health/metrics
+ *
+ * Request latency, per-request query counts and Prisma operation histograms
+ * recorded by lib/telemetry.js. Requires `Authorization: Bearer <METRICS_TOKEN>`
+ * when METRICS_TOKEN is set; without it the endpoint is closed in production.
+ */
+export async function GET(request) {
+  const metricsToken = process.env.METRICS_TOKEN
+
+  if (!metricsToken && process.env.NODE_ENV === 'production') {
+    return NextResponse.json(
+      { error: 'METRICS_TOKEN belum dikonfigurasi' },
+      { status: 503 }
+    )
+  }
+
+  if (metricsToken && request.headers.get('authorization') !== `Bearer ${metricsToken}`) {
+    return NextResponse.json(
+      { error: 'Tidak memiliki akses' },
+      { status: 401 }
+    )
+  }
+
+  return new Response(renderMetrics(), {
+    headers: {
+      'Content-Type': 'text/plain; version=0.0.4; charset=utf-8',
+      'Cache-Control': 'no-store'
+    }
+  })
+}
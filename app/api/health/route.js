@@ -1,5 +1,6 @@
 import { NextResponse } from 'next/server'
 import { prisma } from '@/lib/prisma'
+import { withTelemetry } from '@/lib/telemetry'
 
 const startTime = Date.now()
 
@@ -9,7 +10,7 @@ const startTime = Date.now()
  * 
  * Returns server status, uptime, and database connectivity
  */
-export async function GET() {
+async function handleGET() {
   const timestamp = new Date().toISOString()
   const uptime = Math.floor((Date.now() - startTime) / 1000)
   
@@ -46,3 +47,5 @@ export async function GET() {
     }
   )
 }
+
+export const GET = withTelemetry('/api/health', handleGET)
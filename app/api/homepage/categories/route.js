@@ -1,7 +1,9 @@
 import { NextResponse } from 'next/server'
 import { prisma } from '@/lib/prisma'
-import { publicLimiter, getIP, rateLimitResponse } from '@/lib/rateLimit'
+import { publicLimiter, limitRequest, rateLimitResponse } from '@/lib/rateLimit'
 import { publicActiveJobWhere } from '@/lib/jobs/publicFilters'
+import { cached, CacheTag } from '@/lib/cache'
+import { withTelemetry } from '@/lib/telemetry'
 
 // Category icons mapping
 const categoryIcons = {
@@ -27,38 +29,41 @@ const categoryIcons = {
     'Other': '📋'
 }
 
-export async function GET(request) {
+async function handleGET(request) {
     try {
         // Rate limiting - 100 requests per minute
-        const ip = getIP(request)
-        const { success, reset } = await publicLimiter.limit(ip)
+        const { success, reset } = await limitRequest(request, publicLimiter)
         if (!success) {
             return rateLimitResponse(reset)
         }
 
-        // Get all currently open public jobs grouped by category
-        const jobs = await prisma.jobs.findMany({
-            where: publicActiveJobWhere(new Date()),
-            select: {
-                category: true
-            }
-        })
+        const categories = await cached(
+            'homepage:categories',
+            { ttl: 300, tags: [CacheTag.JOBS] },
+            async () => {
+                // Count currently open public jobs per category in the database
+                const groups = await prisma.jobs.groupBy({
+                    by: ['category'],
+                    where: publicActiveJobWhere(new Date()),
+                    _count: { _all: true }
+                })
 
-        // Count jobs per category
-        const categoryCounts = {}
-        jobs.forEach(job => {
-            const category = job.category || 'Other'
-            categoryCounts[category] = (categoryCounts[category] || 0) + 1
-        })
+                const categoryCounts = {}
+                groups.forEach(group => {
+                    const category = group.category || 'Other'
+                    categoryCounts[category] = (categoryCounts[category] || 0) + group._count._all
+                })
 
-        // Transform to array and sort by count
-        const categories = Object.entries(categoryCounts)
-            .map(([name, count]) => ({
-                name,
-                count,
-                icon: categoryIcons[name] || categoryIcons['Other']
-            }))
-            .sort((a, b) => b.count - a.count)
+                // Transform to array and sort by count
+                return Object.entries(categoryCounts)
+                    .map(([name, count]) => ({
+                        name,
+                        count,
+                        icon: categoryIcons[name] || categoryIcons['Other']
+                    }))
+                    .sort((a, b) => b.count - a.count)
+            }
+        )
 
         return NextResponse.json({
             success: true,
@@ -74,3 +79,5 @@ export async function GET(request) {
         )
     }
 }
+
+export const GET = withTelemetry('/api/homepage/categories', handleGET)
@@ -1,77 +1,86 @@
 import { NextResponse } from 'next/server'
 import { prisma } from '@/lib/prisma'
-import { publicLimiter, getIP, rateLimitResponse } from '@/lib/rateLimit'
+import { publicLimiter, limitRequest, rateLimitResponse } from '@/lib/rateLimit'
 import { publicActiveJobWhere } from '@/lib/jobs/publicFilters'
+import { cached, CacheTag } from '@/lib/cache'
+import { withTelemetry } from '@/lib/telemetry'
 
-export async function GET(request) {
+async function handleGET(request) {
     try {
         // Rate limiting - 100 requests per minute
-        const ip = getIP(request)
-        const { success, reset } = await publicLimiter.limit(ip)
+        const { success, reset } = await limitRequest(request, publicLimiter)
         if (!success) {
             return rateLimitResponse(reset)
         }
 
         const { searchParams } = new URL(request.url)
-        const limit = parseInt(searchParams.get('limit') || '6')
-        const now = new Date()
+        // Bounded so arbitrary limits cannot fan out into separate cache entries
+        const limit = Math.min(Math.max(parseInt(searchParams.get('limit') || '6') || 6, 1), 24)
 
-        // OPTIMIZED: use select instead of include
-        const jobs = await prisma.jobs.findMany({
-            where: publicActiveJobWhere(now),
-            take: limit,
-            orderBy: {
-                publishedAt: 'desc'
-            },
-            select: {
-                id: true,
-                title: true,
-                slug: true,
-                location: true,
-                jobType: true,
-                salaryMin: true,
-                salaryMax: true,
-                category: true,
-                createdAt: true,
-                applicationDeadline: true,
-                companies: {
-                    select: {
-                        name: true,
-                        logo: true,
-                        city: true,
-                        industry: true
-                    }
-                },
-                _count: {
+        const featuredJobs = await cached(
+            `homepage:featured-jobs:${limit}`,
+            { ttl: 120, tags: [CacheTag.JOBS] },
+            async () => {
+                const now = new Date()
+
+                // OPTIMIZED: use select instead of include
+                const jobs = await prisma.jobs.findMany({
+                    where: publicActiveJobWhere(now),
+                    take: limit,
+                    orderBy: {
+                        publishedAt: 'desc'
+                    },
                     select: {
-                        applications: true
+                        id: true,
+                        title: true,
+                        slug: true,
+                        location: true,
+                        jobType: true,
+                        salaryMin: true,
+                        salaryMax: true,
+                        category: true,
+                        createdAt: true,
+                        applicationDeadline: true,
+                        companies: {
+                            select: {
+                                name: true,
+                                logo: true,
+                                city: true,
+                                industry: true
+                            }
+                        },
+                        _count: {
+                            select: {
+                                applications: true
+                            }
+                        }
                     }
-                }
-            }
-        })
+                })
 
-        // Transform data for frontend
-        const featuredJobs = jobs.map(job => ({
-            id: job.id,
-            title: job.title,
-            slug: job.slug,
-            companies: job.companies ? {
-                name: job.companies.name,
-                logo: job.companies.logo,
-                city: job.companies.city,
-                industry: job.companies.industry
-            } : null,
-            location: job.location || job.companies?.city || '',
-            jobType: job.jobType,
-            salaryMin: job.salaryMin,
-            salaryMax: job.salaryMax,
-            salaryCurrency: 'IDR',
-            postedAt: job.createdAt,
-            applicationDeadline: job.applicationDeadline,
-            applicationCount: job._count.applications,
-            applicants: job._count.applications,
-            category: job.category
-        }))
+                // Transform data for frontend
+                return jobs.map(job => ({
+                    id: job.id,
+                    title: job.title,
+                    slug: job.slug,
+                    companies: job.companies ? {
+                        name: job.companies.name,
+                        logo: job.companies.logo,
+                        city: job.companies.city,
+                        industry: job.companies.industry
+                    } : null,
+                    location: job.location || job.companies?.city || '',
+                    jobType: job.jobType,
+                    salaryMin: job.salaryMin,
+                    salaryMax: job.salaryMax,
+                    salaryCurrency: 'IDR',
+                    postedAt: job.createdAt,
+                    applicationDeadline: job.applicationDeadline,
+                    applicationCount: job._count.applications,
+                    applicants: job._count.applications,
+                    category: job.category
+                }))
+            }
+        )
 
         return NextResponse.json({
             success: true,
@@ -91,3 +100,5 @@ export async function GET(request) {
         )
     }
 }
+
+export const GET = withTelemetry('/api/homepage/featured-jobs', handleGET)
@@ -1,53 +1,34 @@
 import { NextResponse } from "next/server";
-import { prisma } from "@/lib/prisma";
-import { publicLimiter, getIP, rateLimitResponse } from "@/lib/rateLimit";
-import { publicActiveJobWhere } from "@/lib/jobs/publicFilters";
+import { publicLimiter, limitRequest, rateLimitResponse } from "@/lib/rateLimit";
+import { getApplicationTotals, getCompanyTotals, getJobTotals } from "@/lib/stats";
+import { withTelemetry } from "@/lib/telemetry";
 
-export async function GET(request) {
+async function handleGET(request) {
   try {
     // Rate limiting - 100 requests per minute
-    const ip = getIP(request);
-    const { success, reset } = await publicLimiter.limit(ip);
+    const { success, reset } = await limitRequest(request, publicLimiter);
     if (!success) {
       return rateLimitResponse(reset);
     }
 
-    // Run all queries in parallel for better performance
-    const [totalJobs, totalVerifiedCompanies, totalApplications, totalHires] =
-      await Promise.all([
-        // Count active jobs
-        prisma.jobs.count({
-          where: publicActiveJobWhere(new Date()),
-        }),
+    // Shared stats readers; job and company writes invalidate them
+    const [jobs, companies, applications] = await Promise.all([
+      getJobTotals(),
+      getCompanyTotals(),
+      getApplicationTotals(),
+    ]);
 
-        // Count verified companies (diverifikasi oleh admin)
-        prisma.companies.count({
-          where: {
-            verified: true,
-            status: "VERIFIED",
-          },
-        }),
-
-        // Count total applications
-        prisma.applications.count(),
-
-        // Count accepted applications (hired candidates)
-        prisma.applications.count({
-          where: {
-            status: "ACCEPTED",
-          },
-        }),
-      ]);
+    const stats = {
+      totalJobs: jobs.public,
+      totalCompanies: companies.public,
+      totalApplications: applications.total,
+      totalHires: applications.accepted,
+    };
 
     // Add cache headers for better performance
     return NextResponse.json({
       success: true,
-      data: {
-        totalJobs,
-        totalCompanies: totalVerifiedCompanies,
-        totalApplications,
-        totalHires,
-      },
+      data: stats,
     }, {
       headers: {
         'Cache-Control': 'public, s-maxage=120, stale-while-revalidate=300'
@@ -60,3 +41,5 @@ export async function GET(request) {
     );
   }
 }
+
+export const GET = withTelemetry("/api/homepage/stats", handleGET);
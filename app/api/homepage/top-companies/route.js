@@ -1,76 +1,84 @@
 import { NextResponse } from 'next/server'
 import { prisma } from '@/lib/prisma'
-import { publicLimiter, getIP, rateLimitResponse } from '@/lib/rateLimit'
+import { publicLimiter, limitRequest, rateLimitResponse } from '@/lib/rateLimit'
 import { openApplicationDeadlineWhere } from '@/lib/jobs/publicFilters'
+import { cached, CacheTag } from '@/lib/cache'
+import { withTelemetry } from '@/lib/telemetry'
 
-export async function GET(request) {
+async function handleGET(request) {
     try {
         // Rate limiting - 100 requests per minute
-        const ip = getIP(request)
-        const { success, reset } = await publicLimiter.limit(ip)
+        const { success, reset } = await limitRequest(request, publicLimiter)
         if (!success) {
             return rateLimitResponse(reset)
         }
 
         const { searchParams } = new URL(request.url)
-        const limit = parseInt(searchParams.get('limit') || '8')
+        // Bounded so arbitrary limits cannot fan out into separate cache entries
+        const limit = Math.min(Math.max(parseInt(searchParams.get('limit') || '8') || 8, 1), 24)
 
-        const openDeadlineWhere = openApplicationDeadlineWhere(new Date())
+        const topCompanies = await cached(
+            `homepage:top-companies:${limit}`,
+            { ttl: 300, tags: [CacheTag.JOBS, CacheTag.COMPANIES] },
+            async () => {
+                const openDeadlineWhere = openApplicationDeadlineWhere(new Date())
 
-        // Get verified companies, sorted by job count
-        const companies = await prisma.companies.findMany({
-            where: {
-                verified: true,
-                status: 'VERIFIED'
-            },
-            take: limit,
-            include: {
-                jobs: {
+                // Get verified companies, sorted by job count
+                const companies = await prisma.companies.findMany({
                     where: {
-                        status: 'ACTIVE',
-                        isActive: true,
-                        publishedAt: { not: null },
-                        ...openDeadlineWhere
+                        verified: true,
+                        status: 'VERIFIED'
                     },
-                    take: 3,
-                    orderBy: {
-                        createdAt: 'desc'
-                    },
-                    select: {
-                        id: true,
-                        title: true,
-                        slug: true,
-                        location: true,
-                        jobType: true,
-                        applicationDeadline: true,
-                        _count: {
+                    take: limit,
+                    include: {
+                        jobs: {
+                            where: {
+                                status: 'ACTIVE',
+                                isActive: true,
+                                publishedAt: { not: null },
+                                ...openDeadlineWhere
+                            },
+                            take: 3,
+                            orderBy: {
+                                createdAt: 'desc'
+                            },
                             select: {
-                                applications: true
+                                id: true,
+                                title: true,
+                                slug: true,
+                                location: true,
+                                jobType: true,
+                                applicationDeadline: true,
+                                _count: {
+                                    select: {
+                                        applications: true
+                                    }
+                                }
                             }
+                        },
+                    },
+                    orderBy: {
+                        jobs: {
+                            _count: 'desc'
                         }
                     }
-                },
-            },
-            orderBy: {
-                jobs: {
-                    _count: 'desc'
-                }
-            }
-        })
+                })
 
-        // Transform data
-        const topCompanies = companies.map(company => ({
-            id: company.id,
-            name: company.name,
-            slug: company.slug,
-            logo: company.logo,
-            description: company.description,
-            city: company.city,
-            province: company.province,
-            industry: company.industry,
-            totalJobsCount: company.jobs.length,
-            latestJobs: company.jobs
-        }))
+                // Transform data
+                return companies.map(company => ({
+                    id: company.id,
+                    name: company.name,
+                    slug: company.slug,
+                    logo: company.logo,
+                    description: company.description,
+                    city: company.city,
+                    province: company.province,
+                    industry: company.industry,
+                    totalJobsCount: company.jobs.length,
+                    latestJobs: company.jobs
+                }))
+            }
+        )
 
         return NextResponse.json({
             success: true,
@@ -86,3 +94,5 @@ export async function GET(request) {
         )
     }
 }
+
+export const GET = withTelemetry('/api/homepage/top-companies', handleGET)
@@ -3,9 +3,10 @@ import { prisma } from '@/lib/prisma'
 import { createErrorResponse } from '@/lib/errorHandler'
 import { requireJobseeker } from '@/lib/authHelper'
 import { validateCSRFToken, csrfErrorResponse } from '@/lib/csrf'
+import { withTelemetry } from '@/lib/telemetry'
 
 // GET - Get interview room details
-export async function GET(request, context) {
+async function handleGET(request, context) {
     try {
         // Authenticate
         const auth = await requireJobseeker(request)
@@ -130,7 +131,7 @@ export async function GET(request, context) {
 }
 
 // PATCH - Jobseeker cannot complete interviews; recruiter controls interview outcomes.
-export async function PATCH(request) {
+async function handlePATCH(request) {
     if (!validateCSRFToken(request)) {
         return csrfErrorResponse()
     }
@@ -145,3 +146,6 @@ export async function PATCH(request) {
         { status: 403 }
     )
 }
+
+export const GET = withTelemetry('/api/interviews/[id]/room', handleGET)
+export const PATCH = withTelemetry('/api/interviews/[id]/room', handlePATCH)
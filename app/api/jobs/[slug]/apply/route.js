@@ -6,8 +6,9 @@ import { verifyToken } from '@/lib/auth'
 import { validateCSRFToken, csrfErrorResponse } from '@/lib/csrf'
 import { validateBody } from '@/lib/validations'
 import { applyJobSchema } from '@/lib/validations/profile'
+import { withTelemetry } from '@/lib/telemetry'
 
-export async function POST(request, context) {
+async function handlePOST(request, context) {
   try {
     // CSRF validation
     if (!validateCSRFToken(request)) {
@@ -224,3 +225,5 @@ export async function POST(request, context) {
     )
   }
 }
+
+export const POST = withTelemetry('/api/jobs/[slug]/apply', handlePOST)
@@ -4,8 +4,10 @@ import { createErrorResponse } from '@/lib/errorHandler'
 import { cookies } from 'next/headers'
 import { verifyToken } from '@/lib/auth'
 import { publicActiveJobWhere } from '@/lib/jobs/publicFilters'
+import { getJobseekerIdForUser } from '@/lib/jobs/appliedStatus'
+import { withTelemetry } from '@/lib/telemetry'
 
-export async function GET(request, context) {
+async function handleGET(request, context) {
   try {
     const params = await context.params
     const { slug } = params
@@ -104,17 +106,14 @@ export async function GET(request, context) {
     let hasApplied = false
     let existingApplication = null
     if (userId && userRole === 'JOBSEEKER') {
-      const user = await prisma.users.findUnique({
-        where: { id: userId },
-        include: { jobseekers: true }
-      })
+      const jobseekerId = await getJobseekerIdForUser(userId)
 
-      if (user?.jobseekers) {
+      if (jobseekerId) {
         existingApplication = await prisma.applications.findUnique({
           where: {
             jobId_jobseekerId: {
               jobId: job.id,
-              jobseekerId: user.jobseekers.id
+              jobseekerId
             }
           },
           select: {
@@ -203,3 +202,5 @@ export async function GET(request, context) {
     )
   }
 }
+
+export const GET = withTelemetry('/api/jobs/[slug]', handleGET)
@@ -4,43 +4,355 @@ import { createErrorResponse } from '@/lib/errorHandler'
 import { jobSearchSchema } from '@/lib/validations/jobs'
 import { prisma } from '@/lib/prisma'
 import { getAuthFromCookies } from '@/lib/auth'
-import { publicLimiter, getIP, rateLimitResponse } from '@/lib/rateLimit'
+import { publicLimiter, limitRequest, rateLimitResponse } from '@/lib/rateLimit'
 import { publicActiveJobWhere } from '@/lib/jobs/publicFilters'
+import { getAppliedJobIds, getJobseekerIdForUser } from '@/lib/jobs/appliedStatus'
+import {
+  decodeJobCursor,
+  decodeOffsetCursor,
+  encodeJobCursor,
+  encodeOffsetCursor,
+  jobCursorWhere,
+  jobListOrderBy
+} from '@/lib/jobs/pagination'
+import { buildPrefixTsQuery, countJobSearchMatches, findJobSearchPage } from '@/lib/jobs/search'
+import { cached, CacheTag } from '@/lib/cache'
+import { withTelemetry } from '@/lib/telemetry'
 
-// Auto-deactivate expired jobs (runs in background, non-blocking)
-async function autoDeactivateExpiredJobs() {
-    try {
-        const now = new Date()
-        await prisma.jobs.updateMany({
-            where: {
-                isActive: true,
-                applicationDeadline: {
-                    lt: now,
-                    not: null
-                }
-            },
-            data: {
-                isActive: false,
-                status: 'CLOSED',
-                closedAt: now
-            }
-        })
-    } catch (error) {
+// Anonymous-equivalent listings are cached briefly and dropped on job writes
+const JOBS_LIST_CACHE_TTL = 60
+
+const JOB_LIST_INCLUDE = {
+  companies: {
+    select: {
+      id: true,
+      name: true,
+      logo: true,
+      city: true,
+      industry: true
+    }
+  },
+  job_skills: {
+    include: {
+      skills: true
     }
+  },
+  _count: {
+    select: {
+      applications: true
+    }
+  }
+}
+
+// `fields=summary`: only the columns a listing card renders; the detail
+// panel loads the rest from /api/jobs/[slug]
+const JOB_SUMMARY_SELECT = {
+  id: true,
+  slug: true,
+  title: true,
+  location: true,
+  city: true,
+  province: true,
+  jobType: true,
+  category: true,
+  showSalary: true,
+  salaryMin: true,
+  salaryMax: true,
+  minExperience: true,
+  maxExperience: true,
+  publishedAt: true,
+  applicationCount: true,
+  applicationDeadline: true,
+  isFeatured: true,
+  isRemote: true,
+  isDisabilityFriendly: true,
+  numberOfPositions: true,
+  malePositions: true,
+  femalePositions: true,
+  companies: {
+    select: {
+      id: true,
+      name: true,
+      logo: true
+    }
+  },
+  _count: {
+    select: {
+      applications: true
+    }
+  }
+}
+
+// Jobs have no kecamatan column; the post-job form writes it into the
+// location text ("Kel, Kec. Sumber, Kab. Cirebon, Jawa Barat")
+function jobKecamatan(job) {
+  return job.location?.match(/Kec\.\s*([^,]+)/)?.[1]?.trim() || null
+}
+
+function jobListProjection(fields) {
+  return fields === 'summary'
+    ? { select: JOB_SUMMARY_SELECT }
+    : { include: JOB_LIST_INCLUDE }
+}
+
+function invalidCursorResponse() {
+  return NextResponse.json(
+    { success: false, error: 'Cursor tidak valid' },
+    { status: 400 }
+  )
+}
+
+const EXPERIENCE_MIN_YEARS = {
+  '0-1 tahun': 0,
+  '1-3 tahun': 1,
+  '3-5 tahun': 3,
+  '5+ tahun': 5
+}
+
+/**
+ * Listing filters besides search, parsed once so the Prisma where clause and
+ * the full-text search SQL (lib/jobs/search.js) apply the same conditions.
+ */
+function parseJobListFilters({ location, jobType, category, experience }) {
+  return {
+    location: location || null,
+    jobTypes: jobType ? jobType.split(',') : null,
+    categories: category ? category.split(',') : null,
+    minExperience: experience
+      ? experience.split(',').map(exp => EXPERIENCE_MIN_YEARS[exp] ?? 0)
+      : null
+  }
+}
+
+function jobListFilterWhere(filters) {
+  const where = {}
+
+  // The kecamatan of a job is part of its location text
+  if (filters.location) {
+    where.OR = [
+      { city: { contains: filters.location, mode: 'insensitive' } },
+      { location: { contains: filters.location, mode: 'insensitive' } },
+      { province: { contains: filters.location, mode: 'insensitive' } }
+    ]
+  }
+  if (filters.jobTypes) {
+    where.jobType = { in: filters.jobTypes }
+  }
+  if (filters.categories) {
+    where.category = { in: filters.categories }
+  }
+  if (filters.minExperience) {
+    where.minExperience = { in: filters.minExperience }
+  }
+
+  return where
 }
 
-export async function GET(request) {
+/**
+ * Load full rows for ids returned by the search SQL, keeping their order
+ */
+async function findJobsInOrder(ids, fields) {
+  if (ids.length === 0) return []
+
+  const rows = await prisma.jobs.findMany({ where: { id: { in: ids } }, ...jobListProjection(fields) })
+  const rowsById = new Map(rows.map(job => [job.id, job]))
+  return ids.map(id => rowsById.get(id)).filter(Boolean)
+}
+
+/**
+ * Build one page of the public listing. Returns null for an invalid cursor.
+ */
+async function listJobs(params) {
+  // Extract validated params
+  const { 
+    search, 
+    location, 
+    jobType, 
+    category, 
+    experience, 
+    sortBy, 
+    page, 
+    limit,
+    cursor,
+    fields
+  } = params
+
+  const now = new Date()
+  const filters = parseJobListFilters({ location, jobType, category, experience })
+
+  // A search (full-text index over title, category, description + company
+  // name) runs filters, order and paging in SQL; without one Prisma does
+  const isSearch = buildPrefixTsQuery(search) !== null
+
+  // Relevance only makes sense for a search; otherwise fall back to latest
+  const sortMode = sortBy === 'relevance' && !isSearch ? 'latest' : sortBy
+
+  // Build where clause with AND for proper filtering
+  const where = {
+    AND: [publicActiveJobWhere(now), jobListFilterWhere(filters)]
+  }
+
+  // Total count is shared by both pagination modes and cached per filter set
+  // so deep pages and "load more" skip the full COUNT(*)
+  const countKey = JSON.stringify({ search, location, jobType, category, experience })
+  const countJobs = () => cached(
+    `jobs:count:${countKey}`,
+    { ttl: JOBS_LIST_CACHE_TTL, tags: [CacheTag.JOBS] },
+    () => isSearch
+      ? countJobSearchMatches(search, filters, now)
+      : prisma.jobs.count({ where })
+  )
+
+  const isCursorMode = cursor !== undefined
+  let offset = isCursorMode ? 0 : (page - 1) * limit
+  let decodedCursor = null
+
+  if (isCursorMode) {
+    if (sortMode === 'relevance') {
+      // Rank is not a column, so relevance pages continue from an offset
+      offset = decodeOffsetCursor(cursor, sortMode)
+      if (offset === null) return null
+    } else {
+      // Keyset mode: continue after the cursor instead of skipping rows
+      decodedCursor = decodeJobCursor(cursor, sortMode)
+      if (!decodedCursor) return null
+    }
+  }
+
+  // Fetch one extra row to know whether another page exists
+  const findPage = async () => {
+    if (isSearch) {
+      const ids = await findJobSearchPage({
+        search,
+        filters,
+        sortBy: sortMode,
+        cursor: decodedCursor,
+        offset,
+        take: limit + 1,
+        now
+      })
+      return findJobsInOrder(ids, fields)
+    }
+
+    return prisma.jobs.findMany({
+      where: decodedCursor
+        ? { AND: [...where.AND, jobCursorWhere(decodedCursor, sortMode)] }
+        : where,
+      ...jobListProjection(fields),
+      // Sorting (id tie-break keeps pages stable and enables keyset pagination)
+      orderBy: jobListOrderBy(sortMode),
+      skip: offset,
+      take: limit + 1
+    })
+  }
+
+  const [pageJobs, totalCount] = await Promise.all([findPage(), countJobs()])
+
+  const jobs = pageJobs.slice(0, limit)
+  // Cursor for the page after this one, null when this is the last page
+  let nextCursor = null
+  if (pageJobs.length > limit) {
+    nextCursor = sortMode === 'relevance'
+      ? encodeOffsetCursor(sortMode, offset + limit)
+      : encodeJobCursor(jobs[jobs.length - 1], sortMode)
+  }
+
+  // Transform data for frontend
+  const transformedJobs = jobs.map((job) => {
+    const kecamatan = jobKecamatan(job)
+    const card = {
+      id: job.id,
+      slug: job.slug,
+      title: job.title,
+      company: job.companies.name,
+      companyId: job.companies.id,
+      logo: job.companies.logo || '🏢',
+      location: kecamatan ? `Kec. ${kecamatan}, ${job.city}` : job.city,
+      fullLocation: kecamatan ? `Kec. ${kecamatan}, ${job.city}, ${job.province}` : `${job.city}, ${job.province}`,
+      type: job.jobType,
+      salary: job.showSalary && job.salaryMin && job.salaryMax
+        ? `Rp ${job.salaryMin.toLocaleString('id-ID')} - ${job.salaryMax.toLocaleString('id-ID')}`
+        : 'Negotiable',
+      experience: job.minExperience !== null && job.minExperience !== undefined
+        ? `${job.minExperience}${job.maxExperience ? `-${job.maxExperience}` : '+'} tahun`
+        : null,
+      category: job.category,
+      postedDate: job.publishedAt,
+      applicants: job._count.applications,
+      urgent: job.isFeatured,
+      remote: job.isRemote,
+      hasApplied: false, // Filled per user after the shared (cached) listing
+      applicationDeadline: job.applicationDeadline,
+      isDisabilityFriendly: job.isDisabilityFriendly,
+      numberOfPositions: job.numberOfPositions,
+      malePositions: job.malePositions,
+      femalePositions: job.femalePositions
+    }
+
+    if (fields === 'summary') {
+      return card
+    }
+
+    return {
+      ...card,
+      description: job.description,
+      requirements: job.requirements,
+      responsibilities: job.responsibilities,
+      benefits: job.benefits,
+      skills: job.job_skills.map(js => js.skills.name),
+      educationLevel: job.educationLevel,
+      gallery: job.gallery || [],
+      photo: job.photo,
+      workingDays: job.workingDays,
+      holidays: job.holidays,
+      isShift: job.isShift,
+      shiftCount: job.shiftCount
+    }
+  })
+
+  if (isCursorMode) {
+    return {
+      data: transformedJobs,
+      pagination: {
+        limit,
+        totalCount,
+        hasNextPage: nextCursor !== null,
+        nextCursor
+      }
+    }
+  }
+
+  // Calculate pagination info
+  const totalPages = Math.ceil(totalCount / limit)
+  const hasNextPage = nextCursor !== null
+  const hasPrevPage = page > 1
+
+  return {
+    data: transformedJobs,
+    pagination: {
+      page,
+      limit,
+      totalCount,
+      totalPages,
+      hasNextPage,
+      hasPrevPage,
+      // Lets offset clients switch to cursor "load more" from any page
+      nextCursor
+    }
+  }
+}
+
+async function handleGET(request) {
   try {
     // Rate limiting - 100 requests per minute
-    const ip = getIP(request)
-    const { success, reset } = await publicLimiter.limit(ip)
+    const { success, reset } = await limitRequest(request, publicLimiter)
     if (!success) {
       return rateLimitResponse(reset)
     }
 
-    // Run auto-deactivation in background (non-blocking)
-    autoDeactivateExpiredJobs()
-    
+    // Expired jobs are filtered by publicActiveJobWhere; closing them is
+    // left to the scheduled maintenance run (lib/maintenance.js)
+
     // Check if user is authenticated
     let userId = null
     let userRole = null
@@ -54,11 +366,7 @@ export async function GET(request) {
         
         // Get jobseeker ID if user is jobseeker
         if (userRole === 'JOBSEEKER') {
-          const user = await prisma.users.findUnique({
-            where: { id: userId },
-            include: { jobseekers: true }
-          })
-          jobseekerId = user?.jobseekers?.id
+          jobseekerId = await getJobseekerIdForUser(userId)
         }
       }
     } catch (error) {
@@ -71,202 +379,31 @@ export async function GET(request) {
       return validation.response
     }
     
-    // Extract validated params
-    const { 
-      search, 
-      location, 
-      jobType, 
-      category, 
-      experience, 
-      sortBy, 
-      page, 
-      limit 
-    } = validation.data
-
-    // Build where clause with AND for proper filtering
-    const where = {
-      AND: [publicActiveJobWhere(new Date())]
-    }
-
-    // Search filter (search in title, description, or company name)
-    if (search) {
-      where.AND.push({
-        OR: [
-          { title: { contains: search, mode: 'insensitive' } },
-          { description: { contains: search, mode: 'insensitive' } },
-          { category: { contains: search, mode: 'insensitive' } },
-          { companies: { name: { contains: search, mode: 'insensitive' } } }
-        ]
-      })
-    }
-
-    // Location filter
-    if (location) {
-      where.AND.push({
-        OR: [
-          { city: { contains: location, mode: 'insensitive' } },
-          { location: { contains: location, mode: 'insensitive' } },
-          { province: { contains: location, mode: 'insensitive' } },
-          { kecamatan: { contains: location, mode: 'insensitive' } }
-        ]
-      })
-    }
+    const params = validation.data
 
-    // Job type filter
-    if (jobType) {
-      const types = jobType.split(',')
-      where.jobType = { in: types }
-    }
-
-    // Category filter
-    if (category) {
-      const categories = category.split(',')
-      where.category = { in: categories }
-    }
-
-    // Experience filter (simplified - you may need to adjust based on your needs)
-    if (experience) {
-      const expLevels = experience.split(',')
-      // Map experience levels to years
-      const minYears = expLevels.map(exp => {
-        if (exp === '0-1 tahun') return 0
-        if (exp === '1-3 tahun') return 1
-        if (exp === '3-5 tahun') return 3
-        if (exp === '5+ tahun') return 5
-        return 0
-      })
-      where.minExperience = { in: minYears }
-    }
+    // The listing is identical for every user, so it is shared through the
+    // response cache; only hasApplied is resolved per jobseeker below
+    const result = await cached(
+      `jobs:list:${JSON.stringify(params)}`,
+      { ttl: JOBS_LIST_CACHE_TTL, tags: [CacheTag.JOBS] },
+      () => listJobs(params)
+    )
 
-    // Sorting
-    let orderBy = {}
-    switch (sortBy) {
-      case 'latest':
-        orderBy = { publishedAt: 'desc' }
-        break
-      case 'salary':
-        orderBy = { salaryMax: 'desc' }
-        break
-      case 'popular':
-        orderBy = { applicationCount: 'desc' }
-        break
-      default:
-        orderBy = { publishedAt: 'desc' }
+    if (!result) {
+      return invalidCursorResponse()
     }
 
-    // Calculate pagination
-    const skip = (page - 1) * limit
-
-    // Fetch jobs with related data
-    const [jobs, totalCount] = await Promise.all([
-      prisma.jobs.findMany({
-        where,
-        include: {
-        companies: {
-          select: {
-            id: true,
-            name: true,
-            logo: true,
-            city: true,
-            industry: true
-          }
-        },
-        job_skills: {
-          include: {
-            skills: true
-          }
-        },
-        _count: {
-          select: {
-            applications: true
-          }
-        }
-      },
-      orderBy,
-      skip,
-      take: limit
-    }),
-    prisma.jobs.count({ where })
-  ])
-
-  // Transform data for frontend
-  const transformedJobs = await Promise.all(jobs.map(async (job) => {
-    // Check if user has applied to this job
-    let hasApplied = false
+    // Check which of these jobs the user has applied to (single query per page)
+    let data = result.data
     if (jobseekerId) {
-      const existingApplication = await prisma.applications.findUnique({
-        where: {
-          jobId_jobseekerId: {
-            jobId: job.id,
-            jobseekerId: jobseekerId
-          }
-        },
-        select: {
-          id: true,
-          status: true
-        }
-      })
-      hasApplied = !!existingApplication
+      const appliedJobIds = await getAppliedJobIds(jobseekerId, data.map(job => job.id))
+      data = data.map(job => ({ ...job, hasApplied: appliedJobIds.has(job.id) }))
     }
-    
-    return {
-      id: job.id,
-      slug: job.slug,
-      title: job.title,
-      company: job.companies.name,
-      companyId: job.companies.id,
-      logo: job.companies.logo || '🏢',
-        location: job.kecamatan ? `Kec. ${job.kecamatan}, ${job.city}` : job.city,
-        fullLocation: job.kecamatan ? `Kec. ${job.kecamatan}, ${job.city}, ${job.province}` : `${job.city}, ${job.province}`,
-        type: job.jobType,
-        salary: job.showSalary && job.salaryMin && job.salaryMax
-          ? `Rp ${job.salaryMin.toLocaleString('id-ID')} - ${job.salaryMax.toLocaleString('id-ID')}`
-          : 'Negotiable',
-        experience: job.minExperience !== null && job.minExperience !== undefined
-          ? `${job.minExperience}${job.maxExperience ? `-${job.maxExperience}` : '+'} tahun`
-          : null,
-        category: job.category,
-        postedDate: job.publishedAt,
-        applicants: job._count.applications,
-        urgent: job.isFeatured,
-        remote: job.isRemote,
-        hasApplied, // Add hasApplied flag
-        description: job.description,
-        requirements: job.requirements,
-        responsibilities: job.responsibilities,
-        benefits: job.benefits,
-        skills: job.job_skills.map(js => js.skills.name),
-        educationLevel: job.educationLevel,
-        applicationDeadline: job.applicationDeadline,
-        gallery: job.gallery || [],
-        photo: job.photo,
-        workingDays: job.workingDays,
-        holidays: job.holidays,
-        isShift: job.isShift,
-        shiftCount: job.shiftCount,
-        isDisabilityFriendly: job.isDisabilityFriendly,
-        numberOfPositions: job.numberOfPositions,
-        malePositions: job.malePositions,
-        femalePositions: job.femalePositions
-      }
-    }))
-
-    // Calculate pagination info
-    const totalPages = Math.ceil(totalCount / limit)
-    const hasNextPage = page < totalPages
-    const hasPrevPage = page > 1
 
     return NextResponse.json({
       success: true,
-      data: transformedJobs,
-      pagination: {
-        page,
-        limit,
-        totalCount,
-        totalPages,
-        hasNextPage,
-        hasPrevPage
-      }
+      data,
+      pagination: result.pagination
     })
 
   } catch (error) {
@@ -283,3 +420,5 @@ export async function GET(request) {
     )
   }
 }
+
+export const GET = withTelemetry('/api/jobs', handleGET)
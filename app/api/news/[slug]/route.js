@@ -1,8 +1,9 @@
 import { NextResponse } from 'next/server'
 import { prisma } from '@/lib/prisma'
+import { withTelemetry } from '@/lib/telemetry'
 
 // GET - Get single news by slug (public)
-export async function GET(request, { params }) {
+async function handleGET(request, { params }) {
     try {
         const { slug } = await params
 
@@ -52,3 +53,5 @@ export async function GET(request, { params }) {
         return NextResponse.json({ error: 'Internal server error' }, { status: 500 })
     }
 }
+
+export const GET = withTelemetry('/api/news/[slug]', handleGET)
@@ -2,8 +2,9 @@ import { NextResponse } from 'next/server'
 import { prisma } from '@/lib/prisma'
 import { getTokenFromRequest, verifyToken } from '@/lib/auth'
 import { validateCSRFToken, csrfErrorResponse } from '@/lib/csrf'
+import { withTelemetry } from '@/lib/telemetry'
 
-export async function POST(request, { params }) {
+async function handlePOST(request, { params }) {
     try {
         if (!validateCSRFToken(request)) {
             return csrfErrorResponse()
@@ -125,3 +126,5 @@ export async function POST(request, { params }) {
         }, { status: 500 })
     }
 }
+
+export const POST = withTelemetry('/api/profile/jobseeker/applications/[id]/accept', handlePOST)
@@ -2,8 +2,9 @@ import { NextResponse } from 'next/server'
 import { prisma } from '@/lib/prisma'
 import { createErrorResponse } from '@/lib/errorHandler'
 import { getTokenFromRequest, verifyToken } from '@/lib/auth'
+import { withTelemetry } from '@/lib/telemetry'
 
-export async function GET(request, { params }) {
+async function handleGET(request, { params }) {
     try {
         const { id: applicationId } = await params
         
@@ -81,3 +82,5 @@ export async function GET(request, { params }) {
         )
     }
 }
+
+export const GET = withTelemetry('/api/profile/jobseeker/applications/[id]/interview', handleGET)
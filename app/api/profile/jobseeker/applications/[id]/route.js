@@ -1,8 +1,9 @@
 import { NextResponse } from 'next/server'
 import { prisma } from '@/lib/prisma'
 import { requireJobseeker } from '@/lib/authHelper'
+import { withTelemetry } from '@/lib/telemetry'
 
-export async function GET(request, context) {
+async function handleGET(request, context) {
   try {
     const params = await context.params
     const { id } = params
@@ -169,3 +170,5 @@ export async function GET(request, context) {
     )
   }
 }
+
+export const GET = withTelemetry('/api/profile/jobseeker/applications/[id]', handleGET)
@@ -1,6 +1,8 @@
 import { NextResponse } from 'next/server'
 import { requireJobseeker } from '@/lib/authHelper'
+import { prisma } from '@/lib/prisma'
 import { supabaseAdmin } from '@/lib/supabase'
+import { withTelemetry } from '@/lib/telemetry'
 
 const DOCUMENT_FIELDS = {
   resume: { field: 'cvUrl', bucket: 'Resume' },
@@ -130,7 +132,7 @@ async function createDocumentResponse(documentUrl, fallbackBucket) {
   )
 }
 
-export async function GET(request) {
+async function handleGET(request) {
   try {
     const auth = await requireJobseeker(request)
 
@@ -151,7 +153,11 @@ export async function GET(request) {
       )
     }
 
-    const documentUrl = auth.jobseeker?.[config.field]
+    const documents = await prisma.jobseekers.findUnique({
+      where: { id: auth.jobseeker.id },
+      select: { [config.field]: true }
+    })
+    const documentUrl = documents?.[config.field]
 
     if (!documentUrl) {
       return NextResponse.json(
@@ -177,3 +183,5 @@ export async function GET(request) {
     )
   }
 }
+
+export const GET = withTelemetry('/api/profile/jobseeker/document', handleGET)
@@ -5,9 +5,10 @@ import { requireJobseeker } from '@/lib/authHelper'
 import { validateBody } from '@/lib/validations'
 import { interviewRespondSchema } from '@/lib/validations/profile'
 import { validateCSRFToken, csrfErrorResponse } from '@/lib/csrf'
+import { withTelemetry } from '@/lib/telemetry'
 
 // PATCH - Respond to interview (Accept/Decline/Request Reschedule)
-export async function PATCH(request, context) {
+async function handlePATCH(request, context) {
     try {
         if (!validateCSRFToken(request)) {
             return csrfErrorResponse()
@@ -115,3 +116,5 @@ export async function PATCH(request, context) {
         )
     }
 }
+
+export const PATCH = withTelemetry('/api/profile/jobseeker/interviews/[id]/respond', handlePATCH)
@@ -2,9 +2,10 @@ import { NextResponse } from 'next/server'
 import { prisma } from '@/lib/prisma'
 import { createErrorResponse } from '@/lib/errorHandler'
 import { requireJobseeker } from '@/lib/authHelper'
+import { withTelemetry } from '@/lib/telemetry'
 
 // GET - Fetch interview details for jobseeker
-export async function GET(request, { params }) {
+async function handleGET(request, { params }) {
   try {
     const { id } = await params
     
@@ -148,3 +149,5 @@ export async function GET(request, { params }) {
     )
   }
 }
+
+export const GET = withTelemetry('/api/profile/jobseeker/interviews/[id]', handleGET)
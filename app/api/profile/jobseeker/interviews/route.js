@@ -2,9 +2,10 @@ import { NextResponse } from 'next/server'
 import { prisma } from '@/lib/prisma'
 import { createErrorResponse } from '@/lib/errorHandler'
 import { requireJobseeker } from '@/lib/authHelper'
+import { withTelemetry } from '@/lib/telemetry'
 
 // GET - Fetch all interviews for jobseeker
-export async function GET(request) {
+async function handleGET(request) {
     try {
         // Authenticate
         const auth = await requireJobseeker(request)
@@ -118,3 +119,5 @@ export async function GET(request) {
         )
     }
 }
+
+export const GET = withTelemetry('/api/profile/jobseeker/interviews', handleGET)
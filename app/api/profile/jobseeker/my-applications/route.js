@@ -3,9 +3,10 @@ import { NextResponse } from 'next/server'
 import { prisma } from '@/lib/prisma'
 import { createErrorResponse } from '@/lib/errorHandler'
 import { requireJobseeker } from '@/lib/authHelper'
+import { withTelemetry } from '@/lib/telemetry'
 
 // GET - Fetch all applications for logged-in jobseeker
-export async function GET(request) {
+async function handleGET(request) {
   try {
     // Authenticate user
     const auth = await requireJobseeker(request)
@@ -139,3 +140,5 @@ export async function GET(request) {
     )
   }
 }
+
+export const GET = withTelemetry('/api/profile/jobseeker/my-applications', handleGET)
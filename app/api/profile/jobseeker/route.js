@@ -4,14 +4,14 @@ import { createErrorResponse } from '@/lib/errorHandler'
 import { cookies } from 'next/headers'
 import { verifyToken } from '@/lib/auth'
 import crypto from 'crypto'
-import { standardLimiter, getIP, rateLimitResponse } from '@/lib/rateLimit'
+import { standardLimiter, limitRequest, rateLimitResponse } from '@/lib/rateLimit'
 import { validateCSRFToken, csrfErrorResponse } from '@/lib/csrf'
+import { withTelemetry } from '@/lib/telemetry'
 
-export async function POST(request) {
+async function handlePOST(request) {
   try {
     // Rate limiting - 60 requests per minute
-    const ip = getIP(request)
-    const { success, reset } = await standardLimiter.limit(ip)
+    const { success, reset } = await limitRequest(request, standardLimiter)
     if (!success) {
       return rateLimitResponse(reset)
     }
@@ -382,7 +382,7 @@ export async function POST(request) {
   }
 }
 
-export async function GET(request) {
+async function handleGET(request) {
   try {
     // Verify authentication - AWAIT cookies()
     const cookieStore = await cookies()
@@ -599,7 +599,7 @@ export async function GET(request) {
   }
 }
 
-export async function PATCH(request) {
+async function handlePATCH(request) {
   try {
     if (!validateCSRFToken(request)) {
       return csrfErrorResponse()
@@ -678,7 +678,7 @@ export async function PATCH(request) {
   }
 }
 
-export async function DELETE(request) {
+async function handleDELETE(request) {
   try {
     if (!validateCSRFToken(request)) {
       return csrfErrorResponse()
@@ -755,3 +755,8 @@ export async function DELETE(request) {
     )
   }
 }
+
+export const POST = withTelemetry('/api/profile/jobseeker', handlePOST)
+export const GET = withTelemetry('/api/profile/jobseeker', handleGET)
+export const PATCH = withTelemetry('/api/profile/jobseeker', handlePATCH)
+export const DELETE = withTelemetry('/api/profile/jobseeker', handleDELETE)
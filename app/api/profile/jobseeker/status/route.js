@@ -2,9 +2,10 @@ import { NextResponse } from 'next/server'
 import { prisma } from '@/lib/prisma'
 import { requireJobseeker } from '@/lib/authHelper'
 import { validateCSRFToken, csrfErrorResponse } from '@/lib/csrf'
+import { withTelemetry } from '@/lib/telemetry'
 
 // GET: Get current jobseeker status (computed from contract workers)
-export async function GET(request) {
+async function handleGET(request) {
     try {
         const auth = await requireJobseeker(request)
         
@@ -78,7 +79,7 @@ export async function GET(request) {
     }
 }
 
-export async function PUT(request) {
+async function handlePUT(request) {
     try {
         if (!validateCSRFToken(request)) {
             return csrfErrorResponse()
@@ -131,3 +132,6 @@ export async function PUT(request) {
         )
     }
 }
+
+export const GET = withTelemetry('/api/profile/jobseeker/status', handleGET)
+export const PUT = withTelemetry('/api/profile/jobseeker/status', handlePUT)
@@ -2,6 +2,7 @@ import { NextResponse } from 'next/server'
 import { prisma } from '@/lib/prisma'
 import { requireRecruiter } from '@/lib/authHelper'
 import { supabaseAdmin } from '@/lib/supabase'
+import { withTelemetry } from '@/lib/telemetry'
 
 const DOCUMENT_FIELDS = {
   resume: { field: 'cvUrl', bucket: 'Resume' },
@@ -131,7 +132,7 @@ async function createDocumentResponse(documentUrl, fallbackBucket) {
   )
 }
 
-export async function GET(request, context) {
+async function handleGET(request, context) {
   try {
     const auth = await requireRecruiter(request)
 
@@ -196,3 +197,5 @@ export async function GET(request, context) {
     )
   }
 }
+
+export const GET = withTelemetry('/api/profile/recruiter/applications/[id]/document', handleGET)
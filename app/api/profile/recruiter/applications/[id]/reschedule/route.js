@@ -2,8 +2,9 @@ import { NextResponse } from 'next/server'
 import { prisma } from '@/lib/prisma'
 import { requireRecruiter } from '@/lib/authHelper'
 import { validateCSRFToken, csrfErrorResponse } from '@/lib/csrf'
+import { withTelemetry } from '@/lib/telemetry'
 
-export async function POST(request, context) {
+async function handlePOST(request, context) {
     try {
         if (!validateCSRFToken(request)) {
             return csrfErrorResponse()
@@ -151,7 +152,7 @@ export async function POST(request, context) {
 }
 
 // DELETE - Reject reschedule request
-export async function DELETE(request, context) {
+async function handleDELETE(request, context) {
     try {
         if (!validateCSRFToken(request)) {
             return csrfErrorResponse()
@@ -271,3 +272,6 @@ export async function DELETE(request, context) {
         )
     }
 }
+
+export const POST = withTelemetry('/api/profile/recruiter/applications/[id]/reschedule', handlePOST)
+export const DELETE = withTelemetry('/api/profile/recruiter/applications/[id]/reschedule', handleDELETE)
@@ -1,16 +1,18 @@
-import { NextResponse } from 'next/server'
+import { NextResponse, after } from 'next/server'
 import { prisma } from '@/lib/prisma'
 import { createErrorResponse } from '@/lib/errorHandler'
 import { requireRecruiter } from '@/lib/authHelper'
-import { sendApplicationDecision } from '@/lib/email/sendApplicationDecision'
+import { applicationDecisionEmail } from '@/lib/email/applicationDecision'
+import { enqueueEmails, drainEmailOutbox } from '@/lib/email/outbox'
 import { validateCSRFToken, csrfErrorResponse } from '@/lib/csrf'
 import {
   RECRUITER_APPLICATION_STATUSES,
   canRecruiterSetApplicationStatus,
   getInvalidRecruiterStatusMessage
 } from '@/lib/applications/statusTransitions'
+import { withTelemetry } from '@/lib/telemetry'
 
-export async function GET(request, context) {
+async function handleGET(request, context) {
   try {
     const params = await context.params
     const { id } = params
@@ -143,7 +145,7 @@ export async function GET(request, context) {
 }
 
 // Update application status
-export async function PATCH(request, context) {
+async function handlePATCH(request, context) {
   try {
     if (!validateCSRFToken(request)) {
       return csrfErrorResponse()
@@ -267,69 +269,79 @@ export async function PATCH(request, context) {
       updateData.respondedAt = new Date()
     }
 
-    const updatedApplication = await prisma.applications.update({
-      where: { id },
-      data: updateData,
-      include: {
-        jobs: {
-          select: {
-            id: true,
-            title: true,
-            slug: true,
-            companies: {
-              select: {
-                name: true
+    const isDecision = status === 'ACCEPTED' || status === 'REJECTED'
+
+    // Status change and decision email commit together
+    const updatedApplication = await prisma.$transaction(async (tx) => {
+      const updated = await tx.applications.update({
+        where: { id },
+        data: updateData,
+        include: {
+          jobs: {
+            select: {
+              id: true,
+              title: true,
+              slug: true,
+              companies: {
+                select: {
+                  name: true
+                }
               }
             }
-          }
-        },
-        jobseekers: {
-          select: {
-            id: true,
-            firstName: true,
-            lastName: true,
-            email: true,
-            users: {
-              select: {
-                email: true
+          },
+          jobseekers: {
+            select: {
+              id: true,
+              firstName: true,
+              lastName: true,
+              email: true,
+              users: {
+                select: {
+                  email: true
+                }
               }
             }
           }
         }
-      }
-    })
-
-    // When ACCEPTED, also update jobseeker employment status
-    if (status === 'ACCEPTED') {
-      await prisma.jobseekers.update({
-        where: { id: updatedApplication.jobseekers.id },
-        data: {
-          isEmployed: true,
-          isLookingForJob: false,
-          employedAt: new Date(),
-          employedCompany: updatedApplication.jobs.companies.name,
-          currentTitle: `${updatedApplication.jobs.companies.name} - ${updatedApplication.jobs.title}`
-        }
       })
-    }
 
-    // Send email notification for final decisions
-    if (status === 'ACCEPTED' || status === 'REJECTED') {
-      try {
-        await sendApplicationDecision({
-          to: updatedApplication.jobseekers.users?.email || updatedApplication.jobseekers.email,
-          jobseekerName: `${updatedApplication.jobseekers.firstName} ${updatedApplication.jobseekers.lastName}`,
-          jobTitle: updatedApplication.jobs.title,
-          companyName: updatedApplication.jobs.companies.name,
-          decision: status,
-          message: recruiterNotes || '',
-          nextSteps: status === 'ACCEPTED' ? 
-            'Tim kami akan segera menghubungi Anda untuk proses selanjutnya. Harap periksa email dan telepon Anda secara berkala.' : 
-            ''
+      // When ACCEPTED, also update jobseeker employment status
+      if (status === 'ACCEPTED') {
+        await tx.jobseekers.update({
+          where: { id: updated.jobseekers.id },
+          data: {
+            isEmployed: true,
+            isLookingForJob: false,
+            employedAt: new Date(),
+            employedCompany: updated.jobs.companies.name,
+            currentTitle: `${updated.jobs.companies.name} - ${updated.jobs.title}`
+          }
         })
-      } catch (emailError) {
-        // Don't fail the request if email fails
       }
+
+      // Email notification for final decisions
+      if (isDecision) {
+        await enqueueEmails(tx, [
+          applicationDecisionEmail({
+            applicationId: id,
+            to: updated.jobseekers.users?.email || updated.jobseekers.email,
+            jobseekerName: `${updated.jobseekers.firstName} ${updated.jobseekers.lastName}`,
+            jobTitle: updated.jobs.title,
+            companyName: updated.jobs.companies.name,
+            decision: status,
+            message: recruiterNotes || '',
+            nextSteps: status === 'ACCEPTED' ?
+              'Tim kami akan segera menghubungi Anda untuk proses selanjutnya. Harap periksa email dan telepon Anda secara berkala.' :
+              ''
+          })
+        ])
+      }
+
+      return updated
+    })
+
+    if (isDecision) {
+      after(() => drainEmailOutbox())
     }
 
     return NextResponse.json({
@@ -347,7 +359,7 @@ export async function PATCH(request, context) {
 }
 
 // Delete application
-export async function DELETE(request, context) {
+async function handleDELETE(request, context) {
   try {
     if (!validateCSRFToken(request)) {
       return csrfErrorResponse()
@@ -420,3 +432,7 @@ export async function DELETE(request, context) {
     )
   }
 }
+
+export const GET = withTelemetry('/api/profile/recruiter/applications/[id]', handleGET)
+export const PATCH = withTelemetry('/api/profile/recruiter/applications/[id]', handlePATCH)
+export const DELETE = withTelemetry('/api/profile/recruiter/applications/[id]', handleDELETE)
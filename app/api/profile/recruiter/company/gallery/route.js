@@ -4,9 +4,10 @@ import { uploadCompanyGalleryPhoto, deleteCompanyGalleryPhoto } from '@/lib/supa
 import { prisma } from '@/lib/prisma'
 import { validateCSRFToken, csrfErrorResponse } from '@/lib/csrf'
 import { validateFile } from '@/lib/fileValidation'
+import { withTelemetry } from '@/lib/telemetry'
 
 // Upload gallery photo
-export async function POST(request) {
+async function handlePOST(request) {
     try {
         if (!validateCSRFToken(request)) {
             return csrfErrorResponse()
@@ -97,7 +98,7 @@ export async function POST(request) {
 }
 
 // Delete gallery photo
-export async function DELETE(request) {
+async function handleDELETE(request) {
     try {
         if (!validateCSRFToken(request)) {
             return csrfErrorResponse()
@@ -166,3 +167,6 @@ export async function DELETE(request) {
         )
     }
 }
+
+export const POST = withTelemetry('/api/profile/recruiter/company/gallery', handlePOST)
+export const DELETE = withTelemetry('/api/profile/recruiter/company/gallery', handleDELETE)
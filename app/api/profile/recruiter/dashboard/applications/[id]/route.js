@@ -4,9 +4,10 @@ import { NextResponse } from 'next/server'
 import { prisma } from '@/lib/prisma'
 import { getTokenFromRequest, verifyToken } from '@/lib/auth'
 import { validateCSRFToken, csrfErrorResponse } from '@/lib/csrf'
+import { withTelemetry } from '@/lib/telemetry'
 
 // GET - Fetch single application detail (FOR RECRUITER)
-export async function GET(request, { params }) {
+async function handleGET(request, { params }) {
   try {
     const token = getTokenFromRequest(request)
     if (!token) {
@@ -158,7 +159,7 @@ export async function GET(request, { params }) {
 }
 
 // PATCH - Update application status and notes (FOR RECRUITER)
-export async function PATCH(request, { params }) {
+async function handlePATCH(request, { params }) {
   try {
     // CSRF validation
     if (!validateCSRFToken(request)) {
@@ -262,3 +263,6 @@ export async function PATCH(request, { params }) {
     )
   }
 }
+
+export const GET = withTelemetry('/api/profile/recruiter/dashboard/applications/[id]', handleGET)
+export const PATCH = withTelemetry('/api/profile/recruiter/dashboard/applications/[id]', handlePATCH)
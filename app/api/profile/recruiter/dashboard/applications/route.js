@@ -4,8 +4,9 @@ import { NextResponse } from 'next/server'
 import { prisma } from '@/lib/prisma'
 import { createErrorResponse } from '@/lib/errorHandler'
 import { getTokenFromRequest, verifyToken } from '@/lib/auth'
+import { withTelemetry } from '@/lib/telemetry'
 
-export async function GET(request) {
+async function handleGET(request) {
   try {
     const token = getTokenFromRequest(request)
     if (!token) {
@@ -186,3 +187,5 @@ export async function GET(request) {
     )
   }
 }
+
+export const GET = withTelemetry('/api/profile/recruiter/dashboard/applications', handleGET)
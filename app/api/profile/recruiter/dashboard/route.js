@@ -2,8 +2,10 @@ import { NextResponse } from "next/server";
 import { createErrorResponse } from '@/lib/errorHandler'
 import { prisma } from "@/lib/prisma";
 import { requireRecruiter } from "@/lib/authHelper";
+import { getDashboardSummary, toDashboardStats } from "@/lib/recruiterDashboard";
+import { withTelemetry } from "@/lib/telemetry";
 
-export async function GET(request) {
+async function handleGET(request) {
   try {
     const auth = await requireRecruiter(request);
 
@@ -21,17 +23,11 @@ export async function GET(request) {
     }
 
     const companyId = recruiter.companyId;
-    const weekAgo = new Date();
-    weekAgo.setDate(weekAgo.getDate() - 7);
 
-    // Run all queries in parallel for better performance
-    const [
-      company,
-      jobStats,
-      applicationStats,
-      newApplicationsCount,
-      recentApplications,
-    ] = await Promise.all([
+    // Counts come from the trigger-maintained summary (one read) instead of
+    // aggregating the company's jobs and applications on every poll; recent
+    // jobs show their stored applicationCount rather than a count per job
+    const [company, summary, recentApplications] = await Promise.all([
       // 1. Get company with recent active jobs
       prisma.companies.findUnique({
         where: { id: companyId },
@@ -56,36 +52,16 @@ export async function GET(request) {
               title: true,
               slug: true,
               createdAt: true,
-              _count: { select: { applications: true } },
+              applicationCount: true,
             },
           },
-          _count: { select: { jobs: true, recruiters: true } },
         },
       }),
 
-      // 2. Get job statistics using aggregation
-      prisma.jobs.groupBy({
-        by: ["isActive"],
-        where: { companyId },
-        _count: true,
-      }),
-
-      // 3. Get application statistics using groupBy (much faster than filtering in JS)
-      prisma.applications.groupBy({
-        by: ["status"],
-        where: { jobs: { companyId } },
-        _count: true,
-      }),
-
-      // 4. Count new applications this week
-      prisma.applications.count({
-        where: {
-          jobs: { companyId },
-          createdAt: { gte: weekAgo },
-        },
-      }),
+      // 2. Job and application counts
+      getDashboardSummary(companyId),
 
-      // 5. Get recent applications with minimal data
+      // 3. Get recent applications with minimal data
       prisma.applications.findMany({
         where: { jobs: { companyId } },
         select: {
@@ -119,38 +95,12 @@ export async function GET(request) {
       return NextResponse.json({ error: "Company not found" }, { status: 404 });
     }
 
-    // Process job stats
-    const totalJobs = jobStats.reduce((sum, stat) => sum + stat._count, 0);
-    const activeJobs = jobStats.find((s) => s.isActive === true)?._count || 0;
-
-    // Process application stats into object
-    const appStatsMap = {};
-    applicationStats.forEach((stat) => {
-      appStatsMap[stat.status] = stat._count;
-    });
-
-    const totalApplications = applicationStats.reduce(
-      (sum, stat) => sum + stat._count,
-      0
-    );
-
-    const stats = {
-      totalJobs,
-      activeJobs,
-      totalApplications,
-      pendingApplications: appStatsMap["PENDING"] || 0,
-      reviewingApplications: appStatsMap["REVIEWING"] || 0,
-      shortlistedApplications: appStatsMap["SHORTLISTED"] || 0,
-      interviewScheduled: appStatsMap["INTERVIEW_SCHEDULED"] || 0,
-      accepted: appStatsMap["ACCEPTED"] || 0,
-      rejected: appStatsMap["REJECTED"] || 0,
-      newApplicationsThisWeek: newApplicationsCount,
-    };
+    const stats = toDashboardStats(summary);
 
     return NextResponse.json({
       success: true,
       data: {
-        company,
+        company: { ...company, _count: { jobs: summary.jobs.total } },
         recruiter,
         stats,
         recentApplications,
@@ -166,3 +116,5 @@ export async function GET(request) {
     );
   }
 }
+
+export const GET = withTelemetry("/api/profile/recruiter/dashboard", handleGET);
@@ -3,9 +3,10 @@ import { prisma } from '@/lib/prisma'
 import { createErrorResponse } from '@/lib/errorHandler'
 import { requireRecruiter } from '@/lib/authHelper'
 import { validateCSRFToken, csrfErrorResponse } from '@/lib/csrf'
+import { withTelemetry } from '@/lib/telemetry'
 
 // PATCH - Mark interview as completed
-export async function PATCH(request, context) {
+async function handlePATCH(request, context) {
     try {
         if (!validateCSRFToken(request)) {
             return csrfErrorResponse()
@@ -180,3 +181,5 @@ export async function PATCH(request, context) {
         )
     }
 }
+
+export const PATCH = withTelemetry('/api/profile/recruiter/interviews/[id]/complete', handlePATCH)
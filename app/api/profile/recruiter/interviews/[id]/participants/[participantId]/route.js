@@ -3,9 +3,10 @@ import { prisma } from '@/lib/prisma'
 import { createErrorResponse } from '@/lib/errorHandler'
 import { requireRecruiter } from '@/lib/authHelper'
 import { validateCSRFToken, csrfErrorResponse } from '@/lib/csrf'
+import { withTelemetry } from '@/lib/telemetry'
 
 // PATCH - Update participant status (for reject reschedule)
-export async function PATCH(request, context) {
+async function handlePATCH(request, context) {
     try {
         if (!validateCSRFToken(request)) {
             return csrfErrorResponse()
@@ -99,3 +100,5 @@ export async function PATCH(request, context) {
         )
     }
 }
+
+export const PATCH = withTelemetry('/api/profile/recruiter/interviews/[id]/participants/[participantId]', handlePATCH)
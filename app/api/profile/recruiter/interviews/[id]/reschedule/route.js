@@ -1,15 +1,17 @@
-import { NextResponse } from 'next/server'
+import { NextResponse, after } from 'next/server'
 import { randomUUID } from 'crypto'
 import { prisma } from '@/lib/prisma'
 import { createErrorResponse } from '@/lib/errorHandler'
 import { requireRecruiter } from '@/lib/authHelper'
-import { sendRescheduleNotification } from '@/lib/email/sendRescheduleNotification'
+import { rescheduleNotificationEmail } from '@/lib/email/rescheduleNotification'
+import { enqueueEmails, drainEmailOutbox } from '@/lib/email/outbox'
 import { validateBody } from '@/lib/validations'
 import { recruiterRescheduleSchema } from '@/lib/validations/profile'
 import { validateCSRFToken, csrfErrorResponse } from '@/lib/csrf'
+import { withTelemetry } from '@/lib/telemetry'
 
 // PATCH - Reschedule interview
-export async function PATCH(request, context) {
+async function handlePATCH(request, context) {
   try {
     if (!validateCSRFToken(request)) {
       return csrfErrorResponse()
@@ -148,13 +150,87 @@ export async function PATCH(request, context) {
         )
       }
 
-      // 2. Create NEW interview for this participant
-      const newInterview = await prisma.interviews.create({
+      // Reschedule and notification commit together
+      const newInterview = await prisma.$transaction(async (tx) => {
+        // 2. Create NEW interview for this participant
+        const created = await tx.interviews.create({
+          data: {
+            id: randomUUID(),
+            recruiterId: interview.recruiterId,
+            jobId: interview.jobId,
+            title: `${interview.title} (Reschedule)`,
+            scheduledAt: parsedScheduledAt,
+            duration: parsedDuration,
+            meetingType: normalizedMeetingType,
+            meetingUrl: normalizedMeetingType === 'ONLINE' ? meetingUrl : null,
+            location: normalizedMeetingType === 'IN_PERSON' ? location : null,
+            description: description || interview.description,
+            status: 'SCHEDULED',
+            updatedAt: new Date()
+          }
+        })
+
+        // 3. Move participant to new interview. A candidate-initiated
+        // reschedule request counts as confirmation for the approved slot.
+        await tx.interview_participants.update({
+          where: { id: participantId },
+          data: {
+            interviewId: created.id,
+            status: 'ACCEPTED',
+            responseMessage: null,
+            respondedAt: new Date(),
+            updatedAt: new Date()
+          }
+        })
+
+        await tx.applications.update({
+          where: { id: participant.applicationId },
+          data: {
+            status: 'INTERVIEW_SCHEDULED',
+            interviewDate: parsedScheduledAt,
+            confirmedByJobseeker: true,
+            respondedAt: new Date(),
+            updatedAt: new Date()
+          }
+        })
+
+        // 4. Notify only this participant
+        await enqueueEmails(tx, [
+          rescheduleNotificationEmail({
+            applicationId: participant.applicationId,
+            to: participant.applications.jobseekers.users.email,
+            candidateName: `${participant.applications.jobseekers.firstName} ${participant.applications.jobseekers.lastName}`,
+            jobTitle: interview.jobs.title,
+            companyName: interview.jobs.companies.name,
+            oldScheduledAt: oldScheduledAt,
+            newScheduledAt: parsedScheduledAt,
+            duration: parsedDuration,
+            meetingType: normalizedMeetingType,
+            location: normalizedMeetingType === 'IN_PERSON' ? location : null,
+            description: description || interview.description,
+            interviewId: created.id
+          })
+        ])
+
+        return created
+      })
+
+      after(() => drainEmailOutbox())
+
+      return NextResponse.json({
+        success: true,
+        message: 'Individual interview rescheduled successfully',
+        data: {
+          interview: newInterview
+        }
+      })
+    }
+
+    // Default: Update entire interview (group reschedule); notifications commit with it
+    const updatedInterview = await prisma.$transaction(async (tx) => {
+      const updated = await tx.interviews.update({
+        where: { id },
         data: {
-          id: randomUUID(),
-          recruiterId: interview.recruiterId,
-          jobId: interview.jobId,
-          title: `${interview.title} (Reschedule)`,
           scheduledAt: parsedScheduledAt,
           duration: parsedDuration,
           meetingType: normalizedMeetingType,
@@ -163,127 +239,56 @@ export async function PATCH(request, context) {
           description: description || interview.description,
           status: 'SCHEDULED',
           updatedAt: new Date()
+        },
+        include: {
+          interview_participants: true
         }
       })
 
-      // 3. Move participant to new interview. A candidate-initiated
-      // reschedule request counts as confirmation for the approved slot.
-      await prisma.interview_participants.update({
-        where: { id: participantId },
+      // Reset all participants status to PENDING
+      await tx.interview_participants.updateMany({
+        where: {
+          interviewId: id
+        },
         data: {
-          interviewId: newInterview.id,
-          status: 'ACCEPTED',
+          status: 'PENDING',
           responseMessage: null,
-          respondedAt: new Date(),
+          respondedAt: null,
           updatedAt: new Date()
         }
       })
 
-      await prisma.applications.update({
-        where: { id: participant.applicationId },
+      await tx.applications.updateMany({
+        where: {
+          id: { in: interview.interview_participants.map(participant => participant.applicationId) }
+        },
         data: {
           status: 'INTERVIEW_SCHEDULED',
           interviewDate: parsedScheduledAt,
-          confirmedByJobseeker: true,
-          respondedAt: new Date(),
           updatedAt: new Date()
         }
       })
 
-      // 4. Send notification only to this participant
-       try {
-        await sendRescheduleNotification({
-          to: participant.applications.jobseekers.users.email,
-          candidateName: `${participant.applications.jobseekers.firstName} ${participant.applications.jobseekers.lastName}`,
-          jobTitle: interview.jobs.title,
-          companyName: interview.jobs.companies.name,
-          oldScheduledAt: oldScheduledAt,
-          newScheduledAt: parsedScheduledAt,
-          duration: parsedDuration,
-          meetingType: normalizedMeetingType,
-          meetingUrl: normalizedMeetingType === 'ONLINE' ? meetingUrl : null,
-          location: normalizedMeetingType === 'IN_PERSON' ? location : null,
-          description: description || interview.description,
-          interviewId: newInterview.id
-        })
-      } catch (emailError) {
-        console.error("Failed to send reschedule email", emailError)
-      }
-
-      return NextResponse.json({
-        success: true,
-        message: 'Individual interview rescheduled successfully',
-        data: {
-          interview: newInterview
-        }
-      })
-    }
-
-    // Default: Update entire interview (group reschedule)
-    const updatedInterview = await prisma.interviews.update({
-      where: { id },
-      data: {
-        scheduledAt: parsedScheduledAt,
+      // Notify all participants
+      await enqueueEmails(tx, interview.interview_participants.map(participant => rescheduleNotificationEmail({
+        applicationId: participant.applicationId,
+        to: participant.applications.jobseekers.users.email,
+        candidateName: `${participant.applications.jobseekers.firstName} ${participant.applications.jobseekers.lastName}`,
+        jobTitle: interview.jobs.title,
+        companyName: interview.jobs.companies.name,
+        oldScheduledAt: oldScheduledAt,
+        newScheduledAt: parsedScheduledAt,
         duration: parsedDuration,
         meetingType: normalizedMeetingType,
-        meetingUrl: normalizedMeetingType === 'ONLINE' ? meetingUrl : null,
         location: normalizedMeetingType === 'IN_PERSON' ? location : null,
         description: description || interview.description,
-        status: 'SCHEDULED',
-        updatedAt: new Date()
-      },
-      include: {
-        interview_participants: true
-      }
-    })
-
-    // Reset all participants status to PENDING
-    await prisma.interview_participants.updateMany({
-      where: {
         interviewId: id
-      },
-      data: {
-        status: 'PENDING',
-        responseMessage: null,
-        respondedAt: null,
-        updatedAt: new Date()
-      }
-    })
+      })))
 
-    await prisma.applications.updateMany({
-      where: {
-        id: { in: interview.interview_participants.map(participant => participant.applicationId) }
-      },
-      data: {
-        status: 'INTERVIEW_SCHEDULED',
-        interviewDate: parsedScheduledAt,
-        updatedAt: new Date()
-      }
+      return updated
     })
 
-    // Send reschedule notification to all participants
-    const emailPromises = interview.interview_participants.map(async (participant) => {
-      try {
-        await sendRescheduleNotification({
-          to: participant.applications.jobseekers.users.email,
-          candidateName: `${participant.applications.jobseekers.firstName} ${participant.applications.jobseekers.lastName}`,
-          jobTitle: interview.jobs.title,
-          companyName: interview.jobs.companies.name,
-          oldScheduledAt: oldScheduledAt,
-          newScheduledAt: parsedScheduledAt,
-          duration: parsedDuration,
-          meetingType: normalizedMeetingType,
-          meetingUrl: normalizedMeetingType === 'ONLINE' ? meetingUrl : null,
-          location: normalizedMeetingType === 'IN_PERSON' ? location : null,
-          description: description || interview.description,
-          interviewId: id
-        })
-      } catch (emailError) {
-        // Don't fail the whole request if email fails
-      }
-    })
-
-    await Promise.all(emailPromises)
+    after(() => drainEmailOutbox())
 
     return NextResponse.json({
       success: true,
@@ -314,3 +319,5 @@ export async function PATCH(request, context) {
     )
   }
 }
+
+export const PATCH = withTelemetry('/api/profile/recruiter/interviews/[id]/reschedule', handlePATCH)
@@ -3,9 +3,10 @@ import { prisma } from '@/lib/prisma'
 import { createErrorResponse } from '@/lib/errorHandler'
 import { requireRecruiter } from '@/lib/authHelper'
 import { validateCSRFToken, csrfErrorResponse } from '@/lib/csrf'
+import { withTelemetry } from '@/lib/telemetry'
 
 // GET - Fetch interview details for recruiter
-export async function GET(request, context) {
+async function handleGET(request, context) {
   try {
     const params = await context.params
     const { id } = params
@@ -153,7 +154,7 @@ export async function GET(request, context) {
 }
 
 // DELETE - Delete interview and auto-reject applications
-export async function DELETE(request, context) {
+async function handleDELETE(request, context) {
   try {
     if (!validateCSRFToken(request)) {
       return csrfErrorResponse()
@@ -240,3 +241,6 @@ export async function DELETE(request, context) {
     )
   }
 }
+
+export const GET = withTelemetry('/api/profile/recruiter/interviews/[id]', handleGET)
+export const DELETE = withTelemetry('/api/profile/recruiter/interviews/[id]', handleDELETE)
@@ -2,9 +2,10 @@ import { NextResponse } from 'next/server'
 import { prisma } from '@/lib/prisma'
 import { createErrorResponse } from '@/lib/errorHandler'
 import { requireRecruiter } from '@/lib/authHelper'
+import { withTelemetry } from '@/lib/telemetry'
 
 // GET - Fetch all interviews for recruiter with participants
-export async function GET(request) {
+async function handleGET(request) {
     try {
         // Authenticate
         const auth = await requireRecruiter(request)
@@ -116,3 +117,5 @@ export async function GET(request) {
         )
     }
 }
+
+export const GET = withTelemetry('/api/profile/recruiter/interviews/list', handleGET)
@@ -1,11 +1,13 @@
-import { NextResponse } from 'next/server'
+import { NextResponse, after } from 'next/server'
 import { randomUUID } from 'crypto'
 import { prisma } from '@/lib/prisma'
 import { createErrorResponse } from '@/lib/errorHandler'
 import { requireRecruiter } from '@/lib/authHelper'
-import { sendInterviewInvitation } from '@/lib/email/sendInterviewInvitation'
+import { interviewInvitationEmail } from '@/lib/email/interviewInvitation'
+import { enqueueEmails, drainEmailOutbox } from '@/lib/email/outbox'
 import { validateCSRFToken, csrfErrorResponse } from '@/lib/csrf'
 import { INTERVIEW_ELIGIBLE_APPLICATION_STATUSES } from '@/lib/applications/statusTransitions'
+import { withTelemetry } from '@/lib/telemetry'
 
 function parseScheduledAt({ scheduledAt, date, time }) {
     if (scheduledAt) return new Date(scheduledAt)
@@ -14,7 +16,7 @@ function parseScheduledAt({ scheduledAt, date, time }) {
 }
 
 // POST - Create interview schedule (supports multiple candidates)
-export async function POST(request) {
+async function handlePOST(request) {
     try {
         if (!validateCSRFToken(request)) {
             return csrfErrorResponse()
@@ -183,86 +185,66 @@ export async function POST(request) {
             )
         }
 
-        // Create single interview for all candidates (group interview)
-        const interview = await prisma.interviews.create({
-            data: {
-                id: randomUUID(),
-                recruiterId: recruiter.id,
-                jobId: jobId,
-                title: title || `Interview - ${jobTitle}${applications.length > 1 ? ` (${applications.length} kandidat)` : ''}`,
-                scheduledAt: parsedScheduledAt,
-                duration: parsedDuration,
-                meetingType: normalizedMeetingType,
-                meetingUrl: normalizedMeetingType === 'ONLINE' ? meetingUrl : null,
-                location: normalizedMeetingType === 'IN_PERSON' ? location : null,
-                description: description || '',
-                notes: notes || null,
-                status: 'SCHEDULED',
-                updatedAt: new Date()
-            }
-        })
-
-        // Create interview participants and send emails
-        const emailPromises = []
-        const participantPromises = []
-
-        for (const application of applications) {
-            // Create participant
-            participantPromises.push(
-                prisma.interview_participants.create({
-                    data: {
-                        id: randomUUID(),
-                        interviewId: interview.id,
-                        applicationId: application.id,
-                        status: 'PENDING', // Waiting for jobseeker response
-                        updatedAt: new Date()
-                    }
-                })
-            )
-
-            // Update application status
-            participantPromises.push(
-                prisma.applications.update({
-                    where: { id: application.id },
-                    data: {
-                        status: 'INTERVIEW_SCHEDULED',
-                        interviewDate: parsedScheduledAt,
-                        updatedAt: new Date()
-                    }
-                })
-            )
-
-            // Send email invitation
-            emailPromises.push(
-                sendInterviewInvitation({
-                    to: application.jobseekers.users.email,
-                    jobseekerName: `${application.jobseekers.firstName} ${application.jobseekers.lastName}`,
-                    jobTitle: jobTitle,
-                    companyName: companyName,
+        // Interview, participants, status changes and invitations commit together
+        const interview = await prisma.$transaction(async (tx) => {
+            // Create single interview for all candidates (group interview)
+            const created = await tx.interviews.create({
+                data: {
+                    id: randomUUID(),
+                    recruiterId: recruiter.id,
+                    jobId: jobId,
+                    title: title || `Interview - ${jobTitle}${applications.length > 1 ? ` (${applications.length} kandidat)` : ''}`,
                     scheduledAt: parsedScheduledAt,
                     duration: parsedDuration,
                     meetingType: normalizedMeetingType,
                     meetingUrl: normalizedMeetingType === 'ONLINE' ? meetingUrl : null,
                     location: normalizedMeetingType === 'IN_PERSON' ? location : null,
-                    description: description,
-                    interviewId: interview.id
-                }).catch(error => {
-                    return { success: false, email: application.jobseekers.users.email, error }
-                })
-            )
-        }
+                    description: description || '',
+                    notes: notes || null,
+                    status: 'SCHEDULED',
+                    updatedAt: new Date()
+                }
+            })
 
-        // Wait for all database operations
-        await Promise.all(participantPromises)
+            await tx.interview_participants.createMany({
+                data: applications.map(application => ({
+                    id: randomUUID(),
+                    interviewId: created.id,
+                    applicationId: application.id,
+                    status: 'PENDING', // Waiting for jobseeker response
+                    updatedAt: new Date()
+                }))
+            })
 
-        // Send all emails (don't wait for these to complete)
-        Promise.all(emailPromises).then(results => {
-            const successful = results.filter(r => r?.success).length
-            const failed = results.filter(r => !r?.success).length
-            void successful
-            void failed
+            await tx.applications.updateMany({
+                where: { id: { in: applications.map(application => application.id) } },
+                data: {
+                    status: 'INTERVIEW_SCHEDULED',
+                    interviewDate: parsedScheduledAt,
+                    updatedAt: new Date()
+                }
+            })
+
+            await enqueueEmails(tx, applications.map(application => interviewInvitationEmail({
+                applicationId: application.id,
+                to: application.jobseekers.users.email,
+                jobseekerName: `${application.jobseekers.firstName} ${application.jobseekers.lastName}`,
+                jobTitle: jobTitle,
+                companyName: companyName,
+                scheduledAt: parsedScheduledAt,
+                duration: parsedDuration,
+                meetingType: normalizedMeetingType,
+                location: normalizedMeetingType === 'IN_PERSON' ? location : null,
+                description: description,
+                interviewId: created.id
+            })))
+
+            return created
         })
 
+        // Invitations are delivered by the outbox worker after the response
+        after(() => drainEmailOutbox())
+
         return NextResponse.json({
             success: true,
             data: {
@@ -279,3 +261,5 @@ export async function POST(request) {
         )
     }
 }
+
+export const POST = withTelemetry('/api/profile/recruiter/interviews', handlePOST)
@@ -9,9 +9,10 @@ import {
   canRecruiterSetApplicationStatus,
   getInvalidRecruiterStatusMessage
 } from '@/lib/applications/statusTransitions'
+import { withTelemetry } from '@/lib/telemetry'
 
 // GET - Fetch single application detail (FOR RECRUITER)
-export async function GET(request, { params }) {
+async function handleGET(request, { params }) {
   try {
     const token = getTokenFromRequest(request)
     if (!token) {
@@ -117,7 +118,7 @@ export async function GET(request, { params }) {
 }
 
 // PATCH - Update application status and notes (FOR RECRUITER)
-export async function PATCH(request, { params }) {
+async function handlePATCH(request, { params }) {
   try {
     if (!validateCSRFToken(request)) {
       return csrfErrorResponse()
@@ -215,3 +216,6 @@ export async function PATCH(request, { params }) {
     )
   }
 }
+
+export const GET = withTelemetry('/api/profile/recruiter/jobs/[slug]/applications/[id]', handleGET)
+export const PATCH = withTelemetry('/api/profile/recruiter/jobs/[slug]/applications/[id]', handlePATCH)
@@ -9,8 +9,9 @@ import {
   canRecruiterSetApplicationStatus,
   getInvalidRecruiterStatusMessage
 } from '@/lib/applications/statusTransitions'
+import { withTelemetry } from '@/lib/telemetry'
 
-export async function PATCH(request, { params }) {
+async function handlePATCH(request, { params }) {
   try {
     if (!validateCSRFToken(request)) {
       return csrfErrorResponse()
@@ -126,3 +127,5 @@ export async function PATCH(request, { params }) {
     )
   }
 }
+
+export const PATCH = withTelemetry('/api/profile/recruiter/jobs/[slug]/applications/[id]/status', handlePATCH)
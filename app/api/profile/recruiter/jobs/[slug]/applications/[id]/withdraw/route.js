@@ -3,10 +3,11 @@ import { NextResponse } from 'next/server'
 import { requireJobseeker } from '@/lib/authHelper'
 import { prisma } from '@/lib/prisma'
 import { validateCSRFToken, csrfErrorResponse } from '@/lib/csrf'
+import { withTelemetry } from '@/lib/telemetry'
 
 
 // PATCH - Withdraw application
-export async function PATCH(request, { params }) {
+async function handlePATCH(request, { params }) {
   try {
     if (!validateCSRFToken(request)) {
       return csrfErrorResponse()
@@ -92,3 +93,5 @@ export async function PATCH(request, { params }) {
     )
   }
 }
+
+export const PATCH = withTelemetry('/api/profile/recruiter/jobs/[slug]/applications/[id]/withdraw', handlePATCH)
@@ -1,9 +1,14 @@
 //app/api/profile/recruiter/jobs/[slug]/applications/batch/route.js
-import { NextResponse } from 'next/server'
+import { NextResponse, after } from 'next/server'
 import { prisma } from '@/lib/prisma'
-import { getCurrentUser } from '@/lib/authHelper'
+import { getCurrentUser, requireRecruiter } from '@/lib/authHelper'
+import { validateCSRFToken, csrfErrorResponse } from '@/lib/csrf'
+import { applyBulkStatusChange, MAX_BULK_APPLICATION_IDS } from '@/lib/applications/bulkStatus'
+import { RECRUITER_APPLICATION_STATUSES } from '@/lib/applications/statusTransitions'
+import { drainEmailOutbox } from '@/lib/email/outbox'
+import { withTelemetry } from '@/lib/telemetry'
 
-export async function GET(request) {
+async function handleGET(request) {
   try {
     const auth = await getCurrentUser(request)
     
@@ -95,4 +100,96 @@ export async function GET(request) {
       { status: 500 }
     )
   }
-}
\ No newline at end of file
+}
+
+// PATCH - Change the status of many applications of this job at once
+// Body: { ids: string[], status: string, notes?: string }
+async function handlePATCH(request, { params }) {
+  try {
+    if (!validateCSRFToken(request)) {
+      return csrfErrorResponse()
+    }
+
+    const { slug } = await params
+
+    const auth = await requireRecruiter(request)
+
+    if (auth.error) {
+      return NextResponse.json(
+        { error: auth.error },
+        { status: auth.status }
+      )
+    }
+
+    const { recruiter } = auth
+    const { ids, status, notes } = await request.json()
+
+    if (!Array.isArray(ids) || ids.length === 0 || ids.some(id => typeof id !== 'string')) {
+      return NextResponse.json(
+        { error: 'Daftar ID lamaran diperlukan' },
+        { status: 400 }
+      )
+    }
+
+    if (ids.length > MAX_BULK_APPLICATION_IDS) {
+      return NextResponse.json(
+        { error: `Maksimal ${MAX_BULK_APPLICATION_IDS} lamaran per permintaan` },
+        { status: 400 }
+      )
+    }
+
+    if (!RECRUITER_APPLICATION_STATUSES.includes(status)) {
+      return NextResponse.json(
+        { error: 'Status lamaran tidak valid untuk recruiter' },
+        { status: 400 }
+      )
+    }
+
+    // Ownership is checked once for the job instead of per application
+    const job = await prisma.jobs.findFirst({
+      where: { slug, recruiterId: recruiter.id },
+      select: {
+        id: true,
+        title: true,
+        companies: { select: { name: true } }
+      }
+    })
+
+    if (!job) {
+      return NextResponse.json(
+        { error: 'Lowongan tidak ditemukan atau tidak diizinkan' },
+        { status: 404 }
+      )
+    }
+
+    const { results, updated, emailsQueued } = await applyBulkStatusChange({
+      recruiter,
+      job,
+      ids,
+      status,
+      notes: typeof notes === 'string' && notes.trim() ? notes : undefined,
+      request
+    })
+
+    if (emailsQueued > 0) {
+      after(() => drainEmailOutbox())
+    }
+
+    return NextResponse.json({
+      success: true,
+      message: `${updated} dari ${results.length} lamaran diperbarui`,
+      updated,
+      failed: results.length - updated,
+      results
+    })
+
+  } catch (error) {
+    return NextResponse.json(
+      { error: 'Failed to update application status' },
+      { status: 500 }
+    )
+  }
+}
+
+export const GET = withTelemetry('/api/profile/recruiter/jobs/[slug]/applications/batch', handleGET)
+export const PATCH = withTelemetry('/api/profile/recruiter/jobs/[slug]/applications/batch', handlePATCH)
@@ -3,8 +3,9 @@
 import { NextResponse } from 'next/server'
 import { prisma } from '@/lib/prisma'
 import { getTokenFromRequest, verifyToken } from '@/lib/auth'
+import { withTelemetry } from '@/lib/telemetry'
 
-export async function GET(request, { params }) {
+async function handleGET(request, { params }) {
   try {
     const token = getTokenFromRequest(request)
     if (!token) {
@@ -58,3 +59,5 @@ export async function GET(request, { params }) {
     )
   }
 }
+
+export const GET = withTelemetry('/api/profile/recruiter/jobs/[slug]/edit', handleGET)
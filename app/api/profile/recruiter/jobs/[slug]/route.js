@@ -2,8 +2,10 @@ import { NextResponse } from 'next/server'
 import { prisma } from '@/lib/prisma'
 import { getCurrentUser } from '@/lib/authHelper'
 import { validateCSRFToken, csrfErrorResponse } from '@/lib/csrf'
+import { invalidateCacheTags, CacheTag } from '@/lib/cache'
+import { withTelemetry } from '@/lib/telemetry'
 
-export async function GET(request, { params }) {
+async function handleGET(request, { params }) {
   try {
     const auth = await getCurrentUser(request)
     if (auth.error) {
@@ -112,7 +114,7 @@ export async function GET(request, { params }) {
   }
 }
 
-export async function DELETE(request, { params }) {
+async function handleDELETE(request, { params }) {
   try {
     if (!validateCSRFToken(request)) {
       return csrfErrorResponse()
@@ -176,6 +178,8 @@ export async function DELETE(request, { params }) {
       where: { id: job.id }
     })
 
+    await invalidateCacheTags(CacheTag.JOBS)
+
     return NextResponse.json({
       success: true,
       message: 'Lowongan berhasil dihapus'
@@ -188,3 +192,6 @@ export async function DELETE(request, { params }) {
     )
   }
 }
+
+export const GET = withTelemetry('/api/profile/recruiter/jobs/[slug]', handleGET)
+export const DELETE = withTelemetry('/api/profile/recruiter/jobs/[slug]', handleDELETE)
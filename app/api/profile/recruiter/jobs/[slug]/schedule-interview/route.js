@@ -4,8 +4,9 @@ import { NextResponse } from 'next/server'
 import { prisma } from '@/lib/prisma'
 import { createErrorResponse } from '@/lib/errorHandler'
 import { getTokenFromRequest, verifyToken } from '@/lib/auth'
+import { withTelemetry } from '@/lib/telemetry'
 
-export async function POST() {
+async function handlePOST() {
   return NextResponse.json(
     { error: 'Endpoint lama tidak digunakan. Gunakan /api/profile/recruiter/interviews untuk menjadwalkan interview.' },
     { status: 410 }
@@ -13,7 +14,7 @@ export async function POST() {
 }
 
 // GET - Fetch applications for scheduling
-export async function GET(request, { params }) {
+async function handleGET(request, { params }) {
   try {
     const token = getTokenFromRequest(request)
     if (!token) {
@@ -87,3 +88,6 @@ export async function GET(request, { params }) {
     )
   }
 }
+
+export const POST = withTelemetry('/api/profile/recruiter/jobs/[slug]/schedule-interview', handlePOST)
+export const GET = withTelemetry('/api/profile/recruiter/jobs/[slug]/schedule-interview', handleGET)
@@ -4,8 +4,10 @@ import { NextResponse } from 'next/server'
 import { prisma } from '@/lib/prisma'
 import { getTokenFromRequest, verifyToken } from '@/lib/auth'
 import { validateCSRFToken, csrfErrorResponse } from '@/lib/csrf'
+import { invalidateCacheTags, CacheTag } from '@/lib/cache'
+import { withTelemetry } from '@/lib/telemetry'
 
-export async function POST(request, { params }) {
+async function handlePOST(request, { params }) {
   try {
     if (!validateCSRFToken(request)) {
       return csrfErrorResponse()
@@ -61,6 +63,8 @@ export async function POST(request, { params }) {
         }
       })
 
+      await invalidateCacheTags(CacheTag.JOBS)
+
       return NextResponse.json({
         success: true,
         job: updatedJob,
@@ -120,6 +124,8 @@ export async function POST(request, { params }) {
       }
     })
 
+    await invalidateCacheTags(CacheTag.JOBS)
+
     return NextResponse.json({
       success: true,
       job: updatedJob,
@@ -133,3 +139,5 @@ export async function POST(request, { params }) {
     )
   }
 }
+
+export const POST = withTelemetry('/api/profile/recruiter/jobs/[slug]/toggle-status', handlePOST)
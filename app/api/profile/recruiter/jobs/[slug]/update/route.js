@@ -5,8 +5,10 @@ import { getTokenFromRequest, verifyToken } from '@/lib/auth'
 import { validateBody } from '@/lib/validations'
 import { updateJobSchema } from '@/lib/validations/profile'
 import { validateCSRFToken, csrfErrorResponse } from '@/lib/csrf'
+import { invalidateCacheTags, CacheTag } from '@/lib/cache'
+import { withTelemetry } from '@/lib/telemetry'
 
-export async function PUT(request, { params }) {
+async function handlePUT(request, { params }) {
   try {
     if (!validateCSRFToken(request)) {
       return csrfErrorResponse()
@@ -188,6 +190,8 @@ export async function PUT(request, { params }) {
       }
     }
 
+    await invalidateCacheTags(CacheTag.JOBS)
+
     return NextResponse.json({
       success: true,
       job: updatedJob,
@@ -204,3 +208,5 @@ export async function PUT(request, { params }) {
     )
   }
 }
+
+export const PUT = withTelemetry('/api/profile/recruiter/jobs/[slug]/update', handlePUT)
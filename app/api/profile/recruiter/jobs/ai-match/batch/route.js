@@ -0,0 +1,63 @@
+import { NextResponse } from 'next/server'
+import { getCurrentUser } from '@/lib/authHelper'
+import { validateCSRFToken, csrfErrorResponse } from '@/lib/csrf'
+import { validateBody } from '@/lib/validations'
+import { aiMatchBatchSchema } from '@/lib/validations/profile'
+import { createCvMatcher } from '@/lib/matching/cvMatcher'
+import { withTelemetry } from '@/lib/telemetry'
+
+// POST /api/profile/recruiter/jobs/ai-match/batch - Score many applicants in one request
+async function handlePOST(request) {
+    try {
+        if (!validateCSRFToken(request)) {
+            return csrfErrorResponse()
+        }
+
+        const auth = await getCurrentUser(request)
+        if (auth.error) {
+            return NextResponse.json({ success: false, error: auth.error }, { status: auth.status })
+        }
+
+        if (auth.user.role !== 'RECRUITER') {
+            return NextResponse.json({ success: false, error: 'Recruiter role required' }, { status: 403 })
+        }
+
+        const validation = await validateBody(request, aiMatchBatchSchema)
+        if (!validation.success) {
+            return validation.response
+        }
+
+        const { items, job_requirements: defaultJob } = validation.data
+
+        const matcher = createCvMatcher()
+        const results = await matcher.matchMany(items.map(item => {
+            const job = item.job_requirements || defaultJob || {}
+            return {
+                cvUrl: item.cv_url,
+                cvSkills: item.cv_skills,
+                jobTitle: job.title || '',
+                jobSkills: job.skills || []
+            }
+        }))
+
+        return NextResponse.json({
+            success: true,
+            results: results.map((result, index) => ({
+                id: items[index].id,
+                match_score: result.match_score,
+                highlights: result.highlights,
+                status: result.status,
+                source: result.source
+            }))
+        })
+
+    } catch (error) {
+        console.error('AI match batch error:', error)
+        return NextResponse.json(
+            { success: false, error: 'Gagal memproses pencocokan CV' },
+            { status: 500 }
+        )
+    }
+}
+
+export const POST = withTelemetry('/api/profile/recruiter/jobs/ai-match/batch', handlePOST)
@@ -5,6 +5,8 @@ import { prisma } from '@/lib/prisma'
 import { createClient } from '@supabase/supabase-js'
 import { getCurrentUser } from '@/lib/authHelper'
 import { validateCSRFToken, csrfErrorResponse } from '@/lib/csrf'
+import { createCvMatcher } from '@/lib/matching/cvMatcher'
+import { withTelemetry } from '@/lib/telemetry'
 
 // Supabase client untuk storage
 const supabase = createClient(
@@ -12,7 +14,7 @@ const supabase = createClient(
   process.env.NEXT_PUBLIC_SUPABASE_PUBLISHABLE_DEFAULT_KEY
 )
 
-export async function POST(request) {
+async function handlePOST(request) {
     try {
         if (!validateCSRFToken(request)) {
             return csrfErrorResponse()
@@ -296,69 +298,20 @@ async function handleSkillMatching(request, user) {
         const jobTitle = body.job_requirements?.title || ''
         const jobSkills = body.job_requirements?.skills || []
         const cvUrl = body.cv_url || ''
+        const cvSkills = Array.isArray(body.cv_skills) ? body.cv_skills : []
+
+        // Cached per CV content + job skill set; falls back to skill overlap
+        // when the Python service is unavailable
+        const result = await createCvMatcher().match({ cvUrl, cvSkills, jobTitle, jobSkills })
 
-        try {
-            const pythonApiUrl = process.env.NEXT_PUBLIC_PYTHON_API_URL
-            
-            if (pythonApiUrl && cvUrl) {
-                
-                const response = await fetch(`${pythonApiUrl}/api/match`, {
-                    method: 'POST',
-                    headers: { 'Content-Type': 'application/json' },
-                    body: JSON.stringify({
-                        uri_cv: cvUrl,
-                        job_title: jobTitle,
-                        required_skill: jobSkills
-                    }),
-                    signal: AbortSignal.timeout(10000) // 10 second timeout
-                })
-
-                if (response.ok) {
-                    const data = await response.json()
-                    let matchScore = data.persentase !== undefined ? parseInt(data.persentase) : 0
-                    const highlights = data.skill || []
-                    const pythonStatus = data.status || (matchScore > 60 ? 'POTENTIAL' : 'NOT_RECOMMENDED')
-                    const noJobSkillsWarning = jobSkills.length === 0
-                    
-                    return NextResponse.json({
-                        match_score: Math.min(matchScore, 100),
-                        highlights: highlights,
-                        source: 'python_api',
-                        status: pythonStatus,
-                        cv_parsed: {
-                            nama: data.nama || null,
-                            email: data.email || null,
-                            no_telepon: data.no_telepon || data.phone || null,
-                            skills_extracted: data.skill || [],
-                            raw_text_preview: data.raw_text ? data.raw_text.substring(0, 500) : null
-                        },
-                        
-                        // Debug info
-                        debug: {
-                            cvSkillsCount: highlights.length,
-                            jobSkillsCount: jobSkills.length,
-                            matchCount: highlights.length,
-                            pythonRawScore: data.persentase,
-                            pythonStatus: pythonStatus,
-                            noJobSkillsWarning: noJobSkillsWarning,
-                            pythonFullResponse: data // Include full Python response for debugging
-                        }
-                    })
-                }
-            }
-        } catch (externalError) {
-            console.error('[AI-MATCH] Python API Error:', externalError.message || externalError)
-        }
         return NextResponse.json({
-            match_score: 0, // Fallback to 0 if analysis fails
-            highlights: [],
-            source: 'fallback_failed',
-            status: 'NOT_RECOMMENDED',
+            ...result,
             debug: {
-                cvSkillsCount: 0,
+                cvSkillsCount: result.source === 'python_api' ? result.highlights.length : cvSkills.length,
                 jobSkillsCount: jobSkills.length,
-                matchCount: 0,
-                reason: 'Python API unavailable or analysis failed'
+                matchCount: result.highlights.length,
+                noJobSkillsWarning: jobSkills.length === 0,
+                ...(result.source !== 'python_api' && { reason: 'Python API unavailable or analysis failed' })
             }
         })
 
@@ -376,13 +329,4 @@ async function handleSkillMatching(request, user) {
     }
 }
 
-// Helper function
-function extractKeywords(text) {
-    if (!text) return []
-    const commonWords = ['dan', 'atau', 'yang', 'untuk', 'dengan', 'dari', 'the', 'and', 'for', 'with', 'this', 'that']
-    return text
-        .toLowerCase()
-        .replace(/[^a-z0-9\s]/g, ' ')
-        .split(/\s+/)
-        .filter(w => w.length > 2 && !commonWords.includes(w))
-}
+export const POST = withTelemetry('/api/profile/recruiter/jobs/ai-match', handlePOST)
@@ -4,8 +4,10 @@ import { getCurrentUser } from '@/lib/authHelper'
 import { validateCSRFToken, csrfErrorResponse } from '@/lib/csrf'
 import { validateBody } from '@/lib/validations'
 import { createJobSchema } from '@/lib/validations/profile'
+import { invalidateCacheTags, CacheTag } from '@/lib/cache'
+import { withTelemetry } from '@/lib/telemetry'
 
-export async function POST(request) {
+async function handlePOST(request) {
   try {
     // CSRF validation
     if (!validateCSRFToken(request)) {
@@ -222,6 +224,8 @@ export async function POST(request) {
       }
     }
 
+    await invalidateCacheTags(CacheTag.JOBS)
+
     return NextResponse.json({
       success: true,
       message: autoApprove 
@@ -238,3 +242,5 @@ export async function POST(request) {
     )
   }
 }
+
+export const POST = withTelemetry('/api/profile/recruiter/jobs/create', handlePOST)
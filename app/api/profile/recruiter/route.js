@@ -2,9 +2,12 @@ import { NextResponse } from 'next/server'
 import { prisma } from '@/lib/prisma'
 import { requireRecruiter, getCurrentUser } from '@/lib/authHelper'
 import { validateCSRFToken, csrfErrorResponse } from '@/lib/csrf'
+import { invalidateCacheTags, CacheTag } from '@/lib/cache'
+import { invalidatePrincipal } from '@/lib/principalCache'
+import { withTelemetry } from '@/lib/telemetry'
 
 // GET - Fetch recruiter profile
-export async function GET(request) {
+async function handleGET(request) {
     try {
         // ✅ Use getCurrentUser instead
         const auth = await getCurrentUser(request)
@@ -91,7 +94,7 @@ export async function GET(request) {
 }
 
 // POST/PUT - Create or Update recruiter profile
-export async function POST(request) {
+async function handlePOST(request) {
     try {
         // CSRF validation
         if (!validateCSRFToken(request)) {
@@ -339,6 +342,11 @@ export async function POST(request) {
             })
         }
 
+        // Company name/logo appear on public listings
+        await invalidateCacheTags(CacheTag.JOBS, CacheTag.COMPANIES)
+        // Company and name are part of the cached recruiter principal
+        await invalidatePrincipal(user.id)
+
         return NextResponse.json({
             success: true,
             message: recruiter ? 'Profile updated successfully' : 'Profile created successfully',
@@ -351,4 +359,7 @@ export async function POST(request) {
             { status: 500 }
         )
     }
-}
\ No newline at end of file
+}
+
+export const GET = withTelemetry('/api/profile/recruiter', handleGET)
+export const POST = withTelemetry('/api/profile/recruiter', handlePOST)
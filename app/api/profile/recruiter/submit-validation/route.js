@@ -3,8 +3,9 @@ import { prisma } from '@/lib/prisma'
 import { createErrorResponse } from '@/lib/errorHandler'
 import { getCurrentUser } from '@/lib/authHelper'
 import { validateCSRFToken, csrfErrorResponse } from '@/lib/csrf'
+import { withTelemetry } from '@/lib/telemetry'
 
-export async function POST(request) {
+async function handlePOST(request) {
     try {
         if (!validateCSRFToken(request)) {
             return csrfErrorResponse()
@@ -84,3 +85,5 @@ export async function POST(request) {
         )
     }
 }
+
+export const POST = withTelemetry('/api/profile/recruiter/submit-validation', handlePOST)
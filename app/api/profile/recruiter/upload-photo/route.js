@@ -4,8 +4,9 @@ import { uploadRecruiterPhoto } from '@/lib/supabaseStorage'
 import { prisma } from '@/lib/prisma'
 import { validateCSRFToken, csrfErrorResponse } from '@/lib/csrf'
 import { validateFile } from '@/lib/fileValidation'
+import { withTelemetry } from '@/lib/telemetry'
 
-export async function POST(request) {
+async function handlePOST(request) {
     try {
         if (!validateCSRFToken(request)) {
             return csrfErrorResponse()
@@ -69,3 +70,5 @@ export async function POST(request) {
         )
     }
 }
+
+export const POST = withTelemetry('/api/profile/recruiter/upload-photo', handlePOST)
@@ -5,6 +5,7 @@ import { getTokenFromRequest, verifyToken } from '@/lib/auth'
 import { validateBody } from '@/lib/validations'
 import { validateCSRFToken, csrfErrorResponse } from '@/lib/csrf'
 import { z } from 'zod'
+import { withTelemetry } from '@/lib/telemetry'
 
 // Validation schema
 const processResignationSchema = z.object({
@@ -16,7 +17,7 @@ const processResignationSchema = z.object({
 
 // PATCH /api/resignations/[id]
 // Recruiter approves or rejects a resignation
-export async function PATCH(request, { params }) {
+async function handlePATCH(request, { params }) {
   try {
     if (!validateCSRFToken(request)) {
       return csrfErrorResponse()
@@ -128,7 +129,7 @@ export async function PATCH(request, { params }) {
 
 // GET /api/resignations/[id]
 // Get single resignation detail
-export async function GET(request, { params }) {
+async function handleGET(request, { params }) {
   try {
     const token = getTokenFromRequest(request)
     if (!token) {
@@ -199,3 +200,6 @@ export async function GET(request, { params }) {
     }, { status: 500 })
   }
 }
+
+export const PATCH = withTelemetry('/api/resignations/[id]', handlePATCH)
+export const GET = withTelemetry('/api/resignations/[id]', handleGET)
@@ -2,10 +2,11 @@ import { NextResponse } from 'next/server'
 import { prisma } from '@/lib/prisma'
 import { createErrorResponse } from '@/lib/errorHandler'
 import { requireRecruiter } from '@/lib/authHelper'
+import { withTelemetry } from '@/lib/telemetry'
 
 // GET /api/resignations
 // Recruiter gets list of resignations for their company
-export async function GET(request) {
+async function handleGET(request) {
   try {
     const auth = await requireRecruiter(request)
     if (auth.error) {
@@ -96,3 +97,5 @@ export async function GET(request) {
     }, { status: 500 })
   }
 }
+
+export const GET = withTelemetry('/api/resignations', handleGET)
@@ -5,6 +5,7 @@ import { getTokenFromRequest, verifyToken } from '@/lib/auth'
 import { validateBody } from '@/lib/validations'
 import { validateCSRFToken, csrfErrorResponse } from '@/lib/csrf'
 import { z } from 'zod'
+import { withTelemetry } from '@/lib/telemetry'
 
 // Validation schema
 const submitResignationSchema = z.object({
@@ -15,7 +16,7 @@ const submitResignationSchema = z.object({
 
 // POST /api/resignations/submit
 // Jobseeker submits a resignation request
-export async function POST(request) {
+async function handlePOST(request) {
   try {
     if (!validateCSRFToken(request)) {
       return csrfErrorResponse()
@@ -115,3 +116,5 @@ export async function POST(request) {
     }, { status: 500 })
   }
 }
+
+export const POST = withTelemetry('/api/resignations/submit', handlePOST)
@@ -1,63 +1,39 @@
-import { NextResponse } from 'next/server'
+import { NextResponse, after } from 'next/server'
 import { getCurrentUser } from '@/lib/authHelper'
 
-import { supabaseAdmin } from '@/lib/supabase'
-
 import { prisma } from '@/lib/prisma'
 
-import sharp from 'sharp'
 import { validateFile, sanitizeFilename, generateSafeFilename } from '@/lib/fileValidation'
 import { createErrorResponse } from '@/lib/errorHandler'
 import { validateCSRFToken, csrfErrorResponse } from '@/lib/csrf'
+import { getStorage } from '@/lib/storage'
+import { enqueueMediaJob, drainMediaQueue, mediaPaths, MediaTarget } from '@/lib/mediaQueue'
+import { withTelemetry } from '@/lib/telemetry'
 
+// Enough for every signature in the magic number table
+const MAGIC_BYTES = 16
 
 /**
- * Convert image to WebP format
- * Returns original buffer if file is PDF or conversion fails
- * @param {Buffer} buffer - File buffer (already read)
- * @param {string} mimeType - File MIME type
- * @param {string} originalName - Original filename for extension
+ * Stream the original to storage and, for images, queue a media job: metadata
+ * stripping for every image, WebP variants only when `target` is set.
+ * Processing happens after the response; the original URL is usable right away.
+ * @returns {Promise<{url: string, media: {id: string, status: string}|null}>}
  */
-async function convertToWebP(buffer, mimeType, originalName) {
-    // Skip PDF files - keep original
-    if (mimeType === 'application/pdf') {
-        return {
-            buffer,
-            extension: 'pdf',
-            contentType: 'application/pdf'
-        }
+async function storeUpload(file, bucket, filePath, { upsert = true, target = null } = {}) {
+    const storage = getStorage()
+    await storage.upload(bucket, filePath, file, {
+        cacheControl: '3600',
+        upsert,
+        contentType: file.type
+    })
+
+    const url = storage.getPublicUrl(bucket, filePath)
+    if (!file.type.startsWith('image/')) {
+        return { url, media: null }
     }
 
-    // Only process image files
-    if (!mimeType.startsWith('image/')) {
-        const ext = originalName.split('.').pop()
-        return {
-            buffer,
-            extension: ext,
-            contentType: mimeType
-        }
-    }
-
-    try {
-        const webpBuffer = await sharp(buffer)
-            .webp({ quality: 80 })
-            .toBuffer()
-        
-        return {
-            buffer: webpBuffer,
-            extension: 'webp',
-            contentType: 'image/webp'
-        }
-    } catch (error) {
-        console.error('WebP conversion failed:', error)
-        // Fallback to original if conversion fails
-        const ext = originalName.split('.').pop()
-        return {
-            buffer,
-            extension: ext,
-            contentType: mimeType
-        }
-    }
+    const media = await enqueueMediaJob({ bucket, path: filePath, sourceUrl: url, target })
+    return { url, media }
 }
 
 function getBucketName(type, bucket) {
@@ -120,7 +96,7 @@ function getMaxUploadSize(type, bucket, folder, mimeType) {
     return twoMB
 }
 
-export async function POST(request) {
+async function handlePOST(request) {
     try {
         if (!validateCSRFToken(request)) {
             return csrfErrorResponse()
@@ -164,8 +140,8 @@ export async function POST(request) {
                           type === 'contract-doc' ||
                           type === 'admin-doc'
 
-        // Read file buffer for validation
-        const fileBuffer = Buffer.from(await file.arrayBuffer())
+        // Only the leading bytes are needed for validation; the body is streamed to storage
+        const fileBuffer = Buffer.from(await file.slice(0, MAGIC_BYTES).arrayBuffer())
         const maxUploadSize = getMaxUploadSize(type, bucket, folder, file.type)
 
         // Comprehensive file validation (magic numbers, filename, size, etc.)
@@ -183,8 +159,9 @@ export async function POST(request) {
 
         // Sanitize filename for security
         const safeFilename = sanitizeFilename(file.name)
+        const extension = safeFilename.split('.').pop().toLowerCase()
 
-        let photoUrl
+        let upload
         const targetBucket = getBucketName(type, bucket)
 
         // ============ RECRUITER PHOTO ============
@@ -201,43 +178,25 @@ export async function POST(request) {
                 )
             }
 
-            // Convert image to WebP
-            const { buffer, extension, contentType } = await convertToWebP(fileBuffer, file.type, safeFilename)
             const fileName = `profile.${extension}`
             const filePath = `recruiter/${recruiter.id}/${fileName}`
 
-            // Delete old photo first (try both webp and old extensions)
-            await supabaseAdmin.storage
-                .from(targetBucket)
-                .remove([filePath, `recruiter/${recruiter.id}/profile.jpg`, `recruiter/${recruiter.id}/profile.png`, `recruiter/${recruiter.id}/profile.jpeg`])
+            // Delete old photo first (every extension and the optimized variants)
+            const oldPaths = [
+                ...await mediaPaths(targetBucket, filePath),
+                ...['jpg', 'jpeg', 'png', 'gif', 'webp'].map(ext => `recruiter/${recruiter.id}/profile.${ext}`)
+            ]
+            await getStorage()
+                .remove(targetBucket, oldPaths)
                 .catch(() => {})
 
-            // Upload new photo
-            const { data, error } = await supabaseAdmin.storage
-                .from(targetBucket)
-                .upload(filePath, buffer, {
-                    cacheControl: '3600',
-                    upsert: true,
-                    contentType
-                })
-
-            if (error) {
-                console.error('Upload error:', error)
-                return NextResponse.json(
-                    createErrorResponse('Gagal mengunggah', error),
-                    { status: 500 }
-                )
-            }
-
-            const { data: { publicUrl } } = supabaseAdmin.storage
-                .from(targetBucket)
-                .getPublicUrl(filePath)
-
-            photoUrl = publicUrl
+            upload = await storeUpload(file, targetBucket, filePath, {
+                target: { kind: MediaTarget.RECRUITER_PHOTO, id: recruiter.id }
+            })
 
             await prisma.recruiters.update({
                 where: { id: recruiter.id },
-                data: { photoUrl }
+                data: { photoUrl: upload.url }
             })
 
         // ============ COMPANY GALLERY ============
@@ -273,37 +232,19 @@ export async function POST(request) {
                 )
             }
 
-            // Convert image to WebP
-            const { buffer, extension, contentType } = await convertToWebP(fileBuffer, file.type, safeFilename)
             const fileName = `${Date.now()}.${extension}`
             const filePath = `company/${companyId}/gallery/${fileName}`
 
-            const { data, error } = await supabaseAdmin.storage
-                .from(targetBucket)
-                .upload(filePath, buffer, {
-                    cacheControl: '3600',
-                    contentType
-                })
-
-            if (error) {
-                console.error('Upload error:', error)
-                return NextResponse.json(
-                    { error: 'Gagal mengunggah file' },
-                    { status: 500 }
-                )
-            }
-
-            const { data: { publicUrl } } = supabaseAdmin.storage
-                .from(targetBucket)
-                .getPublicUrl(filePath)
-
-            photoUrl = publicUrl
+            upload = await storeUpload(file, targetBucket, filePath, {
+                upsert: false,
+                target: { kind: MediaTarget.COMPANY_GALLERY, id: companyId }
+            })
 
             await prisma.companies.update({
                 where: { id: companyId },
                 data: {
                     gallery: {
-                        push: photoUrl
+                        push: upload.url
                     }
                 }
             })
@@ -322,32 +263,10 @@ export async function POST(request) {
                 )
             }
 
-            // Convert image to WebP
-            const { buffer, extension, contentType } = await convertToWebP(fileBuffer, file.type, safeFilename)
             const fileName = `${Date.now()}.${extension}`
             const filePath = `${recruiter.companyId}/${fileName}`
 
-            const { data, error } = await supabaseAdmin.storage
-                .from('Lowongan')
-                .upload(filePath, buffer, {
-                    cacheControl: '3600',
-                    upsert: true,
-                    contentType
-                })
-
-            if (error) {
-                console.error('Upload error:', error)
-                return NextResponse.json(
-                    { error: 'Gagal mengunggah file' },
-                    { status: 500 }
-                )
-            }
-
-            const { data: { publicUrl } } = supabaseAdmin.storage
-                .from('Lowongan')
-                .getPublicUrl(filePath)
-
-            photoUrl = publicUrl
+            upload = await storeUpload(file, 'Lowongan', filePath)
 
         // ============ JOBSEEKER UPLOADS ============
         } else if (bucket && (
@@ -401,32 +320,12 @@ export async function POST(request) {
                 uploadBucket = 'Resume'
             }
 
-            // Convert image to WebP (PDFs will remain unchanged)
-            const { buffer, extension, contentType } = await convertToWebP(fileBuffer, file.type, safeFilename)
             const fileName = `${folderName}-${Date.now()}.${extension}`
             const filePath = `jobseeker/${jobseeker.id}/${folderName}/${fileName}`
 
-            const { data, error } = await supabaseAdmin.storage
-                .from(uploadBucket)
-                .upload(filePath, buffer, {
-                    cacheControl: '3600',
-                    upsert: true,
-                    contentType
-                })
-
-            if (error) {
-                console.error('Upload error:', error)
-                return NextResponse.json(
-                    { error: 'Gagal mengunggah file' },
-                    { status: 500 }
-                )
-            }
-
-            const { data: { publicUrl } } = supabaseAdmin.storage
-                .from(uploadBucket)
-                .getPublicUrl(filePath)
-
-            photoUrl = publicUrl
+            upload = await storeUpload(file, uploadBucket, filePath, {
+                target: folderName === 'photo' ? { kind: MediaTarget.JOBSEEKER_PHOTO, id: jobseeker.id } : null
+            })
 
         // ============ GENERIC UPLOAD ============
         } else {
@@ -435,32 +334,10 @@ export async function POST(request) {
                 let uploadFolder = folder || 'admin-uploads'
                 let uploadBucket = targetBucket || 'Lowongan' // Default to Lowongan bucket for admin docs
                 
-                // Convert image to WebP (PDFs will remain unchanged)
-                const { buffer, extension, contentType } = await convertToWebP(fileBuffer, file.type, safeFilename)
                 const fileName = `${Date.now()}.${extension}`
                 const filePath = `${uploadFolder}/${fileName}`
 
-                const { data, error } = await supabaseAdmin.storage
-                    .from(uploadBucket)
-                    .upload(filePath, buffer, {
-                        cacheControl: '3600',
-                        upsert: true,
-                        contentType
-                    })
-
-                if (error) {
-                    console.error('Upload error:', error)
-                    return NextResponse.json(
-                        { error: 'Gagal mengunggah file' },
-                        { status: 500 }
-                    )
-                }
-
-                const { data: { publicUrl } } = supabaseAdmin.storage
-                    .from(uploadBucket)
-                    .getPublicUrl(filePath)
-
-                photoUrl = publicUrl
+                upload = await storeUpload(file, uploadBucket, filePath)
             } else {
                 // Try to find recruiter first
                 let recruiter = await prisma.recruiters.findUnique({
@@ -472,8 +349,6 @@ export async function POST(request) {
                 let uploadFolder = folder || 'misc'
                 let uploadBucket = targetBucket
 
-                // Convert image to WebP (PDFs will remain unchanged)
-                const { buffer, extension, contentType } = await convertToWebP(fileBuffer, file.type, safeFilename)
                 let filePath = ''
 
                 if (recruiter) {
@@ -499,34 +374,19 @@ export async function POST(request) {
                     filePath = `jobseeker/${jobseeker.id}/${uploadFolder}/${fileName}`
                 }
 
-                const { data, error } = await supabaseAdmin.storage
-                    .from(uploadBucket)
-                    .upload(filePath, buffer, {
-                        cacheControl: '3600',
-                        upsert: true,
-                        contentType
-                    })
-
-                if (error) {
-                    console.error('Upload error:', error)
-                    return NextResponse.json(
-                        { error: 'Gagal mengunggah file' },
-                        { status: 500 }
-                    )
-                }
-
-                const { data: { publicUrl } } = supabaseAdmin.storage
-                    .from(uploadBucket)
-                    .getPublicUrl(filePath)
-
-                photoUrl = publicUrl
+                upload = await storeUpload(file, uploadBucket, filePath)
             }
         }
 
+        if (upload.media) {
+            after(() => drainMediaQueue())
+        }
+
         return NextResponse.json({
             success: true,
-            url: photoUrl,
+            url: upload.url,
             bucket: targetBucket,
+            media: upload.media,
             message: 'File berhasil diunggah'
         })
 
@@ -540,7 +400,7 @@ export async function POST(request) {
 }
 
 // DELETE - Remove photo from gallery
-export async function DELETE(request) {
+async function handleDELETE(request) {
     try {
         if (!validateCSRFToken(request)) {
             return csrfErrorResponse()
@@ -586,10 +446,8 @@ export async function DELETE(request) {
         const fileName = urlParts[urlParts.length - 1]
         const filePath = `company/${companyId}/gallery/${fileName}`
 
-        // Delete from Supabase
-        await supabaseAdmin.storage
-            .from(targetBucket)
-            .remove([filePath])
+        // Delete the original and its optimized variants
+        await getStorage().remove(targetBucket, await mediaPaths(targetBucket, filePath))
 
         // Remove from database
         const company = await prisma.companies.findUnique({
@@ -617,3 +475,6 @@ export async function DELETE(request) {
         )
     }
 }
+
+export const POST = withTelemetry('/api/upload', handlePOST)
+export const DELETE = withTelemetry('/api/upload', handleDELETE)
@@ -30,22 +30,31 @@ import {
 } from "lucide-react";
 
 import { useRouter, useSearchParams } from "next/navigation";
-import { useQueryJobs } from "@/hooks/jobs/useJobs";
+import {
+  mergeJobDetail,
+  useInfiniteQueryJobs,
+  useQueryJobDetail,
+} from "@/hooks/jobs/useJobs";
 import { sanitizeHtml } from "@/lib/sanitize";
 import { getAllKecamatan } from "@/lib/cirebonData";
 
+const SEARCH_DEBOUNCE_MS = 400;
+
 const JobsPage = () => {
   const searchParams = useSearchParams();
   const [searchQuery, setSearchQuery] = useState(
     searchParams.get("search") || ""
   );
+  const [debouncedSearch, setDebouncedSearch] = useState(
+    (searchParams.get("search") || "").trim()
+  );
   const [location, setLocation] = useState(
     searchParams.get("location") || ""
   );
   const [showFilters, setShowFilters] = useState(false);
   const [savedJobs, setSavedJobs] = useState([]);
   const [sortBy, setSortBy] = useState("latest");
-  const [currentPage, setCurrentPage] = useState(1);
+  const [visiblePages, setVisiblePages] = useState(1);
   const [selectedJob, setSelectedJob] = useState(null);
   const [showDetail, setShowDetail] = useState(false); // Mobile detail view toggle
   const [selectedImage, setSelectedImage] = useState(null);
@@ -62,27 +71,80 @@ const JobsPage = () => {
   const jobTypes = ["FULL_TIME", "PART_TIME"];
   const experienceLevels = ["0-1 tahun", "1-3 tahun", "3-5 tahun", "5+ tahun"];
 
-  // Use React Query hook
+  // Only query once typing settles instead of on every keystroke
+  useEffect(() => {
+    const timer = setTimeout(() => {
+      setDebouncedSearch(searchQuery.trim());
+    }, SEARCH_DEBOUNCE_MS);
+
+    return () => clearTimeout(timer);
+  }, [searchQuery]);
+
+  // Cached per query; a superseded request is aborted and the previous
+  // results stay on screen until the new ones arrive
   const {
     data: jobsData,
     isPending: loading,
-    isError,
-  } = useQueryJobs({
-    search: searchQuery,
+    isPlaceholderData,
+    hasNextPage,
+    fetchNextPage,
+    isFetchingNextPage,
+  } = useInfiniteQueryJobs({
+    search: debouncedSearch,
     location,
     jobType: filters.jobType,
     experience: filters.experience,
     sortBy,
-    page: currentPage,
     limit: 20,
+    fields: "summary",
   });
 
-  const jobs = jobsData?.jobs || [];
-  const pagination = jobsData?.pagination || {
-    page: 1,
-    limit: 10,
-    totalCount: 0,
-    totalPages: 0,
+  // List cards carry summary fields only; the detail panel is loaded lazily
+  // and cached per slug by React Query
+  const { data: selectedJobDetail, isPending: detailLoading } =
+    useQueryJobDetail(selectedJob?.slug, !!selectedJob);
+  const selectedJobWithDetail = useMemo(
+    () => mergeJobDetail(selectedJob, selectedJobDetail),
+    [selectedJob, selectedJobDetail]
+  );
+
+  const pages = jobsData?.pages;
+  const loadedPages = pages?.length ?? 0;
+  const jobs = useMemo(
+    () => (pages || []).slice(0, visiblePages).flatMap((page) => page.jobs),
+    [pages, visiblePages]
+  );
+  const totalCount = pages?.[0]?.pagination.totalCount ?? 0;
+  const hasMoreJobs = loadedPages > visiblePages || !!hasNextPage;
+  const loadingMore = isFetchingNextPage && loadedPages <= visiblePages;
+
+  // A new query starts again from its first page
+  useEffect(() => {
+    setVisiblePages(1);
+  }, [debouncedSearch, location, filters, sortBy]);
+
+  // Keyset pagination: prefetch the page after the last visible one so
+  // "load more" renders from cache
+  useEffect(() => {
+    if (
+      !isPlaceholderData &&
+      loadedPages === visiblePages &&
+      hasNextPage &&
+      !isFetchingNextPage
+    ) {
+      fetchNextPage();
+    }
+  }, [
+    isPlaceholderData,
+    loadedPages,
+    visiblePages,
+    hasNextPage,
+    isFetchingNextPage,
+    fetchNextPage,
+  ]);
+
+  const loadMoreJobs = () => {
+    if (hasMoreJobs) setVisiblePages((prev) => prev + 1);
   };
 
   // Auto-select first job on desktop when jobs load
@@ -122,14 +184,12 @@ const JobsPage = () => {
       }
       return { ...prev, [type]: value };
     });
-    setCurrentPage(1);
   };
 
   const clearFilters = () => {
     setFilters({ jobType: [], experience: [], salary: "", category: [] });
     setSearchQuery("");
     setLocation("");
-    setCurrentPage(1);
   };
 
   const toggleSaveJob = (jobId, e) => {
@@ -458,6 +518,12 @@ const JobsPage = () => {
 
       {/* Content */}
       <div className="p-6 lg:p-8 space-y-8">
+        {detailLoading && job.description === undefined && (
+          <div className="flex justify-center py-8">
+            <Loader2 className="w-6 h-6 animate-spin text-primary" />
+          </div>
+        )}
+
         {/* Gallery + Main Photo */}
         {(job.photo || (job.gallery && job.gallery.length > 0)) && (
           <div className="bg-white rounded-3xl border border-slate-100 shadow-sm overflow-hidden">
@@ -653,10 +719,7 @@ const JobsPage = () => {
                   <select
                     aria-label="Filter lokasi kecamatan"
                     value={location}
-                    onChange={(e) => {
-                      setLocation(e.target.value);
-                      setCurrentPage(1);
-                    }}
+                    onChange={(e) => setLocation(e.target.value)}
                     className="w-full pl-9 pr-8 py-3 rounded-xl border border-slate-200 focus:border-primary focus:ring-4 focus:ring-primary/10 transition-all outline-none bg-white shadow-sm text-sm appearance-none cursor-pointer text-slate-700"
                   >
                     <option value="">Semua Lokasi</option>
@@ -668,10 +731,7 @@ const JobsPage = () => {
                   </select>
                   {location && (
                     <button
-                      onClick={() => {
-                        setLocation("");
-                        setCurrentPage(1);
-                      }}
+                      onClick={() => setLocation("")}
                       className="absolute right-2 top-1/2 -translate-y-1/2 p-1 text-slate-400 hover:text-slate-600 transition-colors"
                       aria-label="Hapus filter lokasi"
                     >
@@ -775,13 +835,26 @@ const JobsPage = () => {
                   </div>
                 ))
               ) : jobs.length > 0 ? (
-                jobs.map((job) => (
-                  <JobCard
-                    key={job.id}
-                    job={job}
-                    isSelected={selectedJob?.id === job.id}
-                  />
-                ))
+                <>
+                  {jobs.map((job) => (
+                    <JobCard
+                      key={job.id}
+                      job={job}
+                      isSelected={selectedJob?.id === job.id}
+                    />
+                  ))}
+                  {hasMoreJobs && (
+                    <button
+                      onClick={loadMoreJobs}
+                      disabled={loadingMore}
+                      className="w-full py-3 rounded-xl border border-slate-200 bg-white text-sm font-medium text-slate-600 hover:border-primary/20 hover:text-primary transition-all disabled:opacity-60"
+                    >
+                      {loadingMore
+                        ? "Memuat..."
+                        : `Muat lebih banyak (${jobs.length} dari ${totalCount})`}
+                    </button>
+                  )}
+                </>
               ) : (
                 <div className="text-center py-12">
                   <div className="w-16 h-16 bg-slate-100 rounded-full flex items-center justify-center mx-auto mb-4">
@@ -813,7 +886,7 @@ const JobsPage = () => {
             }`}
           >
             {selectedJob ? (
-              <JobDetail job={selectedJob} />
+              <JobDetail job={selectedJobWithDetail} />
             ) : (
               <div className="h-full flex flex-col items-center justify-center text-center p-8 text-slate-400">
                 <div className="w-24 h-24 bg-slate-50 rounded-full flex items-center justify-center mb-6">
@@ -116,53 +116,70 @@ export default function JobDetailPage() {
     if (applications.length > 0 && job) {
       // Clear old recommendations to force refetch with latest job skills
       setAiRecommendations({});
-
-      applications.forEach((app) => {
-        if (app.jobseekers?.cvUrl && !loadingAI[app.id]) {
-          fetchAIRecommendation(app);
-        }
-      });
+      fetchAIRecommendations(
+        applications.filter((app) => app.jobseekers?.cvUrl && !loadingAI[app.id]),
+      );
     }
   }, [applications, job]);
 
-  const fetchAIRecommendation = async (application) => {
-    try {
-      setLoadingAI((prev) => ({ ...prev, [application.id]: true }));
+  // One batch request scores every applicant (bounded concurrency and
+  // cached per CV on the server) instead of one request per applicant
+  const fetchAIRecommendations = async (pendingApplications) => {
+    if (pendingApplications.length === 0) return;
 
-      // Use internal API route to avoid CORS issues
-      const response = await api.post(
-        "/api/profile/recruiter/jobs/ai-match",
-        {
-          cv_url: application.jobseekers?.cvUrl,
-          cv_skills: application.jobseekers?.skills || [],
-          cv_title: application.jobseekers?.currentTitle || "",
-          job_requirements: {
-            title: job?.title,
-            description: job?.description,
-            requirements: job?.requirements,
-            skills:
-              job?.job_skills?.map((js) => js.skills?.name).filter(Boolean) ||
-              job?.skills ||
-              [],
+    const pendingIds = Object.fromEntries(
+      pendingApplications.map((app) => [app.id, true]),
+    );
+    const pendingOff = Object.fromEntries(
+      pendingApplications.map((app) => [app.id, false]),
+    );
+
+    try {
+      setLoadingAI((prev) => ({ ...prev, ...pendingIds }));
+
+      const jobRequirements = {
+        title: job?.title,
+        skills:
+          job?.job_skills?.map((js) => js.skills?.name).filter(Boolean) ||
+          job?.skills ||
+          [],
+      };
+
+      // The batch endpoint accepts up to 200 items per request
+      for (let start = 0; start < pendingApplications.length; start += 200) {
+        // Use internal API route to avoid CORS issues
+        const response = await api.post(
+          "/api/profile/recruiter/jobs/ai-match/batch",
+          {
+            job_requirements: jobRequirements,
+            items: pendingApplications
+              .slice(start, start + 200)
+              .map((application) => ({
+                id: application.id,
+                cv_url: application.jobseekers?.cvUrl,
+                cv_skills: application.jobseekers?.skills || [],
+              })),
           },
-        },
-        {
-          withCredentials: true,
-        },
-      );
+          {
+            withCredentials: true,
+          },
+        );
 
-      const data = response.data;
-      setAiRecommendations((prev) => ({
-        ...prev,
-        [application.id]: {
-          isRecommended: data.match_score >= 1,
-          score: data.match_score,
-          highlights: data.highlights || [],
-        },
-      }));
+        const recommendations = Object.fromEntries(
+          (response.data.results || []).map((result) => [
+            result.id,
+            {
+              isRecommended: result.match_score >= 1,
+              score: result.match_score,
+              highlights: result.highlights || [],
+            },
+          ]),
+        );
+        setAiRecommendations((prev) => ({ ...prev, ...recommendations }));
+      }
     } catch (error) {
     } finally {
-      setLoadingAI((prev) => ({ ...prev, [application.id]: false }));
+      setLoadingAI((prev) => ({ ...prev, ...pendingOff }));
     }
   };
 
@@ -436,7 +436,7 @@ export default function RecruiterDashboard() {
                       </div>
                       <div className="text-right">
                         <div className="text-2xl font-bold text-gray-900 group-hover:text-blue-700 transition-colors">
-                          {job._count.applications}
+                          {job.applicationCount}
                         </div>
                         <div className="text-xs text-gray-500">Pelamar</div>
                       </div>
@@ -0,0 +1,21 @@
+import { getSitemapManifest, indexVersion, renderSitemapIndex, sitemapResponse } from '@/lib/sitemap'
+
+/**
+ * Sitemap index
+ * GET /sitemap.xml
+ *
+ * Lists one child sitemap per section and creation month (see lib/sitemap.js)
+ */
+export async function GET(request) {
+    try {
+        const manifest = await getSitemapManifest()
+
+        return sitemapResponse(request, {
+            ...indexVersion(manifest),
+            load: () => renderSitemapIndex(manifest)
+        })
+    } catch (error) {
+        console.error('Failed to build sitemap index:', error)
+        return new Response('Sitemap unavailable', { status: 503, headers: { 'Retry-After': '300' } })
+    }
+}
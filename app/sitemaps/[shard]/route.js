@@ -0,0 +1,22 @@
+import { getSitemapShard, sitemapResponse } from '@/lib/sitemap'
+
+/**
+ * Child sitemap
+ * GET /sitemaps/{section}-{YYYY-MM}[-{part}].xml, GET /sitemaps/pages.xml
+ */
+export async function GET(request, { params }) {
+    try {
+        const { shard: fileName } = await params
+        const name = fileName.endsWith('.xml') ? fileName.slice(0, -4) : null
+        const shard = name && await getSitemapShard(name)
+
+        if (!shard) {
+            return new Response('Not found', { status: 404 })
+        }
+
+        return sitemapResponse(request, shard)
+    } catch (error) {
+        console.error('Failed to build sitemap shard:', error)
+        return new Response('Sitemap unavailable', { status: 503, headers: { 'Retry-After': '300' } })
+    }
+}
@@ -1,4 +1,4 @@
-import { useQuery, useMutation, useQueryClient } from "@tanstack/react-query";
+import { useQuery, useInfiniteQuery, useMutation, useQueryClient, keepPreviousData } from "@tanstack/react-query";
 import axios from "axios";
 import api from "@/lib/api"; // CSRF-protected axios instance
 
@@ -15,14 +15,16 @@ export function useQueryJobs({
     sortBy = "latest",
     page = 1,
     limit = 20,
+    fields = "full",
     enabled = true,
 } = {}) {
     return useQuery({
         queryKey: [
             ...queryKeyJobs,
-            { search, location, jobType, experience, sortBy, page, limit },
+            { search, location, jobType, experience, sortBy, page, limit, fields },
         ],
-        queryFn: async () => {
+        // `signal` aborts the request when the query key changes or unmounts
+        queryFn: async ({ signal }) => {
             const { data } = await axios.get("/api/jobs", {
                 params: {
                     search: search || undefined,
@@ -32,8 +34,10 @@ export function useQueryJobs({
                     sortBy,
                     page,
                     limit,
+                    fields: fields === "full" ? undefined : fields,
                 },
                 withCredentials: true,
+                signal,
             });
 
             if (!data.success) throw new Error("Gagal memuat daftar lowongan");
@@ -48,17 +52,68 @@ export function useQueryJobs({
     });
 }
 
+// ============ JOBS LIST (LOAD MORE) ============
+// Keyset pagination: each page continues from the previous page's nextCursor
+export function useInfiniteQueryJobs({
+    search = "",
+    location = "",
+    jobType = [],
+    experience = [],
+    sortBy = "latest",
+    limit = 20,
+    fields = "full",
+    enabled = true,
+} = {}) {
+    return useInfiniteQuery({
+        queryKey: [
+            ...queryKeyJobs,
+            "infinite",
+            { search, location, jobType, experience, sortBy, limit, fields },
+        ],
+        queryFn: async ({ pageParam, signal }) => {
+            const { data } = await axios.get("/api/jobs", {
+                params: {
+                    search: search || undefined,
+                    location: location || undefined,
+                    jobType: jobType.length > 0 ? jobType.join(",") : undefined,
+                    experience: experience.length > 0 ? experience.join(",") : undefined,
+                    sortBy,
+                    limit,
+                    fields: fields === "full" ? undefined : fields,
+                    cursor: pageParam || undefined,
+                },
+                withCredentials: true,
+                signal,
+            });
+
+            if (!data.success) throw new Error("Gagal memuat daftar lowongan");
+
+            return {
+                jobs: data.data,
+                pagination: data.pagination,
+            };
+        },
+        initialPageParam: null,
+        getNextPageParam: (lastPage) => lastPage.pagination.nextCursor ?? undefined,
+        // Keep showing the previous results while a new search loads
+        placeholderData: keepPreviousData,
+        enabled,
+        staleTime: 1000 * 60 * 2, // 2 minutes
+    });
+}
+
 // ============ JOB DETAIL ============
 const queryKeyJobDetail = ["jobDetail"];
 
 export function useQueryJobDetail(slug, enabled = true) {
     return useQuery({
         queryKey: [...queryKeyJobDetail, slug],
-        queryFn: async () => {
+        queryFn: async ({ signal }) => {
             if (!slug) throw new Error("Tidak ada slug yang diberikan");
 
             const { data } = await axios.get(`/api/jobs/${slug}`, {
                 withCredentials: true,
+                signal,
             });
 
             if (!data.success) throw new Error("Gagal memuat detail lowongan");
@@ -70,6 +125,28 @@ export function useQueryJobDetail(slug, enabled = true) {
     });
 }
 
+// Fill a `fields=summary` list card with the detail-only fields of /api/jobs/[slug]
+export function mergeJobDetail(card, detail) {
+    if (!card || !detail) return card;
+
+    return {
+        ...card,
+        description: detail.description,
+        requirements: detail.requirements,
+        responsibilities: detail.responsibilities,
+        benefits: detail.benefits,
+        skills: (detail.skills || []).map((skill) => skill.name),
+        educationLevel: detail.educationLevel,
+        gallery: detail.gallery || [],
+        photo: detail.photo,
+        workingDays: detail.workingDays,
+        holidays: detail.holidays,
+        isShift: detail.isShift,
+        shiftCount: detail.shiftCount,
+        hasApplied: detail.hasApplied,
+    };
+}
+
 // ============ APPLY JOB ============
 export function useMutationApplyJob() {
     const queryClient = useQueryClient();
@@ -19,5 +19,19 @@ export async function register() {
         process.exit(1)
       }
     }
+
+    const { startRuntimeMetrics } = await import('./lib/telemetry.js')
+    startRuntimeMetrics()
   }
 }
+
+/**
+ * Counts and logs errors thrown by route handlers, server components and
+ * server actions; per-request query timing is recorded by lib/telemetry.js
+ */
+export async function onRequestError(error, request, context) {
+  if (process.env.NEXT_RUNTIME !== 'nodejs') return
+
+  const { recordRequestError } = await import('./lib/telemetry.js')
+  recordRequestError(error, request, context)
+}
@@ -0,0 +1,176 @@
+import { prisma } from '@/lib/prisma'
+import { createAuditLogs, AuditAction } from '@/lib/audit'
+import { applicationDecisionEmail } from '@/lib/email/applicationDecision'
+import { enqueueEmails } from '@/lib/email/outbox'
+import {
+  RECRUITER_APPLICATION_STATUSES,
+  canRecruiterSetApplicationStatus,
+  getInvalidRecruiterStatusMessage,
+  getRecruiterSourceStatuses
+} from '@/lib/applications/statusTransitions'
+
+export const MAX_BULK_APPLICATION_IDS = 1000
+
+const DECISION_STATUSES = ['ACCEPTED', 'REJECTED']
+
+const ACCEPTED_NEXT_STEPS =
+  'Tim kami akan segera menghubungi Anda untuk proses selanjutnya. Harap periksa email dan telepon Anda secara berkala.'
+
+/**
+ * Move many applications of one job to `status` in a single transaction.
+ *
+ * Every id gets a result: `{ id, ok: true, from, to }` or
+ * `{ id, ok: false, error }`. Validation runs on one read of all rows; the
+ * write is a single guarded UPDATE, so rows changed concurrently into a state
+ * that no longer allows the transition are reported instead of overwritten.
+ * Decision emails are queued in the same transaction, audit logs in one
+ * insert after it.
+ *
+ * @param {Object} params
+ * @param {{id: string, userId: string}} params.recruiter
+ * @param {{id: string, title: string, companies: {name: string}}} params.job - Owned by the recruiter
+ * @param {string[]} params.ids
+ * @param {string} params.status
+ * @param {string} [params.notes]
+ * @param {Request} [params.request] - For audit IP and user agent
+ * @returns {Promise<{results: Array<Object>, updated: number, emailsQueued: number}>}
+ */
+export async function applyBulkStatusChange({ recruiter, job, ids, status, notes, request = null }) {
+  if (!RECRUITER_APPLICATION_STATUSES.includes(status)) {
+    throw new Error('Status lamaran tidak valid untuk recruiter')
+  }
+
+  const uniqueIds = [...new Set(ids)]
+  const applications = await prisma.applications.findMany({
+    where: { id: { in: uniqueIds }, jobId: job.id },
+    select: {
+      id: true,
+      status: true,
+      jobseekerId: true,
+      jobseekers: {
+        select: {
+          firstName: true,
+          lastName: true,
+          email: true,
+          users: { select: { email: true } }
+        }
+      }
+    }
+  })
+  const byId = new Map(applications.map(application => [application.id, application]))
+
+  // Exclusive acceptance: a jobseeker can only hold one confirmed offer
+  const acceptedElsewhere = new Set()
+  if (status === 'ACCEPTED' && applications.length > 0) {
+    const confirmed = await prisma.applications.findMany({
+      where: {
+        jobseekerId: { in: applications.map(application => application.jobseekerId) },
+        status: 'ACCEPTED',
+        confirmedByJobseeker: true,
+        id: { notIn: uniqueIds }
+      },
+      select: { jobseekerId: true }
+    })
+    confirmed.forEach(application => acceptedElsewhere.add(application.jobseekerId))
+  }
+
+  const results = new Map()
+  const candidates = []
+
+  for (const id of uniqueIds) {
+    const application = byId.get(id)
+
+    if (!application) {
+      results.set(id, { id, ok: false, error: 'Lamaran tidak ditemukan untuk lowongan ini' })
+    } else if (!canRecruiterSetApplicationStatus(application.status, status)) {
+      results.set(id, { id, ok: false, error: getInvalidRecruiterStatusMessage(application.status, status) })
+    } else if (acceptedElsewhere.has(application.jobseekerId)) {
+      results.set(id, { id, ok: false, error: 'Kandidat sudah menerima tawaran perusahaan lain' })
+    } else {
+      candidates.push(application)
+    }
+  }
+
+  const accepted = status === 'ACCEPTED'
+  let updatedIds = new Set()
+  let emailsQueued = 0
+
+  if (candidates.length > 0) {
+    await prisma.$transaction(async tx => {
+      const rows = await tx.$queryRaw`
+        UPDATE "applications"
+        SET "status" = ${status}::"ApplicationStatus",
+            "reviewedAt" = COALESCE("reviewedAt", NOW()),
+            "recruiterNotes" = COALESCE(${notes ?? null}, "recruiterNotes"),
+            "confirmedByJobseeker" = "confirmedByJobseeker" OR ${accepted},
+            "respondedAt" = CASE WHEN ${accepted} THEN NOW() ELSE "respondedAt" END,
+            "updatedAt" = NOW()
+        WHERE "id" = ANY(${candidates.map(application => application.id)})
+          AND "status"::text = ANY(${getRecruiterSourceStatuses(status)})
+        RETURNING "id"
+      `
+      updatedIds = new Set(rows.map(row => row.id))
+      const updated = candidates.filter(application => updatedIds.has(application.id))
+
+      if (accepted && updated.length > 0) {
+        await tx.jobseekers.updateMany({
+          where: { id: { in: updated.map(application => application.jobseekerId) } },
+          data: {
+            isEmployed: true,
+            isLookingForJob: false,
+            employedAt: new Date(),
+            employedCompany: job.companies.name,
+            currentTitle: `${job.companies.name} - ${job.title}`
+          }
+        })
+      }
+
+      if (DECISION_STATUSES.includes(status)) {
+        emailsQueued = await enqueueEmails(
+          tx,
+          updated.map(application =>
+            applicationDecisionEmail({
+              applicationId: application.id,
+              to: application.jobseekers.users?.email || application.jobseekers.email,
+              jobseekerName: `${application.jobseekers.firstName} ${application.jobseekers.lastName}`,
+              jobTitle: job.title,
+              companyName: job.companies.name,
+              decision: status,
+              message: notes || '',
+              nextSteps: accepted ? ACCEPTED_NEXT_STEPS : ''
+            })
+          )
+        )
+      }
+    })
+  }
+
+  for (const application of candidates) {
+    results.set(
+      application.id,
+      updatedIds.has(application.id)
+        ? { id: application.id, ok: true, from: application.status, to: status }
+        : { id: application.id, ok: false, error: 'Status lamaran berubah saat diproses, coba lagi' }
+    )
+  }
+
+  await createAuditLogs(
+    candidates
+      .filter(application => updatedIds.has(application.id))
+      .map(application => ({
+        action: AuditAction.UPDATE_APPLICATION_STATUS,
+        userId: recruiter.userId,
+        userRole: 'RECRUITER',
+        targetType: 'application',
+        targetId: application.id,
+        changes: { from: application.status, to: status, bulk: true }
+      })),
+    request
+  )
+
+  return {
+    results: uniqueIds.map(id => results.get(id)),
+    updated: updatedIds.size,
+    emailsQueued
+  }
+}
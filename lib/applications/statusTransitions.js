@@ -39,3 +39,9 @@ export function getInvalidRecruiterStatusMessage(currentStatus, nextStatus) {
 
   return `Status lamaran tidak bisa diubah dari ${currentStatus} ke ${nextStatus}`;
 }
+
+export function getRecruiterSourceStatuses(nextStatus) {
+  return Object.keys(RECRUITER_TRANSITIONS).filter((currentStatus) =>
+    RECRUITER_TRANSITIONS[currentStatus].includes(nextStatus)
+  );
+}
@@ -46,6 +46,39 @@ export async function createAuditLog({
   }
 }
 
+/**
+ * Create many audit log entries with a single insert
+ * @param {Array<Object>} entries - Same fields as createAuditLog (without request)
+ * @param {Request} [request] - Request object for IP and user agent, shared by all entries
+ */
+export async function createAuditLogs(entries, request = null) {
+  if (entries.length === 0) return
+
+  try {
+    const ipAddress = request?.headers?.get('x-forwarded-for')?.split(',')[0] 
+      ?? request?.headers?.get('x-real-ip') 
+      ?? null
+    const userAgent = request?.headers?.get('user-agent') ?? null
+
+    await prisma.audit_logs.createMany({
+      data: entries.map(({ action, userId = null, userRole = null, targetType = null, targetId = null, changes = null }) => ({
+        id: uuidv4(),
+        action,
+        userId,
+        userRole,
+        targetType,
+        targetId,
+        changes: changes ? JSON.parse(JSON.stringify(changes)) : null,
+        ipAddress,
+        userAgent
+      }))
+    })
+  } catch (error) {
+    // Don't fail the main request if audit logging fails
+    console.error('Audit log error:', error)
+  }
+}
+
 // Common action types
 export const AuditAction = {
   // Auth
@@ -72,6 +105,9 @@ export const AuditAction = {
   APPROVE_RESIGNATION: 'APPROVE_RESIGNATION',
   REJECT_RESIGNATION: 'REJECT_RESIGNATION',
   
+  // Applications
+  UPDATE_APPLICATION_STATUS: 'UPDATE_APPLICATION_STATUS',
+
   // Contract
   CREATE_CONTRACT: 'CREATE_CONTRACT',
   TERMINATE_CONTRACT: 'TERMINATE_CONTRACT'
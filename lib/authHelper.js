@@ -1,5 +1,6 @@
 import { getTokenFromRequest, verifyToken } from '@/lib/auth'
 import { prisma } from '@/lib/prisma'
+import { getCachedPrincipal, PrincipalKind } from '@/lib/principalCache'
 
 export async function getCurrentUser(request) {
   try {
@@ -36,16 +37,18 @@ export async function getCurrentUser(request) {
       return { error: 'Invalid or expired token', status: 401 }
     }
 
-    // Get user from database
-    const user = await prisma.users.findUnique({
-      where: { id: decoded.userId },
-      select: {
-        id: true,
-        email: true,
-        role: true,
-        status: true
-      }
-    })
+    // Get user from the principal cache (database on a miss)
+    const user = await getCachedPrincipal(PrincipalKind.USER, decoded.userId, () =>
+      prisma.users.findUnique({
+        where: { id: decoded.userId },
+        select: {
+          id: true,
+          email: true,
+          role: true,
+          status: true
+        }
+      })
+    )
 
     if (!user) {
       return { error: 'User not found', status: 404 }
@@ -72,10 +75,16 @@ export async function requireJobseeker(request) {
     return { error: 'Access denied. Jobseeker role required', status: 403 }
   }
 
-  // Get jobseeker profile
-  const jobseeker = await prisma.jobseekers.findUnique({
-    where: { userId: user.id }
-  })
+  // Get jobseeker identity; routes load the rest of the profile themselves
+  const jobseeker = await getCachedPrincipal(PrincipalKind.JOBSEEKER, user.id, () =>
+    prisma.jobseekers.findUnique({
+      where: { userId: user.id },
+      select: {
+        id: true,
+        userId: true
+      }
+    })
+  )
 
   if (!jobseeker) {
     return {
@@ -98,13 +107,20 @@ export async function requireRecruiter(request) {
     return { error: 'Access denied. Recruiter role required', status: 403 }
   }
 
-  // Get recruiter profile (might not exist yet)
-  const recruiter = await prisma.recruiters.findUnique({
-    where: { userId: user.id },
-    include: {
-      companies: true
-    }
-  })
+  // Get recruiter identity (might not exist yet)
+  const recruiter = await getCachedPrincipal(PrincipalKind.RECRUITER, user.id, () =>
+    prisma.recruiters.findUnique({
+      where: { userId: user.id },
+      select: {
+        id: true,
+        userId: true,
+        companyId: true,
+        firstName: true,
+        lastName: true,
+        position: true
+      }
+    })
+  )
 
   if (!recruiter) {
     return { error: 'Recruiter profile not found', status: 404 }
@@ -0,0 +1,283 @@
+import { Redis } from '@upstash/redis'
+import { logError } from '@/lib/logger'
+
+/**
+ * Shared response cache for public read endpoints.
+ *
+ * - Redis (Upstash) when configured, otherwise an in-process LRU
+ * - Single-flight: concurrent misses for the same key share one loader call,
+ *   and a short Redis lock keeps other instances from recomputing in parallel
+ * - Tag-based invalidation: `invalidateCacheTags` drops every entry under the
+ *   given tags after a write. The memory store tracks tag members; Redis keeps
+ *   one generation counter per tag, which is part of every tagged key, so an
+ *   invalidation is a single INCR and orphaned entries just expire
+ */
+
+// Tags used by the public endpoints and their writers
+export const CacheTag = {
+  JOBS: 'jobs',
+  COMPANIES: 'companies',
+  NEWS: 'news',
+}
+
+const KEY_PREFIX = 'cache:'
+const TAG_PREFIX = 'cache-tag:'
+const LOCK_PREFIX = 'cache-lock:'
+const LOCK_TTL_MS = 5000
+const LOCK_WAIT_MS = 50
+const LOCK_MAX_WAITS = 10
+// Must outlive every entry TTL: a lapsed counter restarts at 0, and entries
+// from the previous generation 0 are gone by then
+const GENERATION_TTL = 7 * 24 * 60 * 60
+
+/**
+ * In-process LRU store, used when Redis is not configured and in tests
+ * @param {Object} [options]
+ * @param {number} [options.maxEntries=500]
+ */
+export function createMemoryStore({ maxEntries = 500 } = {}) {
+  const entries = new Map()
+  const tags = new Map()
+
+  // Drop an entry together with its tag memberships, so tag sets only ever
+  // hold live keys
+  function removeEntry(key) {
+    const entry = entries.get(key)
+    if (!entry) return
+    entries.delete(key)
+    for (const tag of entry.tags) {
+      const keys = tags.get(tag)
+      if (!keys) continue
+      keys.delete(key)
+      if (keys.size === 0) tags.delete(tag)
+    }
+  }
+
+  return {
+    async get(key) {
+      const entry = entries.get(key)
+      if (!entry) return undefined
+      if (entry.expiresAt <= Date.now()) {
+        removeEntry(key)
+        return undefined
+      }
+      // Re-insert to mark as most recently used
+      entries.delete(key)
+      entries.set(key, entry)
+      return entry.value
+    },
+
+    async set(key, value, ttlSeconds, entryTags = []) {
+      removeEntry(key)
+      while (entries.size >= maxEntries) {
+        removeEntry(entries.keys().next().value)
+      }
+      entries.set(key, { value, expiresAt: Date.now() + ttlSeconds * 1000, tags: entryTags })
+
+      for (const tag of entryTags) {
+        if (!tags.has(tag)) tags.set(tag, new Set())
+        tags.get(tag).add(key)
+      }
+    },
+
+    async invalidateTags(tagList) {
+      for (const tag of tagList) {
+        for (const key of tags.get(tag) || []) {
+          removeEntry(key)
+        }
+        tags.delete(tag)
+      }
+    },
+
+    // Single-flight already serializes loaders within this process
+    async tryLock() {
+      return true
+    },
+
+    async unlock() {},
+
+    get size() {
+      return entries.size
+    },
+
+    // Keys registered across all tags
+    get taggedKeyCount() {
+      let count = 0
+      for (const keys of tags.values()) count += keys.size
+      return count
+    },
+  }
+}
+
+/**
+ * Redis-backed store; each tag is a generation counter (see `generations`)
+ * @param {import('@upstash/redis').Redis} redis
+ */
+export function createRedisStore(redis) {
+  return {
+    async get(key) {
+      const value = await redis.get(KEY_PREFIX + key)
+      return value === null ? undefined : value
+    },
+
+    // Tags are already part of the key, nothing to register
+    async set(key, value, ttlSeconds) {
+      await redis.set(KEY_PREFIX + key, value, { ex: ttlSeconds })
+    },
+
+    // Current generation per tag; a missing counter is generation 0
+    async generations(tagList) {
+      const values = await redis.mget(...tagList.map(tag => TAG_PREFIX + tag))
+      return values.map(value => Number(value) || 0)
+    },
+
+    async invalidateTags(tagList) {
+      const pipeline = redis.pipeline()
+      for (const tag of tagList) {
+        pipeline.incr(TAG_PREFIX + tag)
+        pipeline.expire(TAG_PREFIX + tag, GENERATION_TTL)
+      }
+      await pipeline.exec()
+    },
+
+    async tryLock(key) {
+      const result = await redis.set(LOCK_PREFIX + key, 1, { nx: true, px: LOCK_TTL_MS })
+      return result === 'OK'
+    },
+
+    async unlock(key) {
+      await redis.del(LOCK_PREFIX + key)
+    },
+  }
+}
+
+function createDefaultStore() {
+  if (process.env.UPSTASH_REDIS_REST_URL && process.env.UPSTASH_REDIS_REST_TOKEN) {
+    return createRedisStore(Redis.fromEnv())
+  }
+  return createMemoryStore()
+}
+
+let store = null
+const inFlight = new Map()
+
+function getStore() {
+  if (!store) store = createDefaultStore()
+  return store
+}
+
+/**
+ * Replace the backing store (tests, scripts)
+ */
+export function setCacheStore(nextStore) {
+  store = nextStore
+  inFlight.clear()
+}
+
+const sleep = ms => new Promise(resolve => setTimeout(resolve, ms))
+
+// Key as stored: tagged keys carry their tags' generations on stores that
+// version by generation, so a loader started before an invalidation writes
+// under the old generation and is never read
+async function storeKeyFor(cacheStore, key, tags) {
+  if (!cacheStore.generations || tags.length === 0) return key
+  const generations = await cacheStore.generations(tags)
+  return `${key}@${generations.join('.')}`
+}
+
+async function loadWithLock(cacheStore, key, options, loader) {
+  let locked = false
+  try {
+    locked = await cacheStore.tryLock(key)
+    // Another instance is computing this key; give it a moment to fill the cache
+    for (let attempt = 0; !locked && attempt < LOCK_MAX_WAITS; attempt++) {
+      await sleep(LOCK_WAIT_MS)
+      const value = await cacheStore.get(key)
+      if (value !== undefined) return value
+      locked = await cacheStore.tryLock(key)
+    }
+  } catch (error) {
+    logError(error, { context: 'cache.lock', key })
+  }
+
+  try {
+    const value = await loader()
+    if (value !== undefined && value !== null) {
+      try {
+        await cacheStore.set(key, value, options.ttl, options.tags || [])
+      } catch (error) {
+        logError(error, { context: 'cache.set', key })
+      }
+    }
+    return value
+  } finally {
+    if (locked) {
+      cacheStore.unlock(key).catch(() => {})
+    }
+  }
+}
+
+/**
+ * Return the cached value for `key`, or run `loader` once and cache its result.
+ * `null`/`undefined` results are not cached. Cache failures fall back to the loader.
+ * @param {string} key
+ * @param {Object} options
+ * @param {number} options.ttl - Time to live in seconds
+ * @param {string[]} [options.tags] - Tags for invalidation (see CacheTag)
+ * @param {() => Promise<any>} loader
+ */
+export async function cached(key, options, loader) {
+  const cacheStore = getStore()
+  let storeKey
+
+  try {
+    storeKey = await storeKeyFor(cacheStore, key, options.tags || [])
+    const value = await cacheStore.get(storeKey)
+    if (value !== undefined) return value
+  } catch (error) {
+    logError(error, { context: 'cache.get', key })
+    return loader()
+  }
+
+  if (inFlight.has(storeKey)) {
+    return inFlight.get(storeKey)
+  }
+
+  const promise = loadWithLock(cacheStore, storeKey, options, loader)
+    .finally(() => inFlight.delete(storeKey))
+
+  inFlight.set(storeKey, promise)
+  return promise
+}
+
+/**
+ * Read a cached value without loading it on a miss.
+ * Never throws; a store failure reads as a miss.
+ * @param {string} key
+ * @param {Object} [options]
+ * @param {string[]} [options.tags] - Same tags the value was cached with
+ * @returns {Promise<any>} `undefined` on a miss
+ */
+export async function peekCached(key, { tags = [] } = {}) {
+  const cacheStore = getStore()
+
+  try {
+    return await cacheStore.get(await storeKeyFor(cacheStore, key, tags))
+  } catch (error) {
+    logError(error, { context: 'cache.get', key })
+    return undefined
+  }
+}
+
+/**
+ * Drop every cache entry registered under the given tags.
+ * Never throws; a failed invalidation only means entries live until their TTL.
+ * @param {...string} tags
+ */
+export async function invalidateCacheTags(...tags) {
+  try {
+    await getStore().invalidateTags(tags)
+  } catch (error) {
+    logError(error, { context: 'cache.invalidate', tags })
+  }
+}
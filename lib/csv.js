@@ -0,0 +1,78 @@
+/**
+ * CSV helpers for streaming exports (RFC 4180)
+ */
+
+// Leading characters spreadsheet apps evaluate as formulas
+const FORMULA_PREFIX = /^[=+\-@\t\r]/
+
+/**
+ * Escape a single CSV field.
+ * Fields are quoted when they contain a delimiter, quote or line break;
+ * embedded quotes are doubled. Values that would be evaluated as formulas
+ * get a leading apostrophe.
+ * @param {any} value
+ */
+export function escapeCsvValue(value) {
+  if (value === null || value === undefined) return ''
+
+  let text = value instanceof Date ? value.toISOString() : String(value)
+
+  if (FORMULA_PREFIX.test(text)) {
+    text = `'${text}`
+  }
+
+  if (/[",\r\n]/.test(text)) {
+    return `"${text.replace(/"/g, '""')}"`
+  }
+  return text
+}
+
+/**
+ * Format one CSV record including its line terminator
+ * @param {any[]} values
+ */
+export function toCsvRow(values) {
+  return values.map(escapeCsvValue).join(',') + '\r\n'
+}
+
+/**
+ * Build a byte stream of CSV text from an async iterable of row batches.
+ * Batches are pulled on demand, so memory stays bounded by one batch.
+ * @param {string[]} headers
+ * @param {AsyncIterable<any[][]>} batches
+ * @param {Object} [options]
+ * @param {boolean} [options.gzip=false]
+ * @param {(error: Error) => void} [options.onError]
+ * @returns {ReadableStream<Uint8Array>}
+ */
+export function createCsvStream(headers, batches, { gzip = false, onError } = {}) {
+  const encoder = new TextEncoder()
+  const iterator = batches[Symbol.asyncIterator]()
+
+  const stream = new ReadableStream({
+    start(controller) {
+      controller.enqueue(encoder.encode(toCsvRow(headers)))
+    },
+
+    async pull(controller) {
+      try {
+        const { value: rows, done } = await iterator.next()
+        if (done) {
+          controller.close()
+          return
+        }
+        controller.enqueue(encoder.encode(rows.map(toCsvRow).join('')))
+      } catch (error) {
+        onError?.(error)
+        controller.error(error)
+      }
+    },
+
+    // Client went away: stop querying
+    async cancel() {
+      await iterator.return?.()
+    }
+  })
+
+  return gzip ? stream.pipeThrough(new CompressionStream('gzip')) : stream
+}
@@ -1,8 +1,10 @@
-import { Resend } from 'resend'
+import { EmailTemplate } from '@/lib/email/outbox'
 
-const resend = new Resend(process.env.RESEND_API_KEY)
-
-export async function sendApplicationDecision({
+/**
+ * Outbox entry for an ACCEPTED/REJECTED decision, see enqueueEmails
+ */
+export function applicationDecisionEmail({
+    applicationId,
     to,
     jobseekerName,
     jobTitle,
@@ -11,14 +13,13 @@ export async function sendApplicationDecision({
     message = '',
     nextSteps = ''
 }) {
-    try {
-        const isAccepted = decision === 'ACCEPTED'
-        
-        const subject = isAccepted 
-            ? `🎉 Selamat! Anda Diterima di ${companyName}`
-            : `Pemberitahuan Hasil Seleksi - ${jobTitle}`
-
-        const htmlContent = isAccepted ? `
+    const isAccepted = decision === 'ACCEPTED'
+    
+    const subject = isAccepted 
+        ? `🎉 Selamat! Anda Diterima di ${companyName}`
+        : `Pemberitahuan Hasil Seleksi - ${jobTitle}`
+
+    const htmlContent = isAccepted ? `
 <!DOCTYPE html>
 <html>
 <head>
@@ -100,7 +101,7 @@ export async function sendApplicationDecision({
     </table>
 </body>
 </html>
-        ` : `
+    ` : `
 <!DOCTYPE html>
 <html>
 <head>
@@ -185,21 +186,13 @@ export async function sendApplicationDecision({
     </table>
 </body>
 </html>
-        `
-
-        const { data, error } = await resend.emails.send({
-            from: process.env.RESEND_FROM_EMAIL || 'JobSeeker <noreply@jobseeker.com>',
-            to,
-            subject,
-            html: htmlContent
-        })
-
-        if (error) {
-            return { success: false, error }
-        }
-        return { success: true, data }
-
-    } catch (error) {
-        return { success: false, error: error.message }
+    `
+
+    return {
+        template: EmailTemplate.APPLICATION_DECISION,
+        dedupKey: `${EmailTemplate.APPLICATION_DECISION}:${applicationId}:${decision}`,
+        to,
+        subject,
+        html: htmlContent
     }
 }
@@ -1,8 +1,10 @@
-import { Resend } from 'resend'
+import { EmailTemplate } from '@/lib/email/outbox'
 
-const resend = new Resend(process.env.RESEND_API_KEY)
-
-export async function sendInterviewInvitation({
+/**
+ * Outbox entry for one candidate of a (group) interview, see enqueueEmails
+ */
+export function interviewInvitationEmail({
+    applicationId,
     to,
     jobseekerName,
     jobTitle,
@@ -14,26 +16,25 @@ export async function sendInterviewInvitation({
     description,
     interviewId
 }) {
-    try {
-        const scheduledDate = new Date(scheduledAt)
-        const formattedDate = scheduledDate.toLocaleDateString('id-ID', {
-            weekday: 'long',
-            year: 'numeric',
-            month: 'long',
-            day: 'numeric',
-            timeZone: 'Asia/Jakarta'
-        })
-        const formattedTime = scheduledDate.toLocaleTimeString('id-ID', {
-            hour: '2-digit',
-            minute: '2-digit',
-            timeZone: 'Asia/Jakarta'
-        })
+    const scheduledDate = new Date(scheduledAt)
+    const formattedDate = scheduledDate.toLocaleDateString('id-ID', {
+        weekday: 'long',
+        year: 'numeric',
+        month: 'long',
+        day: 'numeric',
+        timeZone: 'Asia/Jakarta'
+    })
+    const formattedTime = scheduledDate.toLocaleTimeString('id-ID', {
+        hour: '2-digit',
+        minute: '2-digit',
+        timeZone: 'Asia/Jakarta'
+    })
 
-        const appUrl = process.env.NEXT_PUBLIC_APP_URL || 'http://localhost:3000'
-        const detailUrl = `${appUrl}/profile/jobseeker/interviews/${interviewId}`
-        const isInPerson = meetingType === 'IN_PERSON'
+    const appUrl = process.env.NEXT_PUBLIC_APP_URL || 'http://localhost:3000'
+    const detailUrl = `${appUrl}/profile/jobseeker/interviews/${interviewId}`
+    const isInPerson = meetingType === 'IN_PERSON'
 
-        const htmlContent = `
+    const htmlContent = `
 <!DOCTYPE html>
 <html>
 <head>
@@ -137,21 +138,13 @@ export async function sendInterviewInvitation({
     </div>
 </body>
 </html>
-        `
-
-        const { data, error } = await resend.emails.send({
-            from: process.env.RESEND_FROM_EMAIL || 'noreply@jobseeker.com',
-            to: [to],
-            subject: `🎯 Undangan Interview - ${jobTitle} di ${companyName}`,
-            html: htmlContent
-        })
-
-        if (error) {
-            throw new Error(error.message)
-        }
-        return { success: true, data }
+    `
 
-    } catch (error) {
-        throw error
+    return {
+        template: EmailTemplate.INTERVIEW_INVITATION,
+        dedupKey: `${EmailTemplate.INTERVIEW_INVITATION}:${interviewId}:${applicationId}`,
+        to,
+        subject: `🎯 Undangan Interview - ${jobTitle} di ${companyName}`,
+        html: htmlContent
     }
 }
@@ -0,0 +1,244 @@
+import { prisma } from '@/lib/prisma'
+import { createLogger } from '@/lib/logger'
+import { getEmailTransport } from '@/lib/email/transport'
+
+/**
+ * Transactional email outbox.
+ *
+ * - Routes render the email and insert it into `email_outbox` with the same
+ *   transaction client as the status change, so an email exists exactly when
+ *   the change commits; `dedupKey` is unique, so replays do not queue twice
+ * - The worker claims due rows with `FOR UPDATE SKIP LOCKED`, sends them in
+ *   provider-sized batches paced to the transport's request budget, and
+ *   retries failures with exponential backoff
+ * - A rate-limit response defers the rest of the run without using up attempts
+ */
+
+const log = createLogger({ module: 'emailOutbox' })
+
+export const EmailTemplate = {
+  APPLICATION_DECISION: 'applicationDecision',
+  INTERVIEW_INVITATION: 'interviewInvitation',
+  RESCHEDULE_NOTIFICATION: 'rescheduleNotification',
+}
+
+export const EmailStatus = {
+  PENDING: 'PENDING',
+  SENDING: 'SENDING',
+  SENT: 'SENT',
+  FAILED: 'FAILED',
+}
+
+export const MAX_EMAIL_ATTEMPTS = 6
+const LEASE_MS = 2 * 60 * 1000
+const BASE_BACKOFF_MS = 30 * 1000
+const MAX_BACKOFF_MS = 6 * 60 * 60 * 1000
+const RATE_LIMIT_BACKOFF_MS = 60 * 1000
+// Bounds one drain so a post-response hook never runs indefinitely
+const MAX_DRAIN_ROUNDS = 5
+
+const delay = ms => new Promise(resolve => setTimeout(resolve, ms))
+
+/**
+ * Delay before retry number `attempt` (1-based): 30s, 1m, 2m, ... capped at 6h.
+ * Due retries are sent by `/api/cron/send-emails` every 5 minutes (vercel.json),
+ * so a retry goes out at most 5 minutes after it comes due, or earlier if a
+ * post-response drain runs first.
+ */
+export function emailBackoffMs(attempt) {
+  return Math.min(BASE_BACKOFF_MS * 2 ** (attempt - 1), MAX_BACKOFF_MS)
+}
+
+/**
+ * Queue rendered emails
+ * @param {import('@prisma/client').Prisma.TransactionClient} db - Transaction client (or prisma)
+ * @param {Array<{template: string, dedupKey: string, to: string, subject: string, html: string}>} emails
+ * @returns {Promise<number>} Number of newly queued emails (duplicates are skipped)
+ */
+export async function enqueueEmails(db, emails) {
+  const data = emails
+    .filter(email => email.to)
+    .map(({ template, dedupKey, to, subject, html }) => ({ template, dedupKey, recipient: to, subject, html }))
+
+  if (data.length === 0) return 0
+
+  const { count } = await db.email_outbox.createMany({ data, skipDuplicates: true })
+  return count
+}
+
+function claimEmails(limit) {
+  const lockedUntil = new Date(Date.now() + LEASE_MS)
+
+  return prisma.$queryRaw`
+    UPDATE "email_outbox"
+    SET "status" = 'SENDING',
+        "lockedUntil" = ${lockedUntil},
+        "updatedAt" = NOW()
+    WHERE "id" IN (
+      SELECT "id" FROM "email_outbox"
+      WHERE ("status" = 'PENDING' AND "nextAttemptAt" <= NOW())
+         OR ("status" = 'SENDING' AND "lockedUntil" < NOW())
+      ORDER BY "nextAttemptAt"
+      LIMIT ${limit}
+      FOR UPDATE SKIP LOCKED
+    )
+    RETURNING "id", "dedupKey", "recipient", "subject", "html", "attempts"
+  `
+}
+
+function markSent(rows, providerIds) {
+  return prisma.$executeRaw`
+    UPDATE "email_outbox" AS o
+    SET "status" = 'SENT',
+        "attempts" = o."attempts" + 1,
+        "providerId" = v."providerId",
+        "sentAt" = NOW(),
+        "lockedUntil" = NULL,
+        "lastError" = NULL,
+        "updatedAt" = NOW()
+    FROM unnest(${rows.map(row => row.id)}::text[], ${providerIds}::text[]) AS v("id", "providerId")
+    WHERE o."id" = v."id"
+  `
+}
+
+/**
+ * Count a failed attempt; rows go back to PENDING with backoff or end as FAILED
+ * @returns {Promise<{retried: number, failed: number}>}
+ */
+async function markFailed(rows, error, now) {
+  const retryable = error.retryable !== false
+  const byAttempt = new Map()
+  for (const row of rows) {
+    const attempt = row.attempts + 1
+    byAttempt.set(attempt, [...(byAttempt.get(attempt) ?? []), row.id])
+  }
+
+  let retried = 0
+  let failed = 0
+
+  for (const [attempt, ids] of byAttempt) {
+    const giveUp = !retryable || attempt >= MAX_EMAIL_ATTEMPTS
+    await prisma.email_outbox.updateMany({
+      where: { id: { in: ids } },
+      data: {
+        status: giveUp ? EmailStatus.FAILED : EmailStatus.PENDING,
+        attempts: attempt,
+        nextAttemptAt: new Date(now + emailBackoffMs(attempt)),
+        lockedUntil: null,
+        lastError: error.message,
+      }
+    })
+    if (giveUp) failed += ids.length
+    else retried += ids.length
+  }
+
+  return { retried, failed }
+}
+
+function defer(rows, retryAfterMs, now) {
+  return prisma.email_outbox.updateMany({
+    where: { id: { in: rows.map(row => row.id) } },
+    data: {
+      status: EmailStatus.PENDING,
+      nextAttemptAt: new Date(now + retryAfterMs),
+      lockedUntil: null,
+    }
+  })
+}
+
+function chunk(items, size) {
+  const chunks = []
+  for (let i = 0; i < items.length; i += size) {
+    chunks.push(items.slice(i, i + size))
+  }
+  return chunks
+}
+
+/**
+ * Claim up to `limit` due emails and hand them to the transport
+ * @param {Object} [options]
+ * @param {number} [options.limit=100]
+ * @param {import('@/lib/email/transport').EmailTransport} [options.transport]
+ * @param {(ms: number) => Promise<void>} [options.sleep] - Used for request pacing
+ * @returns {Promise<{claimed: number, sent: number, retried: number, failed: number, deferred: number}>}
+ */
+export async function deliverEmailOutbox({ limit = 100, transport = getEmailTransport(), sleep = delay } = {}) {
+  const rows = await claimEmails(limit)
+  const result = { claimed: rows.length, sent: 0, retried: 0, failed: 0, deferred: 0 }
+  const batches = chunk(rows, transport.maxBatchSize)
+  const interval = 1000 / transport.requestsPerSecond
+  let lastRequestAt = -Infinity
+
+  for (let i = 0; i < batches.length; i++) {
+    const batch = batches[i]
+
+    const wait = lastRequestAt + interval - Date.now()
+    if (wait > 0) await sleep(wait)
+    lastRequestAt = Date.now()
+
+    try {
+      const providerIds = await transport.sendBatch(batch.map(row => ({
+        to: row.recipient,
+        subject: row.subject,
+        html: row.html,
+        idempotencyKey: row.dedupKey,
+      })))
+      await markSent(batch, providerIds)
+      result.sent += batch.length
+    } catch (error) {
+      if (error.rateLimited) {
+        const rest = batches.slice(i).flat()
+        await defer(rest, error.retryAfterMs ?? RATE_LIMIT_BACKOFF_MS, Date.now())
+        result.deferred += rest.length
+        log.warn({ deferred: rest.length, error: error.message }, 'Email provider rate limit reached')
+        break
+      }
+
+      // One rejected message fails the whole batch; resend individually to isolate it
+      if (error.retryable === false && batch.length > 1) {
+        batches.splice(i + 1, 0, ...batch.map(row => [row]))
+        continue
+      }
+
+      const { retried, failed } = await markFailed(batch, error, Date.now())
+      result.retried += retried
+      result.failed += failed
+      log[failed > 0 ? 'error' : 'warn'](
+        { emails: batch.length, retried, failed, error: error.message },
+        'Email delivery failed'
+      )
+    }
+  }
+
+  return result
+}
+
+let draining = false
+let drainRequested = false
+
+/**
+ * Deliver until nothing is due (bounded); one drain per process at a time.
+ * Meant to run after the response that queued the emails has been sent.
+ * A call during a drain makes the running drain go another round, so emails
+ * queued meanwhile are not left for the maintenance run.
+ */
+export async function drainEmailOutbox({ limit = 100, transport } = {}) {
+  if (draining) {
+    drainRequested = true
+    return
+  }
+  draining = true
+
+  try {
+    for (let round = 0; round < MAX_DRAIN_ROUNDS; round++) {
+      drainRequested = false
+      const { claimed, deferred } = await deliverEmailOutbox({ limit, transport })
+      if (deferred > 0) break
+      if (claimed < limit && !drainRequested) break
+    }
+  } catch (error) {
+    log.error({ error: error.message }, 'Email outbox drain failed')
+  } finally {
+    draining = false
+  }
+}
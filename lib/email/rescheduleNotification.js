@@ -1,8 +1,10 @@
-import { Resend } from 'resend'
+import { EmailTemplate } from '@/lib/email/outbox'
 
-const resend = new Resend(process.env.RESEND_API_KEY)
-
-export async function sendRescheduleNotification({
+/**
+ * Outbox entry for one rescheduled candidate, see enqueueEmails
+ */
+export function rescheduleNotificationEmail({
+  applicationId,
   to,
   candidateName,
   jobTitle,
@@ -15,29 +17,24 @@ export async function sendRescheduleNotification({
   description,
   interviewId
 }) {
-  try {
-    const oldDate = new Date(oldScheduledAt)
-    const newDate = new Date(newScheduledAt)
-    
-    const formatDate = (date) => {
-      return new Intl.DateTimeFormat('id-ID', {
-        weekday: 'long',
-        year: 'numeric',
-        month: 'long',
-        day: 'numeric',
-        hour: '2-digit',
-        minute: '2-digit',
-        timeZone: 'Asia/Jakarta'
-      }).format(date)
-    }
+  const oldDate = new Date(oldScheduledAt)
+  const newDate = new Date(newScheduledAt)
+  
+  const formatDate = (date) => {
+    return new Intl.DateTimeFormat('id-ID', {
+      weekday: 'long',
+      year: 'numeric',
+      month: 'long',
+      day: 'numeric',
+      hour: '2-digit',
+      minute: '2-digit',
+      timeZone: 'Asia/Jakarta'
+    }).format(date)
+  }
 
-    const isInPerson = meetingType === 'IN_PERSON'
+  const isInPerson = meetingType === 'IN_PERSON'
 
-    const { data, error } = await resend.emails.send({
-      from: process.env.RESEND_FROM_EMAIL || 'JobSeeker <noreply@jobseeker.com>',
-      to: [to],
-      subject: `⚠️ Interview Rescheduled: ${jobTitle} - ${companyName}`,
-      html: `
+  const htmlContent = `
         <!DOCTYPE html>
         <html>
         <head>
@@ -186,15 +183,13 @@ export async function sendRescheduleNotification({
           </table>
         </body>
         </html>
-      `
-    })
-
-    if (error) {
-      throw error
-    }
-    return { success: true, data }
+  `
 
-  } catch (error) {
-    throw error
+  return {
+    template: EmailTemplate.RESCHEDULE_NOTIFICATION,
+    dedupKey: `${EmailTemplate.RESCHEDULE_NOTIFICATION}:${interviewId}:${applicationId}:${newDate.toISOString()}`,
+    to,
+    subject: `⚠️ Interview Rescheduled: ${jobTitle} - ${companyName}`,
+    html: htmlContent
   }
 }
@@ -0,0 +1,157 @@
+import { createHash } from 'crypto'
+import { Resend } from 'resend'
+
+/**
+ * Email transports used by the outbox worker.
+ *
+ * - `resend` (default): Resend batch API, up to 100 messages per request
+ * - `fake` (`EMAIL_TRANSPORT=fake`): keeps messages in memory, for local
+ *   development and tests
+ *
+ * `sendBatch` resolves with one provider id per message or throws an
+ * EmailTransportError describing whether and when to retry.
+ */
+
+export const DEFAULT_FROM_EMAIL = process.env.RESEND_FROM_EMAIL || 'JobSeeker <noreply@jobseeker.com>'
+
+/**
+ * @typedef {Object} EmailMessage
+ * @property {string} to
+ * @property {string} subject
+ * @property {string} html
+ * @property {string} [idempotencyKey]
+ */
+
+/**
+ * @typedef {Object} EmailTransport
+ * @property {string} name
+ * @property {number} maxBatchSize
+ * @property {number} requestsPerSecond - Provider request budget the worker paces itself to
+ * @property {(messages: EmailMessage[]) => Promise<string[]>} sendBatch
+ */
+
+export class EmailTransportError extends Error {
+  /**
+   * @param {string} message
+   * @param {Object} [options]
+   * @param {boolean} [options.retryable=true] - False for errors a retry cannot fix (invalid address, rejected payload)
+   * @param {boolean} [options.rateLimited=false] - Provider asked us to slow down; not counted as an attempt
+   * @param {number} [options.retryAfterMs]
+   */
+  constructor(message, { retryable = true, rateLimited = false, retryAfterMs } = {}) {
+    super(message)
+    this.name = 'EmailTransportError'
+    this.retryable = retryable
+    this.rateLimited = rateLimited
+    this.retryAfterMs = retryAfterMs
+  }
+}
+
+function toTransportError(error) {
+  const status = error?.statusCode
+  const rateLimited = status === 429 || error?.name === 'rate_limit_exceeded'
+
+  return new EmailTransportError(error?.message || 'Email provider error', {
+    rateLimited,
+    // Provider/network failures are worth retrying; other 4xx are not
+    retryable: rateLimited || !status || status >= 500,
+  })
+}
+
+function batchIdempotencyKey(messages) {
+  return createHash('sha256')
+    .update(messages.map(message => message.idempotencyKey).join('\n'))
+    .digest('base64url')
+}
+
+/**
+ * @param {Object} [options]
+ * @param {string} [options.apiKey]
+ * @param {string} [options.from]
+ * @returns {EmailTransport}
+ */
+export function createResendTransport({
+  apiKey = process.env.RESEND_API_KEY,
+  from = DEFAULT_FROM_EMAIL,
+} = {}) {
+  const resend = new Resend(apiKey)
+
+  return {
+    name: 'resend',
+    maxBatchSize: 100,
+    requestsPerSecond: Number(process.env.RESEND_REQUESTS_PER_SECOND) || 2,
+
+    async sendBatch(messages) {
+      let result
+      try {
+        result = await resend.batch.send(
+          messages.map(message => ({ from, to: [message.to], subject: message.subject, html: message.html })),
+          // Same key for a retried batch, so a timeout after delivery is not sent twice
+          { idempotencyKey: batchIdempotencyKey(messages) }
+        )
+      } catch (error) {
+        throw toTransportError(error)
+      }
+
+      if (result.error) throw toTransportError(result.error)
+
+      const sent = result.data?.data ?? result.data ?? []
+      return messages.map((_, i) => sent[i]?.id ?? null)
+    },
+  }
+}
+
+/**
+ * In-memory transport; `sent` holds every accepted message. `failWith` lets a
+ * test make the next requests throw.
+ * @returns {EmailTransport & {sent: EmailMessage[], requests: number, failWith: (error: Error, times?: number) => void}}
+ */
+export function createFakeTransport({ maxBatchSize = 100, requestsPerSecond = Infinity } = {}) {
+  const failures = []
+
+  const transport = {
+    name: 'fake',
+    maxBatchSize,
+    requestsPerSecond,
+    sent: [],
+    requests: 0,
+
+    failWith(error, times = 1) {
+      for (let i = 0; i < times; i++) failures.push(error)
+    },
+
+    async sendBatch(messages) {
+      transport.requests++
+      if (failures.length > 0) throw failures.shift()
+
+      return messages.map(message => {
+        transport.sent.push(message)
+        return `fake-${transport.sent.length}`
+      })
+    },
+  }
+
+  return transport
+}
+
+let transport = null
+
+/**
+ * Transport selected by `EMAIL_TRANSPORT` (created on first use)
+ * @returns {EmailTransport}
+ */
+export function getEmailTransport() {
+  if (!transport) {
+    transport = process.env.EMAIL_TRANSPORT === 'fake'
+      ? createFakeTransport()
+      : createResendTransport()
+  }
+  return transport
+}
+
+/**
+ * Replace the transport (tests, scripts)
+ */
+export function setEmailTransport(nextTransport) {
+  transport = nextTransport
+}
@@ -29,6 +29,13 @@ const envSchema = z.object({
   CRON_SECRET: z.string().min(16, 'CRON_SECRET should be at least 16 characters').optional(),
   RESEND_API_KEY: z.string().optional(),
   RESEND_FROM_EMAIL: z.string().optional(),
+  RESEND_REQUESTS_PER_SECOND: z.coerce.number().positive().optional(),
+  EMAIL_TRANSPORT: z.enum(['resend', 'fake']).optional(),
+
+  // Optional - telemetry
+  METRICS_TOKEN: z.string().min(16, 'METRICS_TOKEN should be at least 16 characters').optional(),
+  SLOW_QUERY_MS: z.coerce.number().positive().optional(),
+  SLOW_REQUEST_MS: z.coerce.number().positive().optional(),
   
   // Node environment
   NODE_ENV: z.enum(['development', 'production', 'test']).default('development'),
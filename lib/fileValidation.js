@@ -145,7 +145,8 @@ export function getMimeCategory(mimeType) {
 /**
  * Comprehensive file validation
  * @param {File} file - The uploaded file
- * @param {Buffer} buffer - File buffer
+ * @param {Buffer} buffer - File buffer; the leading bytes are enough for the
+ *   magic number check, the size comes from `file.size` when available
  * @param {Object} options - Validation options
  * @param {boolean} options.allowDocuments - Allow PDF documents
  * @param {number} options.maxSize - Maximum file size in bytes
@@ -165,8 +166,9 @@ export async function validateFile(file, buffer, options = {}) {
   }
 
   // 3. Check file size
-  if (buffer.length > maxSize) {
-    const sizeMB = (buffer.length / 1024 / 1024).toFixed(2);
+  const size = Math.max(file.size ?? 0, buffer.length);
+  if (size > maxSize) {
+    const sizeMB = (size / 1024 / 1024).toFixed(2);
     const maxMB = (maxSize / 1024 / 1024).toFixed(0);
     return { valid: false, error: `Ukuran file terlalu besar (${sizeMB}MB). Maksimal ${maxMB}MB.` };
   }
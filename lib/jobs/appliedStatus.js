@@ -0,0 +1,67 @@
+import { prisma } from '@/lib/prisma'
+
+const JOBSEEKER_ID_TTL_MS = 5 * 60 * 1000
+const JOBSEEKER_ID_CACHE_MAX = 5000
+
+// userId -> { jobseekerId, expiresAt }. A jobseeker profile is never moved to
+// another user, so only the creation of a missing profile can change the answer.
+const jobseekerIdCache = new Map()
+
+export async function getJobseekerIdForUser(userId) {
+  if (!userId) return null
+
+  const cached = jobseekerIdCache.get(userId)
+  if (cached && cached.expiresAt > Date.now()) {
+    return cached.jobseekerId
+  }
+
+  const jobseeker = await prisma.jobseekers.findUnique({
+    where: { userId },
+    select: { id: true }
+  })
+  const jobseekerId = jobseeker?.id || null
+
+  // Do not remember missing profiles, the user may complete onboarding any time.
+  if (jobseekerId) {
+    if (jobseekerIdCache.size >= JOBSEEKER_ID_CACHE_MAX) {
+      jobseekerIdCache.delete(jobseekerIdCache.keys().next().value)
+    }
+    jobseekerIdCache.set(userId, {
+      jobseekerId,
+      expiresAt: Date.now() + JOBSEEKER_ID_TTL_MS
+    })
+  }
+
+  return jobseekerId
+}
+
+export function clearJobseekerIdCache(userId) {
+  if (userId) {
+    jobseekerIdCache.delete(userId)
+  } else {
+    jobseekerIdCache.clear()
+  }
+}
+
+/**
+ * Resolve which of the given jobs a jobseeker already applied to
+ * using a single `jobId IN (...)` query.
+ * @param {string|null} jobseekerId
+ * @param {string[]} jobIds
+ * @returns {Promise<Set<string>>}
+ */
+export async function getAppliedJobIds(jobseekerId, jobIds) {
+  if (!jobseekerId || jobIds.length === 0) {
+    return new Set()
+  }
+
+  const applications = await prisma.applications.findMany({
+    where: {
+      jobseekerId,
+      jobId: { in: jobIds }
+    },
+    select: { jobId: true }
+  })
+
+  return new Set(applications.map(application => application.jobId))
+}
@@ -0,0 +1,96 @@
+// Keyset (cursor) pagination for the public jobs listing.
+// Every sort is descending on its key and tie-broken by id so that a page
+// boundary can be expressed as a WHERE clause instead of an OFFSET.
+
+export const JOB_SORT_KEYS = {
+  latest: 'publishedAt',
+  salary: 'salaryMax',
+  popular: 'applicationCount'
+}
+
+function sortKeyFor(sortBy) {
+  return JOB_SORT_KEYS[sortBy] || JOB_SORT_KEYS.latest
+}
+
+export function jobListOrderBy(sortBy) {
+  const key = sortKeyFor(sortBy)
+  // salaryMax is nullable; keep "no salary" jobs at the end like a cursor expects
+  const primary = key === 'salaryMax'
+    ? { [key]: { sort: 'desc', nulls: 'last' } }
+    : { [key]: 'desc' }
+
+  return [primary, { id: 'desc' }]
+}
+
+export function encodeJobCursor(job, sortBy) {
+  const key = sortKeyFor(sortBy)
+  let value = job[key] ?? null
+  if (value instanceof Date) value = value.toISOString()
+
+  const payload = JSON.stringify({ s: sortBy, v: value, id: job.id })
+  return Buffer.from(payload).toString('base64url')
+}
+
+/**
+ * Decode an opaque cursor produced by encodeJobCursor.
+ * Returns null when the cursor is malformed or belongs to a different sort.
+ */
+export function decodeJobCursor(cursor, sortBy) {
+  try {
+    const payload = JSON.parse(Buffer.from(cursor, 'base64url').toString('utf8'))
+    if (!payload || payload.s !== sortBy || typeof payload.id !== 'string') {
+      return null
+    }
+
+    let value = payload.v ?? null
+    if (value !== null && sortKeyFor(sortBy) === 'publishedAt') {
+      value = new Date(value)
+      if (Number.isNaN(value.getTime())) return null
+    } else if (value !== null && typeof value !== 'number') {
+      return null
+    }
+
+    return { value, id: payload.id }
+  } catch {
+    return null
+  }
+}
+
+// Offset cursors are used where the order is not a column (search relevance)
+export function encodeOffsetCursor(sortBy, offset) {
+  return Buffer.from(JSON.stringify({ s: sortBy, o: offset })).toString('base64url')
+}
+
+export function decodeOffsetCursor(cursor, sortBy) {
+  try {
+    const payload = JSON.parse(Buffer.from(cursor, 'base64url').toString('utf8'))
+    if (!payload || payload.s !== sortBy || !Number.isInteger(payload.o) || payload.o < 0) {
+      return null
+    }
+    return payload.o
+  } catch {
+    return null
+  }
+}
+
+/**
+ * WHERE clause selecting the rows strictly after the cursor position.
+ */
+export function jobCursorWhere(decodedCursor, sortBy) {
+  const key = sortKeyFor(sortBy)
+  const { value, id } = decodedCursor
+
+  if (value === null) {
+    return { [key]: null, id: { lt: id } }
+  }
+
+  const conditions = [
+    { [key]: { lt: value } },
+    { [key]: value, id: { lt: id } }
+  ]
+  if (key === 'salaryMax') {
+    conditions.push({ [key]: null })
+  }
+
+  return { OR: conditions }
+}
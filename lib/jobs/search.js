@@ -0,0 +1,146 @@
+import { Prisma } from '@prisma/client'
+import { prisma } from '@/lib/prisma'
+import { JOB_SORT_KEYS } from '@/lib/jobs/pagination'
+
+const MAX_SEARCH_TERMS = 8
+
+// Mirrors jobListOrderBy so search pages and plain listing pages sort alike
+const ORDER_BY = {
+  relevance: Prisma.sql`rank DESC, j."publishedAt" DESC, j.id DESC`,
+  latest: Prisma.sql`j."publishedAt" DESC, j.id DESC`,
+  salary: Prisma.sql`j."salaryMax" DESC NULLS LAST, j.id DESC`,
+  popular: Prisma.sql`j."applicationCount" DESC, j.id DESC`
+}
+
+/**
+ * Turn free text into a prefix tsquery ("soft eng" -> "soft:* & eng:*")
+ * so partially typed words still match. Returns null when nothing is left.
+ */
+export function buildPrefixTsQuery(search) {
+  const terms = (search || '')
+    .toLowerCase()
+    .normalize('NFKD')
+    .replace(/[\u0300-\u036f]/g, '')
+    .split(/[^\p{L}\p{N}]+/u)
+    .filter(Boolean)
+    .slice(0, MAX_SEARCH_TERMS)
+
+  if (terms.length === 0) return null
+
+  return terms.map(term => `${term}:*`).join(' & ')
+}
+
+export function escapeLikePattern(value) {
+  return value.replace(/[\\%_]/g, char => `\\${char}`)
+}
+
+/**
+ * SQL equivalent of jobCursorWhere: rows strictly after the cursor position.
+ * The column comes from JOB_SORT_KEYS, never from input.
+ */
+function cursorCondition(decodedCursor, sortBy) {
+  const column = Prisma.raw(`j."${JOB_SORT_KEYS[sortBy] || JOB_SORT_KEYS.latest}"`)
+  const { value, id } = decodedCursor
+
+  if (value === null) {
+    return Prisma.sql`(${column} IS NULL AND j.id < ${id})`
+  }
+
+  const nullsAfter = sortBy === 'salary' ? Prisma.sql` OR ${column} IS NULL` : Prisma.empty
+  return Prisma.sql`(${column} < ${value} OR (${column} = ${value} AND j.id < ${id})${nullsAfter})`
+}
+
+/**
+ * FROM/WHERE shared by the page and count queries: public jobs matching the
+ * `searchVector` GIN index (title, category and description, Indonesian-stemmed
+ * plus unstemmed) or the company name trigram index, narrowed by the listing
+ * filters. Returns null when the search has no searchable terms.
+ * @param {string} search
+ * @param {Object} filters - see parseJobListFilters in app/api/jobs/route.js
+ * @param {Date} now
+ */
+function searchSource(search, filters, now) {
+  const prefixQuery = buildPrefixTsQuery(search)
+  if (!prefixQuery) return null
+
+  const companyPattern = `%${escapeLikePattern(search.trim())}%`
+  const conditions = [
+    Prisma.sql`j.status = 'ACTIVE'`,
+    Prisma.sql`j."isActive" = true`,
+    Prisma.sql`j."publishedAt" IS NOT NULL`,
+    Prisma.sql`(j."applicationDeadline" IS NULL OR j."applicationDeadline" >= ${now})`,
+    Prisma.sql`c.verified = true`,
+    Prisma.sql`c.status = 'VERIFIED'`,
+    Prisma.sql`(j."searchVector" @@ q.query OR c.name ILIKE ${companyPattern})`
+  ]
+
+  if (filters.location) {
+    const pattern = `%${escapeLikePattern(filters.location)}%`
+    conditions.push(Prisma.sql`(j.city ILIKE ${pattern} OR j.location ILIKE ${pattern} OR j.province ILIKE ${pattern})`)
+  }
+  if (filters.jobTypes) {
+    conditions.push(Prisma.sql`j."jobType"::text = ANY(${filters.jobTypes})`)
+  }
+  if (filters.categories) {
+    conditions.push(Prisma.sql`j.category = ANY(${filters.categories})`)
+  }
+  if (filters.minExperience) {
+    conditions.push(Prisma.sql`j."minExperience" = ANY(${filters.minExperience}::int[])`)
+  }
+
+  return {
+    from: Prisma.sql`
+      FROM "jobs" j
+      JOIN "companies" c ON c.id = j."companyId"
+      CROSS JOIN (
+        SELECT to_tsquery('simple', ${prefixQuery}) || plainto_tsquery('indonesian', ${search}) AS query
+      ) q
+      WHERE ${Prisma.join(conditions, ' AND ')}
+    `,
+    rank: Prisma.sql`ts_rank_cd(j."searchVector", q.query)
+      + CASE WHEN c.name ILIKE ${companyPattern} THEN 0.5 ELSE 0 END`
+  }
+}
+
+/**
+ * Ids of one page of public jobs matching a search. Filters, ordering and
+ * paging all run in SQL, so every match is reachable.
+ * @param {Object} params
+ * @param {string} params.search
+ * @param {Object} params.filters
+ * @param {string} params.sortBy - relevance, latest, salary or popular
+ * @param {{value: *, id: string}|null} [params.cursor] - decoded keyset cursor (not for relevance)
+ * @param {number} [params.offset]
+ * @param {number} params.take
+ * @param {Date} [params.now]
+ * @returns {Promise<string[]|null>} ids in page order; null when the search
+ *   has no searchable terms
+ */
+export async function findJobSearchPage({ search, filters, sortBy, cursor = null, offset = 0, take, now = new Date() }) {
+  const source = searchSource(search, filters, now)
+  if (!source) return null
+
+  const afterCursor = cursor ? Prisma.sql`AND ${cursorCondition(cursor, sortBy)}` : Prisma.empty
+
+  const rows = await prisma.$queryRaw`
+    SELECT j.id, ${source.rank} AS rank
+    ${source.from}
+    ${afterCursor}
+    ORDER BY ${ORDER_BY[sortBy] || ORDER_BY.latest}
+    LIMIT ${take} OFFSET ${offset}
+  `
+
+  return rows.map(row => row.id)
+}
+
+/**
+ * Number of public jobs matching a search and the listing filters.
+ * @returns {Promise<number|null>} null when the search has no searchable terms
+ */
+export async function countJobSearchMatches(search, filters, now = new Date()) {
+  const source = searchSource(search, filters, now)
+  if (!source) return null
+
+  const [row] = await prisma.$queryRaw`SELECT COUNT(*)::int AS count ${source.from}`
+  return row.count
+}
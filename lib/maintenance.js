@@ -0,0 +1,278 @@
+import { randomUUID } from 'crypto'
+import { prisma } from '@/lib/prisma'
+import { createLogger } from '@/lib/logger'
+import { invalidateCacheTags, CacheTag } from '@/lib/cache'
+import { refreshDailyStats } from '@/lib/stats'
+import { reconcileDashboardCounters } from '@/lib/recruiterDashboard'
+import { processMediaJobs } from '@/lib/mediaQueue'
+import { deliverEmailOutbox } from '@/lib/email/outbox'
+
+/**
+ * Scheduled maintenance runner (expired jobs, expired contracts, overdue
+ * interviews, daily stats rollup, recruiter dashboard counters, media queue,
+ * email outbox).
+ *
+ * - One run at a time across instances via a lease row in `maintenance_locks`
+ * - Every task works in bounded batches; leftovers are picked up by the next run
+ * - Each run is recorded in `maintenance_runs` with per-task metrics
+ */
+
+const log = createLogger({ module: 'maintenance' })
+
+export const MaintenanceTask = {
+  EXPIRED_JOBS: 'expiredJobs',
+  EXPIRED_CONTRACTS: 'expiredContracts',
+  OVERDUE_INTERVIEWS: 'overdueInterviews',
+  DAILY_STATS: 'dailyStats',
+  DASHBOARD_COUNTERS: 'dashboardCounters',
+  MEDIA_QUEUE: 'mediaQueue',
+  EMAIL_OUTBOX: 'emailOutbox',
+}
+
+const LOCK_NAME = 'maintenance'
+// Longer than a full run (batches × batch time) so the lease never lapses mid-run
+const LOCK_LEASE_MS = 10 * 60 * 1000
+const DEFAULT_BATCH_SIZE = 500
+const DEFAULT_MAX_BATCHES = 20
+// Images are resized a few at a time, not hundreds
+const MEDIA_BATCH_SIZE = 10
+
+/**
+ * Try to take the maintenance lease. Returns true when this owner holds it.
+ */
+export async function acquireMaintenanceLock(owner, leaseMs = LOCK_LEASE_MS) {
+  const lockedUntil = new Date(Date.now() + leaseMs)
+  const rows = await prisma.$queryRaw`
+    INSERT INTO "maintenance_locks" ("name", "owner", "lockedUntil", "updatedAt")
+    VALUES (${LOCK_NAME}, ${owner}, ${lockedUntil}, NOW())
+    ON CONFLICT ("name") DO UPDATE
+      SET "owner" = EXCLUDED."owner",
+          "lockedUntil" = EXCLUDED."lockedUntil",
+          "updatedAt" = NOW()
+      WHERE "maintenance_locks"."lockedUntil" < NOW()
+    RETURNING "owner"
+  `
+  return rows.length > 0
+}
+
+export async function releaseMaintenanceLock(owner) {
+  await prisma.maintenance_locks.updateMany({
+    where: { name: LOCK_NAME, owner },
+    data: { lockedUntil: new Date(0) }
+  })
+}
+
+/**
+ * Run `processBatch` until it reports a short batch or `maxBatches` is reached
+ */
+async function runInBatches(processBatch, { batchSize, maxBatches }) {
+  let processed = 0
+  let batches = 0
+  let hasMore = true
+
+  while (hasMore && batches < maxBatches) {
+    const { fetched, updated } = await processBatch(batchSize)
+    if (fetched === 0) {
+      hasMore = false
+      break
+    }
+    processed += updated
+    batches++
+    hasMore = fetched === batchSize
+  }
+
+  return { processed, batches, hasMore }
+}
+
+async function deactivateExpiredJobs(now, options) {
+  const expiredWhere = {
+    OR: [{ isActive: true }, { status: 'ACTIVE' }],
+    applicationDeadline: { lt: now, not: null }
+  }
+
+  const result = await runInBatches(async (batchSize) => {
+    const expired = await prisma.jobs.findMany({
+      where: expiredWhere,
+      select: { id: true },
+      orderBy: { id: 'asc' },
+      take: batchSize
+    })
+    if (expired.length === 0) return { fetched: 0, updated: 0 }
+
+    const { count } = await prisma.jobs.updateMany({
+      where: { id: { in: expired.map(job => job.id) }, ...expiredWhere },
+      data: {
+        isActive: false,
+        status: 'CLOSED',
+        closedAt: now
+      }
+    })
+    return { fetched: expired.length, updated: count }
+  }, options)
+
+  if (result.processed > 0) {
+    await invalidateCacheTags(CacheTag.JOBS)
+  }
+  return result
+}
+
+async function completeExpiredContracts(now, options) {
+  return runInBatches(async (batchSize) => {
+    const expired = await prisma.contract_workers.findMany({
+      where: {
+        status: 'ACTIVE',
+        endDate: { lt: now },
+        contract_registration: { status: 'APPROVED' }
+      },
+      select: { id: true, applicationId: true },
+      orderBy: { id: 'asc' },
+      take: batchSize
+    })
+    if (expired.length === 0) return { fetched: 0, updated: 0 }
+
+    const [contracts] = await prisma.$transaction([
+      prisma.contract_workers.updateMany({
+        where: { id: { in: expired.map(worker => worker.id) }, status: 'ACTIVE' },
+        data: {
+          status: 'COMPLETED',
+          terminatedAt: now,
+          terminationReason: 'Kontrak berakhir otomatis'
+        }
+      }),
+      // RESIGNED marks the application as a finished contract
+      prisma.applications.updateMany({
+        where: { id: { in: expired.map(worker => worker.applicationId) } },
+        data: { status: 'RESIGNED' }
+      })
+    ])
+    return { fetched: expired.length, updated: contracts.count }
+  }, options)
+}
+
+// Interview completion is controlled by recruiters, so this only reports
+// interviews that are more than 24 hours overdue
+async function reportOverdueInterviews(now) {
+  const overdue = await prisma.interviews.count({
+    where: {
+      status: 'SCHEDULED',
+      scheduledAt: { lte: new Date(now.getTime() - 24 * 60 * 60 * 1000) }
+    }
+  })
+  return { processed: 0, batches: 0, hasMore: false, overdue }
+}
+
+// One upsert over the closed days since the last refresh
+async function rollUpDailyStats(now) {
+  const result = await refreshDailyStats({ now })
+  return { ...result, batches: result.processed > 0 ? 1 : 0, hasMore: false }
+}
+
+// Trigger-maintained counters only drift through manual SQL or restores;
+// this corrects them and drops expired day buckets
+async function reconcileDashboard(now) {
+  const result = await reconcileDashboardCounters({ now })
+  if (result.processed > 0) {
+    log.warn({ ...result }, 'Recruiter dashboard counters drifted and were corrected')
+  }
+  return { ...result, batches: 1, hasMore: false }
+}
+
+// Uploads are normally processed right after their response; this picks up
+// jobs whose drain failed or never ran, and retries put back in the queue
+async function processMediaQueue(now, { maxBatches }) {
+  return runInBatches(async (batchSize) => {
+    const { claimed, done } = await processMediaJobs({ limit: batchSize })
+    return { fetched: claimed, updated: done }
+  }, { batchSize: MEDIA_BATCH_SIZE, maxBatches })
+}
+
+// Same backstop for emails: retries whose backoff has passed and rows no
+// post-response drain picked up. A rate limit ends the task for this run.
+async function deliverEmails(now, options) {
+  return runInBatches(async (batchSize) => {
+    const { claimed, sent, deferred } = await deliverEmailOutbox({ limit: batchSize })
+    return { fetched: claimed - deferred, updated: sent }
+  }, options)
+}
+
+const TASK_HANDLERS = {
+  [MaintenanceTask.EXPIRED_JOBS]: deactivateExpiredJobs,
+  [MaintenanceTask.EXPIRED_CONTRACTS]: completeExpiredContracts,
+  [MaintenanceTask.OVERDUE_INTERVIEWS]: reportOverdueInterviews,
+  [MaintenanceTask.DAILY_STATS]: rollUpDailyStats,
+  [MaintenanceTask.DASHBOARD_COUNTERS]: reconcileDashboard,
+  [MaintenanceTask.MEDIA_QUEUE]: processMediaQueue,
+  [MaintenanceTask.EMAIL_OUTBOX]: deliverEmails,
+}
+
+/**
+ * Run maintenance tasks under the distributed lock.
+ * Returns `{ skipped: true }` when another run holds the lock.
+ * @param {Object} [options]
+ * @param {string[]} [options.tasks] - Subset of MaintenanceTask (default: all)
+ * @param {Date} [options.now]
+ * @param {number} [options.batchSize=500]
+ * @param {number} [options.maxBatches=20] - Per task, per run
+ */
+export async function runMaintenance({
+  tasks = Object.values(MaintenanceTask),
+  now = new Date(),
+  batchSize = DEFAULT_BATCH_SIZE,
+  maxBatches = DEFAULT_MAX_BATCHES
+} = {}) {
+  const owner = randomUUID()
+
+  if (!(await acquireMaintenanceLock(owner))) {
+    log.info({ tasks }, 'Maintenance skipped, another run holds the lock')
+    return { skipped: true }
+  }
+
+  const startedAt = Date.now()
+  const metrics = {}
+  const errors = []
+
+  try {
+    const run = await prisma.maintenance_runs.create({
+      data: { tasks },
+      select: { id: true }
+    })
+
+    for (const task of tasks) {
+      const handler = TASK_HANDLERS[task]
+      if (!handler) continue
+
+      const taskStartedAt = Date.now()
+      try {
+        const result = await handler(now, { batchSize, maxBatches })
+        metrics[task] = { ...result, durationMs: Date.now() - taskStartedAt }
+      } catch (error) {
+        // One failing task must not block the others
+        metrics[task] = { error: error.message, durationMs: Date.now() - taskStartedAt }
+        errors.push(`${task}: ${error.message}`)
+      }
+    }
+
+    const durationMs = Date.now() - startedAt
+    const status = errors.length > 0 ? 'FAILED' : 'SUCCESS'
+
+    await prisma.maintenance_runs.update({
+      where: { id: run.id },
+      data: {
+        status,
+        metrics,
+        error: errors.length > 0 ? errors.join('; ') : null,
+        finishedAt: new Date(),
+        durationMs
+      }
+    })
+
+    log[errors.length > 0 ? 'error' : 'info']({ runId: run.id, status, metrics, durationMs }, 'Maintenance run finished')
+
+    return { skipped: false, runId: run.id, status, metrics, durationMs }
+  } finally {
+    await releaseMaintenanceLock(owner).catch(error => {
+      // The lease expires on its own; the next run just waits for it
+      log.warn({ error: error.message }, 'Failed to release maintenance lock')
+    })
+  }
+}
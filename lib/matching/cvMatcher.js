@@ -0,0 +1,186 @@
+import { createHash } from 'crypto'
+import { cached, peekCached } from '@/lib/cache'
+import { logError } from '@/lib/logger'
+import { mapWithConcurrency } from '@/lib/utils'
+
+/**
+ * CV ↔ job matching used by the recruiter ai-match routes.
+ *
+ * - Python matcher (`NEXT_PUBLIC_PYTHON_API_URL`) is the primary scorer
+ * - Results are cached on CV content hash + job title + skill set, so the
+ *   same PDF is only parsed once per job
+ * - When the service is down, cached scores are still served and a local
+ *   skill-overlap score is returned for the rest
+ */
+
+export const MATCH_CONCURRENCY = 4
+export const MATCH_BATCH_LIMIT = 200
+const MATCH_TIMEOUT_MS = 10000
+const CV_DOWNLOAD_TIMEOUT_MS = 5000
+const CV_MAX_BYTES = 5 * 1024 * 1024
+// Keys are content-addressed, so entries only age out to bound storage
+const MATCH_CACHE_TTL = 60 * 60 * 24 * 7
+
+function normalizeSkill(skill) {
+  return String(skill || '').trim().toLowerCase().replace(/\s+/g, ' ')
+}
+
+function sha256(value) {
+  return createHash('sha256').update(value).digest('hex')
+}
+
+function matchStatus(score) {
+  return score > 60 ? 'POTENTIAL' : 'NOT_RECOMMENDED'
+}
+
+/**
+ * Local fallback: share of job skills present in the jobseeker's profile skills
+ * @param {string[]} cvSkills
+ * @param {string[]} jobSkills
+ */
+export function scoreSkillOverlap(cvSkills = [], jobSkills = []) {
+  const normalizedCv = new Set(cvSkills.map(normalizeSkill).filter(Boolean))
+  const uniqueJobSkills = [...new Map(
+    jobSkills.filter(Boolean).map(skill => [normalizeSkill(skill), skill])
+  ).entries()]
+
+  if (uniqueJobSkills.length === 0) {
+    return { match_score: 0, highlights: [], status: 'NOT_RECOMMENDED', source: 'local_overlap' }
+  }
+
+  const highlights = uniqueJobSkills
+    .filter(([normalized]) => normalizedCv.has(normalized))
+    .map(([, original]) => original)
+  const score = Math.round((highlights.length / uniqueJobSkills.length) * 100)
+
+  return {
+    match_score: score,
+    highlights,
+    status: matchStatus(score),
+    source: 'local_overlap'
+  }
+}
+
+// Only CVs from our own storage are downloaded for hashing
+function isTrustedCvUrl(cvUrl) {
+  try {
+    const { origin } = new URL(cvUrl)
+    return [process.env.NEXT_PUBLIC_SUPABASE_URL, process.env.NEXT_PUBLIC_APP_URL]
+      .filter(Boolean)
+      .some(allowed => new URL(allowed).origin === origin)
+  } catch {
+    return false
+  }
+}
+
+/**
+ * Identify a CV by its content. Falls back to the URL (storage paths are
+ * unique per upload) when the file cannot be fetched.
+ */
+async function cvFingerprint(cvUrl) {
+  if (isTrustedCvUrl(cvUrl)) {
+    try {
+      const response = await fetch(cvUrl, { signal: AbortSignal.timeout(CV_DOWNLOAD_TIMEOUT_MS) })
+      const size = Number(response.headers.get('content-length') || 0)
+      if (response.ok && size <= CV_MAX_BYTES) {
+        const buffer = Buffer.from(await response.arrayBuffer())
+        if (buffer.length <= CV_MAX_BYTES) {
+          return `sha256:${sha256(buffer)}`
+        }
+      }
+    } catch (error) {
+      logError(error, { context: 'cvMatcher.fingerprint' })
+    }
+  }
+  return `url:${sha256(cvUrl)}`
+}
+
+function matchCacheKey(fingerprint, jobTitle, jobSkills) {
+  const skillSet = [...new Set(jobSkills.map(normalizeSkill).filter(Boolean))].sort()
+  return `ai-match:${fingerprint}:${sha256(JSON.stringify([normalizeSkill(jobTitle), skillSet]))}`
+}
+
+function fromPythonResponse(data) {
+  const score = Math.min(parseInt(data.persentase) || 0, 100)
+
+  return {
+    match_score: score,
+    highlights: data.skill || [],
+    status: data.status || matchStatus(score),
+    source: 'python_api',
+    cv_parsed: {
+      nama: data.nama || null,
+      email: data.email || null,
+      no_telepon: data.no_telepon || data.phone || null,
+      skills_extracted: data.skill || [],
+      raw_text_preview: data.raw_text ? data.raw_text.substring(0, 500) : null
+    }
+  }
+}
+
+/**
+ * Create a matcher that shares service health across one batch: after the
+ * first connection failure or timeout the rest of the batch goes straight to
+ * the local scorer instead of waiting out one timeout per applicant.
+ */
+export function createCvMatcher({ pythonApiUrl = process.env.NEXT_PUBLIC_PYTHON_API_URL } = {}) {
+  let serviceDown = !pythonApiUrl
+
+  async function callPython(cvUrl, jobTitle, jobSkills) {
+    try {
+      const response = await fetch(`${pythonApiUrl}/api/match`, {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({
+          uri_cv: cvUrl,
+          job_title: jobTitle,
+          required_skill: jobSkills
+        }),
+        signal: AbortSignal.timeout(MATCH_TIMEOUT_MS)
+      })
+
+      if (!response.ok) {
+        if (response.status >= 500) serviceDown = true
+        return null
+      }
+      return fromPythonResponse(await response.json())
+    } catch (error) {
+      serviceDown = true
+      logError(error, { context: 'cvMatcher.python' })
+      return null
+    }
+  }
+
+  /**
+   * @param {Object} input
+   * @param {string} [input.cvUrl]
+   * @param {string[]} [input.cvSkills] - Profile skills, used by the fallback scorer
+   * @param {string} [input.jobTitle]
+   * @param {string[]} [input.jobSkills]
+   */
+  async function match({ cvUrl, cvSkills = [], jobTitle = '', jobSkills = [] }) {
+    if (cvUrl && pythonApiUrl) {
+      const key = matchCacheKey(await cvFingerprint(cvUrl), jobTitle, jobSkills)
+      // Failed calls return null, which `cached` does not store. Once the
+      // service is down, CVs scored before keep their Python score.
+      const result = serviceDown
+        ? await peekCached(key)
+        : await cached(key, { ttl: MATCH_CACHE_TTL }, () =>
+          serviceDown ? null : callPython(cvUrl, jobTitle, jobSkills)
+        )
+      if (result) return result
+    }
+
+    return scoreSkillOverlap(cvSkills, jobSkills)
+  }
+
+  /**
+   * Score many (CV, job) pairs with bounded concurrency
+   * @param {Array<Object>} items - Same shape as `match` input
+   */
+  function matchMany(items, concurrency = MATCH_CONCURRENCY) {
+    return mapWithConcurrency(items, concurrency, item => match(item))
+  }
+
+  return { match, matchMany }
+}
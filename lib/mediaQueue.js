@@ -0,0 +1,244 @@
+import sharp from 'sharp'
+import { prisma } from '@/lib/prisma'
+import { createLogger } from '@/lib/logger'
+import { invalidateCacheTags, CacheTag } from '@/lib/cache'
+import { getStorage } from '@/lib/storage'
+import { mapWithConcurrency } from '@/lib/utils'
+
+/**
+ * Background image processing for uploads.
+ *
+ * - The upload route streams the original to storage and enqueues a
+ *   `media_jobs` row
+ * - Workers first rewrite the original in place without EXIF/XMP/IPTC (GPS
+ *   position, camera serials); its public URL stays valid for records that
+ *   link to it directly
+ * - Jobs with a target (profile photos, company gallery) are then resized to
+ *   WebP variants (`<name>_<width>w.webp`) with bounded concurrency, and the
+ *   owning record is pointed at the largest variant, but only if it still
+ *   references the original. Untargeted images (job photos, document scans)
+ *   are only stripped: nothing would link to their variants
+ * - Jobs are claimed with `FOR UPDATE SKIP LOCKED` and a lease, so the
+ *   post-response drain and the cron route can run side by side
+ */
+
+const log = createLogger({ module: 'mediaQueue' })
+
+// Records that can be switched to the optimized URL when a job finishes
+export const MediaTarget = {
+  RECRUITER_PHOTO: 'recruiterPhoto',
+  JOBSEEKER_PHOTO: 'jobseekerPhoto',
+  COMPANY_GALLERY: 'companyGallery',
+}
+
+export const MEDIA_VARIANT_WIDTHS = [320, 800, 1600]
+export const MEDIA_CONCURRENCY = 2
+const MAX_ATTEMPTS = 3
+const LEASE_MS = 5 * 60 * 1000
+const WEBP_QUALITY = 80
+// Bounds one drain so a post-response hook never runs indefinitely
+const MAX_DRAIN_ROUNDS = 5
+
+/**
+ * Storage path of a resized variant
+ * @param {string} filePath - Original path, e.g. `company/1/gallery/123.png`
+ * @param {number} width
+ */
+export function variantPath(filePath, width) {
+  return `${filePath.replace(/\.[^./]+$/, '')}_${width}w.webp`
+}
+
+/**
+ * @param {Object} job
+ * @param {string} job.bucket
+ * @param {string} job.path - Path of the stored original
+ * @param {string} job.sourceUrl - Public URL returned to the client
+ * @param {{kind: string, id: string}} [job.target] - See MediaTarget
+ * @returns {Promise<{id: string, status: string}>}
+ */
+export function enqueueMediaJob({ bucket, path, sourceUrl, target = null }) {
+  return prisma.media_jobs.create({
+    data: { bucket, path, sourceUrl, target },
+    select: { id: true, status: true }
+  })
+}
+
+function claimMediaJobs(limit) {
+  const lockedUntil = new Date(Date.now() + LEASE_MS)
+
+  return prisma.$queryRaw`
+    UPDATE "media_jobs"
+    SET "status" = 'PROCESSING',
+        "attempts" = "attempts" + 1,
+        "lockedUntil" = ${lockedUntil},
+        "updatedAt" = NOW()
+    WHERE "id" IN (
+      SELECT "id" FROM "media_jobs"
+      WHERE ("status" = 'PENDING' OR ("status" = 'PROCESSING' AND "lockedUntil" < NOW()))
+        AND "attempts" < ${MAX_ATTEMPTS}
+      ORDER BY "createdAt"
+      LIMIT ${limit}
+      FOR UPDATE SKIP LOCKED
+    )
+    RETURNING "id", "bucket", "path", "sourceUrl", "target", "attempts"
+  `
+}
+
+async function applyTarget(target, sourceUrl, optimizedUrl) {
+  if (!target?.id) return
+
+  switch (target.kind) {
+    case MediaTarget.RECRUITER_PHOTO:
+      await prisma.recruiters.updateMany({
+        where: { id: target.id, photoUrl: sourceUrl },
+        data: { photoUrl: optimizedUrl }
+      })
+      break
+    case MediaTarget.JOBSEEKER_PHOTO:
+      await prisma.jobseekers.updateMany({
+        where: { id: target.id, photo: sourceUrl },
+        data: { photo: optimizedUrl }
+      })
+      break
+    case MediaTarget.COMPANY_GALLERY: {
+      const updated = await prisma.$executeRaw`
+        UPDATE "companies"
+        SET "gallery" = array_replace("gallery", ${sourceUrl}, ${optimizedUrl}),
+            "updatedAt" = NOW()
+        WHERE "id" = ${target.id} AND ${sourceUrl} = ANY("gallery")
+      `
+      if (updated > 0) {
+        await invalidateCacheTags(CacheTag.COMPANIES)
+      }
+      break
+    }
+  }
+}
+
+/**
+ * Drop embedded metadata from a stored original, keeping its format and path.
+ * @returns {Promise<Buffer>} The stripped image (or `original` when it had none)
+ */
+async function stripOriginalMetadata(storage, job, original) {
+  const { format, pages = 1, exif, xmp, iptc } = await sharp(original, { animated: true }).metadata()
+  if (!exif && !xmp && !iptc) return original
+
+  // sharp writes no metadata unless asked; rotate() bakes in the EXIF orientation first
+  const pipeline = sharp(original, { animated: true })
+  const stripped = await (pages > 1 ? pipeline : pipeline.rotate()).toBuffer()
+
+  await storage.upload(job.bucket, job.path, stripped, {
+    contentType: `image/${format}`,
+    upsert: true
+  })
+  return stripped
+}
+
+/**
+ * Strip the original's metadata and, for targeted jobs, resize it into WebP
+ * variants and update the target
+ * @returns {Promise<Object<string, string>>} Variant URL per width (empty without a target)
+ */
+export async function processMediaJob(job) {
+  const storage = getStorage()
+  const original = await stripOriginalMetadata(storage, job, await storage.download(job.bucket, job.path))
+  const variants = {}
+  if (!job.target?.id) return variants
+
+  // Names follow the requested width; smaller originals are never upscaled
+  for (const variantWidth of MEDIA_VARIANT_WIDTHS) {
+    const buffer = await sharp(original)
+      .rotate()
+      .resize({ width: variantWidth, withoutEnlargement: true })
+      .webp({ quality: WEBP_QUALITY })
+      .toBuffer()
+
+    const filePath = variantPath(job.path, variantWidth)
+    await storage.upload(job.bucket, filePath, buffer, {
+      contentType: 'image/webp',
+      upsert: true
+    })
+    variants[variantWidth] = storage.getPublicUrl(job.bucket, filePath)
+  }
+
+  await applyTarget(job.target, job.sourceUrl, variants[Math.max(...MEDIA_VARIANT_WIDTHS)])
+  return variants
+}
+
+/**
+ * Claim and process up to `limit` jobs, `concurrency` at a time
+ * @param {Object} [options]
+ * @param {number} [options.limit=10]
+ * @param {number} [options.concurrency]
+ * @returns {Promise<{claimed: number, done: number, failed: number}>}
+ */
+export async function processMediaJobs({ limit = 10, concurrency = MEDIA_CONCURRENCY } = {}) {
+  const jobs = await claimMediaJobs(limit)
+  let done = 0
+  let failed = 0
+
+  await mapWithConcurrency(jobs, concurrency, async job => {
+    try {
+      const variants = await processMediaJob(job)
+      await prisma.media_jobs.update({
+        where: { id: job.id },
+        data: { status: 'DONE', variants, error: null, lockedUntil: null }
+      })
+      done++
+    } catch (error) {
+      // Retried by a later drain until MAX_ATTEMPTS; the original stays usable meanwhile
+      const finalAttempt = job.attempts >= MAX_ATTEMPTS
+      await prisma.media_jobs.update({
+        where: { id: job.id },
+        data: { status: finalAttempt ? 'FAILED' : 'PENDING', error: error.message, lockedUntil: null }
+      }).catch(() => {})
+      log[finalAttempt ? 'error' : 'warn']({ jobId: job.id, attempt: job.attempts, error: error.message }, 'Media job failed')
+      failed++
+    }
+  })
+
+  return { claimed: jobs.length, done, failed }
+}
+
+let draining = false
+
+/**
+ * Work the queue until it is empty (bounded); one drain per process at a time.
+ * Meant to run after the upload response has been sent.
+ */
+export async function drainMediaQueue() {
+  if (draining) return
+  draining = true
+
+  try {
+    for (let round = 0; round < MAX_DRAIN_ROUNDS; round++) {
+      const { claimed } = await processMediaJobs({ limit: MEDIA_CONCURRENCY })
+      if (claimed === 0) break
+    }
+  } catch (error) {
+    log.error({ error: error.message }, 'Media queue drain failed')
+  } finally {
+    draining = false
+  }
+}
+
+/**
+ * Storage paths of an uploaded image and all of its variants, given the path
+ * of either the original or a variant
+ * @returns {Promise<string[]>}
+ */
+export async function mediaPaths(bucket, filePath) {
+  const base = filePath.replace(/(_\d+w)?\.[^./]+$/, '')
+  const job = await prisma.media_jobs.findFirst({
+    where: { bucket, path: { startsWith: `${base}.` } },
+    select: { path: true }
+  })
+
+  return [
+    ...new Set([
+      filePath,
+      ...(job ? [job.path] : []),
+      ...MEDIA_VARIANT_WIDTHS.map(width => variantPath(`${base}.webp`, width))
+    ])
+  ]
+}
@@ -0,0 +1,175 @@
+/**
+ * Minimal in-process metrics registry rendered in the Prometheus text
+ * exposition format (served by /api/health/metrics).
+ *
+ * The registry lives on globalThis because Next.js bundles route handlers
+ * and instrumentation.js separately; every bundle must record into the same
+ * series. Creating a metric whose name already exists returns the existing
+ * one, so module reloads do not duplicate series.
+ */
+
+// Seconds; tuned for API handlers and database statements
+export const DEFAULT_BUCKETS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10]
+
+const globalForMetrics = globalThis
+
+if (!globalForMetrics.metricsRegistry) {
+  globalForMetrics.metricsRegistry = new Map()
+}
+
+const registry = globalForMetrics.metricsRegistry
+
+function escapeLabelValue(value) {
+  return String(value).replace(/\\/g, '\\\\').replace(/\n/g, '\\n').replace(/"/g, '\\"')
+}
+
+function formatLabels(labels) {
+  const entries = Object.entries(labels)
+  if (entries.length === 0) return ''
+  return `{${entries.map(([key, value]) => `${key}="${escapeLabelValue(value)}"`).join(',')}}`
+}
+
+function labelsFor(labelNames, values = {}) {
+  const labels = {}
+  for (const name of labelNames) labels[name] = values[name] ?? ''
+  return labels
+}
+
+function register(name, create) {
+  if (!registry.has(name)) registry.set(name, create())
+  return registry.get(name)
+}
+
+/**
+ * @param {Object} options
+ * @param {string} options.name
+ * @param {string} options.help
+ * @param {string[]} [options.labelNames]
+ * @param {number[]} [options.buckets] - Upper bounds, ascending
+ * @returns {{observe: (labels: Object, value: number) => void}}
+ */
+export function createHistogram({ name, help, labelNames = [], buckets = DEFAULT_BUCKETS }) {
+  return register(name, () => {
+    const series = new Map()
+
+    return {
+      observe(values, value) {
+        const labels = labelsFor(labelNames, values)
+        const key = JSON.stringify(labels)
+        let entry = series.get(key)
+        if (!entry) {
+          entry = { labels, counts: new Array(buckets.length).fill(0), sum: 0, count: 0 }
+          series.set(key, entry)
+        }
+        for (let i = 0; i < buckets.length; i++) {
+          if (value <= buckets[i]) entry.counts[i]++
+        }
+        entry.sum += value
+        entry.count++
+      },
+      render() {
+        const lines = [`# HELP ${name} ${help}`, `# TYPE ${name} histogram`]
+        for (const { labels, counts, sum, count } of series.values()) {
+          buckets.forEach((bound, i) => {
+            lines.push(`${name}_bucket${formatLabels({ ...labels, le: bound })} ${counts[i]}`)
+          })
+          lines.push(`${name}_bucket${formatLabels({ ...labels, le: '+Inf' })} ${count}`)
+          lines.push(`${name}_sum${formatLabels(labels)} ${sum}`)
+          lines.push(`${name}_count${formatLabels(labels)} ${count}`)
+        }
+        return lines
+      },
+      reset() {
+        series.clear()
+      }
+    }
+  })
+}
+
+/**
+ * @param {Object} options
+ * @param {string} options.name - Should end in `_total`
+ * @param {string} options.help
+ * @param {string[]} [options.labelNames]
+ * @returns {{inc: (labels?: Object, value?: number) => void}}
+ */
+export function createCounter({ name, help, labelNames = [] }) {
+  return register(name, () => {
+    const series = new Map()
+
+    return {
+      inc(values = {}, value = 1) {
+        const labels = labelsFor(labelNames, values)
+        const key = JSON.stringify(labels)
+        const entry = series.get(key) || { labels, value: 0 }
+        entry.value += value
+        series.set(key, entry)
+      },
+      render() {
+        const lines = [`# HELP ${name} ${help}`, `# TYPE ${name} counter`]
+        for (const { labels, value } of series.values()) {
+          lines.push(`${name}${formatLabels(labels)} ${value}`)
+        }
+        return lines
+      },
+      reset() {
+        series.clear()
+      }
+    }
+  })
+}
+
+function createCollected(type, { name, help, collect }) {
+  return register(name, () => ({
+    render() {
+      const collected = collect()
+      const samples = Array.isArray(collected) ? collected : [{ labels: {}, value: collected }]
+      return [
+        `# HELP ${name} ${help}`,
+        `# TYPE ${name} ${type}`,
+        ...samples.map(({ labels, value }) => `${name}${formatLabels(labels)} ${value}`)
+      ]
+    },
+    reset() {}
+  }))
+}
+
+/**
+ * Gauge read at scrape time.
+ * @param {Object} options
+ * @param {string} options.name
+ * @param {string} options.help
+ * @param {() => number | Array<{labels: Object, value: number}>} options.collect
+ */
+export function createGauge(options) {
+  return createCollected('gauge', options)
+}
+
+/**
+ * Counter kept elsewhere and read at scrape time; `collect` must only ever
+ * return increasing values.
+ * @param {Object} options
+ * @param {string} options.name - Should end in `_total`
+ * @param {string} options.help
+ * @param {() => number | Array<{labels: Object, value: number}>} options.collect
+ */
+export function createCollectedCounter(options) {
+  return createCollected('counter', options)
+}
+
+/**
+ * All registered metrics in the Prometheus text format
+ * @returns {string}
+ */
+export function renderMetrics() {
+  const lines = []
+  for (const metric of registry.values()) lines.push(...metric.render())
+  return `${lines.join('\n')}\n`
+}
+
+/**
+ * Clear recorded values, keeping the metric definitions (tests)
+ */
+export function resetMetrics() {
+  for (const metric of registry.values()) metric.reset()
+}
@@ -0,0 +1,91 @@
+import { cached, invalidateCacheTags } from '@/lib/cache'
+
+/**
+ * Short-lived cache of the authenticated principal (user row and role
+ * profile) used by lib/authHelper.
+ *
+ * - Entries are keyed per user and kind and tagged `principal:<userId>`, so
+ *   one `invalidatePrincipal` call drops everything cached for that user
+ * - Only identity fields are cached; routes that need the full profile still
+ *   load it themselves
+ * - Missing users/profiles are not cached (see `cached`)
+ */
+
+export const PRINCIPAL_TTL_SECONDS = 60
+
+export const PrincipalKind = {
+  USER: 'user',
+  JOBSEEKER: 'jobseeker',
+  RECRUITER: 'recruiter',
+}
+
+const stats = {
+  lookups: 0,
+  misses: 0,
+  missMsTotal: 0,
+}
+
+function principalTag(userId) {
+  return `principal:${userId}`
+}
+
+/**
+ * @param {string} kind - One of PrincipalKind
+ * @param {string} userId
+ * @param {() => Promise<Object|null>} loader - Database lookup run on a miss
+ */
+export async function getCachedPrincipal(kind, userId, loader) {
+  stats.lookups++
+
+  return cached(
+    `principal:${kind}:${userId}`,
+    { ttl: PRINCIPAL_TTL_SECONDS, tags: [principalTag(userId)] },
+    async () => {
+      const startedAt = Date.now()
+      try {
+        return await loader()
+      } finally {
+        stats.misses++
+        stats.missMsTotal += Date.now() - startedAt
+      }
+    }
+  )
+}
+
+/**
+ * Drop the cached principal after logout, password, email or status changes
+ * and profile updates that touch cached fields. Never throws.
+ * @param {string} userId
+ */
+export async function invalidatePrincipal(userId) {
+  if (!userId) return
+  await invalidateCacheTags(principalTag(userId))
+}
+
+/**
+ * Counters since process start. `estimatedSavedMs` assumes every hit would
+ * have cost the average observed miss.
+ */
+export function getPrincipalCacheStats() {
+  const hits = stats.lookups - stats.misses
+  const averageMissMs = stats.misses === 0 ? 0 : stats.missMsTotal / stats.misses
+
+  return {
+    lookups: stats.lookups,
+    hits,
+    misses: stats.misses,
+    missMsTotal: stats.missMsTotal,
+    hitRate: stats.lookups === 0 ? 0 : hits / stats.lookups,
+    averageMissMs: Math.round(averageMissMs * 10) / 10,
+    estimatedSavedMs: Math.round(hits * averageMissMs),
+  }
+}
+
+/**
+ * Reset counters (tests)
+ */
+export function resetPrincipalCacheStats() {
+  stats.lookups = 0
+  stats.misses = 0
+  stats.missMsTotal = 0
+}
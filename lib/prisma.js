@@ -1,4 +1,5 @@
 import { PrismaClient } from '@prisma/client'
+import { queryTelemetryExtension } from '@/lib/telemetry'
 
 const prismaClientSingleton = () => {
   return new PrismaClient({
@@ -8,7 +9,7 @@ const prismaClientSingleton = () => {
         url: process.env.DATABASE_URL,
       },
     },
-  })
+  }).$extends(queryTelemetryExtension)
 }
 
 const globalForPrisma = globalThis
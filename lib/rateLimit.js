@@ -1,50 +1,185 @@
-import { Ratelimit } from "@upstash/ratelimit"
 import { Redis } from "@upstash/redis"
 import { NextResponse } from "next/server"
+
+/**
+ * Unified rate limiter for route handlers.
+ *
+ * - Fixed window per (limiter, identifier), counted in Redis with one
+ *   MULTI round-trip (SET NX PX + INCRBY)
+ * - Each instance leases a few tokens per Redis call and serves them from
+ *   memory, so bursts are absorbed locally; once a window is exhausted the
+ *   instance denies locally until it resets
+ *
+ * Edge-safe: middleware imports the Redis client from here, so no Node-only
+ * imports.
+ */
+
 export const redis = Redis.fromEnv()
+
+const MAX_LOCAL_ENTRIES = 10000
+
+/**
+ * Redis-backed window counter
+ * @param {import('@upstash/redis').Redis} client
+ */
+export function createRedisRateLimitStore(client) {
+  return {
+    async increment(key, amount, windowMs) {
+      // Creates the window with its TTL on first use, then adds atomically
+      const [, count] = await client
+        .multi()
+        .set(key, 0, { nx: true, px: windowMs })
+        .incrby(key, amount)
+        .exec()
+      return Number(count)
+    },
+  }
+}
+
+/**
+ * In-process window counter; used when Redis is not configured or fails
+ */
+export function createMemoryRateLimitStore() {
+  const windows = new Map()
+
+  return {
+    async increment(key, amount, windowMs) {
+      const now = Date.now()
+      let entry = windows.get(key)
+      if (!entry || entry.expiresAt <= now) {
+        entry = { count: 0, expiresAt: now + windowMs }
+        windows.set(key, entry)
+      }
+      entry.count += amount
+
+      if (windows.size > MAX_LOCAL_ENTRIES) {
+        for (const [windowKey, value] of windows) {
+          if (value.expiresAt <= now) windows.delete(windowKey)
+        }
+      }
+      return entry.count
+    },
+  }
+}
+
+const fallbackStore = createMemoryRateLimitStore()
+
+function createDefaultStore() {
+  if (process.env.UPSTASH_REDIS_REST_URL && process.env.UPSTASH_REDIS_REST_TOKEN) {
+    return createRedisRateLimitStore(redis)
+  }
+  return fallbackStore
+}
+
+/**
+ * @param {string} name - Limiter name, part of every key
+ * @param {Object} policy
+ * @param {number} policy.limit - Requests per window
+ * @param {number} policy.windowSeconds
+ * @param {Object} [options]
+ * @param {Object} [options.store] - Window counter (defaults to Redis when configured)
+ * @param {number} [options.leaseSize] - Tokens taken per store call
+ */
+export function createRateLimiter(name, { limit, windowSeconds }, options = {}) {
+  const windowMs = windowSeconds * 1000
+  // Small relative to the limit so one instance cannot starve the others
+  const leaseSize = options.leaseSize ?? Math.max(1, Math.floor(limit / 20))
+  const local = new Map()
+  let store = options.store
+
+  function localState(identifier, windowId, reset) {
+    let state = local.get(identifier)
+    if (!state || state.windowId !== windowId) {
+      state = { windowId, reset, leased: 0, remaining: limit, denied: false }
+      local.delete(identifier)
+      local.set(identifier, state)
+      if (local.size > MAX_LOCAL_ENTRIES) {
+        local.delete(local.keys().next().value)
+      }
+    }
+    return state
+  }
+
+  async function increment(key, amount) {
+    store ??= createDefaultStore()
+    try {
+      return await store.increment(key, amount, windowMs)
+    } catch (error) {
+      // Fail open to a per-instance window so Redis issues do not take the API down
+      return fallbackStore.increment(key, amount, windowMs)
+    }
+  }
+
+  return {
+    name,
+    limit,
+    windowSeconds,
+
+    /**
+     * @param {string} identifier - Usually the client IP
+     * @returns {Promise<{success: boolean, limit: number, remaining: number, reset: number}>}
+     */
+    async limit(identifier) {
+      const now = Date.now()
+      const windowId = Math.floor(now / windowMs)
+      const reset = (windowId + 1) * windowMs
+      const state = localState(identifier, windowId, reset)
+
+      if (state.denied) {
+        return { success: false, limit, remaining: 0, reset }
+      }
+
+      if (state.leased === 0) {
+        const count = await increment(`ratelimit:${name}:${identifier}:${windowId}`, leaseSize)
+        const granted = Math.max(0, Math.min(leaseSize, limit - (count - leaseSize)))
+        state.remaining = Math.max(0, limit - count)
+
+        if (granted === 0) {
+          state.denied = true
+          return { success: false, limit, remaining: 0, reset }
+        }
+        state.leased = granted
+      }
+
+      state.leased--
+      return { success: true, limit, remaining: state.remaining + state.leased, reset }
+    },
+  }
+}
+
 // Auth endpoints: 5 requests per 15 minutes (strictest)
-export const authLimiter = new Ratelimit({
-  redis,
-  limiter: Ratelimit.slidingWindow(5, "15 m"),
-  analytics: true,
-  prefix: "@upstash/ratelimit/auth",
-})
+export const authLimiter = createRateLimiter("auth", { limit: 5, windowSeconds: 15 * 60 })
 // Public endpoints: 100 requests per minute
-export const publicLimiter = new Ratelimit({
-  redis,
-  limiter: Ratelimit.slidingWindow(100, "1 m"),
-  analytics: true,
-  prefix: "@upstash/ratelimit/public",
-})
+export const publicLimiter = createRateLimiter("public", { limit: 100, windowSeconds: 60 })
 // Standard endpoints: 60 requests per minute
-export const standardLimiter = new Ratelimit({
-  redis,
-  limiter: Ratelimit.slidingWindow(60, "1 m"),
-  analytics: true,
-  prefix: "@upstash/ratelimit/standard",
-})
+export const standardLimiter = createRateLimiter("standard", { limit: 60, windowSeconds: 60 })
 // Admin endpoints: 120 requests per minute
-export const adminLimiter = new Ratelimit({
-  redis,
-  limiter: Ratelimit.slidingWindow(120, "1 m"),
-  analytics: true,
-  prefix: "@upstash/ratelimit/admin",
-})
+export const adminLimiter = createRateLimiter("admin", { limit: 120, windowSeconds: 60 })
+// Other API reads: 120 requests per minute
+export const apiLimiter = createRateLimiter("api", { limit: 120, windowSeconds: 60 })
+
+/**
+ * Rate-limit a route request by client IP
+ */
+export async function limitRequest(request, limiter) {
+  return limiter.limit(getIP(request))
+}
+
 // Helper to get IP from request
 export function getIP(request) {
-  return request.headers.get("x-forwarded-for")?.split(",")[0] 
-    ?? request.headers.get("x-real-ip") 
+  return request.headers.get("x-forwarded-for")?.split(",")[0]?.trim()
+    ?? request.headers.get("x-real-ip")
     ?? "anonymous"
 }
 // Helper to create rate limit response
 export function rateLimitResponse(reset) {
   return NextResponse.json(
     { error: "Terlalu banyak permintaan. Silakan coba lagi nanti." },
-    { 
+    {
       status: 429,
       headers: {
         "Retry-After": String(Math.ceil((reset - Date.now()) / 1000))
       }
     }
   )
-}
\ No newline at end of file
+}
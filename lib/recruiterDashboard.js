@@ -0,0 +1,231 @@
+import { prisma } from '@/lib/prisma'
+
+/**
+ * Recruiter dashboard summary per company.
+ *
+ * - Counters live in `company_dashboard_counters` and are kept current by
+ *   triggers on `jobs` and `applications` (including bulk and raw SQL writes
+ *   and cascaded deletes), so the dashboard reads them in one query
+ * - "New this week" sums per-day buckets of the last 7 UTC days, today
+ *   included; the triggers only keep the last 8 days of buckets
+ * - computeLiveDashboardSummary runs the equivalent aggregates on the source
+ *   tables; the maintenance runner reconciles the counters against them
+ */
+
+const DAY_MS = 24 * 60 * 60 * 1000
+export const NEW_APPLICATIONS_DAYS = 7
+// Day buckets kept by the triggers (one more than read, for the midnight rollover)
+const TRACKED_DAYS = NEW_APPLICATIONS_DAYS + 1
+
+export const CounterKind = {
+  JOB_STATUS: 'job_status',
+  JOB_OPEN: 'job_open',
+  APPLICATION_STATUS: 'application_status',
+  APPLICATION_DAY: 'application_day',
+}
+
+const JOB_STATUSES = ['PENDING', 'ACTIVE', 'REJECTED', 'CLOSED']
+const APPLICATION_STATUSES = [
+  'PENDING',
+  'REVIEWING',
+  'SHORTLISTED',
+  'INTERVIEW_SCHEDULED',
+  'INTERVIEW_COMPLETED',
+  'ACCEPTED',
+  'REJECTED',
+  'WITHDRAWN',
+  'RESIGNED'
+]
+
+function startOfUtcDay(date) {
+  return new Date(Date.UTC(date.getUTCFullYear(), date.getUTCMonth(), date.getUTCDate()))
+}
+
+function dayKey(date) {
+  return date.toISOString().slice(0, 10)
+}
+
+/**
+ * First instant counted in `newThisWeek`
+ */
+export function newApplicationsSince(now = new Date()) {
+  return new Date(startOfUtcDay(now).getTime() - (NEW_APPLICATIONS_DAYS - 1) * DAY_MS)
+}
+
+function emptySummary() {
+  return {
+    jobs: {
+      total: 0,
+      open: 0,
+      byStatus: Object.fromEntries(JOB_STATUSES.map(status => [status, 0]))
+    },
+    applications: {
+      total: 0,
+      newThisWeek: 0,
+      byStatus: Object.fromEntries(APPLICATION_STATUSES.map(status => [status, 0]))
+    }
+  }
+}
+
+/**
+ * Build the summary from counter rows. Day buckets must already be limited to
+ * the "this week" window.
+ * @param {Array<{kind: string, key: string, count: number}>} rows
+ */
+export function summarizeCounters(rows) {
+  const summary = emptySummary()
+
+  for (const { kind, key, count } of rows) {
+    if (kind === CounterKind.JOB_STATUS) {
+      summary.jobs.byStatus[key] = (summary.jobs.byStatus[key] || 0) + count
+      summary.jobs.total += count
+    } else if (kind === CounterKind.JOB_OPEN) {
+      if (key === 'true') summary.jobs.open += count
+    } else if (kind === CounterKind.APPLICATION_STATUS) {
+      summary.applications.byStatus[key] = (summary.applications.byStatus[key] || 0) + count
+      summary.applications.total += count
+    } else if (kind === CounterKind.APPLICATION_DAY) {
+      summary.applications.newThisWeek += count
+    }
+  }
+
+  return summary
+}
+
+/**
+ * Summary for one company from the counters table (single indexed read)
+ * @param {string} companyId
+ * @param {Object} [options]
+ * @param {Date} [options.now]
+ */
+export async function getDashboardSummary(companyId, { now = new Date() } = {}) {
+  const rows = await prisma.$queryRaw`
+    SELECT "kind", "key", "count"
+    FROM "company_dashboard_counters"
+    WHERE "companyId" = ${companyId}
+      AND ("kind" <> ${CounterKind.APPLICATION_DAY} OR "key" >= ${dayKey(newApplicationsSince(now))})
+  `
+  return summarizeCounters(rows)
+}
+
+/**
+ * The same summary aggregated from `jobs` and `applications` directly.
+ * Reference for reconciliation and tests; too heavy for the polling dashboard.
+ */
+export async function computeLiveDashboardSummary(companyId, { now = new Date() } = {}) {
+  const [jobGroups, applicationGroups, newThisWeek] = await Promise.all([
+    prisma.jobs.groupBy({
+      by: ['status', 'isActive'],
+      where: { companyId },
+      _count: true
+    }),
+    prisma.applications.groupBy({
+      by: ['status'],
+      where: { jobs: { companyId } },
+      _count: true
+    }),
+    prisma.applications.count({
+      where: {
+        jobs: { companyId },
+        createdAt: { gte: newApplicationsSince(now) }
+      }
+    })
+  ])
+
+  const rows = [
+    ...jobGroups.map(group => ({ kind: CounterKind.JOB_STATUS, key: group.status, count: group._count })),
+    ...jobGroups.map(group => ({ kind: CounterKind.JOB_OPEN, key: String(group.isActive), count: group._count })),
+    ...applicationGroups.map(group => ({ kind: CounterKind.APPLICATION_STATUS, key: group.status, count: group._count })),
+    { kind: CounterKind.APPLICATION_DAY, key: dayKey(now), count: newThisWeek }
+  ]
+  return summarizeCounters(rows)
+}
+
+/**
+ * Flat stats object returned by GET /api/profile/recruiter/dashboard
+ */
+export function toDashboardStats(summary) {
+  const { jobs, applications } = summary
+
+  return {
+    totalJobs: jobs.total,
+    activeJobs: jobs.open,
+    totalApplications: applications.total,
+    pendingApplications: applications.byStatus.PENDING,
+    reviewingApplications: applications.byStatus.REVIEWING,
+    shortlistedApplications: applications.byStatus.SHORTLISTED,
+    interviewScheduled: applications.byStatus.INTERVIEW_SCHEDULED,
+    accepted: applications.byStatus.ACCEPTED,
+    rejected: applications.byStatus.REJECTED,
+    newApplicationsThisWeek: applications.newThisWeek,
+    jobsByStatus: jobs.byStatus,
+    applicationsByStatus: applications.byStatus
+  }
+}
+
+/**
+ * Bring every company's counters back in line with the source tables and
+ * drop expired day buckets and zero rows.
+ *
+ * Drift is applied as `count + (live - stored)` with both sides read from one
+ * snapshot, so trigger updates committed while this runs are kept.
+ * @returns {Promise<{processed: number, companies: number, pruned: number}>}
+ */
+export async function reconcileDashboardCounters({ now = new Date() } = {}) {
+  const windowStart = new Date(startOfUtcDay(now).getTime() - (TRACKED_DAYS - 1) * DAY_MS)
+  const windowStartKey = dayKey(windowStart)
+
+  const corrected = await prisma.$queryRaw`
+    WITH "live" AS (
+      SELECT "companyId", 'job_status' AS "kind", "status"::text AS "key", COUNT(*)::int AS "count"
+      FROM "jobs" GROUP BY "companyId", "status"
+      UNION ALL
+      SELECT "companyId", 'job_open', "isActive"::text, COUNT(*)::int
+      FROM "jobs" GROUP BY "companyId", "isActive"
+      UNION ALL
+      SELECT j."companyId", 'application_status', a."status"::text, COUNT(*)::int
+      FROM "applications" AS a JOIN "jobs" AS j ON j."id" = a."jobId"
+      GROUP BY j."companyId", a."status"
+      UNION ALL
+      SELECT j."companyId", 'application_day', to_char(a."createdAt", 'YYYY-MM-DD'), COUNT(*)::int
+      FROM "applications" AS a JOIN "jobs" AS j ON j."id" = a."jobId"
+      WHERE a."createdAt" >= ${windowStart}
+      GROUP BY j."companyId", to_char(a."createdAt", 'YYYY-MM-DD')
+    ),
+    "stored" AS (
+      SELECT "companyId", "kind", "key", "count"
+      FROM "company_dashboard_counters"
+      WHERE "kind" <> 'application_day' OR "key" >= ${windowStartKey}
+    ),
+    "drift" AS (
+      SELECT
+        COALESCE("live"."companyId", "stored"."companyId") AS "companyId",
+        COALESCE("live"."kind", "stored"."kind") AS "kind",
+        COALESCE("live"."key", "stored"."key") AS "key",
+        COALESCE("live"."count", 0) - COALESCE("stored"."count", 0) AS "delta"
+      FROM "live"
+      FULL JOIN "stored"
+        ON "stored"."companyId" = "live"."companyId"
+        AND "stored"."kind" = "live"."kind"
+        AND "stored"."key" = "live"."key"
+      WHERE COALESCE("live"."count", 0) <> COALESCE("stored"."count", 0)
+    )
+    INSERT INTO "company_dashboard_counters" AS c ("companyId", "kind", "key", "count", "updatedAt")
+    SELECT "companyId", "kind", "key", "delta", NOW() FROM "drift"
+    ON CONFLICT ("companyId", "kind", "key") DO UPDATE
+      SET "count" = c."count" + EXCLUDED."count", "updatedAt" = NOW()
+    RETURNING "companyId"
+  `
+
+  const pruned = await prisma.$executeRaw`
+    DELETE FROM "company_dashboard_counters"
+    WHERE "count" = 0
+       OR ("kind" = 'application_day' AND "key" < ${windowStartKey})
+  `
+
+  return {
+    processed: corrected.length,
+    companies: new Set(corrected.map(row => row.companyId)).size,
+    pruned
+  }
+}
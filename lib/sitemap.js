@@ -0,0 +1,284 @@
+import { createHash } from 'crypto'
+import { prisma } from '@/lib/prisma'
+import { cached, CacheTag } from '@/lib/cache'
+
+/**
+ * Sharded sitemap: `/sitemap.xml` is an index of child sitemaps under
+ * `/sitemaps/<shard>.xml`.
+ *
+ * - Jobs, companies and news are sharded by creation month, so shards stay
+ *   stable as the catalogue grows and every published row is listed
+ * - The manifest (one GROUP BY per section) gives each shard its row count and
+ *   max `updatedAt`, which become its ETag and Last-Modified
+ * - Shard XML is built by keyset iteration and cached under its version, so
+ *   repeat crawls are a cache read or a 304
+ * - A month with more URLs than the protocol allows per sitemap (50,000) is
+ *   split into numbered parts: `jobs-2026-10`, `jobs-2026-10-2`, ...
+ */
+
+export const siteUrl = process.env.NEXT_PUBLIC_APP_URL || 'https://kerjasimpel.vercel.app'
+
+const MANIFEST_TTL = 600
+// Content-versioned keys; the TTL only bounds storage
+const SHARD_TTL = 60 * 60 * 24
+const SHARD_BATCH_SIZE = 1000
+// Sitemap protocol limit per file
+export const MAX_SHARD_URLS = 50000
+const STATIC_SHARD = 'pages'
+// Static pages change with deploys
+const STATIC_LAST_MODIFIED = new Date().toISOString()
+
+const STATIC_PAGES = [
+    { path: '', changeFrequency: 'daily', priority: 1 },
+    { path: '/jobs', changeFrequency: 'hourly', priority: 0.9 },
+    { path: '/companies', changeFrequency: 'daily', priority: 0.8 },
+    { path: '/news', changeFrequency: 'daily', priority: 0.8 },
+    { path: '/about', changeFrequency: 'monthly', priority: 0.6 },
+    { path: '/privacy', changeFrequency: 'yearly', priority: 0.4 },
+    { path: '/warning', changeFrequency: 'yearly', priority: 0.4 },
+]
+
+const SECTIONS = {
+    jobs: {
+        model: 'jobs',
+        where: { status: 'ACTIVE', isActive: true },
+        path: '/jobs',
+        changeFrequency: 'weekly',
+        priority: 0.7,
+        months: () => prisma.$queryRaw`
+            SELECT to_char(date_trunc('month', "createdAt"), 'YYYY-MM') AS "month",
+                   MAX("updatedAt") AS "lastModified",
+                   COUNT(*)::int AS "count"
+            FROM "jobs"
+            WHERE "status" = 'ACTIVE' AND "isActive" = true
+            GROUP BY 1
+            ORDER BY 1
+        `,
+    },
+    companies: {
+        model: 'companies',
+        where: { status: 'VERIFIED' },
+        path: '/companies',
+        changeFrequency: 'weekly',
+        priority: 0.6,
+        months: () => prisma.$queryRaw`
+            SELECT to_char(date_trunc('month', "createdAt"), 'YYYY-MM') AS "month",
+                   MAX("updatedAt") AS "lastModified",
+                   COUNT(*)::int AS "count"
+            FROM "companies"
+            WHERE "status" = 'VERIFIED'
+            GROUP BY 1
+            ORDER BY 1
+        `,
+    },
+    news: {
+        model: 'news',
+        where: { status: 'PUBLISHED', publishedAt: { not: null } },
+        path: '/news',
+        changeFrequency: 'weekly',
+        priority: 0.6,
+        months: () => prisma.$queryRaw`
+            SELECT to_char(date_trunc('month', "createdAt"), 'YYYY-MM') AS "month",
+                   MAX("updatedAt") AS "lastModified",
+                   COUNT(*)::int AS "count"
+            FROM "news"
+            WHERE "status" = 'PUBLISHED' AND "publishedAt" IS NOT NULL
+            GROUP BY 1
+            ORDER BY 1
+        `,
+    },
+}
+
+const SHARD_PATTERN = /^(jobs|companies|news)-(\d{4})-(\d{2})(?:-(\d+))?$/
+
+export function escapeXml(value) {
+    return String(value)
+        .replace(/&/g, '&amp;')
+        .replace(/</g, '&lt;')
+        .replace(/>/g, '&gt;')
+        .replace(/"/g, '&quot;')
+        .replace(/'/g, '&apos;')
+}
+
+function urlEntry({ loc, lastModified, changeFrequency, priority }) {
+    return `<url><loc>${escapeXml(loc)}</loc><lastmod>${lastModified}</lastmod>` +
+        `<changefreq>${changeFrequency}</changefreq><priority>${priority}</priority></url>`
+}
+
+function urlset(entries) {
+    return '<?xml version="1.0" encoding="UTF-8"?>\n' +
+        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n' +
+        entries.join('\n') +
+        '\n</urlset>\n'
+}
+
+/**
+ * Every shard with its version info, oldest first per section
+ * @returns {Promise<Array<{name: string, lastModified: string, count: number}>>}
+ */
+export function getSitemapManifest() {
+    return cached(
+        'sitemap:manifest',
+        { ttl: MANIFEST_TTL, tags: [CacheTag.JOBS, CacheTag.COMPANIES, CacheTag.NEWS] },
+        async () => {
+            const sections = Object.entries(SECTIONS)
+            const months = await Promise.all(sections.map(([, section]) => section.months()))
+
+            // `count` stays the month total in every part: rows added or removed
+            // anywhere in the month shift the part boundaries
+            const shards = sections.flatMap(([name], i) =>
+                months[i].flatMap(row => {
+                    const count = Number(row.count)
+                    const parts = Math.max(1, Math.ceil(count / MAX_SHARD_URLS))
+                    return Array.from({ length: parts }, (_, index) => ({
+                        name: index === 0 ? `${name}-${row.month}` : `${name}-${row.month}-${index + 1}`,
+                        lastModified: new Date(row.lastModified).toISOString(),
+                        count,
+                    }))
+                })
+            )
+
+            return [
+                { name: STATIC_SHARD, lastModified: STATIC_LAST_MODIFIED, count: STATIC_PAGES.length },
+                ...shards,
+            ]
+        }
+    )
+}
+
+export function shardVersion(shard) {
+    return `"${shard.name}-${Date.parse(shard.lastModified).toString(36)}-${shard.count}"`
+}
+
+/**
+ * Version of the index itself: changes whenever any shard version does
+ */
+export function indexVersion(manifest) {
+    const digest = createHash('sha1').update(manifest.map(shardVersion).join('\n')).digest('base64url')
+    const lastModified = manifest.reduce(
+        (latest, shard) => (shard.lastModified > latest ? shard.lastModified : latest),
+        STATIC_LAST_MODIFIED
+    )
+    return { etag: `"index-${digest}"`, lastModified }
+}
+
+export function renderSitemapIndex(manifest) {
+    const entries = manifest.map(shard =>
+        `<sitemap><loc>${escapeXml(`${siteUrl}/sitemaps/${shard.name}.xml`)}</loc>` +
+        `<lastmod>${shard.lastModified}</lastmod></sitemap>`
+    )
+
+    return '<?xml version="1.0" encoding="UTF-8"?>\n' +
+        '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n' +
+        entries.join('\n') +
+        '\n</sitemapindex>\n'
+}
+
+function renderStaticShard() {
+    return urlset(STATIC_PAGES.map(page => urlEntry({
+        loc: `${siteUrl}${page.path}`,
+        lastModified: STATIC_LAST_MODIFIED,
+        changeFrequency: page.changeFrequency,
+        priority: page.priority,
+    })))
+}
+
+/**
+ * One part of a month: the rows at positions [(part - 1) * MAX_SHARD_URLS,
+ * part * MAX_SHARD_URLS) in id order
+ */
+async function renderMonthShard(section, year, month, part = 1) {
+    const where = {
+        ...section.where,
+        createdAt: { gte: new Date(Date.UTC(year, month - 1, 1)), lt: new Date(Date.UTC(year, month, 1)) },
+    }
+    const entries = []
+    let lastId = null
+
+    if (part > 1) {
+        // Last id of the previous part; later parts continue after it by keyset
+        const previous = await prisma[section.model].findFirst({
+            where,
+            select: { id: true },
+            orderBy: { id: 'asc' },
+            skip: (part - 1) * MAX_SHARD_URLS - 1,
+        })
+        if (!previous) return urlset(entries)
+        lastId = previous.id
+    }
+
+    // Keyset iteration keeps each query bounded regardless of shard size
+    while (entries.length < MAX_SHARD_URLS) {
+        const take = Math.min(SHARD_BATCH_SIZE, MAX_SHARD_URLS - entries.length)
+        const rows = await prisma[section.model].findMany({
+            where: { ...where, ...(lastId && { id: { gt: lastId } }) },
+            select: { id: true, slug: true, updatedAt: true },
+            orderBy: { id: 'asc' },
+            take,
+        })
+
+        for (const row of rows) {
+            entries.push(urlEntry({
+                loc: `${siteUrl}${section.path}/${row.slug}`,
+                lastModified: new Date(row.updatedAt).toISOString(),
+                changeFrequency: section.changeFrequency,
+                priority: section.priority,
+            }))
+        }
+
+        if (rows.length < take) break
+        lastId = rows[rows.length - 1].id
+    }
+
+    return urlset(entries)
+}
+
+/**
+ * Resolve a shard by name. Returns null for unknown shards; `load()` builds
+ * (or reads the cached) XML for the current version.
+ * @param {string} name - e.g. `jobs-2026-10`, `jobs-2026-10-2` or `pages`
+ */
+export async function getSitemapShard(name) {
+    const manifest = await getSitemapManifest()
+    const shard = manifest.find(entry => entry.name === name)
+    if (!shard) return null
+
+    const etag = shardVersion(shard)
+
+    return {
+        etag,
+        lastModified: shard.lastModified,
+        load() {
+            if (name === STATIC_SHARD) return renderStaticShard()
+
+            const [, section, year, month, part] = name.match(SHARD_PATTERN)
+            return cached(`sitemap:shard:${etag}`, { ttl: SHARD_TTL }, () =>
+                renderMonthShard(SECTIONS[section], Number(year), Number(month), Number(part || 1))
+            )
+        },
+    }
+}
+
+/**
+ * XML response with validators; 304 (without calling `load`) when the crawler
+ * already has this version
+ */
+export async function sitemapResponse(request, { etag, lastModified, load }) {
+    const headers = {
+        'Content-Type': 'application/xml; charset=utf-8',
+        'Cache-Control': 'public, max-age=0, s-maxage=3600, stale-while-revalidate=86400',
+        'Last-Modified': new Date(lastModified).toUTCString(),
+        ETag: etag,
+    }
+
+    const ifNoneMatch = request.headers.get('if-none-match')
+    const ifModifiedSince = request.headers.get('if-modified-since')
+    const notModified = ifNoneMatch
+        ? ifNoneMatch.split(',').map(tag => tag.trim()).includes(etag)
+        : ifModifiedSince && Date.parse(ifModifiedSince) >= Math.floor(Date.parse(lastModified) / 1000) * 1000
+
+    if (notModified) {
+        return new Response(null, { status: 304, headers })
+    }
+    return new Response(await load(), { status: 200, headers })
+}
@@ -0,0 +1,193 @@
+import { prisma } from '@/lib/prisma'
+import { cached, CacheTag } from '@/lib/cache'
+import { publicActiveJobWhere } from '@/lib/jobs/publicFilters'
+
+/**
+ * Dashboard statistics shared by the admin dashboard, the admin jobseeker
+ * stats and the homepage.
+ *
+ * - Point-in-time totals are single `COUNT(*) FILTER (...)` queries per table
+ * - Time series read closed days from the `daily_stats` rollup (refreshed by
+ *   the maintenance runner) and only aggregate the not-yet-rolled-up tail live
+ * - Every reader is cached briefly; job/company writes invalidate their tags
+ */
+
+const STATS_TTL = 60
+const DAY_MS = 24 * 60 * 60 * 1000
+// First refresh on an empty table covers a bit over a year of history
+const DAILY_STATS_BACKFILL_DAYS = 400
+// Recent days are recomputed on every refresh to pick up late edits/deletes
+const DAILY_STATS_OVERLAP_DAYS = 3
+
+const PENDING_APPLICATION_STATUSES = [
+  'PENDING',
+  'REVIEWING',
+  'SHORTLISTED',
+  'INTERVIEW_SCHEDULED',
+  'INTERVIEW_COMPLETED'
+]
+
+export function startOfUtcDay(date) {
+  return new Date(Date.UTC(date.getUTCFullYear(), date.getUTCMonth(), date.getUTCDate()))
+}
+
+function monthKey(date) {
+  return `${date.getUTCFullYear()}-${String(date.getUTCMonth() + 1).padStart(2, '0')}`
+}
+
+/**
+ * @returns {Promise<{total: number, employed: number, looking: number}>}
+ */
+export function getJobseekerTotals() {
+  return cached('stats:jobseekers', { ttl: STATS_TTL }, async () => {
+    const [row] = await prisma.$queryRaw`
+      SELECT
+        COUNT(*)::int AS "total",
+        COUNT(*) FILTER (WHERE "isEmployed")::int AS "employed",
+        COUNT(*) FILTER (WHERE "isLookingForJob")::int AS "looking"
+      FROM "jobseekers"
+    `
+    return row
+  })
+}
+
+/**
+ * @returns {Promise<{total: number, accepted: number, rejected: number, pending: number}>}
+ */
+export function getApplicationTotals() {
+  return cached('stats:applications', { ttl: STATS_TTL }, async () => {
+    const [row] = await prisma.$queryRaw`
+      SELECT
+        COUNT(*)::int AS "total",
+        COUNT(*) FILTER (WHERE "status" = 'ACCEPTED')::int AS "accepted",
+        COUNT(*) FILTER (WHERE "status" = 'REJECTED')::int AS "rejected",
+        COUNT(*) FILTER (WHERE "status"::text = ANY(${PENDING_APPLICATION_STATUSES}))::int AS "pending"
+      FROM "applications"
+    `
+    return row
+  })
+}
+
+/**
+ * Jobs by moderation status, plus the count visible on the public site
+ * @returns {Promise<{active: number, pending: number, public: number}>}
+ */
+export function getJobTotals() {
+  return cached('stats:jobs', { ttl: STATS_TTL, tags: [CacheTag.JOBS, CacheTag.COMPANIES] }, async () => {
+    const [[row], publicCount] = await Promise.all([
+      prisma.$queryRaw`
+        SELECT
+          COUNT(*) FILTER (WHERE "status" = 'ACTIVE')::int AS "active",
+          COUNT(*) FILTER (WHERE "status" = 'PENDING')::int AS "pending"
+        FROM "jobs"
+      `,
+      prisma.jobs.count({ where: publicActiveJobWhere(new Date()) })
+    ])
+    return { ...row, public: publicCount }
+  })
+}
+
+/**
+ * `verified` follows the admin status; `public` also requires the verified flag
+ * @returns {Promise<{verified: number, public: number}>}
+ */
+export function getCompanyTotals() {
+  return cached('stats:companies', { ttl: STATS_TTL, tags: [CacheTag.COMPANIES] }, async () => {
+    const [row] = await prisma.$queryRaw`
+      SELECT
+        COUNT(*) FILTER (WHERE "status" = 'VERIFIED')::int AS "verified",
+        COUNT(*) FILTER (WHERE "status" = 'VERIFIED' AND "verified")::int AS "public"
+      FROM "companies"
+    `
+    return row
+  })
+}
+
+/**
+ * Jobs posted per UTC month for the last `months` months, oldest first.
+ * Closed days come from `daily_stats`; days after the last rollup are counted live.
+ * @param {Object} [options]
+ * @param {number} [options.months=6]
+ * @param {Date} [options.now]
+ * @returns {Promise<Array<{month: string, count: number}>>} `month` is `YYYY-MM`
+ */
+export function getMonthlyJobCounts({ months = 6, now = new Date() } = {}) {
+  const from = new Date(Date.UTC(now.getUTCFullYear(), now.getUTCMonth() - (months - 1), 1))
+
+  return cached(`stats:monthly-jobs:${monthKey(from)}:${months}`, { ttl: STATS_TTL, tags: [CacheTag.JOBS] }, async () => {
+    const rows = await prisma.$queryRaw`
+      WITH "bounds" AS (
+        SELECT GREATEST(COALESCE(MAX("day") + 1, ${from}::date), ${from}::date) AS "liveFrom"
+        FROM "daily_stats"
+      )
+      SELECT to_char("month", 'YYYY-MM') AS "month", SUM("count")::int AS "count"
+      FROM (
+        SELECT date_trunc('month', "day") AS "month", SUM("jobsPosted") AS "count"
+        FROM "daily_stats", "bounds"
+        WHERE "day" >= ${from}::date AND "day" < "bounds"."liveFrom"
+        GROUP BY 1
+        UNION ALL
+        SELECT date_trunc('month', "createdAt") AS "month", COUNT(*) AS "count"
+        FROM "jobs", "bounds"
+        WHERE "createdAt" >= "bounds"."liveFrom"
+        GROUP BY 1
+      ) AS "series"
+      GROUP BY 1
+    `
+
+    const counts = new Map(rows.map(row => [row.month, Number(row.count)]))
+    return Array.from({ length: months }, (_, i) => {
+      const key = monthKey(new Date(Date.UTC(from.getUTCFullYear(), from.getUTCMonth() + i, 1)))
+      return { month: key, count: counts.get(key) ?? 0 }
+    })
+  })
+}
+
+/**
+ * Recompute `daily_stats` for closed UTC days: the last few stored days and
+ * everything after them, or the whole backfill window on an empty table.
+ * @param {Object} [options]
+ * @param {Date} [options.now]
+ * @returns {Promise<{processed: number, from: string|null, to: string}>}
+ */
+export async function refreshDailyStats({ now = new Date() } = {}) {
+  const to = startOfUtcDay(now)
+  const { _max: latest } = await prisma.daily_stats.aggregate({ _max: { day: true } })
+
+  const from = latest.day
+    ? new Date(startOfUtcDay(latest.day).getTime() - (DAILY_STATS_OVERLAP_DAYS - 1) * DAY_MS)
+    : new Date(to.getTime() - DAILY_STATS_BACKFILL_DAYS * DAY_MS)
+
+  if (from >= to) {
+    return { processed: 0, from: null, to: to.toISOString() }
+  }
+
+  const processed = await prisma.$executeRaw`
+    WITH "days" AS (
+      SELECT generate_series(${from}::date, ${to}::date - 1, interval '1 day')::date AS "day"
+    ),
+    "jobs_by_day" AS (
+      SELECT date_trunc('day', "createdAt")::date AS "day", COUNT(*)::int AS "count"
+      FROM "jobs"
+      WHERE "createdAt" >= ${from} AND "createdAt" < ${to}
+      GROUP BY 1
+    ),
+    "applications_by_day" AS (
+      SELECT date_trunc('day', "appliedAt")::date AS "day", COUNT(*)::int AS "count"
+      FROM "applications"
+      WHERE "appliedAt" >= ${from} AND "appliedAt" < ${to}
+      GROUP BY 1
+    )
+    INSERT INTO "daily_stats" ("day", "jobsPosted", "applicationsSubmitted", "updatedAt")
+    SELECT "days"."day", COALESCE("jobs_by_day"."count", 0), COALESCE("applications_by_day"."count", 0), NOW()
+    FROM "days"
+    LEFT JOIN "jobs_by_day" ON "jobs_by_day"."day" = "days"."day"
+    LEFT JOIN "applications_by_day" ON "applications_by_day"."day" = "days"."day"
+    ON CONFLICT ("day") DO UPDATE
+      SET "jobsPosted" = EXCLUDED."jobsPosted",
+          "applicationsSubmitted" = EXCLUDED."applicationsSubmitted",
+          "updatedAt" = NOW()
+  `
+
+  return { processed, from: from.toISOString(), to: to.toISOString() }
+}
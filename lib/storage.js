@@ -0,0 +1,146 @@
+import { createReadStream, createWriteStream } from 'fs'
+import { mkdir, rename, rm, stat } from 'fs/promises'
+import path from 'path'
+import { Readable } from 'stream'
+import { pipeline } from 'stream/promises'
+import { supabaseAdmin } from '@/lib/supabase'
+
+/**
+ * Object storage used by uploads and the media queue.
+ *
+ * - `supabase` (default): Supabase Storage through the service-role client
+ * - `local` (`STORAGE_DRIVER=local`): files under `public/uploads`, for
+ *   offline development and tests
+ *
+ * Upload bodies are passed through as Blob/stream, so the request never
+ * holds an extra Buffer copy of the file.
+ */
+
+/**
+ * @typedef {Object} StorageAdapter
+ * @property {(bucket: string, filePath: string, body: Blob|ReadableStream|Buffer, options?: {contentType?: string, upsert?: boolean, cacheControl?: string}) => Promise<void>} upload
+ * @property {(bucket: string, filePath: string) => Promise<Buffer>} download
+ * @property {(bucket: string, filePaths: string[]) => Promise<void>} remove
+ * @property {(bucket: string, filePath: string) => string} getPublicUrl
+ */
+
+/**
+ * @param {import('@supabase/supabase-js').SupabaseClient} client
+ * @returns {StorageAdapter}
+ */
+export function createSupabaseStorage(client) {
+  if (!client) {
+    throw new Error('Supabase storage is not configured')
+  }
+
+  return {
+    async upload(bucket, filePath, body, { contentType, upsert = false, cacheControl = '3600' } = {}) {
+      const { error } = await client.storage
+        .from(bucket)
+        .upload(filePath, body, { contentType, upsert, cacheControl })
+      if (error) throw new Error(`Storage upload failed: ${error.message}`)
+    },
+
+    async download(bucket, filePath) {
+      const { data, error } = await client.storage.from(bucket).download(filePath)
+      if (error) throw new Error(`Storage download failed: ${error.message}`)
+      return Buffer.from(await data.arrayBuffer())
+    },
+
+    async remove(bucket, filePaths) {
+      const { error } = await client.storage.from(bucket).remove(filePaths)
+      if (error) throw new Error(`Storage remove failed: ${error.message}`)
+    },
+
+    getPublicUrl(bucket, filePath) {
+      return client.storage.from(bucket).getPublicUrl(filePath).data.publicUrl
+    },
+  }
+}
+
+function toNodeStream(body) {
+  if (Buffer.isBuffer(body) || body instanceof Uint8Array) return Readable.from([body])
+  if (typeof body?.stream === 'function') return Readable.fromWeb(body.stream())
+  if (body instanceof ReadableStream) return Readable.fromWeb(body)
+  throw new TypeError('Unsupported upload body')
+}
+
+/**
+ * Filesystem adapter; `<root>/<bucket>/<path>` served from `<publicUrl>/<bucket>/<path>`
+ * @param {Object} [options]
+ * @param {string} [options.root]
+ * @param {string} [options.publicUrl]
+ * @returns {StorageAdapter}
+ */
+export function createLocalStorage({
+  root = process.env.LOCAL_STORAGE_DIR || path.join(process.cwd(), 'public', 'uploads'),
+  publicUrl = process.env.LOCAL_STORAGE_PUBLIC_URL || '/uploads',
+} = {}) {
+  const baseDir = path.resolve(root)
+
+  function resolve(bucket, filePath) {
+    const target = path.resolve(baseDir, bucket, filePath)
+    if (!target.startsWith(baseDir + path.sep)) {
+      throw new Error('Invalid storage path')
+    }
+    return target
+  }
+
+  return {
+    async upload(bucket, filePath, body, { upsert = false } = {}) {
+      const target = resolve(bucket, filePath)
+      await mkdir(path.dirname(target), { recursive: true })
+
+      // Write to a temp file so readers never see a partial object
+      const tmp = `${target}.${process.pid}.${Date.now()}.tmp`
+      try {
+        await pipeline(toNodeStream(body), createWriteStream(tmp, { flags: 'wx' }))
+        if (!upsert) {
+          const exists = await stat(target).then(() => true, () => false)
+          if (exists) throw new Error('Storage upload failed: The resource already exists')
+        }
+        await rename(tmp, target)
+      } finally {
+        await rm(tmp, { force: true })
+      }
+    },
+
+    async download(bucket, filePath) {
+      const chunks = []
+      for await (const chunk of createReadStream(resolve(bucket, filePath))) {
+        chunks.push(chunk)
+      }
+      return Buffer.concat(chunks)
+    },
+
+    async remove(bucket, filePaths) {
+      await Promise.all(filePaths.map(filePath => rm(resolve(bucket, filePath), { force: true })))
+    },
+
+    getPublicUrl(bucket, filePath) {
+      return `${publicUrl}/${bucket}/${filePath}`
+    },
+  }
+}
+
+let storage = null
+
+/**
+ * Adapter selected by `STORAGE_DRIVER` (created on first use)
+ * @returns {StorageAdapter}
+ */
+export function getStorage() {
+  if (!storage) {
+    storage = process.env.STORAGE_DRIVER === 'local'
+      ? createLocalStorage()
+      : createSupabaseStorage(supabaseAdmin)
+  }
+  return storage
+}
+
+/**
+ * Replace the adapter (tests, scripts)
+ */
+export function setStorage(nextStorage) {
+  storage = nextStorage
+}
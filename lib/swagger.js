@@ -115,7 +115,8 @@ export const swaggerSpec = {
               totalCount: { type: 'integer' },
               totalPages: { type: 'integer' },
               hasNextPage: { type: 'boolean' },
-              hasPrevPage: { type: 'boolean' }
+              hasPrevPage: { type: 'boolean' },
+              nextCursor: { type: 'string', nullable: true, description: 'Pass as `cursor` to load the next page' }
             }
           }
         }
@@ -287,14 +288,16 @@ export const swaggerSpec = {
         summary: 'List jobs',
         description: 'Get paginated list of active job listings with filters',
         parameters: [
-          { name: 'search', in: 'query', schema: { type: 'string' }, description: 'Search in title, description, company' },
+          { name: 'search', in: 'query', schema: { type: 'string' }, description: 'Full-text search in title, category, description and company name' },
           { name: 'location', in: 'query', schema: { type: 'string' }, description: 'Filter by city/province' },
           { name: 'jobType', in: 'query', schema: { type: 'string' }, description: 'Filter by job type (comma-separated): FULL_TIME, PART_TIME, CONTRACT, INTERNSHIP' },
           { name: 'category', in: 'query', schema: { type: 'string' }, description: 'Filter by category (comma-separated)' },
           { name: 'experience', in: 'query', schema: { type: 'string' }, description: 'Filter by experience level: 0-1 tahun, 1-3 tahun, 3-5 tahun, 5+ tahun' },
-          { name: 'sortBy', in: 'query', schema: { type: 'string', enum: ['latest', 'salary', 'popular'], default: 'latest' } },
+          { name: 'sortBy', in: 'query', schema: { type: 'string', enum: ['latest', 'salary', 'popular', 'relevance'], default: 'latest' }, description: '`relevance` ranks by search match and falls back to `latest` without `search`' },
           { name: 'page', in: 'query', schema: { type: 'integer', default: 1 } },
-          { name: 'limit', in: 'query', schema: { type: 'integer', default: 12 } }
+          { name: 'limit', in: 'query', schema: { type: 'integer', default: 12 } },
+          { name: 'fields', in: 'query', schema: { type: 'string', enum: ['full', 'summary'], default: 'full' }, description: '`summary` omits description, requirements, benefits, skills, gallery and shift data' },
+          { name: 'cursor', in: 'query', schema: { type: 'string' }, description: 'Opaque keyset cursor from `pagination.nextCursor`; `page` is ignored when set' }
         ],
         responses: {
           200: {
@@ -0,0 +1,201 @@
+import { AsyncLocalStorage } from 'async_hooks'
+import { monitorEventLoopDelay } from 'perf_hooks'
+import { createLogger, logError } from '@/lib/logger'
+import { createCounter, createGauge, createHistogram } from '@/lib/metrics'
+
+const log = createLogger({ module: 'telemetry' })
+
+// Statements and requests slower than these are logged (milliseconds)
+const SLOW_QUERY_MS = Number(process.env.SLOW_QUERY_MS) || 200
+const SLOW_REQUEST_MS = Number(process.env.SLOW_REQUEST_MS) || 1000
+
+const globalForTelemetry = globalThis
+
+if (!globalForTelemetry.telemetryContext) {
+  globalForTelemetry.telemetryContext = new AsyncLocalStorage()
+}
+
+const requestContext = globalForTelemetry.telemetryContext
+
+const requestDuration = createHistogram({
+  name: 'http_request_duration_seconds',
+  help: 'Route handler duration',
+  labelNames: ['route', 'method', 'status']
+})
+
+const requestQueries = createHistogram({
+  name: 'http_request_db_queries',
+  help: 'Database statements issued per request',
+  labelNames: ['route'],
+  buckets: [0, 1, 2, 3, 5, 8, 13, 21, 34, 55]
+})
+
+const queryDuration = createHistogram({
+  name: 'db_query_duration_seconds',
+  help: 'Prisma operation duration',
+  labelNames: ['model', 'operation']
+})
+
+const slowQueries = createCounter({
+  name: 'db_slow_queries_total',
+  help: `Prisma operations slower than ${SLOW_QUERY_MS}ms`,
+  labelNames: ['model', 'operation']
+})
+
+const requestErrors = createCounter({
+  name: 'http_request_errors_total',
+  help: 'Errors reported by Next.js onRequestError',
+  labelNames: ['route', 'route_type']
+})
+
+/**
+ * Counters of the request being handled, or null outside withTelemetry
+ * @returns {{route: string, queries: number, queryMs: number, start: number} | null}
+ */
+export function getRequestTelemetry() {
+  return requestContext.getStore() ?? null
+}
+
+/**
+ * Record one Prisma operation against the current request and the
+ * process-wide histograms. Raw queries have no model.
+ */
+export function recordQuery({ model, operation, durationMs }) {
+  const store = requestContext.getStore()
+  if (store) {
+    store.queries++
+    store.queryMs += durationMs
+  }
+
+  const labels = { model: model || 'raw', operation }
+  queryDuration.observe(labels, durationMs / 1000)
+
+  if (durationMs >= SLOW_QUERY_MS) {
+    slowQueries.inc(labels)
+    // Arguments are left out: they carry user data
+    log.warn({
+      type: 'slow_query',
+      model: labels.model,
+      operation,
+      durationMs: Math.round(durationMs),
+      route: store?.route
+    }, 'Slow database query')
+  }
+}
+
+/**
+ * Prisma client extension that times every operation, raw queries and
+ * statements inside interactive transactions included.
+ */
+export const queryTelemetryExtension = {
+  name: 'query-telemetry',
+  query: {
+    async $allOperations({ model, operation, args, query }) {
+      const start = performance.now()
+      try {
+        return await query(args)
+      } finally {
+        recordQuery({ model, operation, durationMs: performance.now() - start })
+      }
+    }
+  }
+}
+
+/**
+ * Server-Timing value for a finished request. Query time is summed, so
+ * it can exceed the total when statements ran in parallel.
+ */
+export function serverTimingHeader({ queries, queryMs }, totalMs) {
+  return `db;dur=${queryMs.toFixed(1)};desc="${queries} queries", total;dur=${totalMs.toFixed(1)}`
+}
+
+/**
+ * Wrap a route handler so its Prisma operations are counted, its duration
+ * lands in the request histograms and the response carries Server-Timing.
+ *
+ * @param {string} route - Route pattern used as the metric label, e.g. '/api/jobs/[slug]'
+ * @param {Function} handler - (request, context) => Response
+ * @returns {Function}
+ */
+export function withTelemetry(route, handler) {
+  return async function instrumentedHandler(request, context) {
+    const store = { route, queries: 0, queryMs: 0, start: performance.now() }
+    let status = 500
+
+    try {
+      const response = await requestContext.run(store, () => handler(request, context))
+      status = response?.status ?? 200
+
+      try {
+        response?.headers.append('Server-Timing', serverTimingHeader(store, performance.now() - store.start))
+      } catch {
+        // Immutable headers (e.g. Response.redirect): metrics are still recorded
+      }
+
+      return response
+    } finally {
+      const durationMs = performance.now() - store.start
+      requestDuration.observe({ route, method: request.method, status }, durationMs / 1000)
+      requestQueries.observe({ route }, store.queries)
+
+      if (durationMs >= SLOW_REQUEST_MS) {
+        log.warn({
+          type: 'slow_request',
+          route,
+          method: request.method,
+          status,
+          durationMs: Math.round(durationMs),
+          queries: store.queries,
+          queryMs: Math.round(store.queryMs)
+        }, 'Slow request')
+      }
+    }
+  }
+}
+
+/**
+ * Next.js onRequestError hook (instrumentation.js)
+ */
+export function recordRequestError(error, request, context) {
+  requestErrors.inc({ route: context?.routePath, route_type: context?.routeType })
+  logError(error, {
+    module: 'telemetry',
+    route: context?.routePath,
+    method: request?.method,
+    path: request?.path
+  })
+}
+
+/**
+ * Process-level gauges (event loop delay, memory). Called once from
+ * instrumentation.js register().
+ */
+export function startRuntimeMetrics() {
+  if (globalForTelemetry.eventLoopDelay) return
+
+  const eventLoopDelay = monitorEventLoopDelay({ resolution: 20 })
+  eventLoopDelay.enable()
+  globalForTelemetry.eventLoopDelay = eventLoopDelay
+
+  // Histogram values are nanoseconds
+  createGauge({
+    name: 'nodejs_eventloop_delay_seconds',
+    help: 'Event loop delay since process start',
+    collect: () => [50, 99].map(p => ({
+      labels: { quantile: p / 100 },
+      value: eventLoopDelay.percentile(p) / 1e9
+    }))
+  })
+
+  createGauge({
+    name: 'process_resident_memory_bytes',
+    help: 'Resident set size',
+    collect: () => process.memoryUsage().rss
+  })
+
+  createGauge({
+    name: 'nodejs_heap_used_bytes',
+    help: 'V8 heap in use',
+    collect: () => process.memoryUsage().heapUsed
+  })
+}
@@ -45,3 +45,21 @@ export function formatDate(date, options = {}) {
   }
   return new Date(date).toLocaleDateString('id-ID', defaultOptions)
 }
+
+/**
+ * Run `fn` over `items` with at most `limit` calls in flight; keeps input order
+ */
+export async function mapWithConcurrency(items, limit, fn) {
+  const results = new Array(items.length)
+  let next = 0
+
+  async function worker() {
+    while (next < items.length) {
+      const index = next++
+      results[index] = await fn(items[index], index)
+    }
+  }
+
+  await Promise.all(Array.from({ length: Math.min(limit, items.length) }, worker))
+  return results
+}
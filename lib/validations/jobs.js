@@ -8,5 +8,9 @@ export const jobSearchSchema = z.object({
   jobType: z.string().optional(),
   category: z.string().optional(),
   experience: z.string().optional(),
-  sortBy: z.enum(['latest', 'salary', 'popular']).optional().default('latest')
+  sortBy: z.enum(['latest', 'salary', 'popular', 'relevance']).optional().default('latest'),
+  // Opaque keyset cursor; when present `page` is ignored
+  cursor: z.string().min(1).max(512).optional(),
+  // `summary` returns only listing card fields; details come from /api/jobs/[slug]
+  fields: z.enum(['full', 'summary']).optional().default('full')
 })
@@ -198,3 +198,20 @@ export const resubmitContractSchema = z.object({
   })).optional(),
   recruiterDocUrl: z.string().optional().nullable()
 })
+
+// AI Match Batch Schema
+const aiMatchJobSchema = z.object({
+  title: z.string().max(200).optional().default(''),
+  skills: z.array(z.string().max(100)).max(100).optional().default([])
+})
+
+export const aiMatchBatchSchema = z.object({
+  // Default job for items that do not carry their own
+  job_requirements: aiMatchJobSchema.optional(),
+  items: z.array(z.object({
+    id: z.string().min(1, 'ID item wajib diisi'),
+    cv_url: z.string().url('URL CV tidak valid').optional().nullable(),
+    cv_skills: z.array(z.string().max(100)).max(200).optional().default([]),
+    job_requirements: aiMatchJobSchema.optional()
+  })).min(1, 'Minimal 1 item').max(200, 'Maksimal 200 item per permintaan')
+})
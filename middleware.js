@@ -1,61 +1,8 @@
 import { NextResponse } from 'next/server'
-import { Redis } from '@upstash/redis'
-
-const redis = Redis.fromEnv()
+import { redis } from '@/lib/rateLimit'
 
 const JWT_SECRET = process.env.JWT_SECRET
 const MUTATING_METHODS = new Set(['POST', 'PUT', 'PATCH', 'DELETE'])
-const API_RATE_LIMITS = {
-  auth: { limit: 20, windowSeconds: 15 * 60 },
-  admin: { limit: 180, windowSeconds: 60 },
-  mutation: { limit: 60, windowSeconds: 60 },
-  read: { limit: 120, windowSeconds: 60 },
-}
-
-function getClientIP(request) {
-  return request.headers.get('x-forwarded-for')?.split(',')[0]?.trim() ||
-    request.headers.get('x-real-ip') ||
-    'anonymous'
-}
-
-function getRateLimitScope(pathname, method) {
-  if (pathname.startsWith('/api/auth/')) return 'auth'
-  if (pathname.startsWith('/api/admin/')) return 'admin'
-  if (MUTATING_METHODS.has(method)) return 'mutation'
-  return 'read'
-}
-
-async function enforceApiRateLimit(request, pathname, decodedToken) {
-  if (pathname.startsWith('/api/cron/')) return null
-
-  const scope = getRateLimitScope(pathname, request.method)
-  const { limit, windowSeconds } = API_RATE_LIMITS[scope]
-  const identity = decodedToken?.userId || getClientIP(request)
-  const windowId = Math.floor(Date.now() / (windowSeconds * 1000))
-  const key = `ratelimit:${scope}:${identity}:${windowId}`
-
-  try {
-    const count = await redis.incr(key)
-    if (count === 1) {
-      await redis.expire(key, windowSeconds + 5)
-    }
-
-    if (count > limit) {
-      return NextResponse.json(
-        { error: 'Terlalu banyak permintaan. Silakan coba lagi nanti.' },
-        {
-          status: 429,
-          headers: { 'Retry-After': String(windowSeconds) },
-        }
-      )
-    }
-  } catch (error) {
-    // Fail open so Redis issues do not take the entire application down.
-    return null
-  }
-
-  return null
-}
 
 function isCsrfExempt(pathname) {
   return pathname === '/api/auth/login' ||
@@ -152,7 +99,10 @@ export async function middleware(request) {
     '/terms',
     '/privacy',
     '/news',
-    '/maintenance'
+    '/maintenance',
+    '/robots.txt',
+    '/sitemap.xml',
+    '/sitemaps'
   ]
 
   // --- MAINTENANCE MODE CHECK ---
@@ -192,9 +142,6 @@ export async function middleware(request) {
 
   // API routes are always accessible (they handle their own auth)
   if (pathname.startsWith('/api')) {
-    const rateLimitedResponse = await enforceApiRateLimit(request, pathname, decodedToken)
-    if (rateLimitedResponse) return rateLimitedResponse
-
     if (
       MUTATING_METHODS.has(request.method) &&
       token &&
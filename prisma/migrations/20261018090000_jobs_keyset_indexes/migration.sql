@@ -0,0 +1,10 @@
+-- CreateIndex
+CREATE INDEX "jobs_publishedAt_id_idx" ON "jobs"("publishedAt" DESC, "id" DESC);
+
+-- CreateIndex
+-- NULLS LAST to match the salary sort (jobListOrderBy, search ORDER_BY.salary);
+-- a plain DESC index puts nulls first and cannot serve that order
+CREATE INDEX "jobs_salaryMax_id_idx" ON "jobs"("salaryMax" DESC NULLS LAST, "id" DESC);
+
+-- CreateIndex
+CREATE INDEX "jobs_applicationCount_id_idx" ON "jobs"("applicationCount" DESC, "id" DESC);
@@ -0,0 +1,28 @@
+-- Trigram support for the ILIKE '%term%' filters on location and company name
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- AlterTable
+-- Title and category are indexed both stemmed (indonesian) and unstemmed (simple)
+-- so Indonesian inflections and English job titles both match; HTML tags are
+-- stripped from the rich-text description before indexing.
+ALTER TABLE "jobs" ADD COLUMN "searchVector" tsvector GENERATED ALWAYS AS (
+    setweight(to_tsvector('simple'::regconfig, coalesce("title", '')), 'A') ||
+    setweight(to_tsvector('indonesian'::regconfig, coalesce("title", '')), 'A') ||
+    setweight(to_tsvector('simple'::regconfig, coalesce("category", '')), 'B') ||
+    setweight(to_tsvector('indonesian'::regconfig, regexp_replace(coalesce("description", ''), '<[^>]*>', ' ', 'g')), 'C')
+) STORED;
+
+-- CreateIndex
+CREATE INDEX "jobs_searchVector_idx" ON "jobs" USING GIN ("searchVector");
+
+-- CreateIndex
+CREATE INDEX "jobs_city_trgm_idx" ON "jobs" USING GIN ("city" gin_trgm_ops);
+
+-- CreateIndex
+CREATE INDEX "jobs_location_trgm_idx" ON "jobs" USING GIN ("location" gin_trgm_ops);
+
+-- CreateIndex
+CREATE INDEX "jobs_province_trgm_idx" ON "jobs" USING GIN ("province" gin_trgm_ops);
+
+-- CreateIndex
+CREATE INDEX "companies_name_trgm_idx" ON "companies" USING GIN ("name" gin_trgm_ops);
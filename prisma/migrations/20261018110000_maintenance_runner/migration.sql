@@ -0,0 +1,29 @@
+-- CreateTable
+CREATE TABLE "maintenance_locks" (
+    "name" TEXT NOT NULL,
+    "owner" TEXT NOT NULL,
+    "lockedUntil" TIMESTAMP(3) NOT NULL,
+    "updatedAt" TIMESTAMP(3) NOT NULL,
+
+    CONSTRAINT "maintenance_locks_pkey" PRIMARY KEY ("name")
+);
+
+-- CreateTable
+CREATE TABLE "maintenance_runs" (
+    "id" TEXT NOT NULL,
+    "tasks" TEXT[],
+    "status" TEXT NOT NULL DEFAULT 'RUNNING',
+    "metrics" JSONB,
+    "error" TEXT,
+    "startedAt" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "finishedAt" TIMESTAMP(3),
+    "durationMs" INTEGER,
+
+    CONSTRAINT "maintenance_runs_pkey" PRIMARY KEY ("id")
+);
+
+-- CreateIndex
+CREATE INDEX "maintenance_runs_startedAt_idx" ON "maintenance_runs"("startedAt");
+
+-- CreateIndex
+CREATE INDEX "jobs_isActive_applicationDeadline_idx" ON "jobs"("isActive", "applicationDeadline");
@@ -0,0 +1,2 @@
+-- CreateIndex
+CREATE INDEX "audit_logs_createdAt_id_idx" ON "audit_logs"("createdAt" DESC, "id" DESC);
@@ -0,0 +1,12 @@
+-- CreateTable
+CREATE TABLE "daily_stats" (
+    "day" DATE NOT NULL,
+    "jobsPosted" INTEGER NOT NULL DEFAULT 0,
+    "applicationsSubmitted" INTEGER NOT NULL DEFAULT 0,
+    "updatedAt" TIMESTAMP(3) NOT NULL,
+
+    CONSTRAINT "daily_stats_pkey" PRIMARY KEY ("day")
+);
+
+-- CreateIndex
+CREATE INDEX "jobs_createdAt_idx" ON "jobs"("createdAt");
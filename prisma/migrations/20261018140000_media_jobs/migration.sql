@@ -0,0 +1,20 @@
+-- CreateTable
+CREATE TABLE "media_jobs" (
+    "id" TEXT NOT NULL,
+    "bucket" TEXT NOT NULL,
+    "path" TEXT NOT NULL,
+    "sourceUrl" TEXT NOT NULL,
+    "status" TEXT NOT NULL DEFAULT 'PENDING',
+    "target" JSONB,
+    "variants" JSONB,
+    "attempts" INTEGER NOT NULL DEFAULT 0,
+    "error" TEXT,
+    "lockedUntil" TIMESTAMP(3),
+    "createdAt" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "updatedAt" TIMESTAMP(3) NOT NULL,
+
+    CONSTRAINT "media_jobs_pkey" PRIMARY KEY ("id")
+);
+
+-- CreateIndex
+CREATE INDEX "media_jobs_status_createdAt_idx" ON "media_jobs"("status", "createdAt");
@@ -0,0 +1,200 @@
+-- CreateTable
+-- Per-company counters behind the recruiter dashboard (see lib/recruiterDashboard.js).
+-- kind/key pairs:
+--   job_status         / JobStatus
+--   job_open           / 'true' | 'false' (jobs.isActive)
+--   application_status / ApplicationStatus
+--   application_day    / 'YYYY-MM-DD' (UTC day of applications.createdAt, last 8 days only)
+-- No foreign key to companies: the triggers below also run inside cascaded
+-- deletes, after the company row is gone. Orphans are removed by the
+-- reconcile task in lib/maintenance.js.
+CREATE TABLE "company_dashboard_counters" (
+    "companyId" TEXT NOT NULL,
+    "kind" TEXT NOT NULL,
+    "key" TEXT NOT NULL,
+    "count" INTEGER NOT NULL DEFAULT 0,
+    "updatedAt" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+
+    CONSTRAINT "company_dashboard_counters_pkey" PRIMARY KEY ("companyId", "kind", "key")
+);
+
+-- CreateFunction
+CREATE FUNCTION "company_dashboard_bump"(company_id TEXT, counter_kind TEXT, counter_key TEXT, delta INTEGER)
+RETURNS void LANGUAGE sql AS $$
+    INSERT INTO "company_dashboard_counters" AS c ("companyId", "kind", "key", "count", "updatedAt")
+    VALUES (company_id, counter_kind, counter_key, delta, NOW())
+    ON CONFLICT ("companyId", "kind", "key") DO UPDATE
+        SET "count" = c."count" + EXCLUDED."count", "updatedAt" = NOW();
+$$;
+
+-- CreateFunction
+-- Add (direction = 1) or remove (direction = -1) all application counters of
+-- one job for a company; used when a job is deleted or moves company
+CREATE FUNCTION "company_dashboard_shift_applications"(job_id TEXT, company_id TEXT, direction INTEGER)
+RETURNS void LANGUAGE sql AS $$
+    INSERT INTO "company_dashboard_counters" AS c ("companyId", "kind", "key", "count", "updatedAt")
+    SELECT company_id, d."kind", d."key", direction * COUNT(*)::int, NOW()
+    FROM (
+        SELECT 'application_status' AS "kind", "status"::text AS "key"
+        FROM "applications" WHERE "jobId" = job_id
+        UNION ALL
+        SELECT 'application_day', to_char("createdAt", 'YYYY-MM-DD')
+        FROM "applications"
+        WHERE "jobId" = job_id
+          AND "createdAt" >= date_trunc('day', NOW() AT TIME ZONE 'UTC') - interval '7 days'
+    ) AS d
+    GROUP BY d."kind", d."key"
+    ON CONFLICT ("companyId", "kind", "key") DO UPDATE
+        SET "count" = c."count" + EXCLUDED."count", "updatedAt" = NOW();
+$$;
+
+-- CreateFunction
+-- Jobs change rarely, so the job triggers are row level
+CREATE FUNCTION "company_dashboard_jobs_trigger"() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'UPDATE'
+        AND OLD."status" = NEW."status"
+        AND OLD."isActive" = NEW."isActive"
+        AND OLD."companyId" = NEW."companyId" THEN
+        RETURN NULL;
+    END IF;
+
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM "company_dashboard_bump"(OLD."companyId", 'job_status', OLD."status"::text, -1);
+        PERFORM "company_dashboard_bump"(OLD."companyId", 'job_open', OLD."isActive"::text, -1);
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM "company_dashboard_bump"(NEW."companyId", 'job_status', NEW."status"::text, 1);
+        PERFORM "company_dashboard_bump"(NEW."companyId", 'job_open', NEW."isActive"::text, 1);
+    END IF;
+
+    -- Runs BEFORE DELETE, while the applications still exist; their own
+    -- cascaded delete then finds no job and changes nothing
+    IF TG_OP = 'DELETE' THEN
+        PERFORM "company_dashboard_shift_applications"(OLD."id", OLD."companyId", -1);
+        RETURN OLD;
+    END IF;
+
+    IF TG_OP = 'UPDATE' AND OLD."companyId" <> NEW."companyId" THEN
+        PERFORM "company_dashboard_shift_applications"(NEW."id", OLD."companyId", -1);
+        PERFORM "company_dashboard_shift_applications"(NEW."id", NEW."companyId", 1);
+    END IF;
+
+    RETURN NULL;
+END;
+$$;
+
+-- CreateFunction
+-- Applications are written in bulk (status changes, imports), so these
+-- triggers are statement level and apply one aggregated upsert per statement.
+-- Updates that do not touch status, job or createdAt cost nothing.
+CREATE FUNCTION "company_dashboard_applications_trigger"() RETURNS trigger LANGUAGE plpgsql AS $$
+DECLARE
+    day_window_start TIMESTAMP := date_trunc('day', NOW() AT TIME ZONE 'UTC') - interval '7 days';
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO "company_dashboard_counters" AS c ("companyId", "kind", "key", "count", "updatedAt")
+        SELECT j."companyId", d."kind", d."key", SUM(d."delta")::int, NOW()
+        FROM (
+            SELECT "jobId", 'application_status' AS "kind", "status"::text AS "key", 1 AS "delta"
+            FROM "new_rows"
+            UNION ALL
+            SELECT "jobId", 'application_day', to_char("createdAt", 'YYYY-MM-DD'), 1
+            FROM "new_rows" WHERE "createdAt" >= day_window_start
+        ) AS d
+        JOIN "jobs" AS j ON j."id" = d."jobId"
+        GROUP BY j."companyId", d."kind", d."key"
+        ON CONFLICT ("companyId", "kind", "key") DO UPDATE
+            SET "count" = c."count" + EXCLUDED."count", "updatedAt" = NOW();
+
+    ELSIF TG_OP = 'UPDATE' THEN
+        INSERT INTO "company_dashboard_counters" AS c ("companyId", "kind", "key", "count", "updatedAt")
+        SELECT j."companyId", d."kind", d."key", SUM(d."delta")::int, NOW()
+        FROM (
+            SELECT n."jobId", 'application_status' AS "kind", n."status"::text AS "key", 1 AS "delta"
+            FROM "new_rows" AS n JOIN "old_rows" AS o ON o."id" = n."id"
+            WHERE n."status" <> o."status" OR n."jobId" <> o."jobId"
+            UNION ALL
+            SELECT o."jobId", 'application_status', o."status"::text, -1
+            FROM "new_rows" AS n JOIN "old_rows" AS o ON o."id" = n."id"
+            WHERE n."status" <> o."status" OR n."jobId" <> o."jobId"
+            UNION ALL
+            SELECT n."jobId", 'application_day', to_char(n."createdAt", 'YYYY-MM-DD'), 1
+            FROM "new_rows" AS n JOIN "old_rows" AS o ON o."id" = n."id"
+            WHERE (n."createdAt" <> o."createdAt" OR n."jobId" <> o."jobId") AND n."createdAt" >= day_window_start
+            UNION ALL
+            SELECT o."jobId", 'application_day', to_char(o."createdAt", 'YYYY-MM-DD'), -1
+            FROM "new_rows" AS n JOIN "old_rows" AS o ON o."id" = n."id"
+            WHERE (n."createdAt" <> o."createdAt" OR n."jobId" <> o."jobId") AND o."createdAt" >= day_window_start
+        ) AS d
+        JOIN "jobs" AS j ON j."id" = d."jobId"
+        GROUP BY j."companyId", d."kind", d."key"
+        HAVING SUM(d."delta") <> 0
+        ON CONFLICT ("companyId", "kind", "key") DO UPDATE
+            SET "count" = c."count" + EXCLUDED."count", "updatedAt" = NOW();
+
+    ELSE
+        INSERT INTO "company_dashboard_counters" AS c ("companyId", "kind", "key", "count", "updatedAt")
+        SELECT j."companyId", d."kind", d."key", SUM(d."delta")::int, NOW()
+        FROM (
+            SELECT "jobId", 'application_status' AS "kind", "status"::text AS "key", -1 AS "delta"
+            FROM "old_rows"
+            UNION ALL
+            SELECT "jobId", 'application_day', to_char("createdAt", 'YYYY-MM-DD'), -1
+            FROM "old_rows" WHERE "createdAt" >= day_window_start
+        ) AS d
+        JOIN "jobs" AS j ON j."id" = d."jobId"
+        GROUP BY j."companyId", d."kind", d."key"
+        ON CONFLICT ("companyId", "kind", "key") DO UPDATE
+            SET "count" = c."count" + EXCLUDED."count", "updatedAt" = NOW();
+    END IF;
+
+    RETURN NULL;
+END;
+$$;
+
+-- CreateTrigger
+CREATE TRIGGER "company_dashboard_jobs_write"
+AFTER INSERT OR UPDATE ON "jobs"
+FOR EACH ROW EXECUTE FUNCTION "company_dashboard_jobs_trigger"();
+
+-- CreateTrigger
+CREATE TRIGGER "company_dashboard_jobs_delete"
+BEFORE DELETE ON "jobs"
+FOR EACH ROW EXECUTE FUNCTION "company_dashboard_jobs_trigger"();
+
+-- CreateTrigger
+CREATE TRIGGER "company_dashboard_applications_insert"
+AFTER INSERT ON "applications"
+REFERENCING NEW TABLE AS "new_rows"
+FOR EACH STATEMENT EXECUTE FUNCTION "company_dashboard_applications_trigger"();
+
+-- CreateTrigger
+CREATE TRIGGER "company_dashboard_applications_update"
+AFTER UPDATE ON "applications"
+REFERENCING OLD TABLE AS "old_rows" NEW TABLE AS "new_rows"
+FOR EACH STATEMENT EXECUTE FUNCTION "company_dashboard_applications_trigger"();
+
+-- CreateTrigger
+CREATE TRIGGER "company_dashboard_applications_delete"
+AFTER DELETE ON "applications"
+REFERENCING OLD TABLE AS "old_rows"
+FOR EACH STATEMENT EXECUTE FUNCTION "company_dashboard_applications_trigger"();
+
+-- Backfill
+INSERT INTO "company_dashboard_counters" ("companyId", "kind", "key", "count", "updatedAt")
+SELECT "companyId", 'job_status', "status"::text, COUNT(*)::int, NOW()
+FROM "jobs" GROUP BY "companyId", "status"
+UNION ALL
+SELECT "companyId", 'job_open', "isActive"::text, COUNT(*)::int, NOW()
+FROM "jobs" GROUP BY "companyId", "isActive"
+UNION ALL
+SELECT j."companyId", 'application_status', a."status"::text, COUNT(*)::int, NOW()
+FROM "applications" AS a JOIN "jobs" AS j ON j."id" = a."jobId"
+GROUP BY j."companyId", a."status"
+UNION ALL
+SELECT j."companyId", 'application_day', to_char(a."createdAt", 'YYYY-MM-DD'), COUNT(*)::int, NOW()
+FROM "applications" AS a JOIN "jobs" AS j ON j."id" = a."jobId"
+WHERE a."createdAt" >= date_trunc('day', NOW() AT TIME ZONE 'UTC') - interval '7 days'
+GROUP BY j."companyId", to_char(a."createdAt", 'YYYY-MM-DD');
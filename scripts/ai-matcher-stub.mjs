@@ -0,0 +1,90 @@
+// Local stand-in for the Python CV matcher (POST /api/match), for offline
+// development and load testing of the ai-match routes.
+//
+// Scores are deterministic per (CV URL, skill), so repeated runs are comparable.
+// Every 100 requests (and on exit) it prints how many calls it served and the
+// peak number in flight, which shows the effect of caching and the batch
+// concurrency limit.
+//
+// Usage:
+//   node scripts/ai-matcher-stub.mjs [--port 5055] [--latency 800] [--fail-rate 0]
+//   NEXT_PUBLIC_PYTHON_API_URL=http://localhost:5055 npm run dev
+import { createServer } from 'http'
+import { createHash } from 'crypto'
+
+function option(name, fallback) {
+  const index = process.argv.indexOf(`--${name}`)
+  return index === -1 ? fallback : Number(process.argv[index + 1])
+}
+
+const port = option('port', 5055)
+const latencyMs = option('latency', 800) // Roughly one PDF parse
+const failRate = option('fail-rate', 0)
+
+let served = 0
+let inFlight = 0
+let peakInFlight = 0
+
+function hashOf(value) {
+  return createHash('sha256').update(value).digest().readUInt32BE(0)
+}
+
+function score({ uri_cv: cvUrl = '', required_skill: skills = [] }) {
+  const matched = skills.filter(skill => hashOf(`${cvUrl}:${skill.toLowerCase()}`) % 3 !== 0)
+  const percentage = skills.length === 0 ? 0 : Math.round((matched.length / skills.length) * 100)
+
+  return {
+    success: true,
+    nama: `Kandidat ${hashOf(cvUrl) % 1000}`,
+    email: null,
+    skill: matched,
+    persentase: `${percentage}%`,
+    status: percentage >= 70 ? 'RECOMMENDED' : percentage > 60 ? 'POTENTIAL' : 'NOT_RECOMMENDED'
+  }
+}
+
+function report() {
+  console.log(`served=${served} peakInFlight=${peakInFlight}`)
+}
+
+const server = createServer((req, res) => {
+  if (req.method !== 'POST' || req.url !== '/api/match') {
+    res.writeHead(404).end()
+    return
+  }
+
+  let body = ''
+  req.on('data', chunk => { body += chunk })
+  req.on('end', () => {
+    inFlight++
+    peakInFlight = Math.max(peakInFlight, inFlight)
+
+    setTimeout(() => {
+      inFlight--
+      served++
+      if (served % 100 === 0) report()
+
+      if (Math.random() < failRate) {
+        res.writeHead(503, { 'Content-Type': 'application/json' })
+        res.end(JSON.stringify({ success: false, error: 'stub failure' }))
+        return
+      }
+
+      try {
+        res.writeHead(200, { 'Content-Type': 'application/json' })
+        res.end(JSON.stringify(score(JSON.parse(body || '{}'))))
+      } catch {
+        res.writeHead(400).end()
+      }
+    }, latencyMs)
+  })
+})
+
+server.listen(port, () => {
+  console.log(`ai-matcher stub on http://localhost:${port} (latency ${latencyMs}ms, fail rate ${failRate})`)
+})
+
+process.on('SIGINT', () => {
+  report()
+  process.exit(0)
+})
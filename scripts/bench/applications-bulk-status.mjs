@@ -0,0 +1,117 @@
+// Compare changing application statuses one request at a time (read + update
+// + audit insert per id, as PATCH .../applications/[id]/status does) with the
+// single guarded UPDATE + batched audit insert of lib/applications/bulkStatus.js.
+//
+// Every iteration runs inside a transaction that is rolled back, so the
+// database is left untouched. Sizes above the number of existing
+// applications are capped.
+//
+// Usage: DATABASE_URL=... node scripts/bench/applications-bulk-status.mjs [iterations] [sizes]
+//   e.g. node scripts/bench/applications-bulk-status.mjs 5 10,100,1000
+import { randomUUID } from 'crypto'
+import { PrismaClient } from '@prisma/client'
+
+const iterations = Number(process.argv[2] || 5)
+const sizes = (process.argv[3] || '10,100,1000').split(',').map(Number)
+
+const prisma = new PrismaClient({ log: [{ emit: 'event', level: 'query' }] })
+let queryCount = 0
+prisma.$on('query', () => { queryCount++ })
+
+const ROLLBACK = new Error('rollback')
+const TARGET_STATUS = 'REVIEWING'
+
+function auditRow(applicationId, from) {
+  return {
+    id: randomUUID(),
+    action: 'UPDATE_APPLICATION_STATUS',
+    userRole: 'RECRUITER',
+    targetType: 'application',
+    targetId: applicationId,
+    changes: { from, to: TARGET_STATUS }
+  }
+}
+
+async function perId(tx, ids) {
+  for (const id of ids) {
+    const application = await tx.applications.findUnique({
+      where: { id },
+      include: { jobs: { include: { recruiters: true } } }
+    })
+    await tx.applications.update({
+      where: { id },
+      data: { status: TARGET_STATUS, reviewedAt: new Date() }
+    })
+    await tx.audit_logs.create({ data: auditRow(id, application.status) })
+  }
+}
+
+async function bulk(tx, ids) {
+  const applications = await tx.applications.findMany({
+    where: { id: { in: ids } },
+    select: { id: true, status: true }
+  })
+  await tx.$queryRaw`
+    UPDATE "applications"
+    SET "status" = ${TARGET_STATUS}::"ApplicationStatus",
+        "reviewedAt" = COALESCE("reviewedAt", NOW()),
+        "updatedAt" = NOW()
+    WHERE "id" = ANY(${ids})
+    RETURNING "id"
+  `
+  await tx.audit_logs.createMany({
+    data: applications.map(application => auditRow(application.id, application.status))
+  })
+}
+
+function percentile(sorted, p) {
+  return sorted[Math.min(sorted.length - 1, Math.floor((p / 100) * sorted.length))]
+}
+
+async function measure(name, fn, ids) {
+  const durations = []
+  queryCount = 0
+  for (let i = 0; i < iterations; i++) {
+    const start = performance.now()
+    await prisma.$transaction(async (tx) => {
+      await fn(tx, ids)
+      throw ROLLBACK
+    }, { timeout: 120_000 }).catch(error => {
+      if (error !== ROLLBACK) throw error
+    })
+    durations.push(performance.now() - start)
+  }
+  durations.sort((a, b) => a - b)
+  const p50 = percentile(durations, 50)
+  return {
+    name,
+    ids: ids.length,
+    queriesPerRun: queryCount / iterations,
+    p50: Number(p50.toFixed(2)),
+    p95: Number(percentile(durations, 95).toFixed(2)),
+    idsPerSecond: Math.round(ids.length / (p50 / 1000))
+  }
+}
+
+async function main() {
+  const applications = await prisma.applications.findMany({
+    select: { id: true },
+    orderBy: { id: 'asc' },
+    take: Math.max(...sizes)
+  })
+  if (applications.length === 0) throw new Error('Seed some applications before running this benchmark')
+
+  const results = []
+  for (const size of sizes) {
+    const ids = applications.slice(0, size).map(application => application.id)
+    results.push(await measure('per id', perId, ids))
+    results.push(await measure('bulk', bulk, ids))
+  }
+  console.table(results)
+}
+
+main()
+  .catch(e => console.error(e))
+  .finally(async () => {
+    await prisma.$disconnect()
+  })
@@ -0,0 +1,73 @@
+// Diff two reports written by scripts/bench/run.mjs, scenario by scenario.
+// Exits with code 1 when any scenario's p95 regressed by more than the
+// threshold (percent), so it can gate a CI job.
+//
+// Usage: node scripts/bench/compare.mjs <base.json> <head.json> [--threshold 10]
+import { readFileSync } from 'fs'
+
+const args = process.argv.slice(2)
+const argValue = (name, fallback) => {
+  const index = args.indexOf(name)
+  return index === -1 ? fallback : args[index + 1]
+}
+
+const [basePath, headPath] = args.filter(arg => !arg.startsWith('--') && arg !== argValue('--threshold'))
+const threshold = Number(argValue('--threshold', 10))
+
+if (!basePath || !headPath) {
+  console.error('Usage: node scripts/bench/compare.mjs <base.json> <head.json> [--threshold 10]')
+  process.exit(2)
+}
+
+const load = path => JSON.parse(readFileSync(path, 'utf8'))
+
+function change(before, after) {
+  if (before == null || after == null) return null
+  if (before === 0) return after === 0 ? 0 : null
+  return Number((((after - before) / before) * 100).toFixed(1))
+}
+
+const format = (before, after) => {
+  const delta = change(before, after)
+  return `${before ?? '-'} -> ${after ?? '-'}${delta === null ? '' : ` (${delta > 0 ? '+' : ''}${delta}%)`}`
+}
+
+function main() {
+  const base = load(basePath)
+  const head = load(headPath)
+  const baseScenarios = new Map(base.scenarios.map(scenario => [scenario.name, scenario]))
+
+  const rows = []
+  const regressions = []
+  for (const scenario of head.scenarios) {
+    const previous = baseScenarios.get(scenario.name)
+    if (!previous?.latencyMs || !scenario.latencyMs) continue
+
+    const p95Change = change(previous.latencyMs.p95, scenario.latencyMs.p95)
+    if (p95Change !== null && p95Change > threshold) regressions.push(scenario.name)
+
+    rows.push({
+      scenario: scenario.name,
+      p50: format(previous.latencyMs.p50, scenario.latencyMs.p50),
+      p95: format(previous.latencyMs.p95, scenario.latencyMs.p95),
+      p99: format(previous.latencyMs.p99, scenario.latencyMs.p99),
+      rps: format(previous.throughputRps, scenario.throughputRps),
+      queries: format(previous.dbQueriesPerRequest, scenario.dbQueriesPerRequest),
+      prismaQueries: format(previous.prismaQueriesPerRequest, scenario.prismaQueriesPerRequest),
+      bytes: format(previous.bytesPerResponse, scenario.bytesPerResponse)
+    })
+  }
+
+  console.log(`${base.meta.commit} -> ${head.meta.commit}`)
+  if (JSON.stringify(base.meta.dataset) !== JSON.stringify(head.meta.dataset)) {
+    console.warn('Warning: the reports were taken against different datasets', base.meta.dataset, head.meta.dataset)
+  }
+  console.table(rows)
+
+  if (regressions.length > 0) {
+    console.error(`p95 regressed by more than ${threshold}%: ${regressions.join(', ')}`)
+    process.exitCode = 1
+  }
+}
+
+main()
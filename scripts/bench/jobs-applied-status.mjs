@@ -0,0 +1,88 @@
+// Compare the per-job `hasApplied` lookups of GET /api/jobs (N+1) with the
+// batched `jobId IN (...)` query from lib/jobs/appliedStatus.js.
+//
+// Usage: DATABASE_URL=... node scripts/bench/jobs-applied-status.mjs [iterations] [limit]
+import { PrismaClient } from '@prisma/client'
+
+const iterations = Number(process.argv[2] || 50)
+const limit = Number(process.argv[3] || 20)
+
+const prisma = new PrismaClient({ log: [{ emit: 'event', level: 'query' }] })
+let queryCount = 0
+prisma.$on('query', () => { queryCount++ })
+
+async function legacy(userId, jobIds) {
+  const user = await prisma.users.findUnique({
+    where: { id: userId },
+    include: { jobseekers: true }
+  })
+  const jobseekerId = user?.jobseekers?.id
+  return Promise.all(jobIds.map(async (jobId) => {
+    const application = await prisma.applications.findUnique({
+      where: { jobId_jobseekerId: { jobId, jobseekerId } },
+      select: { id: true, status: true }
+    })
+    return !!application
+  }))
+}
+
+const jobseekerIdCache = new Map()
+
+async function batched(userId, jobIds) {
+  let jobseekerId = jobseekerIdCache.get(userId)
+  if (!jobseekerId) {
+    const jobseeker = await prisma.jobseekers.findUnique({ where: { userId }, select: { id: true } })
+    jobseekerId = jobseeker.id
+    jobseekerIdCache.set(userId, jobseekerId)
+  }
+  const applications = await prisma.applications.findMany({
+    where: { jobseekerId, jobId: { in: jobIds } },
+    select: { jobId: true }
+  })
+  const applied = new Set(applications.map(a => a.jobId))
+  return jobIds.map(id => applied.has(id))
+}
+
+function percentile(sorted, p) {
+  return sorted[Math.min(sorted.length - 1, Math.floor((p / 100) * sorted.length))]
+}
+
+async function measure(name, fn, userId, jobIds) {
+  const durations = []
+  queryCount = 0
+  for (let i = 0; i < iterations; i++) {
+    const start = performance.now()
+    await fn(userId, jobIds)
+    durations.push(performance.now() - start)
+  }
+  durations.sort((a, b) => a - b)
+  return {
+    name,
+    queriesPerPage: queryCount / iterations,
+    p50: Number(percentile(durations, 50).toFixed(2)),
+    p95: Number(percentile(durations, 95).toFixed(2))
+  }
+}
+
+async function main() {
+  const jobseeker = await prisma.jobseekers.findFirst({
+    where: { applications: { some: {} } },
+    select: { userId: true }
+  }) ?? await prisma.jobseekers.findFirst({ select: { userId: true } })
+  if (!jobseeker) throw new Error('Seed at least one jobseeker before running this benchmark')
+
+  const jobs = await prisma.jobs.findMany({ select: { id: true }, take: limit })
+  const jobIds = jobs.map(job => job.id)
+
+  const results = [
+    await measure('legacy (findUnique per job)', legacy, jobseeker.userId, jobIds),
+    await measure('batched (jobId IN)', batched, jobseeker.userId, jobIds)
+  ]
+  console.table(results)
+}
+
+main()
+  .catch(e => console.error(e))
+  .finally(async () => {
+    await prisma.$disconnect()
+  })
@@ -0,0 +1,41 @@
+// Measure payload size and TTFB of GET /api/jobs with the full list payload
+// versus `fields=summary`, against a running server.
+//
+// Usage: BASE_URL=http://localhost:3000 node scripts/bench/jobs-payload.mjs [iterations] [limit]
+const baseUrl = process.env.BASE_URL || 'http://localhost:3000'
+const iterations = Number(process.argv[2] || 20)
+const limit = Number(process.argv[3] || 20)
+
+async function measure(fields) {
+  const url = new URL('/api/jobs', baseUrl)
+  url.searchParams.set('limit', String(limit))
+  if (fields) url.searchParams.set('fields', fields)
+
+  const ttfb = []
+  const total = []
+  let bytes = 0
+
+  for (let i = 0; i < iterations; i++) {
+    const start = performance.now()
+    const response = await fetch(url, { headers: { 'accept-encoding': 'identity' } })
+    ttfb.push(performance.now() - start)
+    const body = await response.arrayBuffer()
+    total.push(performance.now() - start)
+    bytes = body.byteLength
+  }
+
+  const median = values => values.sort((a, b) => a - b)[Math.floor(values.length / 2)]
+  return {
+    fields: fields || 'full',
+    bytesPerPage: bytes,
+    bytesPerJob: Math.round(bytes / limit),
+    ttfbMedianMs: Number(median(ttfb).toFixed(2)),
+    totalMedianMs: Number(median(total).toFixed(2))
+  }
+}
+
+async function main() {
+  console.table([await measure(null), await measure('summary')])
+}
+
+main().catch(e => console.error(e))
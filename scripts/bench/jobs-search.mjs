@@ -0,0 +1,112 @@
+// Compare the legacy ILIKE search of GET /api/jobs with the searchVector
+// full-text index (lib/jobs/search.js) on a seeded catalogue.
+//
+// Usage:
+//   DATABASE_URL=... node scripts/bench/jobs-search.mjs --seed 100000
+//   DATABASE_URL=... node scripts/bench/jobs-search.mjs [--iterations 20] [--cleanup]
+import { PrismaClient } from '@prisma/client'
+
+const args = process.argv.slice(2)
+const argValue = (name, fallback) => {
+  const index = args.indexOf(name)
+  return index === -1 ? fallback : args[index + 1]
+}
+
+const seedCount = Number(argValue('--seed', 0))
+const iterations = Number(argValue('--iterations', 20))
+const cleanup = args.includes('--cleanup')
+const terms = ['software engineer', 'admin', 'operator produksi', 'pemasaran', 'gudang']
+
+const prisma = new PrismaClient()
+
+async function seed(count) {
+  const now = new Date()
+  await prisma.$executeRaw`
+    INSERT INTO "users" (id, email, password, role, "updatedAt")
+    VALUES ('bench-user', 'bench@example.com', 'x', 'RECRUITER', ${now})
+    ON CONFLICT (id) DO NOTHING`
+  await prisma.$executeRaw`
+    INSERT INTO "companies" (id, name, slug, industry, "companySize", email, address, city, province, status, verified, "updatedAt")
+    VALUES ('bench-company', 'PT Bench Sejahtera', 'bench-company', 'Manufaktur', '50-100', 'bench@example.com', 'Jl. Bench', 'Cirebon', 'Jawa Barat', 'VERIFIED', true, ${now})
+    ON CONFLICT (id) DO NOTHING`
+  await prisma.$executeRaw`
+    INSERT INTO "recruiters" (id, "userId", "companyId", "firstName", "lastName", position, "updatedAt")
+    VALUES ('bench-recruiter', 'bench-user', 'bench-company', 'Bench', 'Recruiter', 'HR', ${now})
+    ON CONFLICT (id) DO NOTHING`
+  await prisma.$executeRaw`
+    INSERT INTO "jobs" (id, "companyId", "recruiterId", title, slug, description, requirements, responsibilities,
+      "jobType", category, location, city, province, "publishedAt", status, "isActive", "updatedAt")
+    SELECT 'bench-job-' || g,
+      'bench-company', 'bench-recruiter',
+      (ARRAY['Software Engineer', 'Admin Gudang', 'Operator Produksi', 'Staf Pemasaran', 'Kasir'])[1 + g % 5] || ' ' || g,
+      'bench-job-' || g,
+      repeat('<p>Kami mencari kandidat yang teliti, bertanggung jawab dan mampu bekerja dalam tim. </p>', 20) || ' kode ' || md5(g::text),
+      'Minimal SMA/SMK', 'Menjalankan tugas harian',
+      'FULL_TIME',
+      (ARRAY['Teknologi', 'Administrasi', 'Manufaktur', 'Pemasaran', 'Retail'])[1 + g % 5],
+      'Cirebon', 'Cirebon', 'Jawa Barat',
+      ${now}::timestamp - (g || ' minutes')::interval, 'ACTIVE', true, ${now}
+    FROM generate_series(1, ${count}) AS g
+    ON CONFLICT (id) DO NOTHING`
+  await prisma.$executeRawUnsafe('ANALYZE "jobs"')
+}
+
+async function time(fn) {
+  const durations = []
+  for (let i = 0; i < iterations; i++) {
+    const start = performance.now()
+    await fn()
+    durations.push(performance.now() - start)
+  }
+  durations.sort((a, b) => a - b)
+  return {
+    p50: Number(durations[Math.floor(durations.length / 2)].toFixed(2)),
+    p95: Number(durations[Math.min(durations.length - 1, Math.floor(durations.length * 0.95))].toFixed(2))
+  }
+}
+
+function ilikeSearch(term) {
+  const pattern = `%${term}%`
+  return prisma.$queryRaw`
+    SELECT j.id FROM "jobs" j JOIN "companies" c ON c.id = j."companyId"
+    WHERE j.status = 'ACTIVE' AND j."isActive" = true
+      AND (j.title ILIKE ${pattern} OR j.description ILIKE ${pattern}
+        OR j.category ILIKE ${pattern} OR c.name ILIKE ${pattern})
+    ORDER BY j."publishedAt" DESC LIMIT 20`
+}
+
+function fullTextSearch(term) {
+  const prefixQuery = term.toLowerCase().split(/\s+/).filter(Boolean).map(t => `${t}:*`).join(' & ')
+  return prisma.$queryRaw`
+    WITH q AS (SELECT to_tsquery('simple', ${prefixQuery}) || plainto_tsquery('indonesian', ${term}) AS query)
+    SELECT j.id, ts_rank_cd(j."searchVector", q.query) AS rank
+    FROM "jobs" j CROSS JOIN q
+    WHERE j.status = 'ACTIVE' AND j."isActive" = true AND j."searchVector" @@ q.query
+    ORDER BY rank DESC LIMIT 2000`
+}
+
+async function main() {
+  if (seedCount > 0) {
+    console.log(`Seeding ${seedCount} jobs...`)
+    await seed(seedCount)
+  }
+
+  const results = []
+  for (const term of terms) {
+    results.push({ term, mode: 'ILIKE', ...(await time(() => ilikeSearch(term))) })
+    results.push({ term, mode: 'tsvector', ...(await time(() => fullTextSearch(term))) })
+  }
+  console.table(results)
+
+  if (cleanup) {
+    await prisma.$executeRaw`DELETE FROM "jobs" WHERE "companyId" = 'bench-company'`
+    await prisma.$executeRaw`DELETE FROM "companies" WHERE id = 'bench-company'`
+    await prisma.$executeRaw`DELETE FROM "users" WHERE id = 'bench-user'`
+  }
+}
+
+main()
+  .catch(e => console.error(e))
+  .finally(async () => {
+    await prisma.$disconnect()
+  })
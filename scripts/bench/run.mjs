@@ -0,0 +1,286 @@
+// Load scenarios for the public job listing, the homepage and the recruiter
+// dashboard against a running server backed by a local Postgres seeded with
+// scripts/bench/seed.mjs. Writes a JSON report that scripts/bench/compare.mjs
+// can diff between commits.
+//
+// Per scenario: latency p50/p95/p99, throughput, error/429 counts, response
+// size and database statements per request. Statement counts come from the
+// pg_stat_statements delta over the measured phase, so they include anything
+// else hitting the database; they are null when the extension is missing.
+// Routes wrapped with withTelemetry (lib/telemetry.js) also report their own
+// Prisma operation count and time through Server-Timing.
+//
+// /api/jobs is rate limited per IP, so every request carries its own
+// x-forwarded-for address (trusted when the server is reached directly).
+//
+// Usage:
+//   BASE_URL=http://localhost:3000 DATABASE_URL=... JWT_SECRET=... node scripts/bench/run.mjs \
+//     [--requests 200] [--concurrency 10] [--warmup 20] [--scenarios jobs-list,homepage-stats] [--out bench-results/<sha>.json]
+import { execSync } from 'child_process'
+import { mkdirSync, writeFileSync } from 'fs'
+import { dirname } from 'path'
+import jwt from 'jsonwebtoken'
+import { PrismaClient } from '@prisma/client'
+
+const args = process.argv.slice(2)
+const argValue = (name, fallback) => {
+  const index = args.indexOf(name)
+  return index === -1 ? fallback : args[index + 1]
+}
+
+const baseUrl = process.env.BASE_URL || 'http://localhost:3000'
+const requests = Number(argValue('--requests', 200))
+const concurrency = Number(argValue('--concurrency', 10))
+const warmup = Number(argValue('--warmup', 20))
+const only = argValue('--scenarios', null)?.split(',')
+
+const prisma = new PrismaClient()
+
+const SEARCH_TERMS = ['engineer', 'admin gudang', 'operator', 'pemasaran', 'kasir', 'guru', 'kurir']
+const CATEGORIES = ['Teknologi', 'Administrasi', 'Manufaktur', 'Pemasaran', 'Retail', 'Pendidikan', 'Logistik']
+const LOCATIONS = ['Cirebon', 'Kuningan', 'Indramayu', 'Majalengka']
+const JOB_TYPES = ['FULL_TIME', 'PART_TIME', 'CONTRACT', 'FREELANCE', 'INTERNSHIP']
+
+// Each scenario builds the URL for request i; `state` is per worker, so
+// cursor walks follow the nextCursor of that worker's previous response
+const SCENARIOS = [
+  {
+    name: 'jobs-list',
+    path: () => '/api/jobs?limit=20&fields=summary'
+  },
+  {
+    name: 'jobs-search',
+    path: i => `/api/jobs?limit=20&sortBy=relevance&search=${encodeURIComponent(SEARCH_TERMS[i % SEARCH_TERMS.length])}`
+  },
+  {
+    name: 'jobs-filters',
+    path: i => `/api/jobs?limit=20&category=${CATEGORIES[i % CATEGORIES.length]}` +
+      `&location=${LOCATIONS[i % LOCATIONS.length]}&jobType=${JOB_TYPES[i % JOB_TYPES.length]}`
+  },
+  {
+    name: 'jobs-deep-offset',
+    path: i => `/api/jobs?limit=20&page=${200 + (i % 50)}`
+  },
+  {
+    name: 'jobs-deep-cursor',
+    path: (i, state) => state.cursor
+      ? `/api/jobs?limit=20&cursor=${encodeURIComponent(state.cursor)}`
+      : '/api/jobs?limit=20',
+    after: (body, state) => { state.cursor = body?.pagination?.nextCursor || null }
+  },
+  {
+    name: 'jobs-authenticated',
+    auth: 'jobseeker',
+    path: i => `/api/jobs?limit=20&page=${1 + (i % 10)}`
+  },
+  { name: 'homepage-stats', path: () => '/api/homepage/stats' },
+  { name: 'homepage-featured-jobs', path: () => '/api/homepage/featured-jobs' },
+  { name: 'homepage-top-companies', path: () => '/api/homepage/top-companies' },
+  { name: 'homepage-categories', path: () => '/api/homepage/categories' },
+  {
+    name: 'recruiter-dashboard',
+    auth: 'recruiter',
+    path: () => '/api/profile/recruiter/dashboard'
+  }
+]
+
+const SERVER_TIMING_DB = /db;dur=([\d.]+);desc="(\d+) queries"/
+
+const mean = values => (values.length === 0 ? null : values.reduce((sum, value) => sum + value, 0) / values.length)
+
+function percentile(sorted, p) {
+  return sorted[Math.min(sorted.length - 1, Math.floor((p / 100) * sorted.length))]
+}
+
+const round = value => (value === null ? null : Number(value.toFixed(2)))
+
+let ipCounter = 0
+function nextIp() {
+  ipCounter++
+  return `10.${(ipCounter >> 16) & 255}.${(ipCounter >> 8) & 255}.${ipCounter & 255}`
+}
+
+// Tokens are minted directly for the seeded users (their passwords are not usable)
+async function createTokens() {
+  const users = await prisma.users.findMany({
+    where: { id: { in: ['synth-ju-1', 'synth-ru-1'] } },
+    select: { id: true, email: true, role: true }
+  })
+  const tokens = {}
+  for (const user of users) {
+    const key = user.role === 'RECRUITER' ? 'recruiter' : 'jobseeker'
+    tokens[key] = jwt.sign({ userId: user.id, email: user.email, role: user.role }, process.env.JWT_SECRET, { expiresIn: '1h' })
+  }
+  return tokens
+}
+
+async function statementCount() {
+  try {
+    const [row] = await prisma.$queryRaw`SELECT COALESCE(SUM("calls"), 0)::bigint AS "calls" FROM pg_stat_statements`
+    return Number(row.calls)
+  } catch {
+    return null
+  }
+}
+
+async function send(scenario, i, state, token) {
+  const headers = { 'x-forwarded-for': nextIp() }
+  if (token) {
+    headers.authorization = `Bearer ${token}`
+    headers.cookie = `token=${token}`
+  }
+
+  const start = performance.now()
+  const response = await fetch(new URL(scenario.path(i, state), baseUrl), { headers })
+  const body = await response.text()
+  const duration = performance.now() - start
+
+  if (scenario.after) {
+    let json = null
+    try { json = JSON.parse(body) } catch {}
+    scenario.after(json, state)
+  }
+
+  const serverTiming = SERVER_TIMING_DB.exec(response.headers.get('server-timing') || '')
+
+  return {
+    duration,
+    status: response.status,
+    bytes: Buffer.byteLength(body),
+    dbMs: serverTiming ? Number(serverTiming[1]) : null,
+    dbQueries: serverTiming ? Number(serverTiming[2]) : null
+  }
+}
+
+// `concurrency` workers pull request numbers from a shared counter
+async function runPhase(scenario, total, token) {
+  const samples = []
+  let next = 0
+  const worker = async () => {
+    const state = {}
+    while (next < total) {
+      const i = next++
+      try {
+        samples.push(await send(scenario, i, state, token))
+      } catch (error) {
+        samples.push({ duration: null, status: 0, bytes: 0, error: error.message })
+      }
+    }
+  }
+  const start = performance.now()
+  await Promise.all(Array.from({ length: Math.min(concurrency, total) }, worker))
+  return { samples, elapsed: performance.now() - start }
+}
+
+async function runScenario(scenario, tokens) {
+  const token = scenario.auth ? tokens[scenario.auth] : null
+  if (scenario.auth && !token) {
+    return { name: scenario.name, skipped: `No seeded ${scenario.auth} user; run scripts/bench/seed.mjs first` }
+  }
+
+  await runPhase(scenario, warmup, token)
+  const before = await statementCount()
+  const { samples, elapsed } = await runPhase(scenario, requests, token)
+  const after = await statementCount()
+
+  const ok = samples.filter(sample => sample.status >= 200 && sample.status < 400)
+  const durations = ok.map(sample => sample.duration).sort((a, b) => a - b)
+  const timed = ok.filter(sample => sample.dbQueries !== null)
+  const statusCodes = {}
+  for (const sample of samples) statusCodes[sample.status] = (statusCodes[sample.status] || 0) + 1
+
+  return {
+    name: scenario.name,
+    requests: samples.length,
+    errors: samples.length - ok.length,
+    rateLimited: statusCodes[429] || 0,
+    statusCodes,
+    throughputRps: round(samples.length / (elapsed / 1000)),
+    latencyMs: durations.length === 0 ? null : {
+      min: round(durations[0]),
+      mean: round(mean(durations)),
+      p50: round(percentile(durations, 50)),
+      p95: round(percentile(durations, 95)),
+      p99: round(percentile(durations, 99)),
+      max: round(durations[durations.length - 1])
+    },
+    bytesPerResponse: ok.length === 0 ? null : Math.round(ok.reduce((sum, sample) => sum + sample.bytes, 0) / ok.length),
+    // Minus the first pg_stat_statements read, which lands inside the window
+    dbQueriesPerRequest: before === null || after === null ? null : round((after - before - 1) / samples.length),
+    // From Server-Timing; null for routes without withTelemetry
+    prismaQueriesPerRequest: round(mean(timed.map(sample => sample.dbQueries))),
+    prismaMsPerRequest: round(mean(timed.map(sample => sample.dbMs)))
+  }
+}
+
+function gitValue(command) {
+  try {
+    return execSync(command, { stdio: ['ignore', 'pipe', 'ignore'] }).toString().trim()
+  } catch {
+    return null
+  }
+}
+
+async function datasetCounts() {
+  const [row] = await prisma.$queryRaw`
+    SELECT
+      (SELECT COUNT(*) FROM "companies")::int AS "companies",
+      (SELECT COUNT(*) FROM "jobs")::int AS "jobs",
+      (SELECT COUNT(*) FROM "jobseekers")::int AS "jobseekers",
+      (SELECT COUNT(*) FROM "applications")::int AS "applications"
+  `
+  return row
+}
+
+async function main() {
+  const scenarios = only ? SCENARIOS.filter(scenario => only.includes(scenario.name)) : SCENARIOS
+  const tokens = await createTokens()
+  const commit = gitValue('git rev-parse --short HEAD')
+
+  const results = []
+  for (const scenario of scenarios) {
+    console.log(`Running ${scenario.name}`)
+    results.push(await runScenario(scenario, tokens))
+  }
+
+  const report = {
+    meta: {
+      createdAt: new Date().toISOString(),
+      commit,
+      dirty: Boolean(gitValue('git status --porcelain --untracked-files=no')),
+      node: process.version,
+      baseUrl,
+      requests,
+      concurrency,
+      warmup,
+      statementCounts: (await statementCount()) !== null,
+      dataset: await datasetCounts()
+    },
+    scenarios: results
+  }
+
+  const out = argValue('--out', `bench-results/${commit || 'report'}.json`)
+  mkdirSync(dirname(out), { recursive: true })
+  writeFileSync(out, JSON.stringify(report, null, 2) + '\n')
+
+  console.table(results.map(result => ({
+    scenario: result.name,
+    p50: result.latencyMs?.p50,
+    p95: result.latencyMs?.p95,
+    p99: result.latencyMs?.p99,
+    rps: result.throughputRps,
+    errors: result.errors,
+    '429': result.rateLimited,
+    queries: result.dbQueriesPerRequest
+  })))
+  console.log(`Report written to ${out}`)
+}
+
+main()
+  .catch(e => {
+    console.error(e)
+    process.exitCode = 1
+  })
+  .finally(async () => {
+    await prisma.$disconnect()
+  })
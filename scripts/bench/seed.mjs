@@ -0,0 +1,161 @@
+// Synthetic dataset for the benchmark suite (scripts/bench/run.mjs).
+//
+// Generates companies (one recruiter each), jobs, jobseekers and applications
+// with set-based INSERT ... SELECT generate_series statements, so 100k rows
+// take seconds. Values are derived from the row number only, so the same
+// sizes always produce the same data. Rows use the `synth-` id prefix and can
+// be removed with --cleanup.
+//
+// Usage:
+//   DATABASE_URL=... node scripts/bench/seed.mjs [--companies 200] [--jobs 20000] [--jobseekers 20000] [--applications 100000]
+//   DATABASE_URL=... node scripts/bench/seed.mjs --cleanup
+import { PrismaClient } from '@prisma/client'
+
+const args = process.argv.slice(2)
+const argValue = (name, fallback) => {
+  const index = args.indexOf(name)
+  return index === -1 ? fallback : args[index + 1]
+}
+
+const sizes = {
+  companies: Number(argValue('--companies', 200)),
+  jobs: Number(argValue('--jobs', 20000)),
+  jobseekers: Number(argValue('--jobseekers', 20000)),
+  applications: Number(argValue('--applications', 100000)),
+}
+
+const prisma = new PrismaClient()
+
+async function cleanup() {
+  // Children first; applications cascade from jobs/jobseekers but are the bulk of the rows
+  await prisma.$executeRaw`DELETE FROM "applications" WHERE "id" LIKE 'synth-%'`
+  await prisma.$executeRaw`DELETE FROM "jobs" WHERE "id" LIKE 'synth-%'`
+  await prisma.$executeRaw`DELETE FROM "jobseekers" WHERE "id" LIKE 'synth-%'`
+  await prisma.$executeRaw`DELETE FROM "recruiters" WHERE "id" LIKE 'synth-%'`
+  await prisma.$executeRaw`DELETE FROM "companies" WHERE "id" LIKE 'synth-%'`
+  await prisma.$executeRaw`DELETE FROM "users" WHERE "id" LIKE 'synth-%'`
+}
+
+async function seed({ companies, jobs, jobseekers, applications }) {
+  const now = new Date()
+
+  await prisma.$executeRaw`
+    INSERT INTO "users" ("id", "email", "password", "role", "emailVerified", "updatedAt")
+    SELECT 'synth-ru-' || g, 'synth-recruiter-' || g || '@example.com', 'x', 'RECRUITER'::"UserRole", true, ${now}
+    FROM generate_series(1, ${companies}) AS g
+    ON CONFLICT ("id") DO NOTHING`
+
+  await prisma.$executeRaw`
+    INSERT INTO "users" ("id", "email", "password", "role", "emailVerified", "updatedAt")
+    SELECT 'synth-ju-' || g, 'synth-jobseeker-' || g || '@example.com', 'x', 'JOBSEEKER'::"UserRole", true, ${now}
+    FROM generate_series(1, ${jobseekers}) AS g
+    ON CONFLICT ("id") DO NOTHING`
+
+  await prisma.$executeRaw`
+    INSERT INTO "companies" ("id", "name", "slug", "industry", "companySize", "email", "address", "city", "province",
+      "status", "verified", "createdAt", "updatedAt")
+    SELECT 'synth-co-' || g,
+      'PT Sintetis ' || (ARRAY['Maju', 'Jaya', 'Sejahtera', 'Makmur', 'Abadi'])[1 + g % 5] || ' ' || g,
+      'synth-co-' || g,
+      (ARRAY['Teknologi', 'Manufaktur', 'Retail', 'Logistik', 'Pendidikan'])[1 + g % 5],
+      (ARRAY['1-10', '11-50', '51-200', '201-500'])[1 + g % 4],
+      'synth-co-' || g || '@example.com', 'Jl. Sintetis ' || g,
+      (ARRAY['Cirebon', 'Kuningan', 'Indramayu', 'Majalengka'])[1 + g % 4], 'Jawa Barat',
+      CASE WHEN g % 10 = 0 THEN 'PENDING_VERIFICATION' ELSE 'VERIFIED' END::"CompanyStatus",
+      g % 10 <> 0,
+      ${now}::timestamp - ((g % 730) || ' days')::interval, ${now}
+    FROM generate_series(1, ${companies}) AS g
+    ON CONFLICT ("id") DO NOTHING`
+
+  await prisma.$executeRaw`
+    INSERT INTO "recruiters" ("id", "userId", "companyId", "firstName", "lastName", "position", "isVerified", "updatedAt")
+    SELECT 'synth-rec-' || g, 'synth-ru-' || g, 'synth-co-' || g, 'Rekruter', 'Sintetis ' || g, 'HR', true, ${now}
+    FROM generate_series(1, ${companies}) AS g
+    ON CONFLICT ("id") DO NOTHING`
+
+  // Jobs spread over the last year; ~85% active so listings have depth
+  await prisma.$executeRaw`
+    INSERT INTO "jobs" ("id", "companyId", "recruiterId", "title", "slug", "description", "requirements", "responsibilities",
+      "jobType", "category", "location", "city", "province", "salaryMin", "salaryMax", "numberOfPositions",
+      "isActive", "isFeatured", "viewCount", "publishedAt", "createdAt", "updatedAt", "status")
+    SELECT 'synth-job-' || g,
+      'synth-co-' || (1 + g % ${companies}),
+      'synth-rec-' || (1 + g % ${companies}),
+      (ARRAY['Software Engineer', 'Admin Gudang', 'Operator Produksi', 'Staf Pemasaran', 'Kasir', 'Guru', 'Kurir'])[1 + g % 7] || ' ' || g,
+      'synth-job-' || g,
+      repeat('<p>Kami mencari kandidat yang teliti, bertanggung jawab dan mampu bekerja dalam tim. </p>', 1 + g % 10) || ' kode ' || md5(g::text),
+      'Minimal SMA/SMK', 'Menjalankan tugas harian',
+      (ARRAY['FULL_TIME', 'PART_TIME', 'CONTRACT', 'FREELANCE', 'INTERNSHIP'])[1 + g % 5]::"JobType",
+      (ARRAY['Teknologi', 'Administrasi', 'Manufaktur', 'Pemasaran', 'Retail', 'Pendidikan', 'Logistik'])[1 + g % 7],
+      (ARRAY['Cirebon', 'Kuningan', 'Indramayu', 'Majalengka'])[1 + g % 4],
+      (ARRAY['Cirebon', 'Kuningan', 'Indramayu', 'Majalengka'])[1 + g % 4], 'Jawa Barat',
+      2000000 + (g % 20) * 250000, 3000000 + (g % 20) * 400000, 1 + g % 5,
+      g % 20 <> 0, g % 50 = 0, (hashtext(g::text) & 1023),
+      ${now}::timestamp - ((g % 525600) || ' minutes')::interval,
+      ${now}::timestamp - ((g % 525600) || ' minutes')::interval,
+      ${now},
+      CASE WHEN g % 20 = 0 THEN 'CLOSED' WHEN g % 13 = 0 THEN 'PENDING' ELSE 'ACTIVE' END::"JobStatus"
+    FROM generate_series(1, ${jobs}) AS g
+    ON CONFLICT ("id") DO NOTHING`
+
+  await prisma.$executeRaw`
+    INSERT INTO "jobseekers" ("id", "userId", "firstName", "lastName", "email", "city", "province", "currentTitle",
+      "isEmployed", "isLookingForJob", "profileCompleted", "profileCompleteness", "createdAt", "updatedAt")
+    SELECT 'synth-js-' || g, 'synth-ju-' || g, 'Pencari', 'Kerja ' || g, 'synth-jobseeker-' || g || '@example.com',
+      (ARRAY['Cirebon', 'Kuningan', 'Indramayu', 'Majalengka'])[1 + g % 4], 'Jawa Barat',
+      (ARRAY['Lulusan Baru', 'Staf Admin', 'Operator', 'Programmer'])[1 + g % 4],
+      g % 7 = 0, g % 7 <> 0, g % 3 <> 0, 40 + g % 61,
+      ${now}::timestamp - ((g % 730) || ' days')::interval, ${now}
+    FROM generate_series(1, ${jobseekers}) AS g
+    ON CONFLICT ("id") DO NOTHING`
+
+  // Round k of applications gives every jobseeker a different job, so
+  // (jobId, jobseekerId) stays unique as long as k < jobs
+  await prisma.$executeRaw`
+    INSERT INTO "applications" ("id", "jobId", "jobseekerId", "status", "appliedAt", "createdAt", "updatedAt", "viewed")
+    SELECT 'synth-app-' || g,
+      'synth-job-' || (1 + (((g - 1) % ${jobseekers}) * 31 + (g - 1) / ${jobseekers}) % ${jobs}),
+      'synth-js-' || (1 + (g - 1) % ${jobseekers}),
+      (ARRAY['PENDING', 'PENDING', 'REVIEWING', 'SHORTLISTED', 'INTERVIEW_SCHEDULED', 'INTERVIEW_COMPLETED', 'ACCEPTED', 'REJECTED', 'REJECTED'])[1 + abs(hashtext(g::text) % 9)]::"ApplicationStatus",
+      ${now}::timestamp - ((g % 259200) || ' minutes')::interval,
+      ${now}::timestamp - ((g % 259200) || ' minutes')::interval,
+      ${now},
+      g % 2 = 0
+    FROM generate_series(1, ${applications}) AS g
+    ON CONFLICT DO NOTHING`
+
+  await prisma.$executeRaw`
+    UPDATE "jobs" AS j
+    SET "applicationCount" = counts."count"
+    FROM (
+      SELECT "jobId", COUNT(*)::int AS "count" FROM "applications"
+      WHERE "id" LIKE 'synth-%' GROUP BY "jobId"
+    ) AS counts
+    WHERE j."id" = counts."jobId"`
+
+  for (const table of ['users', 'companies', 'recruiters', 'jobs', 'jobseekers', 'applications']) {
+    await prisma.$executeRawUnsafe(`ANALYZE "${table}"`)
+  }
+}
+
+async function main() {
+  if (args.includes('--cleanup')) {
+    await cleanup()
+    console.log('Removed synthetic rows')
+    return
+  }
+
+  const start = performance.now()
+  console.log('Seeding', sizes)
+  await seed(sizes)
+  console.log(`Done in ${((performance.now() - start) / 1000).toFixed(1)}s`)
+}
+
+main()
+  .catch(e => {
+    console.error(e)
+    process.exitCode = 1
+  })
+  .finally(async () => {
+    await prisma.$disconnect()
+  })
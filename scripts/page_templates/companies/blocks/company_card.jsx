@@ -0,0 +1,114 @@
+              const isFollowed = followedCompanies.includes(company.id);
+
+              return (
+                <article
+                  key={company.id}
+                  className="group relative overflow-hidden rounded-[1.5rem] border border-slate-200 bg-white shadow-sm transition duration-300 hover:-translate-y-1 hover:border-primary/25 hover:shadow-xl hover:shadow-primary/10"
+                >
+                  <div className="absolute inset-x-0 top-0 h-28 bg-gradient-to-br from-primary/12 via-blue-50 to-slate-50" />
+                  <div className="relative p-5">
+                    <div className="flex items-start justify-between gap-4">
+                      <div className="flex h-24 w-24 items-center justify-center rounded-2xl border border-slate-100 bg-white p-3 shadow-lg shadow-slate-200/70">
+                        {company.logo ? (
+                          <Image
+                            src={company.logo}
+                            alt={company.name}
+                            width={96}
+                            height={96}
+                            className="h-full w-full object-contain"
+                          />
+                        ) : (
+                          <Building2 className="h-10 w-10 text-slate-300" />
+                        )}
+                      </div>
+
+                      <div className="flex flex-col items-end gap-2">
+                        {company.verified && (
+                          <span className="inline-flex items-center gap-1.5 rounded-full border border-primary/15 bg-white/90 px-3 py-1 text-xs font-semibold text-primary shadow-sm">
+                            <CheckCircle className="h-3.5 w-3.5" />
+                            Verified
+                          </span>
+                        )}
+                        <button
+                          type="button"
+                          onClick={() => toggleFollow(company.id)}
+                          className={`flex h-10 w-10 items-center justify-center rounded-full border bg-white shadow-sm transition ${
+                            isFollowed
+                              ? "border-red-100 text-red-500"
+                              : "border-slate-200 text-slate-400 hover:border-red-100 hover:text-red-500"
+                          }`}
+                          aria-label={
+                            isFollowed
+                              ? "Berhenti ikuti perusahaan"
+                              : "Ikuti perusahaan"
+                          }
+                        >
+                          <Heart
+                            className={`h-5 w-5 ${isFollowed ? "fill-current" : ""}`}
+                          />
+                        </button>
+                      </div>
+                    </div>
+
+                    <div className="mt-6">
+                      <h3 className="line-clamp-2 text-2xl font-bold tracking-tight text-slate-950 transition group-hover:text-primary">
+                        {company.name}
+                      </h3>
+                      <p className="mt-3 line-clamp-2 min-h-[3rem] text-sm leading-6 text-slate-500">
+                        {company.tagline ||
+                          "Perusahaan terverifikasi yang membuka peluang karir untuk talenta lokal."}
+                      </p>
+                    </div>
+
+                    {company.industry && company.industry !== "Belum dilengkapi" && (
+                      <div className="mt-5">
+                        <span className="inline-flex rounded-full border border-primary/15 bg-primary/5 px-3 py-1.5 text-sm font-semibold text-primary">
+                          {company.industry}
+                        </span>
+                      </div>
+                    )}
+
+                    <div className="mt-6 grid gap-3 text-sm text-slate-600">
+                      <div className="flex items-center gap-3 rounded-2xl bg-slate-50 p-3">
+                        <MapPin className="h-5 w-5 flex-none text-slate-400" />
+                        <span className="truncate font-medium">
+                          {company.location || "Lokasi belum tersedia"}
+                        </span>
+                      </div>
+                      <div className="grid gap-3 sm:grid-cols-2">
+                        <div className="flex items-center gap-3 rounded-2xl bg-slate-50 p-3">
+                          <Users className="h-5 w-5 flex-none text-slate-400" />
+                          <span className="truncate font-medium">
+                            {company.companySize} karyawan
+                          </span>
+                        </div>
+                        <div className="flex items-center gap-3 rounded-2xl bg-primary/5 p-3 text-primary">
+                          <Briefcase className="h-5 w-5 flex-none" />
+                          <span className="truncate font-bold">
+                            {company.activeJobs} lowongan
+                          </span>
+                        </div>
+                      </div>
+                    </div>
+
+                    <div className="mt-6 flex items-center justify-between gap-3 border-t border-slate-100 pt-5">
+                      {company.rating > 0 ? (
+                        <div className="flex items-center gap-2 rounded-full bg-amber-50 px-3 py-1.5 text-sm font-semibold text-amber-700">
+                          <Star className="h-4 w-4 fill-amber-400 text-amber-400" />
+                          {company.rating} ({company.reviews})
+                        </div>
+                      ) : (
+                        <span className="text-sm text-slate-400">Belum ada ulasan</span>
+                      )}
+
+                      <Link
+                        href={`/companies/${company.slug}`}
+                        className="inline-flex items-center gap-2 rounded-full bg-slate-950 px-4 py-2.5 text-sm font-semibold text-white transition hover:bg-primary"
+                      >
+                        Lihat Profil
+                        <ArrowRight className="h-4 w-4" />
+                      </Link>
+                    </div>
+                  </div>
+                </article>
+              );
@@ -0,0 +1,88 @@
+        <div className="relative z-20 rounded-[1.75rem] border border-slate-200 bg-white p-4 shadow-[0_24px_80px_rgba(15,23,42,0.08)] md:p-5">
+          <div className="flex flex-col gap-4 xl:flex-row xl:items-center xl:justify-between">
+            <div className="flex items-center gap-3 text-slate-800">
+              <div className="flex h-11 w-11 items-center justify-center rounded-xl bg-primary/10 text-primary">
+                <Filter className="h-5 w-5" />
+              </div>
+              <div>
+                <p className="font-semibold">Filter perusahaan</p>
+                <p className="text-sm text-slate-500">
+                  Saring berdasarkan industri dan ukuran tim.
+                </p>
+              </div>
+            </div>
+
+            <div className="flex flex-col gap-3 sm:flex-row xl:items-center">
+              <select
+                value={selectedIndustry}
+                onChange={(event) => setSelectedIndustry(event.target.value)}
+                className="h-12 min-w-[190px] rounded-xl border border-slate-200 bg-slate-50 px-4 text-sm font-medium text-slate-700 transition hover:bg-white focus:border-primary focus:ring-2 focus:ring-primary/15"
+              >
+                <option value="all">Semua Industri</option>
+                {industries
+                  .filter((industry) => industry !== "all")
+                  .map((industry) => (
+                    <option key={industry} value={industry}>
+                      {industry}
+                    </option>
+                  ))}
+              </select>
+
+              <select
+                value={selectedSize}
+                onChange={(event) => setSelectedSize(event.target.value)}
+                className="h-12 min-w-[180px] rounded-xl border border-slate-200 bg-slate-50 px-4 text-sm font-medium text-slate-700 transition hover:bg-white focus:border-primary focus:ring-2 focus:ring-primary/15"
+              >
+                <option value="all">Semua Ukuran</option>
+                {companySizes
+                  .filter((size) => size !== "all")
+                  .map((size) => (
+                    <option key={size} value={size}>
+                      {size} karyawan
+                    </option>
+                  ))}
+              </select>
+
+              {hasFilters && (
+                <button
+                  type="button"
+                  onClick={clearFilters}
+                  className="inline-flex h-12 items-center justify-center gap-2 rounded-xl border border-slate-200 px-4 text-sm font-semibold text-slate-600 transition hover:border-red-200 hover:bg-red-50 hover:text-red-600"
+                >
+                  <X className="h-4 w-4" />
+                  Reset
+                </button>
+              )}
+            </div>
+          </div>
+        </div>
+
+        <div className="mb-6 mt-10 flex flex-col gap-3 sm:flex-row sm:items-end sm:justify-between">
+          <div>
+            <p className="text-sm font-semibold uppercase tracking-[0.22em] text-primary">
+              Hasil Pencarian
+            </p>
+            <h2 className="mt-2 text-2xl font-bold tracking-tight text-slate-950 md:text-3xl">
+              {loading ? "Memuat perusahaan..." : `${companies.length} perusahaan ditemukan`}
+            </h2>
+          </div>
+          {hasFilters && (
+            <div className="flex flex-wrap gap-2 text-sm">
+              {searchQuery.trim() && (
+                <span className="rounded-full border border-slate-200 bg-white px-3 py-1.5 text-slate-600">
+                  {searchQuery.trim()}
+                </span>
+              )}
+              {selectedIndustry !== "all" && (
+                <span className="rounded-full border border-primary/15 bg-primary/5 px-3 py-1.5 text-primary">
+                  {selectedIndustry}
+                </span>
+              )}
+              {selectedSize !== "all" && (
+                <span className="rounded-full border border-primary/15 bg-primary/5 px-3 py-1.5 text-primary">
+                  {selectedSize} karyawan
+                </span>
+              )}
+            </div>
+          )}
+        </div>
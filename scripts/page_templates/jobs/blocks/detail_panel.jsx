@@ -0,0 +1,342 @@
+  // Job Detail Component
+  const JobDetail = ({ job }) => (
+    <div className="h-full overflow-y-auto custom-scrollbar relative">
+      {/* Header */}
+      <div className="p-6 lg:p-8 border-b border-slate-100 bg-white">
+        {/* Mobile Back Button */}
+        <button
+          onClick={() => setShowDetail(false)}
+          className="lg:hidden flex items-center gap-2 text-slate-600 mb-6 hover:text-slate-900 transition-colors"
+        >
+          <ArrowLeft className="w-5 h-5" />
+          <span className="font-medium">Kembali ke daftar</span>
+        </button>
+
+        <div className="flex items-start gap-6">
+          <div className="w-20 h-20 rounded-2xl bg-white shadow-sm border border-slate-100 flex items-center justify-center overflow-hidden flex-shrink-0 p-2">
+            {job.logo?.startsWith("http") ? (
+              <img
+                src={job.logo}
+                alt={job.company}
+                className="w-full h-full object-contain"
+              />
+            ) : (
+              <Building2 className="w-10 h-10 text-slate-300" />
+            )}
+          </div>
+          <div className="flex-1 min-w-0 pt-1">
+            <h1 className="text-2xl font-bold text-slate-900 leading-tight mb-2">
+              {job.title}
+            </h1>
+            <div className="flex items-center gap-2">
+              <span className="text-slate-600 font-medium">{job.company}</span>
+              {job.companyVerified && (
+                <CheckCircle className="w-5 h-5 text-primary" />
+              )}
+            </div>
+          </div>
+          <button
+            onClick={(e) => toggleSaveJob(job.id, e)}
+            aria-label={savedJobs.includes(job.id) ? "Hapus lowongan tersimpan" : "Simpan lowongan"}
+            className={`p-3 rounded-xl transition-all hidden lg:flex ${
+              savedJobs.includes(job.id)
+                ? "bg-primary/10 text-primary"
+                : "bg-slate-50 text-slate-400 hover:bg-slate-100 hover:text-slate-600"
+            }`}
+          >
+            {savedJobs.includes(job.id) ? (
+              <BookmarkCheck className="w-6 h-6" />
+            ) : (
+              <Bookmark className="w-6 h-6" />
+            )}
+          </button>
+        </div>
+
+        {/* Quick Info */}
+        <div className="flex flex-wrap gap-3 mt-6">
+          <span
+            className={`px-4 py-2 text-sm font-medium rounded-xl border ${getJobTypeBadgeClass(
+              job.type
+            )}`}
+          >
+            {formatJobType(job.type)}
+          </span>
+          <span className="px-4 py-2 text-sm bg-slate-50 text-slate-600 rounded-xl flex items-center gap-2 border border-slate-100">
+            <MapPin className="w-4 h-4" />
+            {job.location}
+          </span>
+          {job.remote && (
+            <span className="px-4 py-2 text-sm bg-emerald-50 text-emerald-700 rounded-xl border border-emerald-100 flex items-center gap-2">
+              <Globe className="w-4 h-4" />
+              Remote
+            </span>
+          )}
+          {job.salary && (
+            <span className="px-4 py-2 text-sm bg-primary/10 text-primary rounded-xl flex items-center gap-2 font-medium border border-primary/20">
+              <Banknote className="w-4 h-4" />
+              {job.salary}
+            </span>
+          )}
+        </div>
+
+        {/* Disability Friendly Prominent Banner */}
+        {job.isDisabilityFriendly && (
+          <div className="mt-6 bg-gradient-to-r from-green-600 to-green-500 rounded-2xl p-4 shadow-lg shadow-green-500/20 text-white flex items-center gap-4 animate-in slide-in-from-bottom-2">
+            <div className="w-12 h-12 bg-white/20 backdrop-blur-sm rounded-xl flex items-center justify-center flex-shrink-0">
+              <Accessibility className="w-7 h-7" />
+            </div>
+            <div className="flex-1">
+              <h3 className="font-bold text-lg leading-tight">
+                Ramah Disabilitas
+              </h3>
+              <p className="text-green-50 text-sm opacity-90">
+                Lowongan ini terbuka dan inklusif untuk teman-teman difabel.
+              </p>
+            </div>
+            <div className="hidden sm:block">
+              <span className="px-3 py-1 bg-white/20 rounded-lg text-xs font-semibold backdrop-blur-md">
+                Inclusive
+              </span>
+            </div>
+          </div>
+        )}
+
+        {/* Meta Info */}
+        <div className="flex flex-wrap items-center gap-6 mt-6 pt-6 border-t border-slate-100 text-sm text-slate-500">
+          <span className="flex items-center gap-2">
+            <Clock className="w-4 h-4" />
+            Diposting {getTimeSince(job.postedDate)}
+          </span>
+          <span className="flex items-center gap-2">
+            <Users className="w-4 h-4" />
+            {job.applicants || 0} pelamar
+          </span>
+          {job.numberOfPositions && (
+            <span className="flex items-center gap-2 text-purple-700 font-medium">
+              <Users className="w-4 h-4 text-purple-600" />
+              {job.numberOfPositions} posisi dibutuhkan
+              {(job.malePositions > 0 || job.femalePositions > 0) &&
+                ` (${job.malePositions || 0} Pria, ${job.femalePositions || 0} Wanita)`}
+            </span>
+          )}
+          <span className="flex items-center gap-2">
+            <CalendarDays className="w-4 h-4" />
+            Ditutup {formatDeadline(job.applicationDeadline)}
+          </span>
+          {job.experience && (
+            <span className="flex items-center gap-2">
+              <Briefcase className="w-4 h-4" />
+              Min. {job.experience}
+            </span>
+          )}
+        </div>
+
+        {/* Action Buttons */}
+        <div className="flex gap-4 mt-8">
+          {job.hasApplied ? (
+            <button
+              disabled
+              className="flex-1 flex items-center justify-center gap-2 px-8 py-4 bg-green-50 text-green-700 font-bold rounded-xl border border-green-200 cursor-not-allowed opacity-90"
+            >
+              <CheckCircle className="w-5 h-5" />
+              Sudah Dilamar
+            </button>
+          ) : (
+            <Link
+              href={`/jobs/${job.slug}/apply`}
+              className="flex-1 flex items-center justify-center gap-2 px-8 py-4 bg-primary hover:bg-primary-hover text-primary-foreground font-bold rounded-xl transition-all shadow-lg shadow-primary/20 hover:shadow-primary/30 hover:-translate-y-0.5"
+            >
+              Lamar Sekarang
+              <ArrowRight className="w-5 h-5" />
+            </Link>
+          )}
+          <button
+            onClick={(e) => toggleSaveJob(job.id, e)}
+            className={`lg:hidden px-6 py-4 rounded-xl transition-all border ${
+              savedJobs.includes(job.id)
+                ? "bg-primary/10 text-primary border-primary/20"
+                : "bg-white text-slate-600 border-slate-200"
+            }`}
+          >
+            {savedJobs.includes(job.id) ? (
+              <BookmarkCheck className="w-6 h-6" />
+            ) : (
+              <Bookmark className="w-6 h-6" />
+            )}
+          </button>
+        </div>
+      </div>
+
+      {/* Content */}
+      <div className="p-6 lg:p-8 space-y-8">
+        {detailLoading && job.description === undefined && (
+          <div className="flex justify-center py-8">
+            <Loader2 className="w-6 h-6 animate-spin text-primary" />
+          </div>
+        )}
+
+        {/* Gallery + Main Photo */}
+        {(job.photo || (job.gallery && job.gallery.length > 0)) && (
+          <div className="bg-white rounded-3xl border border-slate-100 shadow-sm overflow-hidden">
+            <div className="p-6 border-b border-slate-50 flex items-center justify-between">
+              <h2 className="font-bold text-slate-900 flex items-center gap-2">
+                <ImageIcon className="w-5 h-5 text-purple-500" />
+                Media & Galeri
+              </h2>
+            </div>
+            <div className="p-6">
+              {job.photo && (
+                <div
+                  className="aspect-video rounded-2xl overflow-hidden bg-slate-50 mb-4 border border-slate-100 cursor-pointer hover:opacity-95 transition"
+                  onClick={() => setSelectedImage(job.photo)}
+                >
+                  <img
+                    src={job.photo}
+                    alt="Main Job Photo"
+                    className="w-full h-full object-cover"
+                  />
+                </div>
+              )}
+
+              {job.gallery && job.gallery.length > 0 && (
+                <div className="grid grid-cols-4 gap-3">
+                  {job.gallery.map((img, idx) => (
+                    <button
+                      type="button"
+                      key={idx}
+                      className="aspect-square rounded-xl overflow-hidden bg-slate-50 border border-slate-100 hover:shadow-md transition-shadow cursor-pointer hover:opacity-95"
+                      onClick={() => setSelectedImage(img)}
+                      aria-label={`Lihat gambar galeri lowongan ${idx + 1}`}
+                    >
+                      <img
+                        src={img}
+                        alt={`Gallery ${idx}`}
+                        className="w-full h-full object-cover"
+                      />
+                    </button>
+                  ))}
+                </div>
+              )}
+            </div>
+          </div>
+        )}
+
+        {/* Description */}
+        {job.description && (
+          <section>
+            <h3 className="text-lg font-bold text-slate-900 mb-4">
+              Deskripsi Pekerjaan
+            </h3>
+            <div
+              className="prose prose-slate max-w-none text-slate-600 leading-relaxed"
+              dangerouslySetInnerHTML={{ __html: sanitizeHtml(job.description) }}
+            />
+          </section>
+        )}
+
+        {/* Working Days & Holidays */}
+        {(job.workingDays || job.holidays) && (
+          <div className="bg-white rounded-2xl border border-slate-100 p-6 flex flex-col md:flex-row gap-6">
+            {job.workingDays && (
+              <div className="flex items-start gap-3 flex-1">
+                <div className="w-10 h-10 rounded-lg bg-primary/10 flex items-center justify-center text-primary flex-shrink-0">
+                  <CalendarDays className="w-5 h-5" />
+                </div>
+                <div>
+                  <h4 className="font-semibold text-slate-900">Hari Kerja</h4>
+                  <p className="text-slate-600 text-sm mt-0.5">
+                    {job.workingDays}
+                  </p>
+                </div>
+              </div>
+            )}
+            {job.holidays && (
+              <div className="flex items-start gap-3 flex-1">
+                <div className="w-10 h-10 rounded-lg bg-orange-50 flex items-center justify-center text-orange-600 flex-shrink-0">
+                  <Coffee className="w-5 h-5" />
+                </div>
+                <div>
+                  <h4 className="font-semibold text-slate-900">Hari Libur</h4>
+                  <p className="text-slate-600 text-sm mt-0.5">
+                    {job.holidays}
+                  </p>
+                </div>
+              </div>
+            )}
+          </div>
+        )}
+
+        {/* Shift Info */}
+        {job.isShift && (
+          <div className="bg-purple-50 rounded-2xl border border-purple-100 p-6 flex items-center gap-4">
+            <div className="w-10 h-10 rounded-lg bg-white flex items-center justify-center text-purple-600 flex-shrink-0 shadow-sm">
+              <Clock className="w-5 h-5" />
+            </div>
+            <div>
+              <h4 className="font-semibold text-purple-900">Sistem Shift</h4>
+              <p className="text-purple-700 text-sm mt-0.5">
+                Posisi ini menggunakan sistem shift ({job.shiftCount} shift)
+              </p>
+            </div>
+          </div>
+        )}
+
+        {/* Requirements */}
+        {job.requirements && (
+          <section>
+            <h3 className="text-lg font-bold text-slate-900 mb-4">
+              Kualifikasi
+            </h3>
+            <div
+              className="prose prose-slate max-w-none text-slate-600 leading-relaxed"
+              dangerouslySetInnerHTML={{ __html: sanitizeHtml(job.requirements) }}
+            />
+          </section>
+        )}
+
+        {/* Benefits */}
+        {job.benefits && job.benefits.length > 0 && (
+          <section>
+            <h3 className="text-lg font-bold text-slate-900 mb-4">Benefit</h3>
+            <ul className="grid grid-cols-1 sm:grid-cols-2 gap-3">
+              {job.benefits.map((benefit, index) => (
+                <li
+                  key={index}
+                  className="flex items-center gap-3 p-3 rounded-xl bg-slate-50 border border-slate-100 text-slate-700"
+                >
+                  <CheckCircle className="w-5 h-5 text-green-500 flex-shrink-0" />
+                  <span className="text-sm font-medium">{benefit}</span>
+                </li>
+              ))}
+            </ul>
+          </section>
+        )}
+      </div>
+
+      {/* Image Modal */}
+      {selectedImage && (
+        <div
+          role="dialog"
+          aria-modal="true"
+          aria-label="Pratinjau gambar lowongan"
+          className="fixed inset-0 z-[60] flex items-center justify-center bg-black/90 backdrop-blur-sm p-4 animate-in fade-in duration-200"
+          onClick={() => setSelectedImage(null)}
+        >
+          <div className="relative max-w-5xl w-full max-h-[90vh] flex items-center justify-center">
+            <button
+              onClick={() => setSelectedImage(null)}
+              aria-label="Tutup pratinjau gambar"
+              className="absolute -top-12 right-0 text-white/80 hover:text-white transition"
+            >
+              <XCircle className="w-8 h-8" />
+            </button>
+            <img
+              src={selectedImage}
+              alt="Full View"
+              className="max-w-full max-h-[85vh] rounded-lg shadow-2xl object-contain"
+            />
+          </div>
+        </div>
+      )}
+    </div>
+  );
@@ -0,0 +1,116 @@
+            {/* Search & Filter Header */}
+            <div className="mb-6 space-y-4">
+              <div className="flex gap-3">
+                <div className="flex-1 relative">
+                  <Search className="absolute left-4 top-1/2 -translate-y-1/2 w-5 h-5 text-slate-400" />
+                  <input
+                    type="text"
+                    aria-label="Cari posisi atau perusahaan"
+                    placeholder="Cari posisi atau perusahaan..."
+                    value={searchQuery}
+                    onChange={(e) => setSearchQuery(e.target.value)}
+                    className="w-full pl-12 pr-4 py-3 rounded-xl border border-slate-200 focus:border-primary focus:ring-4 focus:ring-primary/10 transition-all outline-none bg-white shadow-sm"
+                  />
+                </div>
+                <div className="relative w-44 sm:w-52">
+                  <MapPin className="absolute left-3 top-1/2 -translate-y-1/2 w-4 h-4 text-slate-400 pointer-events-none" />
+                  <select
+                    aria-label="Filter lokasi kecamatan"
+                    value={location}
+                    onChange={(e) => setLocation(e.target.value)}
+                    className="w-full pl-9 pr-8 py-3 rounded-xl border border-slate-200 focus:border-primary focus:ring-4 focus:ring-primary/10 transition-all outline-none bg-white shadow-sm text-sm appearance-none cursor-pointer text-slate-700"
+                  >
+                    <option value="">Semua Lokasi</option>
+                    {kecamatanList.map((kec) => (
+                      <option key={kec} value={kec}>
+                        Kec. {kec}
+                      </option>
+                    ))}
+                  </select>
+                  {location && (
+                    <button
+                      onClick={() => setLocation("")}
+                      className="absolute right-2 top-1/2 -translate-y-1/2 p-1 text-slate-400 hover:text-slate-600 transition-colors"
+                      aria-label="Hapus filter lokasi"
+                    >
+                      <X className="w-4 h-4" />
+                    </button>
+                  )}
+                </div>
+                <button
+                  onClick={() => setShowFilters(!showFilters)}
+                  aria-label="Tampilkan filter lowongan"
+                  className={`px-4 py-3 rounded-xl border transition-all flex items-center gap-2 ${
+                    showFilters || activeFiltersCount > 0
+                      ? "bg-primary/10 border-primary/20 text-primary"
+                      : "bg-white border-slate-200 text-slate-600 hover:bg-slate-50"
+                  }`}
+                >
+                  <Filter className="w-5 h-5" />
+                  <span className="hidden sm:inline">Filter</span>
+                  {activeFiltersCount > 0 && (
+                    <span className="bg-primary text-primary-foreground text-xs w-5 h-5 rounded-full flex items-center justify-center">
+                      {activeFiltersCount}
+                    </span>
+                  )}
+                </button>
+              </div>
+
+              {/* Expanded Filters */}
+              {showFilters && (
+                <div className="p-4 bg-white rounded-2xl border border-slate-200 shadow-sm animate-in slide-in-from-top-2">
+                  <div className="grid grid-cols-1 sm:grid-cols-2 gap-6">
+                    <div>
+                      <label className="block text-sm font-medium text-slate-700 mb-2">
+                        Tipe Pekerjaan
+                      </label>
+                      <div className="flex flex-wrap gap-2">
+                        {jobTypes.map((type) => (
+                          <button
+                            key={type}
+                            onClick={() => handleFilterChange("jobType", type)}
+                            className={`px-3 py-1.5 text-sm rounded-lg border transition-all ${
+                              filters.jobType.includes(type)
+                                ? "bg-primary/10 border-primary/20 text-primary"
+                                : "bg-white border-slate-200 text-slate-600 hover:bg-slate-50"
+                            }`}
+                          >
+                            {formatJobType(type)}
+                          </button>
+                        ))}
+                      </div>
+                    </div>
+                    <div>
+                      <label className="block text-sm font-medium text-slate-700 mb-2">
+                        Pengalaman
+                      </label>
+                      <div className="flex flex-wrap gap-2">
+                        {experienceLevels.map((level) => (
+                          <button
+                            key={level}
+                            onClick={() =>
+                              handleFilterChange("experience", level)
+                            }
+                            className={`px-3 py-1.5 text-sm rounded-lg border transition-all ${
+                              filters.experience.includes(level)
+                                ? "bg-primary/10 border-primary/20 text-primary"
+                                : "bg-white border-slate-200 text-slate-600 hover:bg-slate-50"
+                            }`}
+                          >
+                            {level}
+                          </button>
+                        ))}
+                      </div>
+                    </div>
+                  </div>
+                  <div className="flex justify-end mt-4 pt-4 border-t border-slate-100">
+                    <button
+                      onClick={clearFilters}
+                      className="text-sm text-slate-500 hover:text-red-500 transition-colors"
+                    >
+                      Reset Filter
+                    </button>
+                  </div>
+                </div>
+              )}
+            </div>
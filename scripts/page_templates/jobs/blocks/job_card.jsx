@@ -0,0 +1,92 @@
+  // Job Card Component
+  const JobCard = ({ job, isSelected }) => (
+    <div
+      onClick={() => selectJob(job)}
+      className={`bg-white rounded-2xl p-5 cursor-pointer transition-all duration-300 border ${
+        isSelected
+          ? "border-primary shadow-lg shadow-primary/10 ring-1 ring-primary"
+          : "border-slate-100 hover:border-primary/20 hover:shadow-md"
+      }`}
+    >
+      <div className="flex gap-4">
+        <div className="w-14 h-14 rounded-xl bg-slate-50 flex items-center justify-center overflow-hidden flex-shrink-0 border border-slate-100 relative">
+          {job.logo?.startsWith("http") ? (
+            <img
+              src={job.logo}
+              alt={job.company}
+              className="w-full h-full object-cover"
+            />
+          ) : (
+            <Building2 className="w-7 h-7 text-slate-400" />
+          )}
+          {/* Disability Badge for Card */}
+          {job.isDisabilityFriendly && (
+            <div
+              className="absolute -bottom-1 -right-1 bg-green-600 text-white p-0.5 rounded-full border-2 border-white"
+              title="Ramah Difabel"
+            >
+              <Accessibility className="w-3 h-3" />
+            </div>
+          )}
+        </div>
+        <div className="flex-1 min-w-0">
+          <h3 className="font-bold text-slate-900 text-base truncate mb-1">
+            {job.title}
+          </h3>
+          <div className="flex items-center gap-1.5 text-slate-600 text-sm mb-2">
+            <span className="truncate font-medium">{job.company}</span>
+            {job.companyVerified && (
+              <CheckCircle className="w-4 h-4 text-primary flex-shrink-0" />
+            )}
+          </div>
+          <div className="flex flex-wrap items-center gap-2 text-xs text-slate-500">
+            <span className="flex items-center gap-1 bg-slate-50 px-2 py-1 rounded-md">
+              <MapPin className="w-3 h-3" />
+              {job.location}
+            </span>
+            <span className="flex items-center gap-1">
+              <Clock className="w-3 h-3" />
+              {getTimeSince(job.postedDate)}
+            </span>
+            <span className="flex items-center gap-1">
+              <CalendarDays className="w-3 h-3" />
+              Tutup {formatDeadline(job.applicationDeadline)}
+            </span>
+            <span className="flex items-center gap-1">
+              <Users className="w-3 h-3" />
+              {job.applicants || 0} pelamar
+            </span>
+            {job.numberOfPositions && (
+              <span className="flex items-center gap-1 bg-purple-50 text-purple-700 px-2 py-0.5 rounded-md font-medium border border-purple-100">
+                <Users className="w-3 h-3" />
+                {job.numberOfPositions} posisi
+                {(job.malePositions > 0 || job.femalePositions > 0) &&
+                  ` (${job.malePositions || 0}P/${job.femalePositions || 0}W)`}
+              </span>
+            )}
+            {job.hasApplied && (
+              <span className="flex items-center gap-1 text-green-600 bg-green-50 px-2 py-0.5 rounded-md font-medium border border-green-100">
+                <CheckCircle className="w-3 h-3" />
+                Dilamar
+              </span>
+            )}
+          </div>
+        </div>
+        <button
+          onClick={(e) => toggleSaveJob(job.id, e)}
+          aria-label={savedJobs.includes(job.id) ? "Hapus lowongan tersimpan" : "Simpan lowongan"}
+          className={`p-2 rounded-xl transition-all flex-shrink-0 h-fit ${
+            savedJobs.includes(job.id)
+              ? "text-primary bg-primary/10"
+              : "text-slate-300 hover:text-slate-500 hover:bg-slate-50"
+          }`}
+        >
+          {savedJobs.includes(job.id) ? (
+            <BookmarkCheck className="w-5 h-5" />
+          ) : (
+            <Bookmark className="w-5 h-5" />
+          )}
+        </button>
+      </div>
+    </div>
+  );
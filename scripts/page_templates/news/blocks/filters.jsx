@@ -0,0 +1,35 @@
+                {/* Category Filter */}
+                <div className="bg-white rounded-2xl shadow-lg shadow-gray-200/50 border border-gray-100 p-5 mb-10">
+                    <div className="flex flex-wrap items-center gap-3">
+                        <span className="text-gray-700 font-semibold text-sm mr-2">Kategori:</span>
+                        <button
+                            onClick={() => {
+                                setSelectedCategory('all')
+                                setCurrentPage(1)
+                            }}
+                            className={`px-5 py-2.5 rounded-xl text-sm font-medium transition-all ${
+                                selectedCategory === 'all'
+                                    ? 'bg-[#03587f] text-white shadow-lg shadow-[#03587f]/30'
+                                    : 'bg-gray-100 text-gray-600 hover:bg-gray-200'
+                            }`}
+                        >
+                            Semua
+                        </button>
+                        {categories.map(cat => (
+                            <button
+                                key={cat}
+                                onClick={() => {
+                                    setSelectedCategory(cat)
+                                    setCurrentPage(1)
+                                }}
+                                className={`px-5 py-2.5 rounded-xl text-sm font-medium transition-all ${
+                                    selectedCategory === cat
+                                        ? 'bg-[#03587f] text-white shadow-lg shadow-[#03587f]/30'
+                                        : 'bg-gray-100 text-gray-600 hover:bg-gray-200'
+                                }`}
+                            >
+                                {cat}
+                            </button>
+                        ))}
+                    </div>
+                </div>
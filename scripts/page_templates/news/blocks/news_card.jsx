@@ -0,0 +1,60 @@
+                                <Link 
+                                    key={item.id}
+                                    href={`/news/${item.slug}`}
+                                    className="bg-white rounded-2xl border border-gray-100 overflow-hidden hover:shadow-2xl hover:shadow-gray-200/60 hover:border-[#03587f]/20 transition-all duration-300 group flex flex-col"
+                                >
+                                    {/* Image */}
+                                    <div className="relative h-52 overflow-hidden">
+                                        <div className="absolute top-4 left-4 z-10">
+                                            <span className="bg-[#03587f] text-white px-4 py-1.5 rounded-full text-xs font-bold shadow-lg">
+                                                {item.category}
+                                            </span>
+                                        </div>
+                                        <NewsCoverImage
+                                            src={item.image}
+                                            alt={item.title}
+                                            sizes="(min-width: 1024px) 33vw, (min-width: 768px) 50vw, 100vw"
+                                            className="object-cover transition-transform duration-500 group-hover:scale-110"
+                                        />
+                                        {/* Overlay on hover */}
+                                        <div className="absolute inset-0 bg-gradient-to-t from-black/50 via-transparent to-transparent opacity-0 group-hover:opacity-100 transition-opacity duration-300" />
+                                    </div>
+
+                                    {/* Content */}
+                                    <div className="p-6 flex-1 flex flex-col">
+                                        {/* Meta */}
+                                        <div className="flex items-center gap-3 text-gray-500 text-sm mb-4">
+                                            <span className="flex items-center gap-1.5">
+                                                <Calendar className="w-4 h-4" />
+                                                {formatDate(item.publishedAt)}
+                                            </span>
+                                            <span className="w-1.5 h-1.5 rounded-full bg-gray-300" />
+                                            <span className="flex items-center gap-1.5">
+                                                <User className="w-4 h-4" />
+                                                {item.author}
+                                            </span>
+                                        </div>
+
+                                        {/* Title */}
+                                        <h3 className="text-xl font-bold text-gray-900 mb-3 line-clamp-2 group-hover:text-[#03587f] transition-colors leading-tight">
+                                            {item.title}
+                                        </h3>
+
+                                        {/* Excerpt */}
+                                        <p className="text-gray-600 text-sm line-clamp-3 flex-1 leading-relaxed">
+                                            {item.excerpt || 'Klik untuk membaca selengkapnya...'}
+                                        </p>
+
+                                        {/* Footer */}
+                                        <div className="flex items-center justify-between mt-5 pt-5 border-t border-gray-100">
+                                            <span className="text-gray-400 text-sm flex items-center gap-1.5">
+                                                <Eye className="w-4 h-4" />
+                                                {item.viewCount || 0} dibaca
+                                            </span>
+                                            <span className="text-[#03587f] font-bold text-sm flex items-center gap-1.5 group-hover:gap-3 transition-all">
+                                                Baca Selengkapnya
+                                                <ArrowRight className="w-4 h-4" />
+                                            </span>
+                                        </div>
+                                    </div>
+                                </Link>